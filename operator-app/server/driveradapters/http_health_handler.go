@@ -2,14 +2,21 @@ package driveradapters
 
 import (
 	"net/http"
+	"runtime"
 	"sync"
+	"time"
 
+	"github.com/kweaver-ai/operator-hub/operator-app/server/driveradapters/mcp"
+	"github.com/kweaver-ai/operator-hub/operator-app/server/infra/config"
 	"github.com/kweaver-ai/operator-hub/operator-app/server/interfaces"
+	"github.com/kweaver-ai/operator-hub/operator-app/server/logics/mcp/storage"
 	"github.com/gin-gonic/gin"
 )
 
 // 健康检查
-type httpHealthHandler struct{}
+type httpHealthHandler struct {
+	debug bool
+}
 
 var (
 	httpHealthOnce sync.Once
@@ -18,7 +25,9 @@ var (
 
 func NewHTTPHealthHandler() interfaces.HTTPRouterInterface {
 	httpHealthOnce.Do(func() {
-		httpHealthHand = &httpHealthHandler{}
+		httpHealthHand = &httpHealthHandler{
+			debug: config.NewConfigLoader().Project.Debug,
+		}
 	})
 
 	return httpHealthHand
@@ -28,6 +37,10 @@ func NewHTTPHealthHandler() interfaces.HTTPRouterInterface {
 func (h *httpHealthHandler) RegisterRouter(router *gin.RouterGroup) {
 	router.GET("/ready", h.getReady)
 	router.GET("/alive", h.getAlive)
+	// 健康检查路由不经过鉴权，运行时统计会暴露实例数与连接数，仅在调试模式下开启
+	if h.debug {
+		router.GET("/stats", h.getStats)
+	}
 }
 
 func (h *httpHealthHandler) getReady(c *gin.Context) {
@@ -39,3 +52,46 @@ func (h *httpHealthHandler) getAlive(c *gin.Context) {
 	c.Writer.Header().Set("Content-Type", "application/json")
 	c.String(http.StatusOK, "alive")
 }
+
+// runtimeStats 进程运行时指标，供性能测试采样MCP实例与会话的资源占用
+type runtimeStats struct {
+	Timestamp  int64       `json:"timestamp"` // 采样时间，单位：毫秒
+	Goroutines int         `json:"goroutines"`
+	Memory     memoryStats `json:"memory"`
+	MCP        mcpStats    `json:"mcp"`
+}
+
+type memoryStats struct {
+	HeapAlloc    uint64 `json:"heap_alloc"`
+	HeapInuse    uint64 `json:"heap_inuse"`
+	Sys          uint64 `json:"sys"`
+	NumGC        uint32 `json:"num_gc"`
+	PauseTotalNs uint64 `json:"pause_total_ns"`
+	LastPauseNs  uint64 `json:"last_pause_ns"`
+}
+
+type mcpStats struct {
+	Instances   int   `json:"instances"`    // 内存中的MCP实例数
+	SSESessions int64 `json:"sse_sessions"` // 保持中的SSE连接数
+}
+
+func (h *httpHealthHandler) getStats(c *gin.Context) {
+	var mem runtime.MemStats
+	runtime.ReadMemStats(&mem)
+	c.JSON(http.StatusOK, runtimeStats{
+		Timestamp:  time.Now().UnixMilli(),
+		Goroutines: runtime.NumGoroutine(),
+		Memory: memoryStats{
+			HeapAlloc:    mem.HeapAlloc,
+			HeapInuse:    mem.HeapInuse,
+			Sys:          mem.Sys,
+			NumGC:        mem.NumGC,
+			PauseTotalNs: mem.PauseTotalNs,
+			LastPauseNs:  mem.PauseNs[(mem.NumGC+255)%256],
+		},
+		MCP: mcpStats{
+			Instances:   storage.NewMemoryStore().Count(),
+			SSESessions: mcp.ActiveSSESessions(),
+		},
+	})
+}
@@ -2,6 +2,7 @@ package mcp
 
 import (
 	"net/http"
+	"sync/atomic"
 
 	infraerrors "github.com/kweaver-ai/operator-hub/operator-app/server/infra/errors"
 	"github.com/kweaver-ai/operator-hub/operator-app/server/infra/rest"
@@ -10,6 +11,14 @@ import (
 	"github.com/go-playground/validator/v10"
 )
 
+// activeSSESessions 当前保持中的SSE连接数
+var activeSSESessions atomic.Int64
+
+// ActiveSSESessions 返回当前保持中的SSE连接数，供性能测试采样
+func ActiveSSESessions() int64 {
+	return activeSSESessions.Load()
+}
+
 func (h *mcpHnadle) StreamHandler(c *gin.Context) {
 	var req interfaces.MCPAppRequest
 	if err := c.ShouldBindUri(&req); err != nil {
@@ -50,7 +59,9 @@ func (h *mcpHnadle) SSEHandler(c *gin.Context) {
 		rest.ReplyError(c, err)
 		return
 	}
-	// 代理sse请求
+	// 代理sse请求，连接保持期间计入活跃SSE连接数
+	activeSSESessions.Add(1)
+	defer activeSSESessions.Add(-1)
 	instance.SSEServer.SSEHandler().ServeHTTP(c.Writer, c.Request)
 }
 
@@ -62,6 +62,13 @@ func (s *MemoryStore) Delete(mcpID string, version int) error {
 	return nil
 }
 
+// Count 返回当前实例数
+func (s *MemoryStore) Count() int {
+	s.mu.RLock()
+	defer s.mu.RUnlock()
+	return len(s.instances)
+}
+
 func (s *MemoryStore) Exists(mcpID string, version int) bool {
 	key := utils.GenerateMCPKey(mcpID, version)
 	_, exists := s.instances[key]
@@ -9,4 +9,5 @@ type Storage interface {
 	Get(mcpID string, version int) (*interfaces.MCPServerInstance, error)
 	Delete(mcpID string, version int) error
 	Exists(mcpID string, version int) bool
+	Count() int
 }
@@ -11,6 +11,7 @@ import (
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/db"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces/model"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/utils"
 	"github.com/kweaver-ai/proton-rds-sdk-go/sqlx"
 	"github.com/pkg/errors"
 )
@@ -215,6 +216,13 @@ func (or *operatorReleaseDB) SelectByOpID(ctx context.Context, opID string) (exi
 	return
 }
 
+// SelectByOpIDs 根据算子ID列表批量查询算子发布信息
+func (or *operatorReleaseDB) SelectByOpIDs(ctx context.Context, opIDs []string) (releaseList []*model.OperatorReleaseDB, err error) {
+	releaseList = []*model.OperatorReleaseDB{}
+	err = or.orm.Select().From(tbOperatorRelease).WhereIn("f_op_id", utils.SliceToInterface(opIDs)...).Get(ctx, &releaseList)
+	return
+}
+
 // SelectByName 根据算子名称查询算子发布信息
 func (or *operatorReleaseDB) SelectByName(ctx context.Context, tx *sql.Tx, name string) (exist bool, releaseDB *model.OperatorReleaseDB, err error) {
 	releaseDB = &model.OperatorReleaseDB{}
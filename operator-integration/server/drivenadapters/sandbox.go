@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"net/http"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/common"
@@ -25,6 +26,7 @@ type sandBoxEnvClient struct {
 	baseURL    string
 	logger     interfaces.Logger
 	httpClient interfaces.HTTPClient
+	codeCache  *codeCache // 沙箱已编译代码的哈希，未启用时为nil
 }
 
 const (
@@ -36,11 +38,15 @@ func NewSandBoxEnvClient() interfaces.SandBoxEnv {
 		conf := config.NewConfigLoader()
 		fmt.Println(conf.SandboxRuntime)
 		fmt.Println(conf.SandboxRuntime)
+		if conf.SandboxCodeCache.Enabled {
+			sandboxCodeCache = newCodeCache(conf.SandboxCodeCache.MaxEntries)
+		}
 		sandBoxEnv = &sandBoxEnvClient{
 			baseURL: fmt.Sprintf("%s://%s:%d/workspace/se", conf.SandboxRuntime.PrivateProtocol,
 				conf.SandboxRuntime.PrivateHost, conf.SandboxRuntime.PrivatePort),
 			logger:     conf.GetLogger(),
 			httpClient: rest.NewHTTPClient(),
+			codeCache:  sandboxCodeCache,
 		}
 	})
 	return sandBoxEnv
@@ -100,7 +106,7 @@ func (s *sandBoxEnvClient) GetSandBoxRequestConfig(ctx context.Context, req *int
 // 执行代码
 func (s *sandBoxEnvClient) ExecuteCode(ctx context.Context, req *interfaces.ExecuteCodeReq) (resp *interfaces.ExecuteCodeResp, err error) {
 	headers := common.GetHeaderFromCtx(ctx)
-	code, respData, err := s.httpClient.Post(ctx, fmt.Sprintf("%s%s", s.baseURL, executeCodeURL), headers, req)
+	code, respData, err := s.postExecuteCode(ctx, headers, req)
 	if err != nil {
 		s.logger.Errorf("execute code failed, err: %v", err)
 		err = errors.NewHTTPError(ctx, code, errors.ErrExtSandboxRuntimeExecuteCodeFailed, err.Error())
@@ -114,3 +120,38 @@ func (s *sandBoxEnvClient) ExecuteCode(ctx context.Context, req *interfaces.Exec
 	}
 	return
 }
+
+// postExecuteCode 发送执行请求
+// 启用代码缓存时，沙箱已编译过的代码只发送哈希；沙箱返回未命中（如已重启或淘汰）时回退发送完整代码和哈希
+func (s *sandBoxEnvClient) postExecuteCode(ctx context.Context, headers map[string]string,
+	req *interfaces.ExecuteCodeReq) (code int, respData any, err error) {
+	url := fmt.Sprintf("%s%s", s.baseURL, executeCodeURL)
+	if s.codeCache == nil || req.HandlerCode == "" {
+		return s.httpClient.Post(ctx, url, headers, req)
+	}
+	hash := utils.SHA256(req.HandlerCode)
+	if s.codeCache.contains(hash) {
+		hashOnly := *req
+		hashOnly.HandlerCode, hashOnly.CodeHash = "", hash
+		code, respData, err = s.httpClient.Post(ctx, url, headers, &hashOnly)
+		if err == nil {
+			atomic.AddInt64(&codeCacheStats.Hits, 1)
+			atomic.AddInt64(&codeCacheStats.SavedBytes, int64(len(req.HandlerCode)))
+			return
+		}
+		if !isCodeNotCached(err) {
+			// 其他错误（如沙箱池已满、请求超时）无法确认沙箱是否命中，不计入命中，原样返回
+			return
+		}
+		atomic.AddInt64(&codeCacheStats.Misses, 1)
+		s.codeCache.remove(hash)
+	}
+	full := *req
+	full.CodeHash = hash
+	atomic.AddInt64(&codeCacheStats.Uploads, 1)
+	code, respData, err = s.httpClient.Post(ctx, url, headers, &full)
+	if err == nil {
+		s.codeCache.add(hash)
+	}
+	return
+}
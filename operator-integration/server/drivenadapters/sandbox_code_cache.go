@@ -0,0 +1,124 @@
+package drivenadapters
+
+import (
+	"container/list"
+	"net/http"
+	"strings"
+	"sync"
+	"sync/atomic"
+
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/rest"
+)
+
+// codeNotCachedCode 沙箱未持有该哈希对应的已编译代码时返回 404 {"code": "CodeNotCached"}
+const codeNotCachedCode = "CodeNotCached"
+
+// SandboxCodeCacheStats 沙箱代码缓存统计
+type SandboxCodeCacheStats struct {
+	Enabled    bool  `json:"enabled"`     // 是否启用
+	Entries    int   `json:"entries"`     // 已知沙箱持有的代码数
+	Hits       int64 `json:"hits"`        // 只发送哈希且沙箱命中的次数
+	Misses     int64 `json:"misses"`      // 只发送哈希但沙箱未命中、回退发送完整代码的次数
+	Uploads    int64 `json:"uploads"`     // 发送完整代码的次数
+	SavedBytes int64 `json:"saved_bytes"` // 命中时省去发送的代码字节数
+}
+
+var codeCacheStats SandboxCodeCacheStats
+
+// codeCache 记录沙箱已编译过的代码哈希，按最近使用淘汰
+// 只是客户端对沙箱状态的估计：沙箱重启或淘汰后会返回未命中，由调用方回退发送完整代码
+type codeCache struct {
+	mu         sync.Mutex
+	maxEntries int
+	ll         *list.List
+	items      map[string]*list.Element
+}
+
+var sandboxCodeCache *codeCache
+
+func newCodeCache(maxEntries int) *codeCache {
+	return &codeCache{
+		maxEntries: maxEntries,
+		ll:         list.New(),
+		items:      make(map[string]*list.Element),
+	}
+}
+
+// contains 判断沙箱是否持有该代码，命中时移到最近使用
+func (c *codeCache) contains(hash string) bool {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	e, ok := c.items[hash]
+	if ok {
+		c.ll.MoveToFront(e)
+	}
+	return ok
+}
+
+func (c *codeCache) add(hash string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if e, ok := c.items[hash]; ok {
+		c.ll.MoveToFront(e)
+		return
+	}
+	c.items[hash] = c.ll.PushFront(hash)
+	for c.maxEntries > 0 && c.ll.Len() > c.maxEntries {
+		oldest := c.ll.Back()
+		c.ll.Remove(oldest)
+		delete(c.items, oldest.Value.(string))
+	}
+}
+
+func (c *codeCache) remove(hash string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if e, ok := c.items[hash]; ok {
+		c.ll.Remove(e)
+		delete(c.items, hash)
+	}
+}
+
+func (c *codeCache) len() int {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return c.ll.Len()
+}
+
+func (c *codeCache) flush() int {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	n := c.ll.Len()
+	c.ll.Init()
+	c.items = make(map[string]*list.Element)
+	return n
+}
+
+// isCodeNotCached 判断沙箱是否因未持有代码哈希而拒绝执行
+func isCodeNotCached(err error) bool {
+	httpErr, ok := err.(*rest.ExHTTPError)
+	return ok && httpErr.HTTPCode == http.StatusNotFound && strings.Contains(string(httpErr.Body), codeNotCachedCode)
+}
+
+// GetSandboxCodeCacheStats 获取沙箱代码缓存统计快照
+func GetSandboxCodeCacheStats() SandboxCodeCacheStats {
+	stats := SandboxCodeCacheStats{
+		Hits:       atomic.LoadInt64(&codeCacheStats.Hits),
+		Misses:     atomic.LoadInt64(&codeCacheStats.Misses),
+		Uploads:    atomic.LoadInt64(&codeCacheStats.Uploads),
+		SavedBytes: atomic.LoadInt64(&codeCacheStats.SavedBytes),
+	}
+	if sandboxCodeCache != nil {
+		stats.Enabled = true
+		stats.Entries = sandboxCodeCache.len()
+	}
+	return stats
+}
+
+// FlushSandboxCodeCache 清空已知的代码哈希，之后每段代码首次执行都会发送完整代码，返回清空的条目数
+func FlushSandboxCodeCache() int {
+	if sandboxCodeCache == nil {
+		return 0
+	}
+	return sandboxCodeCache.flush()
+}
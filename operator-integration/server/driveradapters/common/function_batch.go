@@ -0,0 +1,320 @@
+package common
+
+import (
+	"bufio"
+	"context"
+	"fmt"
+	"io"
+	"net/http"
+	"strings"
+
+	"github.com/gin-gonic/gin"
+	"github.com/go-playground/validator/v10"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/errors"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/rest"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/utils"
+)
+
+const (
+	defaultBatchChunkSize = 100              // 每次沙箱执行的默认事件数
+	maxBatchChunkSize     = 1000             // 每次沙箱执行的最大事件数
+	maxBatchLineSize      = 10 * 1024 * 1024 // NDJSON请求体单行最大字节数
+)
+
+// batchDriverCode 批量执行驱动：在一次沙箱执行中加载一次用户代码，逐个事件调用并分别捕获输出
+// 用户代码通过事件传入而不是拼接进驱动，驱动同时以 handler 和 main 作为入口
+const batchDriverCode = `import contextlib, inspect, io, time, traceback
+
+
+def handler(event, context=None):
+    scope = {"__name__": "__batch__"}
+    func, setup_error, with_context = None, None, False
+    try:
+        exec(compile(event["code"], "<handler>", "exec"), scope)
+        func = scope.get("handler") or scope.get("main")
+        if not callable(func):
+            raise NameError("handler function not found: define handler(event) or main(event)")
+        with_context = len(inspect.signature(func).parameters) >= 2
+    except Exception:
+        setup_error = traceback.format_exc()
+    results = []
+    for item in event.get("events") or []:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        result, failed = None, setup_error is not None
+        begin = time.perf_counter()
+        if failed:
+            stderr.write(setup_error)
+        else:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    result = func(item, context) if with_context else func(item)
+                except Exception:
+                    failed = True
+                    traceback.print_exc()
+        results.append({"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "result": result,
+                        "error": failed, "duration_ms": (time.perf_counter() - begin) * 1000})
+    return {"results": results}
+
+
+main = handler
+`
+
+// FunctionExecuteBatchReq 批量函数执行请求参数
+// JSON请求体：{"code": "...", "events": [...], "chunk_size": 100}
+// NDJSON请求体：首行 {"code": "...", "chunk_size": 100}，之后每行一个事件，边读取边执行
+type FunctionExecuteBatchReq struct {
+	Code      string           `json:"code" validate:"required"`                       // 执行代码
+	Events    []map[string]any `json:"events" validate:"max=10000"`                    // 事件列表，最多10000个，更多事件请使用NDJSON请求体
+	ChunkSize int              `json:"chunk_size" validate:"omitempty,min=1,max=1000"` // 每次沙箱执行的事件数
+	Timeout   int64            `form:"timeout"`                                        // 每次沙箱执行的超时时间（毫秒）
+}
+
+// FunctionExecuteBatchResult 单个事件的执行结果，按事件顺序以NDJSON逐行返回
+type FunctionExecuteBatchResult struct {
+	Index   int            `json:"index"`   // 事件序号
+	Stdout  string         `json:"stdout"`  // 标准输出
+	Stderr  string         `json:"stderr"`  // 标准错误输出
+	Result  any            `json:"result"`  // 执行结果
+	Error   bool           `json:"error"`   // 是否执行失败
+	Metrics map[string]any `json:"metrics"` // 执行指标
+}
+
+// batchDriverResult 批量执行驱动返回的结果
+type batchDriverResult struct {
+	Results []struct {
+		Stdout     string  `json:"stdout"`
+		Stderr     string  `json:"stderr"`
+		Result     any     `json:"result"`
+		Error      bool    `json:"error"`
+		DurationMs float64 `json:"duration_ms"`
+	} `json:"results"`
+}
+
+// FunctionExecuteBatch 批量函数执行：一段代码、多个事件，按 chunk_size 分批在沙箱中执行，逐个事件以NDJSON流式返回
+func (h *unifiedProxyHandler) FunctionExecuteBatch(c *gin.Context) {
+	var err error
+	ctx := c.Request.Context()
+	req := &FunctionExecuteBatchReq{}
+	if err = c.ShouldBindQuery(req); err != nil {
+		rest.ReplyError(c, errors.DefaultHTTPError(ctx, http.StatusBadRequest, err.Error()))
+		return
+	}
+	var events func() ([]map[string]any, error)
+	if strings.HasPrefix(c.ContentType(), rest.ContentTypeNDJSON) {
+		events, err = streamBatchEvents(c.Request.Body, req)
+		if err == nil {
+			events, err = h.enableBatchDuplex(c, req, events)
+		}
+	} else {
+		err = c.ShouldBindJSON(req)
+		events = sliceBatchEvents(req)
+	}
+	if err != nil {
+		err = errors.NewHTTPError(ctx, http.StatusBadRequest, errors.ErrExtDebugParamsInvalid,
+			fmt.Sprintf("invalid request body, err: %v", err))
+		rest.ReplyError(c, err)
+		return
+	}
+	if err = validator.New().Struct(req); err != nil {
+		rest.ReplyError(c, err)
+		return
+	}
+
+	started := false
+	for index, chunkIndex := 0, 0; ; chunkIndex++ {
+		chunk, readErr := events()
+		if len(chunk) > 0 {
+			results, execErr := h.executeBatchChunk(ctx, req, chunk, index, chunkIndex)
+			if execErr != nil {
+				if !started {
+					// 首批执行失败（如沙箱池已满）时尚未发送响应，按原状态码返回
+					rest.ReplyError(c, execErr)
+					return
+				}
+				results = batchErrorResults(chunk, index, chunkIndex, execErr)
+			}
+			if !started {
+				rest.StartNDJSON(c)
+				started = true
+			}
+			if err = rest.WriteNDJSON(c, results); err != nil {
+				return
+			}
+			index += len(chunk)
+		}
+		if readErr != nil {
+			if readErr != io.EOF {
+				h.Logger.Errorf("read batch events failed, err: %v", readErr)
+				if !started {
+					rest.ReplyError(c, errors.NewHTTPError(ctx, http.StatusBadRequest, errors.ErrExtDebugParamsInvalid,
+						fmt.Sprintf("invalid request body, err: %v", readErr)))
+					return
+				}
+				// 已开始输出时追加一行错误结果，避免调用方把被截断的输入当作正常结束
+				_ = rest.WriteNDJSON(c, []*FunctionExecuteBatchResult{{
+					Index:   index,
+					Stderr:  fmt.Sprintf("System error: read request body failed, events from index %d were not executed: %v", index, readErr),
+					Error:   true,
+					Metrics: map[string]any{"chunk": chunkIndex, "input_error": true},
+				}})
+			}
+			break
+		}
+	}
+	if !started {
+		rest.StartNDJSON(c)
+		c.Writer.Flush()
+	}
+}
+
+// enableBatchDuplex 开启全双工，使首批结果写出后仍可继续读取NDJSON请求体
+// HTTP/1.1 默认在写出响应后丢弃未读的请求体，无法开启时先读完全部事件再执行
+func (h *unifiedProxyHandler) enableBatchDuplex(c *gin.Context, req *FunctionExecuteBatchReq,
+	events func() ([]map[string]any, error)) (func() ([]map[string]any, error), error) {
+	if c.Request.ProtoMajor != 1 {
+		return events, nil // HTTP/2 可同时读请求体与写响应
+	}
+	err := http.NewResponseController(c.Writer).EnableFullDuplex()
+	if err == nil {
+		return events, nil
+	}
+	h.Logger.Warnf("enable full duplex failed, read all batch events before executing, err: %v", err)
+	buffered := &FunctionExecuteBatchReq{ChunkSize: req.ChunkSize}
+	for {
+		chunk, readErr := events()
+		buffered.Events = append(buffered.Events, chunk...)
+		if readErr == io.EOF {
+			return sliceBatchEvents(buffered), nil
+		}
+		if readErr != nil {
+			return nil, readErr
+		}
+	}
+}
+
+// sliceBatchEvents 将JSON请求体中的事件列表按 chunk_size 切分
+func sliceBatchEvents(req *FunctionExecuteBatchReq) func() ([]map[string]any, error) {
+	offset := 0
+	return func() ([]map[string]any, error) {
+		size := batchChunkSize(req)
+		if offset >= len(req.Events) {
+			return nil, io.EOF
+		}
+		end := min(offset+size, len(req.Events))
+		chunk := req.Events[offset:end]
+		offset = end
+		return chunk, nil
+	}
+}
+
+// streamBatchEvents 读取NDJSON请求体：首行为代码与参数，之后每次读取 chunk_size 行事件
+func streamBatchEvents(body io.Reader, req *FunctionExecuteBatchReq) (func() ([]map[string]any, error), error) {
+	scanner := bufio.NewScanner(body)
+	scanner.Buffer(make([]byte, 64*1024), maxBatchLineSize)
+	if !scanner.Scan() {
+		if err := scanner.Err(); err != nil {
+			return nil, err
+		}
+		return nil, fmt.Errorf("empty request body")
+	}
+	header, err := utils.JSONToObjectWithError[FunctionExecuteBatchReq](scanner.Text())
+	if err != nil {
+		return nil, err
+	}
+	req.Code, req.ChunkSize = header.Code, header.ChunkSize
+	return func() ([]map[string]any, error) {
+		size := batchChunkSize(req)
+		chunk := make([]map[string]any, 0, size)
+		for len(chunk) < size {
+			if !scanner.Scan() {
+				if err := scanner.Err(); err != nil {
+					return chunk, err
+				}
+				return chunk, io.EOF
+			}
+			line := strings.TrimSpace(scanner.Text())
+			if line == "" {
+				continue
+			}
+			event, err := utils.JSONToObjectWithError[map[string]any](line)
+			if err != nil {
+				return chunk, err
+			}
+			chunk = append(chunk, event)
+		}
+		return chunk, nil
+	}, nil
+}
+
+func batchChunkSize(req *FunctionExecuteBatchReq) int {
+	if req.ChunkSize <= 0 {
+		return defaultBatchChunkSize
+	}
+	return min(req.ChunkSize, maxBatchChunkSize)
+}
+
+// executeBatchChunk 一次沙箱执行处理一批事件
+func (h *unifiedProxyHandler) executeBatchChunk(ctx context.Context, req *FunctionExecuteBatchReq, chunk []map[string]any,
+	index, chunkIndex int) ([]*FunctionExecuteBatchResult, error) {
+	events := make([]any, len(chunk))
+	for i, event := range chunk {
+		events[i] = event
+	}
+	resp, err := h.SandBoxEnvClient.ExecuteCode(ctx, &interfaces.ExecuteCodeReq{
+		HandlerCode: batchDriverCode,
+		Event:       map[string]any{"code": req.Code, "events": events},
+		ExecuteContext: interfaces.ExecuteContext{
+			FunctionName:          "function_execute_batch",
+			RemainingTimeInMillis: req.Timeout,
+		},
+	})
+	if err != nil {
+		return nil, err
+	}
+	driver := &batchDriverResult{}
+	if err = utils.AnyToObject(resp.Result, driver); err != nil || len(driver.Results) != len(chunk) {
+		// 驱动未正常返回（如超时、沙箱系统错误），整批事件共用沙箱的输出
+		h.Logger.Warnf("batch driver returned unexpected result, stderr: %s", resp.Stderr)
+		stderr := resp.Stderr
+		if stderr == "" {
+			stderr = "System error: batch driver returned no results"
+		}
+		return batchErrorResults(chunk, index, chunkIndex, fmt.Errorf("%s", stderr)), nil
+	}
+	results := make([]*FunctionExecuteBatchResult, len(chunk))
+	for i, r := range driver.Results {
+		results[i] = &FunctionExecuteBatchResult{
+			Index:  index + i,
+			Stdout: r.Stdout,
+			Stderr: r.Stderr,
+			Result: r.Result,
+			Error:  r.Error,
+			Metrics: map[string]any{
+				"duration_ms": r.DurationMs,
+				"chunk":       chunkIndex,
+				"chunk_size":  len(chunk),
+				"sandbox":     resp.Metrics,
+			},
+		}
+	}
+	return results, nil
+}
+
+// batchErrorResults 整批执行失败时为每个事件生成错误结果，使调用方可按序号重试
+func batchErrorResults(chunk []map[string]any, index, chunkIndex int, err error) []*FunctionExecuteBatchResult {
+	stderr := err.Error()
+	if !strings.HasPrefix(stderr, "System error") {
+		stderr = "System error: " + stderr
+	}
+	results := make([]*FunctionExecuteBatchResult, len(chunk))
+	for i := range chunk {
+		results[i] = &FunctionExecuteBatchResult{
+			Index:   index + i,
+			Stderr:  stderr,
+			Error:   true,
+			Metrics: map[string]any{"chunk": chunkIndex, "chunk_size": len(chunk)},
+		}
+	}
+	return results
+}
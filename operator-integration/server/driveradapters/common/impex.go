@@ -9,6 +9,7 @@ import (
 	"sync"
 	"time"
 
+	infracommon "github.com/kweaver-ai/operator-hub/operator-integration/server/infra/common"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/config"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/errors"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/rest"
@@ -139,7 +140,12 @@ func (impexH *impexHandler) Import(c *gin.Context) {
 		rest.ReplyError(c, err)
 		return
 	}
-	err = impexH.ComponentImpexConfig.ImportConfig(c.Request.Context(), req)
+	// 以 Server-Timing 响应头返回解析、鉴权、事务内导入与提交的耗时
+	ctx, timing := infracommon.SetServerTimingToCtx(c.Request.Context())
+	start := time.Now()
+	err = impexH.ComponentImpexConfig.ImportConfig(ctx, req)
+	timing.Since("total", start)
+	c.Header("Server-Timing", timing.Header())
 	if err != nil {
 		rest.ReplyError(c, err)
 		return
@@ -19,6 +19,7 @@ import (
 type UnifiedProxyHandler interface {
 	FunctionExecuteProxy(c *gin.Context)
 	FunctionExecute(c *gin.Context)
+	FunctionExecuteBatch(c *gin.Context)
 }
 
 // unifiedProxyHandler 代理处理实现
@@ -4,15 +4,26 @@
 package driveradapters
 
 import (
+	"database/sql"
 	"net/http"
+	"net/http/pprof"
+	"runtime"
 	"sync"
+	"time"
 
-	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
 	"github.com/gin-gonic/gin"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/drivenadapters"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/config"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/db"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/lock"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/logics/proxy"
 )
 
 // 健康检查
-type httpHealthHandler struct{}
+type httpHealthHandler struct {
+	debug bool
+}
 
 var (
 	httpHealthOnce sync.Once
@@ -21,7 +32,9 @@ var (
 
 func NewHTTPHealthHandler() interfaces.HTTPRouterInterface {
 	httpHealthOnce.Do(func() {
-		httpHealthHand = &httpHealthHandler{}
+		httpHealthHand = &httpHealthHandler{
+			debug: config.NewConfigLoader().Project.Debug,
+		}
 	})
 
 	return httpHealthHand
@@ -31,6 +44,19 @@ func NewHTTPHealthHandler() interfaces.HTTPRouterInterface {
 func (h *httpHealthHandler) RegisterRouter(router *gin.RouterGroup) {
 	router.GET("/ready", h.getReady)
 	router.GET("/alive", h.getAlive)
+	// 健康检查路由不经过鉴权，运行时统计与 pprof 仅在调试模式下开启
+	if h.debug {
+		router.GET("/stats", h.getStats)
+		router.GET("/debug/pprof/", gin.WrapF(pprof.Index))
+		router.GET("/debug/pprof/cmdline", gin.WrapF(pprof.Cmdline))
+		router.GET("/debug/pprof/profile", gin.WrapF(pprof.Profile))
+		router.GET("/debug/pprof/symbol", gin.WrapF(pprof.Symbol))
+		router.GET("/debug/pprof/trace", gin.WrapF(pprof.Trace))
+		router.GET("/debug/pprof/:name", func(c *gin.Context) {
+			pprof.Handler(c.Param("name")).ServeHTTP(c.Writer, c.Request)
+		})
+		router.POST("/debug/flush", h.flush)
+	}
 }
 
 func (h *httpHealthHandler) getReady(c *gin.Context) {
@@ -42,3 +68,73 @@ func (h *httpHealthHandler) getAlive(c *gin.Context) {
 	c.Writer.Header().Set("Content-Type", "application/json")
 	c.String(http.StatusOK, "alive")
 }
+
+// runtimeStats 进程运行时指标，供性能测试在压测期间采样
+type runtimeStats struct {
+	Timestamp  int64                                `json:"timestamp"` // 采样时间，单位：毫秒
+	Goroutines int                                  `json:"goroutines"`
+	Memory     memoryStats                          `json:"memory"`
+	DB         *dbStats                             `json:"db,omitempty"`
+	Lock       lock.Stats                           `json:"lock"`
+	CodeCache  drivenadapters.SandboxCodeCacheStats `json:"sandbox_code_cache"`
+	ProxyPool  proxy.PoolStats                      `json:"proxy_pool"`
+}
+
+type memoryStats struct {
+	HeapAlloc    uint64 `json:"heap_alloc"`
+	HeapInuse    uint64 `json:"heap_inuse"`
+	Sys          uint64 `json:"sys"`
+	NumGC        uint32 `json:"num_gc"`
+	PauseTotalNs uint64 `json:"pause_total_ns"`
+	LastPauseNs  uint64 `json:"last_pause_ns"`
+}
+
+type dbStats struct {
+	MaxOpenConnections int   `json:"max_open_connections"`
+	OpenConnections    int   `json:"open_connections"`
+	InUse              int   `json:"in_use"`
+	Idle               int   `json:"idle"`
+	WaitCount          int64 `json:"wait_count"`
+	WaitDurationMs     int64 `json:"wait_duration_ms"`
+}
+
+func (h *httpHealthHandler) getStats(c *gin.Context) {
+	var mem runtime.MemStats
+	runtime.ReadMemStats(&mem)
+	stats := runtimeStats{
+		Timestamp:  time.Now().UnixMilli(),
+		Goroutines: runtime.NumGoroutine(),
+		Memory: memoryStats{
+			HeapAlloc:    mem.HeapAlloc,
+			HeapInuse:    mem.HeapInuse,
+			Sys:          mem.Sys,
+			NumGC:        mem.NumGC,
+			PauseTotalNs: mem.PauseTotalNs,
+			LastPauseNs:  mem.PauseNs[(mem.NumGC+255)%256],
+		},
+		Lock:      lock.GetStats(),
+		CodeCache: drivenadapters.GetSandboxCodeCacheStats(),
+		ProxyPool: proxy.GetPoolStats(),
+	}
+	// 连接池实现未必暴露 Stats，取不到时不返回 db 字段
+	if pool, ok := interface{}(db.NewDBPool()).(interface{ Stats() sql.DBStats }); ok {
+		s := pool.Stats()
+		stats.DB = &dbStats{
+			MaxOpenConnections: s.MaxOpenConnections,
+			OpenConnections:    s.OpenConnections,
+			InUse:              s.InUse,
+			Idle:               s.Idle,
+			WaitCount:          s.WaitCount,
+			WaitDurationMs:     s.WaitDuration.Milliseconds(),
+		}
+	}
+	c.JSON(http.StatusOK, stats)
+}
+
+// flush 清空进程内缓存（代理客户端池、沙箱代码缓存），供冷启动性能测试在迭代之间调用
+func (h *httpHealthHandler) flush(c *gin.Context) {
+	c.JSON(http.StatusOK, gin.H{
+		"proxy_clients":      proxy.NewClientPool().Flush(),
+		"sandbox_code_cache": drivenadapters.FlushSandboxCodeCache(),
+	})
+}
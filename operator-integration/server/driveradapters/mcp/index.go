@@ -42,6 +42,8 @@ type MCPPublicHandler interface {
 	QueryMCPServerMarketDetail(c *gin.Context)
 	// QueryMCPServerMarketBatch 批量查询MCP服务市场详情
 	QueryMCPServerMarketBatch(c *gin.Context)
+	// QueryMCPServerMarketBatchByIDs 批量查询MCP服务市场详情（请求体传参）
+	QueryMCPServerMarketBatchByIDs(c *gin.Context)
 
 	// HandleStreamingHttp 基于HTTP分块传输的流式处理
 	HandleStreamingHttp(c *gin.Context)
@@ -118,3 +118,46 @@ func (h *mcpHandle) QueryMCPServerMarketBatch(c *gin.Context) {
 	}
 	rest.ReplyOK(c, http.StatusOK, result)
 }
+
+// QueryMCPServerMarketBatchByIDs 批量查询MCP服务市场详情（请求体传参）
+func (h *mcpHandle) QueryMCPServerMarketBatchByIDs(c *gin.Context) {
+	var err error
+	ctx := c.Request.Context()
+
+	req := &interfaces.MCPServerReleaseBatchQueryRequest{}
+
+	if err = c.ShouldBindHeader(req); err != nil {
+		err = errors.DefaultHTTPError(ctx, http.StatusBadRequest, err.Error())
+		rest.ReplyError(c, err)
+		return
+	}
+
+	if err = c.ShouldBindQuery(req); err != nil {
+		err = errors.DefaultHTTPError(ctx, http.StatusBadRequest, err.Error())
+		rest.ReplyError(c, err)
+		return
+	}
+
+	if err = c.ShouldBindJSON(req); err != nil {
+		err = errors.DefaultHTTPError(ctx, http.StatusBadRequest, err.Error())
+		rest.ReplyError(c, err)
+		return
+	}
+
+	err = validator.New().Struct(req)
+	if err != nil {
+		rest.ReplyError(c, err)
+		return
+	}
+
+	result, err := h.mcpService.QueryReleaseBatchByIDs(ctx, req)
+	if err != nil {
+		rest.ReplyError(c, err)
+		return
+	}
+	if req.Stream {
+		rest.ReplyNDJSON(c, result)
+		return
+	}
+	rest.ReplyOK(c, http.StatusOK, result)
+}
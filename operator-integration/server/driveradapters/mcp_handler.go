@@ -92,6 +92,8 @@ func (r *mcpRestHandler) RegisterPublic(engine *gin.RouterGroup) {
 	mcpGroup.GET("/market/list", middlewareBusinessDomain(true, false), r.MCPPublicHandler.QueryMCPServerMarketList)
 	// 批量查询MCP服务市场详情 GET /api/agent-operator-integration/v1/mcp/market/{mcp_ids}/{fields}
 	mcpGroup.GET("/market/batch/:mcp_ids/:fields", middlewareBusinessDomain(true, false), r.MCPPublicHandler.QueryMCPServerMarketBatch)
+	// 批量查询MCP服务市场详情（请求体传参，?stream=true 时以NDJSON返回） POST /api/agent-operator-integration/v1/mcp/market/batch
+	mcpGroup.POST("/market/batch", middlewareBusinessDomain(true, false), r.MCPPublicHandler.QueryMCPServerMarketBatchByIDs)
 	mcpGroup.GET("/market/:mcp_id", r.MCPPublicHandler.QueryMCPServerMarketDetail)
 
 	// MCP 代理相关接口
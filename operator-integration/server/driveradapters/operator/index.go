@@ -35,6 +35,7 @@ type OperatorHandler interface {
 	/*算子市场查询操作*/
 	QueryOperatorMarketList(c *gin.Context)
 	QueryOperatorMarketDetail(c *gin.Context)
+	QueryOperatorMarketBatch(c *gin.Context)
 
 	/*内部算子注册*/
 	RegisterInternalOperator(c *gin.Context)
@@ -74,3 +74,41 @@ func (op *operatorHandle) QueryOperatorMarketDetail(c *gin.Context) {
 	}
 	rest.ReplyOK(c, http.StatusOK, resp)
 }
+
+// QueryOperatorMarketBatch 算子市场批量详情（请求体传参）
+func (op *operatorHandle) QueryOperatorMarketBatch(c *gin.Context) {
+	req := &interfaces.OperatorMarketBatchReq{}
+	var err error
+	if err = c.ShouldBindHeader(req); err != nil {
+		err = errors.DefaultHTTPError(c, http.StatusBadRequest, err.Error())
+		rest.ReplyError(c, err)
+		return
+	}
+	err = c.ShouldBindQuery(req)
+	if err != nil {
+		err = errors.DefaultHTTPError(c.Request.Context(), http.StatusBadRequest, err.Error())
+		rest.ReplyError(c, err)
+		return
+	}
+	err = c.ShouldBindJSON(req)
+	if err != nil {
+		err = errors.DefaultHTTPError(c.Request.Context(), http.StatusBadRequest, err.Error())
+		rest.ReplyError(c, err)
+		return
+	}
+	err = validator.New().Struct(req)
+	if err != nil {
+		rest.ReplyError(c, err)
+		return
+	}
+	resp, err := op.OperatorManager.QueryOperatorMarketBatch(c.Request.Context(), req)
+	if err != nil {
+		rest.ReplyError(c, err)
+		return
+	}
+	if req.Stream {
+		rest.ReplyNDJSON(c, resp)
+		return
+	}
+	rest.ReplyOK(c, http.StatusOK, resp)
+}
@@ -70,6 +70,8 @@ func (o *operatorRestHandler) RegisterPrivate(engine *gin.RouterGroup) {
 	engine.GET("/operator/market", middlewareBusinessDomain(true, false), o.OperatorHandler.QueryOperatorMarketList)
 	// GET /api/agent-operator-integration/internal-v1/operator/market/:operator_id 在算子市场查看详情
 	engine.GET("/operator/market/:operator_id", o.OperatorHandler.QueryOperatorMarketDetail)
+	// POST /api/agent-operator-integration/internal-v1/operator/market/batch 按请求体中的ID列表批量获取算子市场详情
+	engine.POST("/operator/market/batch", o.OperatorHandler.QueryOperatorMarketBatch)
 
 	/*内置算子管理*/
 	// POST /api/agent-operator-integration/internal-v1/operator/intcomp 注册(更新)内置算子
@@ -117,6 +119,8 @@ func (o *operatorRestHandler) RegisterPublic(engine *gin.RouterGroup) {
 	engine.GET("/operator/market", middlewareBusinessDomain(true, false), o.OperatorHandler.QueryOperatorMarketList)
 	// GET /api/agent-operator-integration/v1/operator/market/:operator_id 在算子市场查看详情
 	engine.GET("/operator/market/:operator_id", middlewareBusinessDomain(true, false), o.OperatorHandler.QueryOperatorMarketDetail)
+	// POST /api/agent-operator-integration/v1/operator/market/batch 按请求体中的ID列表批量获取算子市场详情
+	engine.POST("/operator/market/batch", middlewareBusinessDomain(true, false), o.OperatorHandler.QueryOperatorMarketBatch)
 
 	/*内置算子管理*/
 	// POST /api/agent-operator-integration/v1/operator/intcomp
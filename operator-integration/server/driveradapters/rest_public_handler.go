@@ -54,6 +54,7 @@ func (r *restPublicHandler) RegisterRouter(engine *gin.RouterGroup) {
 	engine.POST("/impex/import/:type", middlewareBusinessDomain(true, false), r.ImpexHandler.Import)
 	// 函数执行
 	engine.POST("/function/execute", middlewareBusinessDomain(true, false), r.UnifiedProxyHandler.FunctionExecute)
+	engine.POST("/function/execute/batch", middlewareBusinessDomain(true, false), r.UnifiedProxyHandler.FunctionExecuteBatch)
 	// 获取Python模板
 	engine.GET("/template/:template_type", middlewareBusinessDomain(true, false), r.TemplateHandler.GetTemplate)
 	// AI辅助生成
@@ -40,6 +40,8 @@ type ToolBoxHandler interface {
 	CreateInternalToolBox(c *gin.Context)
 	// 查询工具箱信息
 	GetReleaseToolBoxInfo(c *gin.Context)
+	// 批量查询工具箱信息（请求体传参）
+	BatchGetReleaseToolBoxInfo(c *gin.Context)
 
 	/*工具箱市场*/
 	QueryMarketToolBoxPage(c *gin.Context)
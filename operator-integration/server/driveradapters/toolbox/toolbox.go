@@ -2,7 +2,9 @@ package toolbox
 
 import (
 	"net/http"
+	"time"
 
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/common"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/errors"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/rest"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
@@ -605,7 +607,17 @@ func (h *toolBoxHandler) ExecuteTool(c *gin.Context) {
 		rest.ReplyError(c, err)
 		return
 	}
-	resp, err := h.ToolService.ExecuteTool(c.Request.Context(), req)
+	// 以 Server-Timing 响应头返回权限校验、工具解析与代理转发的耗时
+	ctx, timing := common.SetServerTimingToCtx(c.Request.Context())
+	start := time.Now()
+	resp, err := h.ToolService.ExecuteTool(ctx, req)
+	timing.Since("total", start)
+	if c.Writer.Written() {
+		// 流式模式下代理转发时已发出响应头并写入响应体（分块传输），改以 HTTP trailer 在响应体之后返回
+		c.Writer.Header().Set(http.TrailerPrefix+"Server-Timing", timing.Header())
+	} else {
+		c.Header("Server-Timing", timing.Header())
+	}
 	rest.ReplyWithExecutionMode(c, resp, err)
 }
 
@@ -664,3 +676,41 @@ func (h *toolBoxHandler) GetReleaseToolBoxInfo(c *gin.Context) {
 	}
 	rest.ReplyOK(c, http.StatusOK, resp)
 }
+
+// BatchGetReleaseToolBoxInfo 批量获取已发布工具箱信息（请求体传参）
+func (h *toolBoxHandler) BatchGetReleaseToolBoxInfo(c *gin.Context) {
+	req := &interfaces.BatchGetReleaseToolBoxInfoReq{}
+	err := c.ShouldBindHeader(req)
+	if err != nil {
+		err = errors.DefaultHTTPError(c.Request.Context(), http.StatusBadRequest, err.Error())
+		rest.ReplyError(c, err)
+		return
+	}
+	err = c.ShouldBindQuery(req)
+	if err != nil {
+		err = errors.DefaultHTTPError(c.Request.Context(), http.StatusBadRequest, err.Error())
+		rest.ReplyError(c, err)
+		return
+	}
+	err = c.ShouldBindJSON(req)
+	if err != nil {
+		err = errors.DefaultHTTPError(c.Request.Context(), http.StatusBadRequest, err.Error())
+		rest.ReplyError(c, err)
+		return
+	}
+	err = validator.New().Struct(req)
+	if err != nil {
+		rest.ReplyError(c, err)
+		return
+	}
+	resp, err := h.ToolService.BatchGetReleaseToolBoxInfo(c.Request.Context(), req)
+	if err != nil {
+		rest.ReplyError(c, err)
+		return
+	}
+	if req.Stream {
+		rest.ReplyNDJSON(c, resp)
+		return
+	}
+	rest.ReplyOK(c, http.StatusOK, resp)
+}
@@ -79,6 +79,8 @@ func (r *toolboxRestHandler) RegisterPublic(engine *gin.RouterGroup) {
 	engine.POST("/tool-box/intcomp", middlewareBusinessDomain(true, false), r.ToolBoxHandler.CreateInternalToolBox)
 	// 批量获取已发布工具箱信息
 	engine.GET("/tool-box/market/:box_id/:fields", r.ToolBoxHandler.GetReleaseToolBoxInfo)
+	// 批量获取已发布工具箱信息（请求体传参，?stream=true 时以NDJSON返回）
+	engine.POST("/tool-box/market/batch", r.ToolBoxHandler.BatchGetReleaseToolBoxInfo)
 
 	/*工具箱市场界面*/
 	engine.GET("/tool-box/market", middlewareBusinessDomain(true, false), r.ToolBoxHandler.QueryMarketToolBoxPage)
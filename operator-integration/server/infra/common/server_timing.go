@@ -0,0 +1,65 @@
+package common
+
+import (
+	"context"
+	"fmt"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
+)
+
+// ServerTiming 记录一次请求在服务端各阶段的耗时，以 Server-Timing 响应头返回
+type ServerTiming struct {
+	mu      sync.Mutex
+	entries []serverTimingEntry
+}
+
+type serverTimingEntry struct {
+	name     string
+	duration time.Duration
+}
+
+// SetServerTimingToCtx 在context中开始记录分段耗时
+func SetServerTimingToCtx(ctx context.Context) (context.Context, *ServerTiming) {
+	timing := &ServerTiming{}
+	return context.WithValue(ctx, interfaces.KeyServerTiming, timing), timing
+}
+
+// GetServerTimingFromCtx 从context中获取分段耗时记录，未开启时返回 nil，nil 上的记录操作不生效
+func GetServerTimingFromCtx(ctx context.Context) *ServerTiming {
+	timing, _ := ctx.Value(interfaces.KeyServerTiming).(*ServerTiming)
+	return timing
+}
+
+// Since 记录从 start 到现在的耗时，同名阶段累加
+func (t *ServerTiming) Since(name string, start time.Time) {
+	if t == nil {
+		return
+	}
+	duration := time.Since(start)
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	for i := range t.entries {
+		if t.entries[i].name == name {
+			t.entries[i].duration += duration
+			return
+		}
+	}
+	t.entries = append(t.entries, serverTimingEntry{name: name, duration: duration})
+}
+
+// Header 格式化为 Server-Timing 响应头，如 "auth;dur=1.20, upstream;dur=35.01"，单位：毫秒
+func (t *ServerTiming) Header() string {
+	if t == nil {
+		return ""
+	}
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	parts := make([]string, 0, len(t.entries))
+	for _, e := range t.entries {
+		parts = append(parts, fmt.Sprintf("%s;dur=%.2f", e.name, float64(e.duration.Microseconds())/1000)) //nolint:mnd
+	}
+	return strings.Join(parts, ", ")
+}
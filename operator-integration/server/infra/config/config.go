@@ -48,6 +48,7 @@ type Config struct {
 	FlowAutomation           PrivateBaseConfig   `yaml:"flow-automation"`
 	BusinessDomainManagement PrivateBaseConfig   `yaml:"business-system-service"`
 	SandboxRuntime           PrivateBaseConfig   `yaml:"sandbox-runtime"`
+	SandboxCodeCache         CodeCacheConfig     `yaml:"sandbox_code_cache"`
 	MFModelAPI               PrivateBaseConfig   `yaml:"mf-model-api"`
 	MFModelManager           PrivateBaseConfig   `yaml:"mf-model-manager"`
 	AIGenerationConfig       AIGenerationConfig  `yaml:"ai_generation_config"`
@@ -119,6 +120,17 @@ type ProxyModuleConfig struct {
 	// 代理池配置
 	MaxClients     int   `yaml:"max_clients" default:"50"`      // 最大客户端连接数
 	ClientLifetime int64 `yaml:"client_lifetime" default:"300"` // 单位: 秒
+	// 上游连接配置，HostTransports 按上游 host:port（或 host）覆盖 Transport
+	Transport      ProxyTransportConfig            `yaml:"transport"`
+	HostTransports map[string]ProxyTransportConfig `yaml:"host_transports"`
+}
+
+// ProxyTransportConfig 代理到上游的连接复用配置，为 0 时使用默认值
+type ProxyTransportConfig struct {
+	MaxIdleConns        int  `yaml:"max_idle_conns"`          // 所有上游的最大空闲连接数，默认100
+	MaxIdleConnsPerHost int  `yaml:"max_idle_conns_per_host"` // 单个上游的最大空闲连接数，默认100
+	IdleConnTimeout     int  `yaml:"idle_conn_timeout"`       // 空闲连接超时，单位: 秒，默认90
+	HTTP2               bool `yaml:"http2"`                   // 是否与 HTTPS 上游协商 HTTP/2
 }
 
 // OperatorConfig 算子配置
@@ -133,6 +145,12 @@ type MCPConfig struct {
 	ConnTimeout int64 `yaml:"conn_timeout" default:"10"` // 单位: 秒
 }
 
+// CodeCacheConfig 沙箱代码缓存配置，需要沙箱支持按 code_hash 复用已编译的代码
+type CodeCacheConfig struct {
+	Enabled    bool `yaml:"enabled"`                    // 是否启用，默认关闭
+	MaxEntries int  `yaml:"max_entries" default:"1000"` // 客户端记录的最大代码数
+}
+
 // CategoryConfig 算子分类配置
 type CategoryConfig struct {
 	InitSwitch bool `yaml:"init_switch"` // 是否初始化算子分类
@@ -3,6 +3,7 @@ package lock
 
 import (
 	"context"
+	"sync/atomic"
 	"time"
 
 	"github.com/redis/go-redis/v9"
@@ -14,6 +15,28 @@ const (
 	divisor            = 2
 )
 
+// Stats 分布式锁获取统计，用于定位锁竞争
+type Stats struct {
+	Attempts  int64 `json:"attempts"`   // 尝试获取次数
+	Acquired  int64 `json:"acquired"`   // 获取成功次数
+	Contended int64 `json:"contended"`  // 锁被其他实例持有次数
+	Errors    int64 `json:"errors"`     // Redis 访问失败次数
+	WaitNanos int64 `json:"wait_nanos"` // 获取锁累计耗时
+}
+
+var lockStats Stats
+
+// GetStats 获取进程内分布式锁统计快照
+func GetStats() Stats {
+	return Stats{
+		Attempts:  atomic.LoadInt64(&lockStats.Attempts),
+		Acquired:  atomic.LoadInt64(&lockStats.Acquired),
+		Contended: atomic.LoadInt64(&lockStats.Contended),
+		Errors:    atomic.LoadInt64(&lockStats.Errors),
+		WaitNanos: atomic.LoadInt64(&lockStats.WaitNanos),
+	}
+}
+
 // RedisLocker redis分布式锁
 type RedisLocker struct {
 	client *redis.Client
@@ -40,13 +63,19 @@ func NewRedisLocker(client *redis.Client, key, value string, expiry time.Duratio
 func (l *RedisLocker) Lock(ctx context.Context) (bool, error) {
 	ctx, cancel := context.WithTimeout(ctx, connectTimeout)
 	defer cancel()
+	start := time.Now()
+	atomic.AddInt64(&lockStats.Attempts, 1)
 	ok, err := l.acquireLock(ctx)
+	atomic.AddInt64(&lockStats.WaitNanos, int64(time.Since(start)))
 	if err != nil {
+		atomic.AddInt64(&lockStats.Errors, 1)
 		return false, err
 	}
 	if ok {
+		atomic.AddInt64(&lockStats.Acquired, 1)
 		return true, nil
 	}
+	atomic.AddInt64(&lockStats.Contended, 1)
 	return false, nil
 }
 
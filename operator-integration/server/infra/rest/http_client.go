@@ -29,6 +29,11 @@ type httpClient struct {
 type HTTPClientOptions struct {
 	TimeOut               int
 	ResponseHeaderTimeout int
+	// 连接复用配置，为 0 时使用默认值
+	MaxIdleConns        int
+	MaxIdleConnsPerHost int
+	IdleConnTimeout     int  // 单位: 秒
+	ForceAttemptHTTP2   bool // 自定义 TLS 配置时默认不协商 HTTP/2，需显式开启
 }
 
 // NewRawHTTPClient 创建原生HTTP客户端对象
@@ -57,22 +62,40 @@ func NewRawHTTPClientWithOptions(opts HTTPClientOptions) *http.Client {
 			return http.ErrUseLastResponse
 		},
 		// 自定义Transport
-		Transport: &http.Transport{
-			TLSClientConfig:       &tls.Config{InsecureSkipVerify: true},
-			MaxIdleConnsPerHost:   100,              //nolint:mnd
-			MaxIdleConns:          100,              //nolint:mnd
-			IdleConnTimeout:       90 * time.Second, //nolint:mnd
-			TLSHandshakeTimeout:   10 * time.Second, //nolint:mnd
-			ExpectContinueTimeout: 30 * time.Second, //nolint:mnd
-			DisableKeepAlives:     false,
-			ResponseHeaderTimeout: time.Duration(opts.ResponseHeaderTimeout) * time.Second,
-		},
-		Timeout: time.Duration(opts.TimeOut) * time.Second,
+		Transport: NewHTTPTransport(opts),
+		Timeout:   time.Duration(opts.TimeOut) * time.Second,
 	}
 
 	return rawClient
 }
 
+// NewHTTPTransport 根据配置创建Transport
+func NewHTTPTransport(opts HTTPClientOptions) *http.Transport {
+	maxIdleConns := 100        //nolint:mnd
+	maxIdleConnsPerHost := 100 //nolint:mnd
+	idleConnTimeout := 90      //nolint:mnd
+	if opts.MaxIdleConns > 0 {
+		maxIdleConns = opts.MaxIdleConns
+	}
+	if opts.MaxIdleConnsPerHost > 0 {
+		maxIdleConnsPerHost = opts.MaxIdleConnsPerHost
+	}
+	if opts.IdleConnTimeout > 0 {
+		idleConnTimeout = opts.IdleConnTimeout
+	}
+	return &http.Transport{
+		TLSClientConfig:       &tls.Config{InsecureSkipVerify: true},
+		MaxIdleConnsPerHost:   maxIdleConnsPerHost,
+		MaxIdleConns:          maxIdleConns,
+		IdleConnTimeout:       time.Duration(idleConnTimeout) * time.Second,
+		TLSHandshakeTimeout:   10 * time.Second, //nolint:mnd
+		ExpectContinueTimeout: 30 * time.Second, //nolint:mnd
+		DisableKeepAlives:     false,
+		ForceAttemptHTTP2:     opts.ForceAttemptHTTP2,
+		ResponseHeaderTimeout: time.Duration(opts.ResponseHeaderTimeout) * time.Second,
+	}
+}
+
 func NewHTTPClientWithRawClient(rawClient *http.Client) *httpClient {
 	client := &httpClient{
 		client: rawClient,
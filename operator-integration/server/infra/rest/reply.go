@@ -19,8 +19,11 @@ import (
 )
 
 const (
-	ContentTypeKey  = "Content-Type"
-	ContentTypeJSON = "application/json"
+	ContentTypeKey    = "Content-Type"
+	ContentTypeJSON   = "application/json"
+	ContentTypeNDJSON = "application/x-ndjson"
+
+	ndjsonFlushSize = 100 // NDJSON每写入100行刷新一次
 )
 
 // ReplyOK 响应成功
@@ -44,6 +47,38 @@ func ReplyOK(c *gin.Context, statusCode int, body interface{}) {
 	c.String(statusCode, bodyStr)
 }
 
+// ReplyNDJSON 以NDJSON格式逐行响应列表，每行一个JSON对象，客户端可边接收边解析
+func ReplyNDJSON[T any](c *gin.Context, items []T) {
+	StartNDJSON(c)
+	_ = WriteNDJSON(c, items)
+}
+
+// StartNDJSON 设置NDJSON响应头，之后可多次调用 WriteNDJSON 边生成边输出
+func StartNDJSON(c *gin.Context) {
+	c.Writer.Header().Set(ContentTypeKey, ContentTypeNDJSON)
+	c.Status(http.StatusOK)
+}
+
+// WriteNDJSON 逐行写入一批对象并刷新，返回错误表示序列化失败或客户端已断开，调用方应停止输出
+func WriteNDJSON[T any](c *gin.Context, items []T) error {
+	for i, item := range items {
+		line, err := sonic.Marshal(item)
+		if err != nil {
+			// 响应头已发送，只能记录错误并中断输出
+			logger.DefaultLogger().Errorf("marshal ndjson line error: %v", err)
+			return err
+		}
+		if _, err = c.Writer.Write(append(line, '\n')); err != nil {
+			return err // 客户端已断开
+		}
+		if (i+1)%ndjsonFlushSize == 0 {
+			c.Writer.Flush()
+		}
+	}
+	c.Writer.Flush()
+	return nil
+}
+
 // ReplyError 响应错误
 func ReplyError(c *gin.Context, err error) {
 	if err != nil {
@@ -0,0 +1,68 @@
+package rest
+
+import (
+	"bufio"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+
+	"github.com/gin-gonic/gin"
+	. "github.com/smartystreets/goconvey/convey"
+)
+
+type ndjsonItem struct {
+	Index int    `json:"index"`
+	Name  string `json:"name"`
+}
+
+func newTestContext() (*gin.Context, *httptest.ResponseRecorder) {
+	gin.SetMode(gin.TestMode)
+	w := httptest.NewRecorder()
+	c, _ := gin.CreateTestContext(w)
+	c.Request = httptest.NewRequest(http.MethodPost, "/batch", nil)
+	return c, w
+}
+
+func TestReplyNDJSON(t *testing.T) {
+	Convey("TestReplyNDJSON: 以NDJSON逐行响应列表", t, func() {
+		Convey("每个元素一行，行数超过刷新间隔时完整输出", func() {
+			c, w := newTestContext()
+			items := make([]*ndjsonItem, ndjsonFlushSize*2+5)
+			for i := range items {
+				items[i] = &ndjsonItem{Index: i, Name: "名称"}
+			}
+			ReplyNDJSON(c, items)
+			So(w.Code, ShouldEqual, http.StatusOK)
+			So(w.Header().Get(ContentTypeKey), ShouldEqual, ContentTypeNDJSON)
+			So(w.Flushed, ShouldBeTrue)
+			scanner := bufio.NewScanner(strings.NewReader(w.Body.String()))
+			index := 0
+			for scanner.Scan() {
+				item := &ndjsonItem{}
+				So(json.Unmarshal(scanner.Bytes(), item), ShouldBeNil)
+				So(item.Index, ShouldEqual, index)
+				So(item.Name, ShouldEqual, "名称")
+				index++
+			}
+			So(index, ShouldEqual, len(items))
+		})
+		Convey("空列表返回空响应体", func() {
+			c, w := newTestContext()
+			ReplyNDJSON(c, []*ndjsonItem{})
+			So(w.Code, ShouldEqual, http.StatusOK)
+			So(w.Header().Get(ContentTypeKey), ShouldEqual, ContentTypeNDJSON)
+			So(w.Body.Len(), ShouldEqual, 0)
+		})
+		Convey("多次写入按顺序追加", func() {
+			c, w := newTestContext()
+			StartNDJSON(c)
+			So(WriteNDJSON(c, []*ndjsonItem{{Index: 0}}), ShouldBeNil)
+			So(WriteNDJSON(c, []*ndjsonItem{{Index: 1}, {Index: 2}}), ShouldBeNil)
+			lines := strings.Split(strings.TrimSuffix(w.Body.String(), "\n"), "\n")
+			So(len(lines), ShouldEqual, 3)
+			So(lines[2], ShouldEqual, `{"index":2,"name":""}`)
+		})
+	})
+}
@@ -546,9 +546,10 @@ type BusinessDomainManagement interface {
 
 // ExecuteCodeReq 执行代码请求
 type ExecuteCodeReq struct {
-	HandlerCode    string         `json:"handler_code" validate:"required"` // 执行代码
-	Event          map[string]any `json:"event" validate:"required"`        // 事件
-	ExecuteContext ExecuteContext `json:"context"`                          // 执行上下文
+	HandlerCode    string         `json:"handler_code,omitempty" validate:"required_without=CodeHash"` // 执行代码
+	CodeHash       string         `json:"code_hash,omitempty"`                                         // 代码的sha256，沙箱据此复用已编译的代码，命中时可不传执行代码
+	Event          map[string]any `json:"event" validate:"required"`                                   // 事件
+	ExecuteContext ExecuteContext `json:"context"`                                                     // 执行上下文
 }
 
 // ExecuteContext 执行上下文
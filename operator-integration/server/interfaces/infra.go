@@ -36,6 +36,7 @@ const (
 	KeyResponseWriter ContextKey = "response_writer" // 响应写入器
 	KeyExecutionMode  ContextKey = "execution_mode"  // 执行模式
 	KeyStreamingMode  ContextKey = "streaming_mode"  // 流式模式
+	KeyServerTiming   ContextKey = "server_timing"   // 服务端分段耗时
 	// KeyAccountAuthContext 账户认证上下文
 	KeyAccountAuthContext ContextKey = "account_auth_context"
 	// XBusinessDomain 业务域id
@@ -18,8 +18,9 @@ type LogModelOperator[T any] interface {
 }
 
 const (
-	DefaultBatchSize = 1000 // 默认批量大小为1000
-	MaxQuerySize     = 5000 // 最大查询数量为5000
+	DefaultBatchSize  = 1000  // 默认批量大小为1000
+	MaxQuerySize      = 5000  // 最大查询数量为5000
+	MaxBatchQuerySize = 10000 // 请求体批量查询单次最多ID数
 )
 
 // ResourceObjectType 资源对象类型
@@ -16,6 +16,8 @@ type ImportType string
 const (
 	ImportTypeUpsert ImportType = "upsert" // 更新或创建
 	ImportTypeCreate ImportType = "create" // 仅创建
+	// ImportTypeIncremental 增量导入：与 upsert 相同，但跳过内容与当前配置一致的组件
+	ImportTypeIncremental ImportType = "incremental"
 )
 
 // IComponentImpexConfig 组件导入导出配置接口
@@ -33,10 +35,10 @@ type ExportConfigReq struct {
 
 // ImportConfigReq 导入配置请求
 type ImportConfigReq struct {
-	BusinessDomainID string          `header:"x-business-domain" validate:"required"`              // 业务域ID
-	UserID           string          `header:"user_id" validate:"required"`                        // 用户ID
-	Type             ComponentType   `uri:"type" validate:"required,oneof=operator toolbox mcp"`   // 组件类型
-	Mode             ImportType      `form:"mode" default:"create" validate:"oneof=create upsert"` // 配置导入类型
+	BusinessDomainID string          `header:"x-business-domain" validate:"required"`                          // 业务域ID
+	UserID           string          `header:"user_id" validate:"required"`                                    // 用户ID
+	Type             ComponentType   `uri:"type" validate:"required,oneof=operator toolbox mcp"`               // 组件类型
+	Mode             ImportType      `form:"mode" default:"create" validate:"oneof=create upsert incremental"` // 配置导入类型
 	Data             json.RawMessage `form:"data" validate:"required"`
 }
 
@@ -78,7 +80,7 @@ type ExportReq struct {
 // ImportReq 导入请求
 type ImportReq[T any] struct {
 	UserID string     `header:"user_id" validate:"required"`
-	Mode   ImportType `json:"mode" validate:"required,oneof=upsert create"`
+	Mode   ImportType `json:"mode" validate:"required,oneof=upsert create incremental"`
 	Data   T          `json:"data" validate:"required"`
 }
 
@@ -237,6 +237,15 @@ type MCPServerReleaseBatchRequest struct {
 	Fields   string `uri:"fields" validate:"required"`  // 获取MCP信息字段名：（可任意组合，若获取多个，用逗号分隔）
 }
 
+// MCPServerReleaseBatchQueryRequest MCP Server发布批量详情请求（请求体传参，不受URL长度限制）
+type MCPServerReleaseBatchQueryRequest struct {
+	UserID   string   `header:"user_id"`                                 // 用户ID，内部使用
+	IsPublic bool     `header:"is_public"`                               // 是否为公共接口
+	MCPIDs   []string `json:"mcp_ids" validate:"required,dive,required"` // MCP Server ID列表
+	Fields   []string `json:"fields" validate:"required,dive,required"`  // 获取MCP信息字段名
+	Stream   bool     `form:"stream"`                                    // 是否以NDJSON流式返回
+}
+
 // MCPServerUpdateRequest MCP Server更新请求
 type MCPServerUpdateRequest struct {
 	UserID       string               `header:"user_id" validate:"required"`                                                           // 用户ID，内部使用
@@ -383,6 +392,8 @@ type IMCPReleaseService interface {
 	GetReleaseDetail(ctx context.Context, req *MCPServerReleaseDetailRequest) (*MCPServerReleaseDetailResponse, error)
 	// QueryReleaseBatch 批量获取MCP Server发布详情
 	QueryReleaseBatch(ctx context.Context, req *MCPServerReleaseBatchRequest) ([]map[string]any, error)
+	// QueryReleaseBatchByIDs 批量获取MCP Server发布详情（请求体传参）
+	QueryReleaseBatchByIDs(ctx context.Context, req *MCPServerReleaseBatchQueryRequest) ([]map[string]any, error)
 }
 
 // IMCPExecuteService MCP代理接口
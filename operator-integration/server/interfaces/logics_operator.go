@@ -183,6 +183,14 @@ type OperatorMarketDetailReq struct {
 	OperatorID string `uri:"operator_id" validate:"required"`
 }
 
+// OperatorMarketBatchReq 算子市场批量详情查询请求（请求体传参）
+type OperatorMarketBatchReq struct {
+	UserID      string   `header:"user_id"`                                      // 非必填
+	OperatorIDs []string `json:"operator_ids" validate:"required,dive,required"` // 算子ID列表
+	Fields      []string `json:"fields"`                                         // 返回字段，为空时返回全部字段
+	Stream      bool     `form:"stream"`                                         // 是否以NDJSON流式返回
+}
+
 // DebugOperatorReq 调试请求
 type DebugOperatorReq struct {
 	UserID            string `header:"user_id" validate:"required"` // 用户ID,内部使用
@@ -256,6 +264,8 @@ type OperatorManager interface {
 	QueryOperatorMarketList(ctx context.Context, req *PageQueryOperatorMarketReq) (*PageQueryResponse, error)
 	// QueryOperatorMarketDetail 算子市场详情查询
 	QueryOperatorMarketDetail(ctx context.Context, req *OperatorMarketDetailReq) (*OperatorDataInfo, error)
+	// QueryOperatorMarketBatch 算子市场批量详情查询
+	QueryOperatorMarketBatch(ctx context.Context, req *OperatorMarketBatchReq) ([]map[string]any, error)
 	// 注册内置算子
 	RegisterInternalOperator(ctx context.Context, req *RegisterInternalOperatorReq) (resp *OperatorRegisterResp, err error)
 	/*导入导出*/
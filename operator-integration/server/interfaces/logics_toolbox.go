@@ -366,6 +366,14 @@ type GetReleaseToolBoxInfoReq struct {
 	Fields string `uri:"fields" validate:"required"` // 字段
 }
 
+// BatchGetReleaseToolBoxInfoReq 批量获取工具箱信息请求（请求体传参，不受URL长度限制）
+type BatchGetReleaseToolBoxInfoReq struct {
+	UserID string   `header:"user_id"`                                 // 用户ID,内部使用
+	BoxIDs []string `json:"box_ids" validate:"required,dive,required"` // 工具箱ID列表
+	Fields []string `json:"fields" validate:"required,dive,required"`  // 字段
+	Stream bool     `form:"stream"`                                    // 是否以NDJSON流式返回
+}
+
 // GetReleaseToolBoxInfoResp 获取工具箱信息响应
 type GetReleaseToolBoxInfoResp struct {
 	MetadataType MetadataType `json:"metadata_type" validate:"required,oneof=openapi function"`
@@ -410,6 +418,7 @@ type IToolService interface {
 	// 算子转换成工具
 	ConvertOperatorToTool(ctx context.Context, req *ConvertOperatorToToolReq) (resp *ConvertOperatorToToolResp, err error)
 	GetReleaseToolBoxInfo(ctx context.Context, req *GetReleaseToolBoxInfoReq) (resp []*GetReleaseToolBoxInfoResp, err error)
+	BatchGetReleaseToolBoxInfo(ctx context.Context, req *BatchGetReleaseToolBoxInfoReq) (resp []*GetReleaseToolBoxInfoResp, err error)
 	// 内部接口
 	CreateInternalToolBox(ctx context.Context, req *CreateInternalToolBoxReq) (resp *CreateInternalToolBoxResp, err error)
 
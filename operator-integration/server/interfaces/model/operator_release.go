@@ -51,6 +51,8 @@ type IOperatorReleaseDB interface {
 	DeleteByOpID(ctx context.Context, tx *sql.Tx, opID string) error
 	// SelectByOpID 根据算子ID查询算子发布信息
 	SelectByOpID(ctx context.Context, opID string) (exist bool, releaseDB *OperatorReleaseDB, err error)
+	// SelectByOpIDs 根据算子ID列表批量查询算子发布信息
+	SelectByOpIDs(ctx context.Context, opIDs []string) (releaseList []*OperatorReleaseDB, err error)
 	// SelectByName 根据算子名称查询算子发布信息
 	SelectByName(ctx context.Context, tx *sql.Tx, name string) (exist bool, releaseDB *OperatorReleaseDB, err error)
 	// CountByWhereClause 根据条件查询算子发布信息数量
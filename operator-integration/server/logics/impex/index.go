@@ -5,9 +5,11 @@ import (
 	"context"
 	"net/http"
 	"sync"
+	"time"
 
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/dbaccess"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/drivenadapters"
+	icommon "github.com/kweaver-ai/operator-hub/operator-integration/server/infra/common"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/config"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/errors"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/validator"
@@ -84,6 +86,8 @@ func (m *componentImpexManager) ExportConfig(ctx context.Context, req *interface
 
 // ImportConfig 导入组件配置
 func (m *componentImpexManager) ImportConfig(ctx context.Context, importReq *interfaces.ImportConfigReq) (err error) {
+	timing := icommon.GetServerTimingFromCtx(ctx)
+	start := time.Now()
 	// 解析数据
 	data := &interfaces.ComponentImpexConfigModel{
 		Operator: &interfaces.OperatorImpexConfig{},
@@ -103,6 +107,8 @@ func (m *componentImpexManager) ImportConfig(ctx context.Context, importReq *int
 		err = errors.DefaultHTTPError(ctx, http.StatusBadRequest, "validate config failed")
 		return
 	}
+	timing.Since("parse", start)
+	start = time.Now()
 	// 检查资源新建权限
 	resourceType := convertResourceType(importReq.Type)
 	if resourceType == "" {
@@ -144,17 +150,24 @@ func (m *componentImpexManager) ImportConfig(ctx context.Context, importReq *int
 		err = errors.DefaultHTTPError(ctx, http.StatusBadRequest, "component type not support")
 		return
 	}
+	timing.Since("auth", start)
 	err = m.importConfigWithTx(ctx, importReq.Type, data, importReq.Mode, importReq.UserID)
 	if err != nil {
 		return
 	}
 	if data.Operator != nil && len(data.Operator.CompositeConfigs) > 0 {
-		// 导入依赖
+		// 导入依赖，组合算子流程不支持增量导入，按 upsert 处理
+		mode := importReq.Mode
+		if mode == interfaces.ImportTypeIncremental {
+			mode = interfaces.ImportTypeUpsert
+		}
 		req := &interfaces.FlowAutomationImportReq{
-			Mode:    string(importReq.Mode),
+			Mode:    string(mode),
 			Configs: data.Operator.CompositeConfigs,
 		}
+		start = time.Now()
 		err = m.FlowAutomation.Import(ctx, req, importReq.UserID)
+		timing.Since("composite", start)
 		if err != nil {
 			return
 		}
@@ -170,9 +183,11 @@ func (m *componentImpexManager) ImportConfig(ctx context.Context, importReq *int
 	return
 }
 
-// 事务导入
+// 事务导入，事务内导入耗时与提交耗时分别记为 Server-Timing 的 import、commit 阶段
 func (m *componentImpexManager) importConfigWithTx(ctx context.Context, compType interfaces.ComponentType,
 	data *interfaces.ComponentImpexConfigModel, mode interfaces.ImportType, userID string) (err error) {
+	timing := icommon.GetServerTimingFromCtx(ctx)
+	txStart := time.Now()
 	tx, err := m.DBTx.GetTx(ctx)
 	if err != nil {
 		m.Logger.WithContext(ctx).Errorf("get tx failed, err: %v", err)
@@ -180,12 +195,16 @@ func (m *componentImpexManager) importConfigWithTx(ctx context.Context, compType
 		return
 	}
 	defer func() {
+		start := time.Now()
 		if err != nil {
 			_ = tx.Rollback()
 		} else {
 			err = tx.Commit()
 		}
+		timing.Since("commit", start)
+		m.Logger.WithContext(ctx).Infof("import %s config in %s mode, tx duration: %v, err: %v", compType, mode, time.Since(txStart), err)
 	}()
+	defer timing.Since("import", time.Now())
 	switch compType {
 	case interfaces.ComponentTypeOperator:
 		err = m.OperatorMgr.Import(ctx, tx, mode, data.Operator, userID)
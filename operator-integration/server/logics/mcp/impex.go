@@ -5,8 +5,10 @@ import (
 	"database/sql"
 	"fmt"
 	"net/http"
+	"sort"
 	"time"
 
+	"github.com/creasty/defaults"
 	icommon "github.com/kweaver-ai/operator-hub/operator-integration/server/infra/common"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/errors"
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
@@ -34,7 +36,7 @@ func (s *mcpServiceImpl) Import(ctx context.Context, tx *sql.Tx, mode interfaces
 	if err != nil {
 		return
 	}
-	createMap, updateMap, depToolBoxMap, err := s.batchImportMcpMetadata(ctx, tx, data.MCP.Configs, waitUpdataMCPList, accessor)
+	createMap, updateMap, depToolBoxMap, err := s.batchImportMcpMetadata(ctx, tx, mode, data.MCP.Configs, waitUpdataMCPList, accessor)
 	if err != nil {
 		return
 	}
@@ -118,8 +120,8 @@ func (s *mcpServiceImpl) importPostProcess(ctx context.Context, createMCPMap, up
 	}
 }
 
-func (s *mcpServiceImpl) batchImportMcpMetadata(ctx context.Context, tx *sql.Tx, items []*interfaces.MCPServersImpexItem, waitUpdataMCPList []*model.MCPServerConfigDB,
-	accessor *interfaces.AuthAccessor) (createMCPMap, updateMCPMap map[string]*model.MCPServerConfigDB,
+func (s *mcpServiceImpl) batchImportMcpMetadata(ctx context.Context, tx *sql.Tx, mode interfaces.ImportType, items []*interfaces.MCPServersImpexItem,
+	waitUpdataMCPList []*model.MCPServerConfigDB, accessor *interfaces.AuthAccessor) (createMCPMap, updateMCPMap map[string]*model.MCPServerConfigDB,
 	depToolBoxMap map[string]bool, err error) {
 	// 收集需要新增的mcp
 	createMCPMap = map[string]*model.MCPServerConfigDB{}
@@ -139,9 +141,28 @@ func (s *mcpServiceImpl) batchImportMcpMetadata(ctx context.Context, tx *sql.Tx,
 		}
 		updateMCPMap[mcpDB.MCPID] = mcpDB
 	}
+	// 增量导入：内容未变化的MCP不再更新
+	unchangedMCPIDs := map[string]bool{}
+	if mode == interfaces.ImportTypeIncremental && len(waitUpdataMCPList) > 0 {
+		unchangedMCPIDs, err = s.unchangedMCPs(ctx, items, waitUpdataMCPList)
+		if err != nil {
+			return
+		}
+		s.logger.WithContext(ctx).Infof("[Import] incremental import, %d/%d mcp unchanged", len(unchangedMCPIDs), len(items))
+	}
 	// 检查是否存在依赖工具
 	depToolBoxMap = map[string]bool{}
 	for _, item := range items {
+		if unchangedMCPIDs[item.MCPID] {
+			delete(updateMCPMap, item.MCPID)
+			// 依赖的工具箱仍需增量导入
+			if item.CreationType == interfaces.MCPCreationTypeToolImported {
+				for _, tool := range item.MCPTools {
+					depToolBoxMap[tool.BoxID] = true
+				}
+			}
+			continue
+		}
 		var mcpTools []*model.MCPToolDB
 		if mcpDB, ok := updateMCPMap[item.MCPID]; ok {
 			mcpTools, err = s.importByUpsert(ctx, tx, mcpDB, item, accessor.ID)
@@ -159,6 +180,69 @@ func (s *mcpServiceImpl) batchImportMcpMetadata(ctx context.Context, tx *sql.Tx,
 	return
 }
 
+// unchangedMCPs 比较导入项与已有MCP当前导出内容的哈希，返回内容一致的MCP ID
+func (s *mcpServiceImpl) unchangedMCPs(ctx context.Context, items []*interfaces.MCPServersImpexItem,
+	mcpDBs []*model.MCPServerConfigDB) (unchangedMCPIDs map[string]bool, err error) {
+	current, _, err := s.batchGetExportMetadata(ctx, mcpDBs)
+	if err != nil {
+		return
+	}
+	currentHashes := map[string]string{}
+	for _, item := range current.Configs {
+		currentHashes[item.MCPID], err = mcpContentHash(item)
+		if err != nil {
+			s.logger.WithContext(ctx).Errorf("hash mcp %s failed, err: %v", item.MCPID, err)
+			err = errors.DefaultHTTPError(ctx, http.StatusInternalServerError, err)
+			return
+		}
+	}
+	unchangedMCPIDs = map[string]bool{}
+	for _, item := range items {
+		currentHash, ok := currentHashes[item.MCPID]
+		if !ok {
+			continue
+		}
+		var itemHash string
+		itemHash, err = mcpContentHash(item)
+		if err != nil {
+			s.logger.WithContext(ctx).Errorf("hash mcp %s failed, err: %v", item.MCPID, err)
+			err = errors.DefaultHTTPError(ctx, http.StatusInternalServerError, err)
+			return
+		}
+		if itemHash == currentHash {
+			unchangedMCPIDs[item.MCPID] = true
+		}
+	}
+	return
+}
+
+// mcpContentHash 计算MCP导入内容的哈希
+// 忽略导入时会重写的字段（版本、时间、用户、工具导入型MCP的内部地址与工具ID），工具按工具ID排序；哈希不一致时按 upsert 正常更新
+func mcpContentHash(item *interfaces.MCPServersImpexItem) (hash string, err error) {
+	content := &interfaces.MCPServersImpexItem{}
+	err = utils.AnyToObject(item, content)
+	if err != nil {
+		return
+	}
+	err = defaults.Set(content)
+	if err != nil {
+		return
+	}
+	content.Version = 0
+	content.IsInternal = false
+	content.CreateTime, content.UpdateTime = 0, 0
+	content.CreateUser, content.UpdateUser = "", ""
+	if content.CreationType == interfaces.MCPCreationTypeToolImported {
+		content.URL = ""
+	}
+	for _, tool := range content.MCPTools {
+		tool.MCPToolID = ""
+		tool.MCPVersion = 0
+	}
+	sort.Slice(content.MCPTools, func(i, j int) bool { return content.MCPTools[i].ToolID < content.MCPTools[j].ToolID })
+	return utils.ObjectSHA256Hash(content)
+}
+
 func (s *mcpServiceImpl) importPreCheck(ctx context.Context, mode interfaces.ImportType, items []*interfaces.MCPServersImpexItem) (mcpList []*model.MCPServerConfigDB, err error) {
 	// 收集mcpID、name 检查
 	mcpIDs := []string{}
@@ -0,0 +1,72 @@
+package mcp
+
+import (
+	"testing"
+	"time"
+
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
+	. "github.com/smartystreets/goconvey/convey"
+)
+
+func TestMCPContentHash(t *testing.T) {
+	Convey("TestMCPContentHash:增量导入内容哈希", t, func() {
+		newItem := func(creationType interfaces.MCPCreationType) *interfaces.MCPServersImpexItem {
+			return &interfaces.MCPServersImpexItem{
+				MCPCoreConfigInfo: interfaces.MCPCoreConfigInfo{
+					Mode: interfaces.MCPModeSSE,
+					URL:  "http://127.0.0.1:9000/sse",
+				},
+				MCPID:        "mcp_id_1",
+				Version:      1,
+				CreationType: creationType,
+				Name:         "mcp_a",
+				Description:  "mcp_desc_a",
+				Status:       interfaces.BizStatusPublished,
+				Source:       "custom",
+				MCPTools: []*interfaces.MCPToolItem{
+					{MCPToolID: "mcp_tool_id_1", MCPID: "mcp_id_1", MCPVersion: 1, BoxID: "box_id_1", BoxName: "box_a",
+						ToolID: "tool_id_1", Name: "tool_a", UseRule: "rule_a"},
+					{MCPToolID: "mcp_tool_id_2", MCPID: "mcp_id_1", MCPVersion: 1, BoxID: "box_id_1", BoxName: "box_a",
+						ToolID: "tool_id_2", Name: "tool_b"},
+				},
+			}
+		}
+		hash, err := mcpContentHash(newItem(interfaces.MCPCreationTypeToolImported))
+		So(err, ShouldBeNil)
+		Convey("忽略版本、时间、用户、内置标记、MCP工具ID及工具顺序", func() {
+			item := newItem(interfaces.MCPCreationTypeToolImported)
+			item.Version, item.IsInternal = 2, true
+			item.CreateTime, item.UpdateUser = time.Now().UnixNano(), "user_2"
+			for _, tool := range item.MCPTools {
+				tool.MCPToolID, tool.MCPVersion = tool.MCPToolID+"_new", 2
+			}
+			item.MCPTools[0], item.MCPTools[1] = item.MCPTools[1], item.MCPTools[0]
+			other, err := mcpContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldEqual, hash)
+		})
+		Convey("工具导入型MCP忽略内部地址", func() {
+			item := newItem(interfaces.MCPCreationTypeToolImported)
+			item.URL = "http://127.0.0.2:9000/sse"
+			other, err := mcpContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldEqual, hash)
+		})
+		Convey("自定义MCP地址变化", func() {
+			custom, err := mcpContentHash(newItem(interfaces.MCPCreationTypeCustom))
+			So(err, ShouldBeNil)
+			item := newItem(interfaces.MCPCreationTypeCustom)
+			item.URL = "http://127.0.0.2:9000/sse"
+			other, err := mcpContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldNotEqual, custom)
+		})
+		Convey("工具使用规则变化", func() {
+			item := newItem(interfaces.MCPCreationTypeToolImported)
+			item.MCPTools[0].UseRule = "rule_b"
+			other, err := mcpContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldNotEqual, hash)
+		})
+	})
+}
@@ -229,7 +229,24 @@ func (s *mcpServiceImpl) QueryReleaseBatch(ctx context.Context, req *interfaces.
 	defer o11y.EndSpan(ctx, err)
 	mcpIDs := strings.Split(req.MCPIDs, ",")
 	fields := strings.Split(req.Fields, ",")
+	return s.queryReleaseBatch(ctx, req.UserID, mcpIDs, fields, false)
+}
 
+// QueryReleaseBatchByIDs 按请求体中的ID列表批量查询MCP Server Release，返回全部有权限的结果
+func (s *mcpServiceImpl) QueryReleaseBatchByIDs(ctx context.Context, req *interfaces.MCPServerReleaseBatchQueryRequest) (mapData []map[string]any, err error) {
+	// 记录可观测
+	ctx, _ = o11y.StartInternalSpan(ctx)
+	defer o11y.EndSpan(ctx, err)
+	if len(req.MCPIDs) > interfaces.MaxBatchQuerySize {
+		err = infraerrors.DefaultHTTPError(ctx, http.StatusBadRequest,
+			fmt.Sprintf("too many mcp_ids: %d, max %d", len(req.MCPIDs), interfaces.MaxBatchQuerySize))
+		return
+	}
+	return s.queryReleaseBatch(ctx, req.UserID, req.MCPIDs, req.Fields, true)
+}
+
+// queryReleaseBatch 按ID分批执行IN查询，all为false时最多返回defaultPageSize条
+func (s *mcpServiceImpl) queryReleaseBatch(ctx context.Context, userID string, mcpIDs, fields []string, all bool) (mapData []map[string]any, err error) {
 	columns := []string{}
 	for _, field := range fields {
 		if slices.Contains(interfaces.MCPFields, field) {
@@ -246,14 +263,17 @@ func (s *mcpServiceImpl) QueryReleaseBatch(ctx context.Context, req *interfaces.
 	}
 
 	// 查询MCP Server配置列表
-	accessor, err := s.AuthService.GetAccessor(ctx, req.UserID)
+	accessor, err := s.AuthService.GetAccessor(ctx, userID)
 	if err != nil {
 		return
 	}
 	resp, err := auth.SelectListWithAuth(
-		ctx, defaultPage, defaultPageSize, false,
+		ctx, defaultPage, defaultPageSize, all,
 		func() ([]*model.MCPServerReleaseDB, error) {
-			return s.DBMCPServerRelease.SelectByMCPIDs(ctx, nil, mcpIDs, columns)
+			return utils.BatchQueryWithContext(ctx, mcpIDs, interfaces.DefaultBatchSize,
+				func(ctx context.Context, ids []string) ([]*model.MCPServerReleaseDB, error) {
+					return s.DBMCPServerRelease.SelectByMCPIDs(ctx, nil, ids, columns)
+				})
 		},
 		func() ([]string, error) {
 			return s.AuthService.ResourceListIDs(ctx, accessor, interfaces.AuthResourceTypeMCP, interfaces.AuthOperationTypePublicAccess)
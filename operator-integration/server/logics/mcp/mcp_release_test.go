@@ -0,0 +1,94 @@
+package mcp
+
+import (
+	"context"
+	"database/sql"
+	"errors"
+	"fmt"
+	"net/http"
+	"testing"
+
+	myErr "github.com/kweaver-ai/operator-hub/operator-integration/server/infra/errors"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/logger"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces/model"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/mocks"
+	. "github.com/smartystreets/goconvey/convey"
+	"go.uber.org/mock/gomock"
+)
+
+func TestQueryReleaseBatchByIDs(t *testing.T) {
+	ctrl := gomock.NewController(t)
+	defer ctrl.Finish()
+	mockDBMCPServerRelease := mocks.NewMockDBMCPServerRelease(ctrl)
+	mockAuthService := mocks.NewMockIAuthorizationService(ctrl)
+	mockUserMgnt := mocks.NewMockUserManagement(ctrl)
+	s := &mcpServiceImpl{
+		logger:             logger.DefaultLogger(),
+		DBMCPServerRelease: mockDBMCPServerRelease,
+		AuthService:        mockAuthService,
+		UserMgnt:           mockUserMgnt,
+	}
+	Convey("TestQueryReleaseBatchByIDs: 请求体传参批量查询MCP Server详情", t, func() {
+		ctx := context.Background()
+		accessor := &interfaces.AuthAccessor{}
+		mcpIDs := make([]string, 2500)
+		for i := range mcpIDs {
+			mcpIDs[i] = fmt.Sprintf("mcp_%d", i)
+		}
+		req := &interfaces.MCPServerReleaseBatchQueryRequest{
+			MCPIDs: mcpIDs,
+			Fields: []string{"name", "create_user"},
+		}
+		Convey("ID数量超过上限", func() {
+			req.MCPIDs = make([]string, interfaces.MaxBatchQuerySize+1)
+			_, err := s.QueryReleaseBatchByIDs(ctx, req)
+			So(err, ShouldNotBeNil)
+			httpErr := &myErr.HTTPError{}
+			So(errors.As(err, &httpErr), ShouldBeTrue)
+			So(httpErr.HTTPCode, ShouldEqual, http.StatusBadRequest)
+		})
+		Convey("字段不合法", func() {
+			req.Fields = []string{"invalid"}
+			_, err := s.QueryReleaseBatchByIDs(ctx, req)
+			So(err, ShouldNotBeNil)
+			httpErr := &myErr.HTTPError{}
+			So(errors.As(err, &httpErr), ShouldBeTrue)
+			So(httpErr.HTTPCode, ShouldEqual, http.StatusBadRequest)
+		})
+		Convey("查询发布记录失败（db）", func() {
+			mockAuthService.EXPECT().GetAccessor(gomock.Any(), gomock.Any()).Return(accessor, nil).Times(1)
+			mockDBMCPServerRelease.EXPECT().SelectByMCPIDs(gomock.Any(), gomock.Any(), gomock.Any(), gomock.Any()).
+				Return(nil, mocks.MockFuncErr("SelectByMCPIDs")).Times(1)
+			_, err := s.QueryReleaseBatchByIDs(ctx, req)
+			So(err, ShouldNotBeNil)
+		})
+		Convey("按批次执行IN查询，返回全部有权限的结果", func() {
+			var batches []int
+			mockAuthService.EXPECT().GetAccessor(gomock.Any(), gomock.Any()).Return(accessor, nil).Times(1)
+			mockDBMCPServerRelease.EXPECT().SelectByMCPIDs(gomock.Any(), gomock.Any(), gomock.Any(), gomock.Any()).
+				DoAndReturn(func(_ context.Context, _ *sql.Tx, ids, columns []string) ([]*model.MCPServerReleaseDB, error) {
+					batches = append(batches, len(ids))
+					So(columns, ShouldContain, "f_mcp_id")
+					list := make([]*model.MCPServerReleaseDB, len(ids))
+					for i, id := range ids {
+						list[i] = &model.MCPServerReleaseDB{MCPID: id, Name: "name_" + id, CreateUser: "user1"}
+					}
+					return list, nil
+				}).Times(3)
+			// 第一个MCP没有公开访问权限
+			mockAuthService.EXPECT().ResourceListIDs(gomock.Any(), gomock.Any(), gomock.Any(), interfaces.AuthOperationTypePublicAccess).
+				Return(mcpIDs[1:], nil).Times(1)
+			mockUserMgnt.EXPECT().GetUsersName(gomock.Any(), gomock.Any()).Return(map[string]string{"user1": "用户1"}, nil).Times(1)
+			data, err := s.QueryReleaseBatchByIDs(ctx, req)
+			So(err, ShouldBeNil)
+			So(batches, ShouldResemble, []int{interfaces.DefaultBatchSize, interfaces.DefaultBatchSize, 500})
+			// 超过单页条数时仍返回全部结果
+			So(len(data), ShouldEqual, len(mcpIDs)-1)
+			So(data[0]["mcp_id"], ShouldEqual, mcpIDs[1])
+			So(data[0]["name"], ShouldEqual, "name_"+mcpIDs[1])
+			So(data[0]["create_user"], ShouldEqual, "用户1")
+			So(data[0], ShouldNotContainKey, "description")
+		})
+	})
+}
@@ -67,7 +67,7 @@ func (m *operatorManager) Import(ctx context.Context, tx *sql.Tx, mode interface
 		return
 	}
 	// 导入算子元数据
-	createMap, updateMap, err := m.batchImportOperatorMetadata(ctx, tx, data.Configs, operatorList, accessor)
+	createMap, updateMap, err := m.batchImportOperatorMetadata(ctx, tx, mode, data.Configs, operatorList, accessor)
 	if err != nil {
 		return
 	}
@@ -174,8 +174,8 @@ func (m *operatorManager) importPreCheck(ctx context.Context, mode interfaces.Im
 }
 
 // 批量导入算子元数据
-func (m *operatorManager) batchImportOperatorMetadata(ctx context.Context, tx *sql.Tx, items []*interfaces.OperatorImpexItem, needUpdateOperatorList []*model.OperatorRegisterDB,
-	accessor *interfaces.AuthAccessor) (createMap, updateMap map[string]*model.OperatorRegisterDB, err error) {
+func (m *operatorManager) batchImportOperatorMetadata(ctx context.Context, tx *sql.Tx, mode interfaces.ImportType, items []*interfaces.OperatorImpexItem,
+	needUpdateOperatorList []*model.OperatorRegisterDB, accessor *interfaces.AuthAccessor) (createMap, updateMap map[string]*model.OperatorRegisterDB, err error) {
 	// 需要新增的算子列表
 	createMap = map[string]*model.OperatorRegisterDB{}
 	// 需要更新的算子列表
@@ -194,7 +194,20 @@ func (m *operatorManager) batchImportOperatorMetadata(ctx context.Context, tx *s
 		}
 		updateMap[operatorDB.OperatorID] = operatorDB
 	}
+	// 增量导入：内容未变化的算子不再更新
+	unchangedOperatorIDs := map[string]bool{}
+	if mode == interfaces.ImportTypeIncremental && len(needUpdateOperatorList) > 0 {
+		unchangedOperatorIDs, err = m.unchangedOperators(ctx, items, needUpdateOperatorList)
+		if err != nil {
+			return
+		}
+		m.Logger.WithContext(ctx).Infof("[Import] incremental import, %d/%d operators unchanged", len(unchangedOperatorIDs), len(items))
+	}
 	for _, operatorItem := range items {
+		if unchangedOperatorIDs[operatorItem.OperatorID] {
+			delete(updateMap, operatorItem.OperatorID)
+			continue
+		}
 		// 参数预备检查
 		var newOperatorDB *model.OperatorRegisterDB
 		var newMetadataDB interfaces.IMetadataDB
@@ -230,6 +243,66 @@ func (m *operatorManager) batchImportOperatorMetadata(ctx context.Context, tx *s
 	return
 }
 
+// unchangedOperators 比较导入项与已有算子当前导出内容的哈希，返回内容一致的算子ID
+func (m *operatorManager) unchangedOperators(ctx context.Context, items []*interfaces.OperatorImpexItem,
+	operatorDBs []*model.OperatorRegisterDB) (unchangedOperatorIDs map[string]bool, err error) {
+	current, err := m.batchGetOperatorInfo(ctx, operatorDBs)
+	if err != nil {
+		return
+	}
+	currentHashes := map[string]string{}
+	for _, item := range current {
+		currentHashes[item.OperatorID], err = operatorContentHash(item)
+		if err != nil {
+			m.Logger.WithContext(ctx).Errorf("hash operator %s failed, err: %v", item.OperatorID, err)
+			err = errors.DefaultHTTPError(ctx, http.StatusInternalServerError, err.Error())
+			return
+		}
+	}
+	unchangedOperatorIDs = map[string]bool{}
+	for _, item := range items {
+		currentHash, ok := currentHashes[item.OperatorID]
+		if !ok {
+			continue
+		}
+		var itemHash string
+		itemHash, err = operatorContentHash(item)
+		if err != nil {
+			m.Logger.WithContext(ctx).Errorf("hash operator %s failed, err: %v", item.OperatorID, err)
+			err = errors.DefaultHTTPError(ctx, http.StatusInternalServerError, err.Error())
+			return
+		}
+		if itemHash == currentHash {
+			unchangedOperatorIDs[item.OperatorID] = true
+		}
+	}
+	return
+}
+
+// operatorContentHash 计算算子导入内容的哈希
+// 忽略导入时会重写的字段（时间、用户、元数据版本）；哈希不一致时按 upsert 正常更新
+func operatorContentHash(item *interfaces.OperatorImpexItem) (hash string, err error) {
+	content := &interfaces.OperatorImpexItem{}
+	err = utils.AnyToObject(item, content)
+	if err != nil {
+		return
+	}
+	err = defaults.Set(content)
+	if err != nil {
+		return
+	}
+	content.Version = ""
+	content.IsInternal = false
+	content.CreateTime, content.UpdateTime = 0, 0
+	content.CreateUser, content.UpdateUser = "", ""
+	if content.Metadata != nil {
+		content.Metadata.Version = ""
+		content.Metadata.CreateTime, content.Metadata.UpdateTime = 0, 0
+		content.Metadata.CreateUser, content.Metadata.UpdateUser = "", ""
+	}
+	return utils.ObjectSHA256Hash(content)
+}
+
 // 添加算子配置
 func (m *operatorManager) addOperatorConfig(ctx context.Context, tx *sql.Tx, operatorDB *model.OperatorRegisterDB, metadataDB interfaces.IMetadataDB) (err error) {
 	metadataDB.SetVersion(uuid.New().String())
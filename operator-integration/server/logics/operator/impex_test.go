@@ -566,3 +566,52 @@ func TestExport(t *testing.T) {
 		})
 	})
 }
+
+func TestOperatorContentHash(t *testing.T) {
+	Convey("TestOperatorContentHash:增量导入内容哈希", t, func() {
+		newItem := func() *interfaces.OperatorImpexItem {
+			return &interfaces.OperatorImpexItem{
+				OperatorID:   "operator_id_1",
+				OperatorName: "operator_a",
+				Version:      "version_1",
+				Status:       interfaces.BizStatusPublished,
+				MetadataType: interfaces.MetadataTypeAPI,
+				Metadata: &interfaces.MetadataInfo{
+					Version: "version_1",
+					Summary: "summary_a",
+					Path:    "/a",
+					Method:  http.MethodGet,
+				},
+				OperatorInfo: &interfaces.OperatorInfo{
+					Type:          "basic",
+					ExecutionMode: "sync",
+				},
+			}
+		}
+		hash, err := operatorContentHash(newItem())
+		So(err, ShouldBeNil)
+		Convey("忽略时间、用户、内置标记及算子与元数据版本", func() {
+			item := newItem()
+			item.CreateTime, item.UpdateUser, item.IsInternal = time.Now().UnixNano(), "user_2", true
+			item.Version, item.Metadata.Version = "version_2", "version_2"
+			item.Metadata.UpdateTime = time.Now().UnixNano()
+			other, err := operatorContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldEqual, hash)
+		})
+		Convey("元数据内容变化", func() {
+			item := newItem()
+			item.Metadata.Path = "/b"
+			other, err := operatorContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldNotEqual, hash)
+		})
+		Convey("算子信息变化", func() {
+			item := newItem()
+			item.OperatorInfo.ExecutionMode = "async"
+			other, err := operatorContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldNotEqual, hash)
+		})
+	})
+}
@@ -2,6 +2,7 @@ package operator
 
 import (
 	"context"
+	"fmt"
 	"net/http"
 	"strings"
 
@@ -98,6 +99,76 @@ func (m *operatorManager) QueryOperatorMarketList(ctx context.Context, req *inte
 	if len(releaseList) == 0 {
 		return
 	}
+	infos, err := m.assembleReleaseList(ctx, releaseList)
+	if err != nil {
+		return
+	}
+	for _, info := range infos {
+		info.BusinessDomainID = resourceToBdMap[info.OperatorID]
+	}
+	result.Data = infos
+	return
+}
+
+// QueryOperatorMarketBatch 按ID列表批量查询算子市场详情，ID分批执行IN查询
+func (m *operatorManager) QueryOperatorMarketBatch(ctx context.Context, req *interfaces.OperatorMarketBatchReq) (
+	result []map[string]any, err error) {
+	// 记录可观测
+	ctx, _ = o11y.StartInternalSpan(ctx)
+	defer o11y.EndSpan(ctx, err)
+	if len(req.OperatorIDs) > interfaces.MaxBatchQuerySize {
+		err = errors.DefaultHTTPError(ctx, http.StatusBadRequest,
+			fmt.Sprintf("too many operator_ids: %d, max %d", len(req.OperatorIDs), interfaces.MaxBatchQuerySize))
+		return
+	}
+	queryReleaseList := func() ([]*model.OperatorReleaseDB, error) {
+		releaseList, qErr := utils.BatchQueryWithContext(ctx, req.OperatorIDs, interfaces.DefaultBatchSize, m.OpReleaseDB.SelectByOpIDs)
+		if qErr != nil {
+			m.Logger.WithContext(ctx).Errorf("select operator release list error: %v", qErr)
+			return nil, errors.DefaultHTTPError(ctx, http.StatusInternalServerError, "select operator release list error")
+		}
+		return releaseList, nil
+	}
+	var releaseList []*model.OperatorReleaseDB
+	if common.IsPublicAPIFromCtx(ctx) {
+		// 与详情接口一致，外部接口仅返回有公开访问权限的算子
+		var accessor *interfaces.AuthAccessor
+		accessor, err = m.AuthService.GetAccessor(ctx, req.UserID)
+		if err != nil {
+			return
+		}
+		var authResp *interfaces.QueryResponse[model.OperatorReleaseDB]
+		authResp, err = auth.SelectListWithAuth(ctx, 0, 0, true, queryReleaseList, func() ([]string, error) {
+			return m.AuthService.ResourceListIDs(ctx, accessor, interfaces.AuthResourceTypeOperator, interfaces.AuthOperationTypePublicAccess)
+		})
+		if err != nil {
+			return
+		}
+		releaseList = authResp.Data
+	} else {
+		releaseList, err = queryReleaseList()
+		if err != nil {
+			return
+		}
+	}
+	result = []map[string]any{}
+	if len(releaseList) == 0 {
+		return
+	}
+	infos, err := m.assembleReleaseList(ctx, releaseList)
+	if err != nil {
+		return
+	}
+	for _, info := range infos {
+		result = append(result, projectOperatorFields(info, req.Fields))
+	}
+	return
+}
+
+// assembleReleaseList 批量获取元数据并组装算子发布信息，渲染用户名称
+func (m *operatorManager) assembleReleaseList(ctx context.Context, releaseList []*model.OperatorReleaseDB) (
+	infos []*interfaces.OperatorDataInfo, err error) {
+	infos = []*interfaces.OperatorDataInfo{}
 	// 获取元数据信息
 	sourceMap := map[model.SourceType][]string{}
 	for _, release := range releaseList {
@@ -127,22 +198,37 @@ func (m *operatorManager) QueryOperatorMarketList(ctx context.Context, req *inte
 			m.Logger.WithContext(ctx).Errorf("assemble release result failed, err: %v", err)
 			continue
 		}
-		info.BusinessDomainID = resourceToBdMap[info.OperatorID]
-		result.Data = append(result.Data, info)
+		infos = append(infos, info)
 		userList = append(userList, userIDs...)
 	}
 	userMap, err := m.UserMgnt.GetUsersName(ctx, userList)
 	if err != nil {
 		return
 	}
-	for i := range result.Data {
-		result.Data[i].CreateUser = utils.GetValueOrDefault(userMap, result.Data[i].CreateUser, "")
-		result.Data[i].UpdateUser = utils.GetValueOrDefault(userMap, result.Data[i].UpdateUser, "")
-		result.Data[i].ReleaseUser = utils.GetValueOrDefault(userMap, result.Data[i].ReleaseUser, "")
+	for i := range infos {
+		infos[i].CreateUser = utils.GetValueOrDefault(userMap, infos[i].CreateUser, "")
+		infos[i].UpdateUser = utils.GetValueOrDefault(userMap, infos[i].UpdateUser, "")
+		infos[i].ReleaseUser = utils.GetValueOrDefault(userMap, infos[i].ReleaseUser, "")
 	}
 	return
 }
 
+// projectOperatorFields 按字段名裁剪算子信息，fields为空时返回全部字段，operator_id始终返回
+func projectOperatorFields(info *interfaces.OperatorDataInfo, fields []string) map[string]any {
+	fullMap := utils.JSONToObject[map[string]any](utils.ObjectToJSON(info))
+	if len(fields) == 0 {
+		return fullMap
+	}
+	result := make(map[string]any, len(fields)+1)
+	for _, field := range fields {
+		if value, exists := fullMap[field]; exists {
+			result[field] = value
+		}
+	}
+	result["operator_id"] = info.OperatorID
+	return result
+}
+
 // 根据请求参数查询并过滤算子发布列表
 func (m *operatorManager) queryOperatorReleaseList(ctx context.Context, req *interfaces.PageQueryOperatorMarketReq) (
 	authResp *interfaces.QueryResponse[model.OperatorReleaseDB], resourceToBdMap map[string]string, err error) {
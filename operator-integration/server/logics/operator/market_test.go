@@ -3,6 +3,7 @@ package operator
 import (
 	"context"
 	"errors"
+	"fmt"
 	"net/http"
 	"testing"
 
@@ -334,3 +335,67 @@ func TestQueryOperatorMarketList(t *testing.T) {
 		})
 	})
 }
+
+func TestQueryOperatorMarketBatch(t *testing.T) {
+	ctrl := gomock.NewController(t)
+	defer ctrl.Finish()
+	mockOpReleaseDB := mocks.NewMockIOperatorReleaseDB(ctrl)
+	mockAuthService := mocks.NewMockIAuthorizationService(ctrl)
+	operator := &operatorManager{
+		Logger:      logger.DefaultLogger(),
+		OpReleaseDB: mockOpReleaseDB,
+		AuthService: mockAuthService,
+	}
+	Convey("TestQueryOperatorMarketBatch: 请求体传参批量查询算子市场详情", t, func() {
+		opIDs := make([]string, 2500)
+		for i := range opIDs {
+			opIDs[i] = fmt.Sprintf("op_%d", i)
+		}
+		req := &interfaces.OperatorMarketBatchReq{OperatorIDs: opIDs, Fields: []string{"name"}}
+		publicCtx := common.SetPublicAPIToCtx(context.Background(), true)
+		Convey("ID数量超过上限", func() {
+			req.OperatorIDs = make([]string, interfaces.MaxBatchQuerySize+1)
+			_, err := operator.QueryOperatorMarketBatch(context.TODO(), req)
+			So(err, ShouldNotBeNil)
+			httpErr := &myErr.HTTPError{}
+			So(errors.As(err, &httpErr), ShouldBeTrue)
+			So(httpErr.HTTPCode, ShouldEqual, http.StatusBadRequest)
+		})
+		Convey("内部接口: 查询发布记录失败（db）", func() {
+			mockOpReleaseDB.EXPECT().SelectByOpIDs(gomock.Any(), gomock.Any()).Return(nil, mocks.MockFuncErr("SelectByOpIDs")).Times(1)
+			_, err := operator.QueryOperatorMarketBatch(context.TODO(), req)
+			So(err, ShouldNotBeNil)
+			httpErr := &myErr.HTTPError{}
+			So(errors.As(err, &httpErr), ShouldBeTrue)
+			So(httpErr.HTTPCode, ShouldEqual, http.StatusInternalServerError)
+		})
+		Convey("内部接口: 按批次执行IN查询，未匹配到数据", func() {
+			var batches []int
+			mockOpReleaseDB.EXPECT().SelectByOpIDs(gomock.Any(), gomock.Any()).
+				DoAndReturn(func(_ context.Context, ids []string) ([]*model.OperatorReleaseDB, error) {
+					batches = append(batches, len(ids))
+					return nil, nil
+				}).Times(3)
+			result, err := operator.QueryOperatorMarketBatch(context.TODO(), req)
+			So(err, ShouldBeNil)
+			So(result, ShouldNotBeNil)
+			So(result, ShouldBeEmpty)
+			So(batches, ShouldResemble, []int{interfaces.DefaultBatchSize, interfaces.DefaultBatchSize, 500})
+		})
+		Convey("外部接口: 获取accessor信息失败", func() {
+			mockAuthService.EXPECT().GetAccessor(gomock.Any(), gomock.Any()).Return(nil, mocks.MockFuncErr("GetAccessor")).Times(1)
+			_, err := operator.QueryOperatorMarketBatch(publicCtx, req)
+			So(err, ShouldNotBeNil)
+		})
+		Convey("外部接口: 没有公开访问权限的算子被过滤", func() {
+			mockAuthService.EXPECT().GetAccessor(gomock.Any(), gomock.Any()).Return(&interfaces.AuthAccessor{}, nil).Times(1)
+			mockOpReleaseDB.EXPECT().SelectByOpIDs(gomock.Any(), gomock.Any()).
+				Return([]*model.OperatorReleaseDB{{OpID: opIDs[0]}}, nil).Times(3)
+			mockAuthService.EXPECT().ResourceListIDs(gomock.Any(), gomock.Any(), gomock.Any(), interfaces.AuthOperationTypePublicAccess).
+				Return([]string{}, nil).Times(1)
+			result, err := operator.QueryOperatorMarketBatch(publicCtx, req)
+			So(err, ShouldBeNil)
+			So(result, ShouldBeEmpty)
+		})
+	})
+}
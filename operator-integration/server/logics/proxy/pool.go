@@ -3,6 +3,7 @@ package proxy
 import (
 	"net/http"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/config"
@@ -33,10 +34,12 @@ func GetClientKey(executionMode interfaces.ExecutionMode, streamingMode interfac
 
 // PoolConfig 连接池配置
 type PoolConfig struct {
-	MaxClients     int           // 最大客户端数量
-	MaxTimeout     time.Duration // 最大超时时间
-	DefaultTimeout time.Duration // 默认超时时间
-	ClientLifetime time.Duration // 客户端生命周期
+	MaxClients     int                                    // 最大客户端数量
+	MaxTimeout     time.Duration                          // 最大超时时间
+	DefaultTimeout time.Duration                          // 默认超时时间
+	ClientLifetime time.Duration                          // 客户端生命周期
+	Transport      config.ProxyTransportConfig            // 到上游的连接复用配置
+	HostTransports map[string]config.ProxyTransportConfig // 按上游覆盖的连接复用配置
 }
 
 // ProxyClient 代理客户端信息
@@ -71,6 +74,8 @@ func NewClientPool() *clientPool {
 			MaxTimeout:     time.Duration(conf.ProxyModuleConfig.MaxTimeout) * time.Second,
 			DefaultTimeout: time.Duration(conf.ProxyModuleConfig.DefaultTimeout) * time.Second,
 			ClientLifetime: time.Duration(conf.ProxyModuleConfig.ClientLifetime) * time.Second,
+			Transport:      conf.ProxyModuleConfig.Transport,
+			HostTransports: conf.ProxyModuleConfig.HostTransports,
 		}
 		clientPoolInstance = &clientPool{
 			mu:          sync.Mutex{},
@@ -99,9 +104,11 @@ func (p *clientPool) GetClient(timeout time.Duration) *http.Client {
 
 	// 检查客户端是否已存在
 	if client, exists := p.clients[key]; exists {
+		atomic.AddInt64(&poolStats.Hits, 1)
 		client.CreateAt = time.Now() // 更新访问时间
 		return client.Client
 	}
+	atomic.AddInt64(&poolStats.Misses, 1)
 
 	// 如果达到最大客户端数量，移除最旧的客户端
 	if len(p.clients) >= p.config.MaxClients {
@@ -110,7 +117,7 @@ func (p *clientPool) GetClient(timeout time.Duration) *http.Client {
 
 	// 创建新客户端
 	client := &ProxyClient{
-		Client: rest.NewRawHTTPClientWithOptions(rest.HTTPClientOptions{
+		Client: p.newHTTPClient(rest.HTTPClientOptions{
 			TimeOut: int(timeout.Seconds()),
 		}),
 		IsStreaming: false,
@@ -131,9 +138,11 @@ func (p *clientPool) GetStreamClient(streamingMode interfaces.StreamingMode, tim
 	// 检查客户端是否已存在
 	if client, exists := p.clients[key]; exists {
 		p.logger.Debugf("stream client exists, streamingMode: %v, timeout: %v", streamingMode, timeout)
+		atomic.AddInt64(&poolStats.Hits, 1)
 		client.CreateAt = time.Now() // 更新访问时间
 		return client.Client
 	}
+	atomic.AddInt64(&poolStats.Misses, 1)
 	p.logger.Debugf("stream client not exists, streamingMode: %v, timeout: %v", streamingMode, timeout)
 	// 如果达到最大客户端数量，优先移除同步客户端
 	if len(p.clients) >= p.config.MaxClients {
@@ -147,7 +156,7 @@ func (p *clientPool) GetStreamClient(streamingMode interfaces.StreamingMode, tim
 	}
 	// 创建新客户端
 	client := &ProxyClient{
-		Client: rest.NewRawHTTPClientWithOptions(rest.HTTPClientOptions{
+		Client: p.newHTTPClient(rest.HTTPClientOptions{
 			TimeOut:               int(timeout.Seconds()),
 			ResponseHeaderTimeout: int(responseHeaderTimeout.Seconds()),
 		}),
@@ -161,6 +170,13 @@ func (p *clientPool) GetStreamClient(streamingMode interfaces.StreamingMode, tim
 	return client.Client
 }
 
+// newHTTPClient 创建客户端，Transport 按上游应用连接复用配置并统计连接
+func (p *clientPool) newHTTPClient(opts rest.HTTPClientOptions) *http.Client {
+	client := rest.NewRawHTTPClientWithOptions(opts)
+	client.Transport = newInstrumentedTransport(opts, p.config.Transport, p.config.HostTransports)
+	return client
+}
+
 // / 移除最旧的客户端
 func (p *clientPool) removeOldestClient() {
 	var oldestKey *clientKey
@@ -192,6 +208,7 @@ func (p *clientPool) removeOldestClient() {
 	if !oldestTime.IsZero() && oldestKey != nil {
 		p.clients[*oldestKey].CloseIdleConnections()
 		delete(p.clients, *oldestKey)
+		atomic.AddInt64(&poolStats.Evictions, 1)
 	}
 }
 
@@ -223,10 +240,23 @@ func (p *clientPool) cleanupIdleClients() {
 			p.logger.Infof("cleanup idle sync client, key: %v, created at: %v", key, createdAt)
 			client.CloseIdleConnections() // 关闭同步客户端的闲置连接
 			delete(p.clients, key)
+			atomic.AddInt64(&poolStats.Expired, 1)
 		}
 	}
 }
 
+// Flush 关闭并移除全部客户端，返回移除数量，用于冷启动性能测试模拟空连接池
+func (p *clientPool) Flush() int {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+	count := len(p.clients)
+	for key, client := range p.clients {
+		client.CloseIdleConnections()
+		delete(p.clients, key)
+	}
+	return count
+}
+
 // Close 关闭连接池
 func (p *clientPool) Close() {
 	close(p.stopCleanup)
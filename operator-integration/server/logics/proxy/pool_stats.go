@@ -0,0 +1,207 @@
+package proxy
+
+import (
+	"context"
+	"io"
+	"net"
+	"net/http"
+	"net/http/httptrace"
+	"sort"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/config"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/rest"
+)
+
+// PoolStats 代理客户端池统计
+type PoolStats struct {
+	LiveClients int             `json:"live_clients"` // 当前缓存的客户端数
+	Hits        int64           `json:"hits"`         // 复用已有客户端的次数
+	Misses      int64           `json:"misses"`       // 新建客户端的次数
+	Evictions   int64           `json:"evictions"`    // 达到 max_clients 时淘汰的客户端数
+	Expired     int64           `json:"expired"`      // 超过 client_lifetime 被清理的客户端数
+	Hosts       []HostConnStats `json:"hosts"`        // 按上游统计的连接复用情况
+}
+
+// HostConnStats 单个上游（host:port）的连接统计
+type HostConnStats struct {
+	Host     string `json:"host"`
+	Requests int64  `json:"requests"` // 发往该上游的请求数
+	Reused   int64  `json:"reused"`   // 复用已有连接的请求数
+	Dials    int64  `json:"dials"`    // 新建连接数
+	Open     int64  `json:"open"`     // 当前打开的连接数
+	Active   int64  `json:"active"`   // 正在使用（请求未结束或响应体未关闭）的连接数
+	Idle     int64  `json:"idle"`     // 打开但未使用的连接数，即 Open - Active
+}
+
+// hostCounters 单个上游的计数，所有客户端共享
+type hostCounters struct {
+	requests int64
+	reused   int64
+	dials    int64
+	open     int64
+	active   int64
+}
+
+var (
+	poolStats    PoolStats
+	hostCounterM sync.Map // host:port -> *hostCounters
+)
+
+func countersFor(host string) *hostCounters {
+	if c, ok := hostCounterM.Load(host); ok {
+		return c.(*hostCounters)
+	}
+	c, _ := hostCounterM.LoadOrStore(host, &hostCounters{})
+	return c.(*hostCounters)
+}
+
+// hostPort 返回带端口的上游地址，与拨号地址保持一致
+func hostPort(req *http.Request) string {
+	if req.URL.Port() != "" {
+		return req.URL.Host
+	}
+	if req.URL.Scheme == "https" {
+		return net.JoinHostPort(req.URL.Hostname(), "443")
+	}
+	return net.JoinHostPort(req.URL.Hostname(), "80")
+}
+
+// instrumentedTransport 按上游选择 Transport 并统计连接复用
+type instrumentedTransport struct {
+	defaultTransport *http.Transport
+	hostTransports   map[string]*http.Transport
+}
+
+// newInstrumentedTransport 创建带统计的 Transport，hosts 中配置的上游使用各自的 Transport
+func newInstrumentedTransport(opts rest.HTTPClientOptions, defaults config.ProxyTransportConfig,
+	hosts map[string]config.ProxyTransportConfig) *instrumentedTransport {
+	t := &instrumentedTransport{
+		defaultTransport: newCountingTransport(opts, defaults),
+		hostTransports:   make(map[string]*http.Transport, len(hosts)),
+	}
+	for host, conf := range hosts {
+		t.hostTransports[host] = newCountingTransport(opts, conf)
+	}
+	return t
+}
+
+func newCountingTransport(opts rest.HTTPClientOptions, conf config.ProxyTransportConfig) *http.Transport {
+	opts.MaxIdleConns = conf.MaxIdleConns
+	opts.MaxIdleConnsPerHost = conf.MaxIdleConnsPerHost
+	opts.IdleConnTimeout = conf.IdleConnTimeout
+	opts.ForceAttemptHTTP2 = conf.HTTP2
+	transport := rest.NewHTTPTransport(opts)
+	dialer := &net.Dialer{Timeout: 30 * time.Second, KeepAlive: 30 * time.Second} //nolint:mnd
+	transport.DialContext = func(ctx context.Context, network, addr string) (net.Conn, error) {
+		conn, err := dialer.DialContext(ctx, network, addr)
+		if err != nil {
+			return nil, err
+		}
+		counters := countersFor(addr)
+		atomic.AddInt64(&counters.dials, 1)
+		atomic.AddInt64(&counters.open, 1)
+		return &countedConn{Conn: conn, counters: counters}, nil
+	}
+	return transport
+}
+
+func (t *instrumentedTransport) transportFor(req *http.Request) *http.Transport {
+	if len(t.hostTransports) > 0 {
+		if transport, ok := t.hostTransports[req.URL.Host]; ok {
+			return transport
+		}
+		if transport, ok := t.hostTransports[req.URL.Hostname()]; ok {
+			return transport
+		}
+	}
+	return t.defaultTransport
+}
+
+// RoundTrip 发送请求，连接在响应体关闭前计为使用中
+func (t *instrumentedTransport) RoundTrip(req *http.Request) (*http.Response, error) {
+	counters := countersFor(hostPort(req))
+	atomic.AddInt64(&counters.requests, 1)
+	atomic.AddInt64(&counters.active, 1)
+	trace := &httptrace.ClientTrace{
+		GotConn: func(info httptrace.GotConnInfo) {
+			if info.Reused {
+				atomic.AddInt64(&counters.reused, 1)
+			}
+		},
+	}
+	resp, err := t.transportFor(req).RoundTrip(req.WithContext(httptrace.WithClientTrace(req.Context(), trace)))
+	if err != nil {
+		atomic.AddInt64(&counters.active, -1)
+		return nil, err
+	}
+	resp.Body = &countedBody{ReadCloser: resp.Body, counters: counters}
+	return resp, nil
+}
+
+// CloseIdleConnections 关闭所有 Transport 的空闲连接，http.Client.CloseIdleConnections 会调用
+func (t *instrumentedTransport) CloseIdleConnections() {
+	t.defaultTransport.CloseIdleConnections()
+	for _, transport := range t.hostTransports {
+		transport.CloseIdleConnections()
+	}
+}
+
+// countedConn 关闭时减少打开的连接数
+type countedConn struct {
+	net.Conn
+	counters *hostCounters
+	once     sync.Once
+}
+
+func (c *countedConn) Close() error {
+	c.once.Do(func() { atomic.AddInt64(&c.counters.open, -1) })
+	return c.Conn.Close()
+}
+
+// countedBody 关闭时减少使用中的连接数
+type countedBody struct {
+	io.ReadCloser
+	counters *hostCounters
+	once     sync.Once
+}
+
+func (b *countedBody) Close() error {
+	b.once.Do(func() { atomic.AddInt64(&b.counters.active, -1) })
+	return b.ReadCloser.Close()
+}
+
+// GetPoolStats 获取代理客户端池统计快照
+func GetPoolStats() PoolStats {
+	stats := PoolStats{
+		Hits:      atomic.LoadInt64(&poolStats.Hits),
+		Misses:    atomic.LoadInt64(&poolStats.Misses),
+		Evictions: atomic.LoadInt64(&poolStats.Evictions),
+		Expired:   atomic.LoadInt64(&poolStats.Expired),
+		Hosts:     []HostConnStats{},
+	}
+	if clientPoolInstance != nil {
+		clientPoolInstance.mu.Lock()
+		stats.LiveClients = len(clientPoolInstance.clients)
+		clientPoolInstance.mu.Unlock()
+	}
+	hostCounterM.Range(func(key, value any) bool {
+		c := value.(*hostCounters)
+		host := HostConnStats{
+			Host:     key.(string),
+			Requests: atomic.LoadInt64(&c.requests),
+			Reused:   atomic.LoadInt64(&c.reused),
+			Dials:    atomic.LoadInt64(&c.dials),
+			Open:     atomic.LoadInt64(&c.open),
+			Active:   atomic.LoadInt64(&c.active),
+		}
+		// 多个请求可能排队等待同一连接，使用中的请求数可能超过打开的连接数
+		host.Idle = max(0, host.Open-host.Active)
+		stats.Hosts = append(stats.Hosts, host)
+		return true
+	})
+	sort.Slice(stats.Hosts, func(i, j int) bool { return stats.Hosts[i].Host < stats.Hosts[j].Host })
+	return stats
+}
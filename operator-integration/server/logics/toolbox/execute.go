@@ -99,6 +99,9 @@ func (s *ToolServiceImpl) ExecuteTool(ctx context.Context, req *interfaces.Execu
 		"tool_id": req.ToolID,
 		"user_id": req.UserID,
 	})
+	// 记录权限校验与工具解析耗时，供性能测试区分服务端开销与上游耗时
+	timing := infracommon.GetServerTimingFromCtx(ctx)
+	start := time.Now()
 	var accessor *interfaces.AuthAccessor
 	accessor, err = s.AuthService.GetAccessor(ctx, req.UserID)
 	if err != nil {
@@ -108,6 +111,8 @@ func (s *ToolServiceImpl) ExecuteTool(ctx context.Context, req *interfaces.Execu
 	if err != nil {
 		return
 	}
+	timing.Since("auth", start)
+	start = time.Now()
 	// 检查工具箱是否存在
 	exist, toolBox, err := s.ToolBoxDB.SelectToolBox(ctx, req.BoxID)
 	if err != nil {
@@ -137,6 +142,7 @@ func (s *ToolServiceImpl) ExecuteTool(ctx context.Context, req *interfaces.Execu
 			"tool not available", tool.Name)
 		return
 	}
+	timing.Since("lookup", start)
 	resp, err = s.executeTool(ctx, req, tool, toolBox.ServerURL)
 	if err != nil {
 		return
@@ -203,6 +209,8 @@ func (s *ToolServiceImpl) ExecuteToolCore(ctx context.Context, req *interfaces.E
 }
 
 func (s *ToolServiceImpl) executeTool(ctx context.Context, req *interfaces.ExecuteToolReq, tool *model.ToolDB, toolBoxURL string) (resp *interfaces.HTTPResponse, err error) {
+	timing := infracommon.GetServerTimingFromCtx(ctx)
+	start := time.Now()
 	// 获取元数据
 	exist, metadata, err := s.MetadataService.GetMetadataBySource(ctx, tool.SourceID, tool.SourceType)
 	if err != nil {
@@ -234,6 +242,9 @@ func (s *ToolServiceImpl) executeTool(ctx context.Context, req *interfaces.Execu
 		HTTPRequestParams: req.HTTPRequestParams,
 		Timeout:           time.Duration(req.Timeout) * time.Second,
 	}
+	timing.Since("metadata", start)
+	start = time.Now()
 	resp, err = s.Proxy.HandlerRequest(ctx, proxyReq)
+	timing.Since("proxy", start)
 	return
 }
@@ -5,6 +5,7 @@ import (
 	"database/sql"
 	"fmt"
 	"net/http"
+	"sort"
 	"time"
 
 	"github.com/creasty/defaults"
@@ -39,7 +40,7 @@ func (s *ToolServiceImpl) Import(ctx context.Context, tx *sql.Tx, mode interface
 		return
 	}
 	// 导入工具箱、工具信息
-	createMap, updateMap, err := s.batchImportToolBoxMetadata(ctx, tx, data.Toolbox.Configs, waitUpdataBoxList, accessor)
+	createMap, updateMap, err := s.batchImportToolBoxMetadata(ctx, tx, mode, data.Toolbox.Configs, waitUpdataBoxList, accessor)
 	if err != nil {
 		s.Logger.WithContext(ctx).Warnf("[Import] batchImportToolBoxMetadata err:%v", err)
 		return
@@ -158,8 +159,8 @@ func (s *ToolServiceImpl) importPreCheck(ctx context.Context, mode interfaces.Im
 }
 
 // 批量导入工具箱及工具元数据
-func (s *ToolServiceImpl) batchImportToolBoxMetadata(ctx context.Context, tx *sql.Tx, items []*interfaces.ToolBoxImpexItem, waitUpdataBoxList []*model.ToolboxDB,
-	accessor *interfaces.AuthAccessor) (createBoxMap, updateBoxMap map[string]*model.ToolboxDB, err error) {
+func (s *ToolServiceImpl) batchImportToolBoxMetadata(ctx context.Context, tx *sql.Tx, mode interfaces.ImportType, items []*interfaces.ToolBoxImpexItem,
+	waitUpdataBoxList []*model.ToolboxDB, accessor *interfaces.AuthAccessor) (createBoxMap, updateBoxMap map[string]*model.ToolboxDB, err error) {
 	// 收集需要新增的ToolBox
 	createBoxMap = map[string]*model.ToolboxDB{}
 	// 收集需要更新的工具ToolBox
@@ -179,8 +180,21 @@ func (s *ToolServiceImpl) batchImportToolBoxMetadata(ctx context.Context, tx *sq
 		}
 		updateBoxMap[boxDB.BoxID] = boxDB
 	}
+	// 增量导入：内容未变化的工具箱不再更新
+	unchangedBoxIDs := map[string]bool{}
+	if mode == interfaces.ImportTypeIncremental && len(updateBoxMap) > 0 {
+		unchangedBoxIDs, err = s.unchangedToolBoxes(ctx, items, updateBoxMap)
+		if err != nil {
+			return
+		}
+		s.Logger.WithContext(ctx).Infof("[Import] incremental import, %d/%d toolboxes unchanged", len(unchangedBoxIDs), len(items))
+	}
 	// 遍历导入项，根据是否存在工具箱ID判断是新增还是更新
 	for _, item := range items {
+		if unchangedBoxIDs[item.BoxID] {
+			delete(updateBoxMap, item.BoxID)
+			continue
+		}
 		if boxDB, ok := updateBoxMap[item.BoxID]; ok {
 			err = s.importByUpsert(ctx, tx, boxDB, item, accessor.ID)
 			if err != nil {
@@ -197,6 +211,94 @@ func (s *ToolServiceImpl) batchImportToolBoxMetadata(ctx context.Context, tx *sq
 	return
 }
 
+// unchangedToolBoxes 比较导入项与已有工具箱当前导出内容的哈希，返回内容一致的工具箱ID
+func (s *ToolServiceImpl) unchangedToolBoxes(ctx context.Context, items []*interfaces.ToolBoxImpexItem,
+	updateBoxMap map[string]*model.ToolboxDB) (unchangedBoxIDs map[string]bool, err error) {
+	boxDBs := make([]*model.ToolboxDB, 0, len(updateBoxMap))
+	for _, boxDB := range updateBoxMap {
+		boxDBs = append(boxDBs, boxDB)
+	}
+	current, _, err := s.batchGetToolBoxInfo(ctx, boxDBs)
+	if err != nil {
+		return
+	}
+	currentHashes := map[string]string{}
+	for _, item := range current.Configs {
+		currentHashes[item.BoxID], err = toolBoxContentHash(item)
+		if err != nil {
+			s.Logger.WithContext(ctx).Errorf("hash toolbox %s failed, err: %v", item.BoxID, err)
+			err = errors.DefaultHTTPError(ctx, http.StatusInternalServerError, err.Error())
+			return
+		}
+	}
+	unchangedBoxIDs = map[string]bool{}
+	for _, item := range items {
+		currentHash, ok := currentHashes[item.BoxID]
+		if !ok {
+			continue
+		}
+		var itemHash string
+		itemHash, err = toolBoxContentHash(item)
+		if err != nil {
+			s.Logger.WithContext(ctx).Errorf("hash toolbox %s failed, err: %v", item.BoxID, err)
+			err = errors.DefaultHTTPError(ctx, http.StatusInternalServerError, err.Error())
+			return
+		}
+		if itemHash == currentHash {
+			unchangedBoxIDs[item.BoxID] = true
+		}
+	}
+	return
+}
+
+// toolBoxContentHash 计算工具箱导入内容的哈希
+// 忽略导入时会重写的字段（时间、用户、分类名称、元数据版本），工具按ID排序；哈希不一致时按 upsert 正常更新
+func toolBoxContentHash(item *interfaces.ToolBoxImpexItem) (hash string, err error) {
+	content := &interfaces.ToolBoxImpexItem{}
+	err = utils.AnyToObject(item, content)
+	if err != nil {
+		return
+	}
+	err = defaults.Set(content)
+	if err != nil {
+		return
+	}
+	content.CategoryName = ""
+	content.CreateTime, content.UpdateTime = 0, 0
+	content.CreateUser, content.UpdateUser = "", ""
+	for _, tool := range content.Tools {
+		if tool.Description == "" {
+			tool.Description = tool.Name
+		}
+		if tool.MetadataType == "" {
+			tool.MetadataType = content.MetadataType
+		}
+		tool.CreateTime, tool.UpdateTime = 0, 0
+		tool.CreateUser, tool.UpdateUser = "", ""
+		// 导出时空的全局参数、扩展信息为空结构体、空map，与导入包中的 null 视为相同
+		if p := tool.GlobalParameters; p != nil && p.Name == "" && p.Description == "" && p.In == "" && p.Type == "" &&
+			!p.Required && p.Value == nil {
+			tool.GlobalParameters = nil
+		}
+		if len(tool.ExtendInfo) == 0 {
+			tool.ExtendInfo = nil
+		}
+		if tool.Metadata != nil {
+			tool.Metadata.Version = ""
+			tool.Metadata.CreateTime, tool.Metadata.UpdateTime = 0, 0
+			tool.Metadata.CreateUser, tool.Metadata.UpdateUser = "", ""
+			// 函数内容以工具上的定义为准，导入时不读取元数据中的函数内容
+			tool.Metadata.FunctionContent = nil
+		}
+		// 元数据ID在创建导入时会重新生成，算子工具的来源ID为算子ID需保留
+		if tool.SourceType != model.SourceTypeOperator {
+			tool.SourceID = ""
+		}
+	}
+	sort.Slice(content.Tools, func(i, j int) bool { return content.Tools[i].ToolID < content.Tools[j].ToolID })
+	return utils.ObjectSHA256Hash(content)
+}
+
 // importByCreate 导入工具箱
 func (s *ToolServiceImpl) importByCreate(ctx context.Context, tx *sql.Tx, item *interfaces.ToolBoxImpexItem, userID string) (boxDB *model.ToolboxDB, err error) {
 	// 校验导入的工具箱信息
@@ -650,3 +650,64 @@ func TestExport(t *testing.T) {
 		})
 	})
 }
+
+func TestToolBoxContentHash(t *testing.T) {
+	Convey("TestToolBoxContentHash:增量导入内容哈希", t, func() {
+		newItem := func() *interfaces.ToolBoxImpexItem {
+			return &interfaces.ToolBoxImpexItem{
+				BoxID:        "box_id_1",
+				BoxName:      "BoxName",
+				BoxSvcURL:    "http://127.0.0.1",
+				CategoryType: "other_category",
+				MetadataType: interfaces.MetadataTypeAPI,
+				Tools: []*interfaces.ToolImpexItem{
+					{
+						ToolInfo: interfaces.ToolInfo{
+							ToolID: "tool_id_1",
+							Name:   "tool_a",
+							Metadata: &interfaces.MetadataInfo{
+								Version: "version_1",
+								Summary: "summary_a",
+								Path:    "/a",
+								Method:  http.MethodGet,
+							},
+						},
+						SourceID:   "version_1",
+						SourceType: model.SourceTypeOpenAPI,
+					},
+					{
+						ToolInfo:   interfaces.ToolInfo{ToolID: "tool_id_2", Name: "tool_b", Description: "tool_desc_b"},
+						SourceID:   "operator_id_1",
+						SourceType: model.SourceTypeOperator,
+					},
+				},
+			}
+		}
+		hash, err := toolBoxContentHash(newItem())
+		So(err, ShouldBeNil)
+		Convey("忽略时间、用户、元数据版本及工具顺序", func() {
+			item := newItem()
+			item.CreateTime, item.UpdateUser, item.CategoryName = time.Now().UnixNano(), "user_2", "其他"
+			item.Tools[0].UpdateTime = time.Now().UnixNano()
+			item.Tools[0].SourceID, item.Tools[0].Metadata.Version = "version_2", "version_2"
+			item.Tools[0], item.Tools[1] = item.Tools[1], item.Tools[0]
+			other, err := toolBoxContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldEqual, hash)
+		})
+		Convey("工具内容变化", func() {
+			item := newItem()
+			item.Tools[0].Metadata.Path = "/b"
+			other, err := toolBoxContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldNotEqual, hash)
+		})
+		Convey("算子工具来源变化", func() {
+			item := newItem()
+			item.Tools[1].SourceID = "operator_id_2"
+			other, err := toolBoxContentHash(item)
+			So(err, ShouldBeNil)
+			So(other, ShouldNotEqual, hash)
+		})
+	})
+}
@@ -216,10 +216,30 @@ func (s *ToolServiceImpl) GetReleaseToolBoxInfo(ctx context.Context, req *interf
 		err = errors.DefaultHTTPError(ctx, http.StatusBadRequest, "fields is nil")
 		return
 	}
+	return s.getReleaseToolBoxInfo(ctx, req.UserID, boxIDs, fields)
+}
+
+// BatchGetReleaseToolBoxInfo 批量获取发布工具箱信息（请求体传参）
+func (s *ToolServiceImpl) BatchGetReleaseToolBoxInfo(ctx context.Context, req *interfaces.BatchGetReleaseToolBoxInfoReq) (
+	resp []*interfaces.GetReleaseToolBoxInfoResp, err error) {
+	// 记录可观测
+	ctx, _ = o11y.StartInternalSpan(ctx)
+	defer o11y.EndSpan(ctx, err)
+	if len(req.BoxIDs) > interfaces.MaxBatchQuerySize {
+		err = errors.DefaultHTTPError(ctx, http.StatusBadRequest,
+			fmt.Sprintf("too many box_ids: %d, max %d", len(req.BoxIDs), interfaces.MaxBatchQuerySize))
+		return
+	}
+	return s.getReleaseToolBoxInfo(ctx, req.UserID, req.BoxIDs, req.Fields)
+}
+
+// getReleaseToolBoxInfo 按ID分批查询已发布工具箱，过滤权限后按字段组织结果
+func (s *ToolServiceImpl) getReleaseToolBoxInfo(ctx context.Context, userID string, boxIDs, fields []string) (
+	resp []*interfaces.GetReleaseToolBoxInfoResp, err error) {
 	resp = []*interfaces.GetReleaseToolBoxInfoResp{}
 	// 权限过滤
 	var accessor *interfaces.AuthAccessor
-	accessor, err = s.AuthService.GetAccessor(ctx, req.UserID)
+	accessor, err = s.AuthService.GetAccessor(ctx, userID)
 	if err != nil {
 		return
 	}
@@ -228,7 +248,10 @@ func (s *ToolServiceImpl) GetReleaseToolBoxInfo(ctx context.Context, req *interf
 		ctx, page, pageSize, true,
 		func() ([]*model.ToolboxDB, error) {
 			var boxList []*model.ToolboxDB
-			boxList, err = s.ToolBoxDB.SelectListByBoxIDs(ctx, boxIDs, interfaces.BizStatusPublished.String())
+			boxList, err = utils.BatchQueryWithContext(ctx, boxIDs, interfaces.DefaultBatchSize,
+				func(ctx context.Context, ids []string) ([]*model.ToolboxDB, error) {
+					return s.ToolBoxDB.SelectListByBoxIDs(ctx, ids, interfaces.BizStatusPublished.String())
+				})
 			if err != nil {
 				s.Logger.WithContext(ctx).Errorf("select toolbox list error: %v", err)
 				err = errors.DefaultHTTPError(ctx, http.StatusInternalServerError, "select toolbox list error")
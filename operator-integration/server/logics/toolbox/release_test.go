@@ -0,0 +1,104 @@
+package toolbox
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"net/http"
+	"testing"
+
+	myErr "github.com/kweaver-ai/operator-hub/operator-integration/server/infra/errors"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/infra/logger"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/interfaces/model"
+	"github.com/kweaver-ai/operator-hub/operator-integration/server/mocks"
+	. "github.com/smartystreets/goconvey/convey"
+	"go.uber.org/mock/gomock"
+)
+
+func TestBatchGetReleaseToolBoxInfo(t *testing.T) {
+	ctrl := gomock.NewController(t)
+	defer ctrl.Finish()
+	mockToolBoxDB := mocks.NewMockIToolboxDB(ctrl)
+	mockAuthService := mocks.NewMockIAuthorizationService(ctrl)
+	mockUserMgnt := mocks.NewMockUserManagement(ctrl)
+	s := &ToolServiceImpl{
+		Logger:      logger.DefaultLogger(),
+		ToolBoxDB:   mockToolBoxDB,
+		AuthService: mockAuthService,
+		UserMgnt:    mockUserMgnt,
+	}
+	Convey("TestBatchGetReleaseToolBoxInfo: 请求体传参批量获取发布工具箱信息", t, func() {
+		ctx := context.Background()
+		accessor := &interfaces.AuthAccessor{}
+		boxIDs := make([]string, 1500)
+		for i := range boxIDs {
+			boxIDs[i] = fmt.Sprintf("box_%d", i)
+		}
+		req := &interfaces.BatchGetReleaseToolBoxInfoReq{
+			BoxIDs: boxIDs,
+			Fields: []string{"box_name", "create_user"},
+		}
+		selectBoxes := func(_ context.Context, ids []string, _ ...string) ([]*model.ToolboxDB, error) {
+			list := make([]*model.ToolboxDB, len(ids))
+			for i, id := range ids {
+				list[i] = &model.ToolboxDB{BoxID: id, Name: "name_" + id, Description: "desc", CreateUser: "user1",
+					MetadataType: string(interfaces.MetadataTypeAPI)}
+			}
+			return list, nil
+		}
+		Convey("ID数量超过上限", func() {
+			req.BoxIDs = make([]string, interfaces.MaxBatchQuerySize+1)
+			_, err := s.BatchGetReleaseToolBoxInfo(ctx, req)
+			So(err, ShouldNotBeNil)
+			httpErr := &myErr.HTTPError{}
+			So(errors.As(err, &httpErr), ShouldBeTrue)
+			So(httpErr.HTTPCode, ShouldEqual, http.StatusBadRequest)
+		})
+		Convey("获取accessor信息失败", func() {
+			mockAuthService.EXPECT().GetAccessor(gomock.Any(), gomock.Any()).Return(nil, mocks.MockFuncErr("GetAccessor")).Times(1)
+			_, err := s.BatchGetReleaseToolBoxInfo(ctx, req)
+			So(err, ShouldNotBeNil)
+		})
+		Convey("查询工具箱失败（db）", func() {
+			mockAuthService.EXPECT().GetAccessor(gomock.Any(), gomock.Any()).Return(accessor, nil).Times(1)
+			mockToolBoxDB.EXPECT().SelectListByBoxIDs(gomock.Any(), gomock.Any(), interfaces.BizStatusPublished.String()).
+				Return(nil, mocks.MockFuncErr("SelectListByBoxIDs")).Times(1)
+			_, err := s.BatchGetReleaseToolBoxInfo(ctx, req)
+			So(err, ShouldNotBeNil)
+			httpErr := &myErr.HTTPError{}
+			So(errors.As(err, &httpErr), ShouldBeTrue)
+			So(httpErr.HTTPCode, ShouldEqual, http.StatusInternalServerError)
+		})
+		Convey("没有公开访问权限的工具箱被过滤", func() {
+			mockAuthService.EXPECT().GetAccessor(gomock.Any(), gomock.Any()).Return(accessor, nil).Times(1)
+			mockToolBoxDB.EXPECT().SelectListByBoxIDs(gomock.Any(), gomock.Any(), interfaces.BizStatusPublished.String()).
+				DoAndReturn(selectBoxes).Times(2)
+			mockAuthService.EXPECT().ResourceListIDs(gomock.Any(), gomock.Any(), gomock.Any(), interfaces.AuthOperationTypePublicAccess).
+				Return([]string{}, nil).Times(1)
+			resp, err := s.BatchGetReleaseToolBoxInfo(ctx, req)
+			So(err, ShouldBeNil)
+			So(resp, ShouldBeEmpty)
+		})
+		Convey("按批次执行IN查询，按字段返回全部结果", func() {
+			var batches []int
+			mockAuthService.EXPECT().GetAccessor(gomock.Any(), gomock.Any()).Return(accessor, nil).Times(1)
+			mockToolBoxDB.EXPECT().SelectListByBoxIDs(gomock.Any(), gomock.Any(), interfaces.BizStatusPublished.String()).
+				DoAndReturn(func(ctx context.Context, ids []string, status ...string) ([]*model.ToolboxDB, error) {
+					batches = append(batches, len(ids))
+					return selectBoxes(ctx, ids, status...)
+				}).Times(2)
+			mockAuthService.EXPECT().ResourceListIDs(gomock.Any(), gomock.Any(), gomock.Any(), interfaces.AuthOperationTypePublicAccess).
+				Return([]string{interfaces.ResourceIDAll}, nil).Times(1)
+			mockUserMgnt.EXPECT().GetUsersName(gomock.Any(), gomock.Any()).Return(map[string]string{"user1": "用户1"}, nil).Times(1)
+			resp, err := s.BatchGetReleaseToolBoxInfo(ctx, req)
+			So(err, ShouldBeNil)
+			So(batches, ShouldResemble, []int{interfaces.DefaultBatchSize, 500})
+			So(len(resp), ShouldEqual, len(boxIDs))
+			So(resp[0].BoxID, ShouldEqual, boxIDs[0])
+			So(resp[0].BoxName, ShouldEqual, "name_"+boxIDs[0])
+			So(resp[0].CreateUser, ShouldEqual, "用户1")
+			So(resp[0].BoxDesc, ShouldBeEmpty)
+		})
+	})
+}
@@ -230,6 +230,21 @@ func (mr *MockIMCPReleaseServiceMockRecorder) QueryReleaseBatch(ctx, req any) *g
 	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "QueryReleaseBatch", reflect.TypeOf((*MockIMCPReleaseService)(nil).QueryReleaseBatch), ctx, req)
 }
 
+// QueryReleaseBatchByIDs mocks base method.
+func (m *MockIMCPReleaseService) QueryReleaseBatchByIDs(ctx context.Context, req *interfaces.MCPServerReleaseBatchQueryRequest) ([]map[string]any, error) {
+	m.ctrl.T.Helper()
+	ret := m.ctrl.Call(m, "QueryReleaseBatchByIDs", ctx, req)
+	ret0, _ := ret[0].([]map[string]any)
+	ret1, _ := ret[1].(error)
+	return ret0, ret1
+}
+
+// QueryReleaseBatchByIDs indicates an expected call of QueryReleaseBatchByIDs.
+func (mr *MockIMCPReleaseServiceMockRecorder) QueryReleaseBatchByIDs(ctx, req any) *gomock.Call {
+	mr.mock.ctrl.T.Helper()
+	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "QueryReleaseBatchByIDs", reflect.TypeOf((*MockIMCPReleaseService)(nil).QueryReleaseBatchByIDs), ctx, req)
+}
+
 // MockIMCPExecuteService is a mock of IMCPExecuteService interface.
 type MockIMCPExecuteService struct {
 	ctrl     *gomock.Controller
@@ -638,6 +653,21 @@ func (mr *MockIMCPServiceMockRecorder) QueryReleaseBatch(ctx, req any) *gomock.C
 	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "QueryReleaseBatch", reflect.TypeOf((*MockIMCPService)(nil).QueryReleaseBatch), ctx, req)
 }
 
+// QueryReleaseBatchByIDs mocks base method.
+func (m *MockIMCPService) QueryReleaseBatchByIDs(ctx context.Context, req *interfaces.MCPServerReleaseBatchQueryRequest) ([]map[string]any, error) {
+	m.ctrl.T.Helper()
+	ret := m.ctrl.Call(m, "QueryReleaseBatchByIDs", ctx, req)
+	ret0, _ := ret[0].([]map[string]any)
+	ret1, _ := ret[1].(error)
+	return ret0, ret1
+}
+
+// QueryReleaseBatchByIDs indicates an expected call of QueryReleaseBatchByIDs.
+func (mr *MockIMCPServiceMockRecorder) QueryReleaseBatchByIDs(ctx, req any) *gomock.Call {
+	mr.mock.ctrl.T.Helper()
+	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "QueryReleaseBatchByIDs", reflect.TypeOf((*MockIMCPService)(nil).QueryReleaseBatchByIDs), ctx, req)
+}
+
 // RegisterBuiltinMCPServer mocks base method.
 func (m *MockIMCPService) RegisterBuiltinMCPServer(ctx context.Context, req *interfaces.MCPBuiltinRegisterRequest) (*interfaces.MCPBuiltinRegisterResponse, error) {
 	m.ctrl.T.Helper()
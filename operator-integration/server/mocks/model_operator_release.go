@@ -133,6 +133,21 @@ func (mr *MockIOperatorReleaseDBMockRecorder) SelectByOpID(ctx, opID any) *gomoc
 	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "SelectByOpID", reflect.TypeOf((*MockIOperatorReleaseDB)(nil).SelectByOpID), ctx, opID)
 }
 
+// SelectByOpIDs mocks base method.
+func (m *MockIOperatorReleaseDB) SelectByOpIDs(ctx context.Context, opIDs []string) ([]*model.OperatorReleaseDB, error) {
+	m.ctrl.T.Helper()
+	ret := m.ctrl.Call(m, "SelectByOpIDs", ctx, opIDs)
+	ret0, _ := ret[0].([]*model.OperatorReleaseDB)
+	ret1, _ := ret[1].(error)
+	return ret0, ret1
+}
+
+// SelectByOpIDs indicates an expected call of SelectByOpIDs.
+func (mr *MockIOperatorReleaseDBMockRecorder) SelectByOpIDs(ctx, opIDs any) *gomock.Call {
+	mr.mock.ctrl.T.Helper()
+	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "SelectByOpIDs", reflect.TypeOf((*MockIOperatorReleaseDB)(nil).SelectByOpIDs), ctx, opIDs)
+}
+
 // SelectByWhereClause mocks base method.
 func (m *MockIOperatorReleaseDB) SelectByWhereClause(ctx context.Context, conditions map[string]any, sort *ormhelper.SortParams, cursor *ormhelper.CursorParams) ([]*model.OperatorReleaseDB, error) {
 	m.ctrl.T.Helper()
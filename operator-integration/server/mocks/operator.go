@@ -205,6 +205,21 @@ func (mr *MockOperatorManagerMockRecorder) QueryOperatorHistoryList(ctx, req any
 	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "QueryOperatorHistoryList", reflect.TypeOf((*MockOperatorManager)(nil).QueryOperatorHistoryList), ctx, req)
 }
 
+// QueryOperatorMarketBatch mocks base method.
+func (m *MockOperatorManager) QueryOperatorMarketBatch(ctx context.Context, req *interfaces.OperatorMarketBatchReq) ([]map[string]any, error) {
+	m.ctrl.T.Helper()
+	ret := m.ctrl.Call(m, "QueryOperatorMarketBatch", ctx, req)
+	ret0, _ := ret[0].([]map[string]any)
+	ret1, _ := ret[1].(error)
+	return ret0, ret1
+}
+
+// QueryOperatorMarketBatch indicates an expected call of QueryOperatorMarketBatch.
+func (mr *MockOperatorManagerMockRecorder) QueryOperatorMarketBatch(ctx, req any) *gomock.Call {
+	mr.mock.ctrl.T.Helper()
+	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "QueryOperatorMarketBatch", reflect.TypeOf((*MockOperatorManager)(nil).QueryOperatorMarketBatch), ctx, req)
+}
+
 // QueryOperatorMarketDetail mocks base method.
 func (m *MockOperatorManager) QueryOperatorMarketDetail(ctx context.Context, req *interfaces.OperatorMarketDetailReq) (*interfaces.OperatorDataInfo, error) {
 	m.ctrl.T.Helper()
@@ -42,6 +42,21 @@ func (m *MockIToolService) EXPECT() *MockIToolServiceMockRecorder {
 	return m.recorder
 }
 
+// BatchGetReleaseToolBoxInfo mocks base method.
+func (m *MockIToolService) BatchGetReleaseToolBoxInfo(ctx context.Context, req *interfaces.BatchGetReleaseToolBoxInfoReq) ([]*interfaces.GetReleaseToolBoxInfoResp, error) {
+	m.ctrl.T.Helper()
+	ret := m.ctrl.Call(m, "BatchGetReleaseToolBoxInfo", ctx, req)
+	ret0, _ := ret[0].([]*interfaces.GetReleaseToolBoxInfoResp)
+	ret1, _ := ret[1].(error)
+	return ret0, ret1
+}
+
+// BatchGetReleaseToolBoxInfo indicates an expected call of BatchGetReleaseToolBoxInfo.
+func (mr *MockIToolServiceMockRecorder) BatchGetReleaseToolBoxInfo(ctx, req any) *gomock.Call {
+	mr.mock.ctrl.T.Helper()
+	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "BatchGetReleaseToolBoxInfo", reflect.TypeOf((*MockIToolService)(nil).BatchGetReleaseToolBoxInfo), ctx, req)
+}
+
 // ConvertOperatorToTool mocks base method.
 func (m *MockIToolService) ConvertOperatorToTool(ctx context.Context, req *interfaces.ConvertOperatorToToolReq) (*interfaces.ConvertOperatorToToolResp, error) {
 	m.ctrl.T.Helper()
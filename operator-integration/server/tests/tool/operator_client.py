@@ -4,12 +4,21 @@ import argparse
 import requests
 import json
 import os
+import time
 import yaml
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+
+# 批量注册识别的元数据文件后缀
+SPEC_SUFFIXES = ('.yaml', '.yml', '.json')
+# 批量注册时重试的响应状态码（限流、网关错误）；注册接口非幂等，读超时不重试，避免重复注册
+RETRY_STATUS = {429, 502, 503, 504}
+
 
 # OperatorClient：封装Operator API调用
 class OperatorClient:
-    def __init__(self, base_url, token):
+    def __init__(self, base_url, token, pool_size=10):
         # 读取配置文件
         self.BASE_URL = base_url
         self.headers = {
@@ -17,11 +26,16 @@ class OperatorClient:
             "Content-Type": "application/json"
         }
         self.url = f"{self.BASE_URL}/api/agent-operator-integration/v1"
+        # 复用连接的会话，批量注册时各线程共用，pool_size 不小于并发数
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _send_request(self, method, endpoint, params=None, data=None):
         url = f"{self.url}{endpoint}"
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self.headers,
@@ -49,6 +63,29 @@ class OperatorClient:
         endpoint = "/operator/register"
         return self._send_request('POST', endpoint, data=data)
 
+    def register_operator_with_retry(self, data, max_retries=3, timeout=60):
+        """注册算子，连接失败及限流、网关错误时按指数退避重试
+        返回 (HTTP状态码, 响应内容, 重试次数, 错误信息)，请求未完成时状态码为 None"""
+        url = f"{self.url}/operator/register"
+        retries = 0
+        while True:
+            try:
+                response = self.session.post(url, headers=self.headers, json=data, verify=False, timeout=timeout)
+                if response.status_code not in RETRY_STATUS or retries >= max_retries:
+                    try:
+                        body = response.json() if response.text.strip() else None
+                    except ValueError:
+                        body = response.text[:500]
+                    error = None if response.ok else response.text[:500]
+                    return response.status_code, body, retries, error
+            except requests.exceptions.ConnectionError as err:
+                if retries >= max_retries:
+                    return None, None, retries, str(err)
+            except requests.exceptions.RequestException as err:
+                return None, None, retries, str(err)
+            time.sleep(min(0.5 * 2 ** retries, 8))
+            retries += 1
+
     def update_operator(self, data):
         endpoint = "/operator/info/update"
         return self._send_request('POST', endpoint, data=data)
@@ -97,6 +134,7 @@ class OperatorOperation:
     def _init_operation_configs(self):
         """从配置文件中加载各操作参数"""
         self.register_config = self.config.get('register', {})
+        self.register_dir_config = self.config.get('register_dir', {})
         self.update_config = self.config.get('update', {})
         self.delete_config = self.config.get('delete', {})
         self.list_config = self.config.get('list', {}).get('query', {})
@@ -120,6 +158,108 @@ class OperatorOperation:
 
         return self.client.register_operator(payload)
 
+    def _spec_payload(self, file_path, base):
+        """按文件内容生成注册请求：含 code 字段的 JSON 为函数定义，其余为 OpenAPI 文档"""
+        with open(file_path, 'r', encoding='utf-8') as spec_file:
+            content = spec_file.read()
+        payload = dict(base)
+        if file_path.lower().endswith('.json'):
+            try:
+                spec = json.loads(content)
+            except ValueError:
+                spec = None
+            if isinstance(spec, dict) and 'code' in spec and 'openapi' not in spec:
+                payload['operator_metadata_type'] = 'function'
+                payload['function_input'] = spec
+                return payload
+        payload['operator_metadata_type'] = 'openapi'
+        payload['data'] = content
+        return payload
+
+    def _register_file(self, file_path, base, max_retries, timeout):
+        """注册单个元数据文件，返回写入清单的结果"""
+        begin = time.perf_counter()
+        record = {"file": file_path}
+        try:
+            payload = self._spec_payload(file_path, base)
+        except (OSError, UnicodeDecodeError) as err:
+            record.update(status="failed", retries=0, elapsed_ms=0, operators=[], error=str(err))
+            return record
+        status_code, body, retries, error = self.client.register_operator_with_retry(
+            payload, max_retries, timeout)
+        operators = body if status_code == 200 and isinstance(body, list) else []
+        succeeded = [op for op in operators if op.get('status') == 'success']
+        if operators and len(succeeded) == len(operators):
+            status = "success"
+        elif succeeded:
+            status = "partial"
+        else:
+            status = "failed"
+        record.update(
+            metadata_type=payload['operator_metadata_type'],
+            status=status,
+            http_status=status_code,
+            retries=retries,
+            elapsed_ms=round((time.perf_counter() - begin) * 1000, 1),
+            operators=[{
+                "operator_id": op.get('operator_id'),
+                "version": op.get('version'),
+                "status": op.get('status'),
+                "error": op.get('error')
+            } for op in operators])
+        if error:
+            record["error"] = error
+        elif status_code == 200 and not operators:
+            record["error"] = "未解析出算子"
+        return record
+
+    def register_dir(self, path=None, workers=None, publish=None, manifest=None, max_retries=None):
+        """并发注册目录（含子目录）下的全部元数据文件，结果逐行写入 JSONL 清单，返回汇总信息
+        命令行参数优先于配置文件 register_dir 段，算子信息等参数缺省时沿用 register 段"""
+        conf = self.register_dir_config
+        path = path or conf.get('path')
+        workers = workers or conf.get('workers', 8)
+        publish = conf.get('direct-publish', False) if publish is None else publish
+        manifest = manifest or conf.get('manifest', 'register_manifest.jsonl')
+        max_retries = conf.get('max_retries', 3) if max_retries is None else max_retries
+        timeout = conf.get('timeout', 60)
+        if not path or not os.path.isdir(path):
+            raise ValueError(f"元数据目录 {path} 不存在")
+        files = sorted(os.path.join(root, name) for root, _, names in os.walk(path)
+                       for name in names if name.lower().endswith(SPEC_SUFFIXES))
+        base = {"direct_publish": publish}
+        for key in ('operator_info', 'operator_execute_control', 'extend_info'):
+            base[key] = conf.get(key, self.register_config.get(key))
+
+        summary = {
+            "files": len(files), "success": 0, "partial": 0, "failed": 0,
+            "operators": 0, "operators_failed": 0, "retries": 0, "retried_files": 0,
+            "workers": workers, "direct_publish": publish, "manifest": manifest
+        }
+        step = max(1, len(files) // 20)
+        start = time.perf_counter()
+        with open(manifest, 'w', encoding='utf-8') as manifest_file, \
+                ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._register_file, file_path, base, max_retries, timeout)
+                       for file_path in files]
+            for done, future in enumerate(as_completed(futures), 1):
+                record = future.result()
+                manifest_file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                manifest_file.flush()
+                summary[record['status']] += 1
+                summary['operators'] += sum(1 for op in record['operators'] if op['status'] == 'success')
+                summary['operators_failed'] += sum(1 for op in record['operators'] if op['status'] != 'success')
+                summary['retries'] += record['retries']
+                summary['retried_files'] += 1 if record['retries'] else 0
+                if done % step == 0 or done == len(files):
+                    elapsed = time.perf_counter() - start
+                    print(f"[{done}/{len(files)}] {done / elapsed:.1f} 文件/秒, 失败 {summary['failed']}")
+        elapsed = time.perf_counter() - start
+        summary['elapsed_seconds'] = round(elapsed, 2)
+        summary['files_per_second'] = round(len(files) / elapsed, 2) if elapsed else 0.0
+        summary['operators_per_second'] = round(summary['operators'] / elapsed, 2) if elapsed else 0.0
+        return summary
+
     def update_operator(self):
         """更新算子信息"""
         # 动态参数优先于配置文件参数
@@ -176,6 +316,13 @@ if __name__ == "__main__":
     subparsers = parser.add_subparsers(dest='command')
     # Register command
     register_parser = subparsers.add_parser('register')
+    # Register dir command：未指定的参数取配置文件 register_dir 段
+    register_dir_parser = subparsers.add_parser('register-dir')
+    register_dir_parser.add_argument('--dir', help='元数据目录，递归查找 .yaml/.yml/.json 文件')
+    register_dir_parser.add_argument('--workers', type=int, help='并发数')
+    register_dir_parser.add_argument('--publish', action='store_true', default=None, help='注册后直接发布')
+    register_dir_parser.add_argument('--manifest', help='结果清单（JSONL）路径')
+    register_dir_parser.add_argument('--retries', type=int, help='连接失败、限流及网关错误的最大重试次数')
     # Update command
     update_parser = subparsers.add_parser('update')
     # List command
@@ -211,11 +358,23 @@ if __name__ == "__main__":
     if not args.token:
         parser.error("必须通过以下方式之一提供token: \n1. --token 参数\n2. 配置文件(--config指定)\n3. 当前目录的config.json")
 
-    client = OperatorClient(args.base_url, args.token)
+    pool_size = 10
+    if args.command == 'register-dir':
+        pool_size = max(pool_size, args.workers or config.get('register_dir', {}).get('workers', 8))
+    client = OperatorClient(args.base_url, args.token, pool_size=pool_size)
     operation = OperatorOperation(client, config)
 
     if args.command == 'register':
         print(operation.register_operator())
+    elif args.command == 'register-dir':
+        try:
+            summary = operation.register_dir(args.dir, args.workers, args.publish, args.manifest, args.retries)
+        except ValueError as err:
+            print(f"Error: {err}")
+            exit(1)
+        print(json.dumps(summary, ensure_ascii=False, indent=4))
+        if summary['failed'] or summary['partial']:
+            exit(1)
     elif args.command == 'update':
         print(operation.update_operator())
     elif args.command == 'list':
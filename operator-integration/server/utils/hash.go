@@ -5,6 +5,7 @@ package utils
 
 import (
 	"crypto/md5"
+	"crypto/sha256"
 	"fmt"
 	"io"
 
@@ -20,6 +21,13 @@ func MD5(str string) string {
 	return fmt.Sprintf("%x", h.Sum(nil))
 }
 
+// SHA256 sha256 hash
+func SHA256(str string) string {
+	h := sha256.New()
+	_, _ = io.WriteString(h, str)
+	return fmt.Sprintf("%x", h.Sum(nil))
+}
+
 // ObjectMD5Hash 计算对象的MD5哈希值
 func ObjectMD5Hash(data interface{}) (string, error) {
 	b, err := jsoniter.Marshal(data)
@@ -34,6 +42,20 @@ func ObjectMD5Hash(data interface{}) (string, error) {
 	return fmt.Sprintf("%x", h.Sum(nil)), nil
 }
 
+// ObjectSHA256Hash 计算对象的SHA256哈希值，map 按键排序序列化，相同内容的哈希稳定
+func ObjectSHA256Hash(data interface{}) (string, error) {
+	b, err := jsoniter.ConfigCompatibleWithStandardLibrary.Marshal(data)
+	if err != nil {
+		return "", err
+	}
+	h := sha256.New()
+	_, err = h.Write(b)
+	if err != nil {
+		return "", err
+	}
+	return fmt.Sprintf("%x", h.Sum(nil)), nil
+}
+
 // ObjectUUIDHash 计算对象的UUID哈希值
 func ObjectUUIDHash(data interface{}) (string, error) {
 	b, err := jsoniter.Marshal(data)
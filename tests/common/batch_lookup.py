@@ -0,0 +1,87 @@
+# -*- coding:UTF-8 -*-
+
+import json
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from urllib3 import disable_warnings
+from urllib3.exceptions import InsecureRequestWarning
+disable_warnings(InsecureRequestWarning)
+
+
+def chunked(items, size):
+    '''按 size 切分列表'''
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class BatchLookup():
+    '''
+    市场详情批量查询客户端（POST /market/batch）：ID 列表自动按 chunk_size 分批，多批并发请求，
+    stream=True 时请求 NDJSON 流式响应并逐行解析；每个线程复用各自的连接池会话
+    :param url: 批量查询接口地址，如 .../v1/mcp/market/batch
+    :param id_key: 请求体中 ID 列表的字段名（mcp_ids / box_ids / operator_ids）
+    '''
+    def __init__(self, url, id_key, headers, chunk_size=1000, workers=4, stream=False, timeout=60):
+        self.url = url
+        self.id_key = id_key
+        self.headers = dict(headers)
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.stream = stream
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def session(self):
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+            self.local.session.verify = False
+        return self.local.session
+
+    def fetch_chunk(self, ids, fields, start):
+        '''
+        查询一批 ID
+        :param start: 整次查询的起始时间，用于计算首条结果到达时间
+        :return: {"ids", "status", "items", "latency", "first_item", "bytes", "error"}
+        '''
+        result = {"ids": len(ids), "status": 0, "items": [], "latency": 0.0, "first_item": None, "bytes": 0, "error": None}
+        body = {self.id_key: ids, "fields": fields}
+        params = {"stream": "true"} if self.stream else None
+        begin = time.perf_counter()
+        try:
+            with self.session().post(self.url, params=params, json=body, headers=self.headers,
+                                     timeout=self.timeout, stream=self.stream, allow_redirects=False) as resp:
+                result["status"] = resp.status_code
+                if resp.status_code != 200:
+                    result["error"] = resp.text[:200]
+                elif self.stream:
+                    for line in resp.iter_lines():
+                        if not line:
+                            continue
+                        if result["first_item"] is None:
+                            result["first_item"] = time.perf_counter() - start
+                        result["bytes"] += len(line) + 1
+                        result["items"].append(json.loads(line))
+                else:
+                    result["bytes"] = len(resp.content)
+                    result["items"] = resp.json() or []
+                    result["first_item"] = time.perf_counter() - start
+        except (requests.RequestException, ValueError) as e:
+            result["error"] = repr(e)
+        result["latency"] = time.perf_counter() - begin
+        return result
+
+    def fetch(self, ids, fields):
+        '''
+        分批并发查询全部 ID
+        :return: (结果列表, 每批查询明细列表, 总耗时（秒）)
+        '''
+        start = time.perf_counter()
+        chunks = chunked(list(ids), self.chunk_size)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(chunks)))) as pool:
+            results = list(pool.map(lambda chunk: self.fetch_chunk(chunk, fields, start), chunks))
+        items = [item for r in results for item in r["items"]]
+        return items, results, time.perf_counter() - start
@@ -0,0 +1,212 @@
+# -*- coding:UTF-8 -*-
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from common.perf_stats import summarize
+
+
+def default_success(result):
+    '''默认成功判定：HTTP 状态码为 200'''
+    return result[0] == 200
+
+
+class CapacityFinder():
+    '''
+    容量探测：逐级加压（或二分查找）直到 P99 延迟或错误率突破 SLO
+    支持两种加压方式：
+        concurrency: 闭环模式，level 表示并发线程数，每个线程循环发起请求
+        rate: 开环模式，level 表示每秒到达请求数，延迟从计划发起时间开始计算，避免协同遗漏
+    '''
+    def __init__(self, func, slo_p99, slo_error_rate=0.01, duration=30, mode="concurrency",
+                 is_success=default_success, max_workers=500):
+        '''
+        :param func: 单次请求函数，入参为请求序号，返回 [status_code, response]
+        :param slo_p99: P99 延迟上限（秒）
+        :param slo_error_rate: 错误率上限，取值 0~1
+        :param duration: 每个压力等级的持续时间（秒）
+        :param mode: 加压方式，concurrency 或 rate
+        :param is_success: 成功判定函数，入参为 func 的返回值
+        :param max_workers: rate 模式下最大在途请求数
+        '''
+        if mode not in ("concurrency", "rate"):
+            raise ValueError(f"unsupported mode: {mode}")
+        self.func = func
+        self.slo_p99 = slo_p99
+        self.slo_error_rate = slo_error_rate
+        self.duration = duration
+        self.mode = mode
+        self.is_success = is_success
+        self.max_workers = max_workers
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def _next_index(self):
+        with self._lock:
+            self._counter += 1
+            return self._counter
+
+    def _call(self, start):
+        '''执行一次请求，返回 (延迟, 是否成功)；start 为计时起点'''
+        try:
+            ok = bool(self.is_success(self.func(self._next_index())))
+        except Exception as e:
+            print(f"请求异常: {e}")
+            ok = False
+        return time.perf_counter() - start, ok
+
+    def _run_concurrency(self, level):
+        latencies = []
+        errors = [0]
+        lock = threading.Lock()
+        deadline = time.perf_counter() + self.duration
+
+        def worker():
+            while time.perf_counter() < deadline:
+                latency, ok = self._call(time.perf_counter())
+                with lock:
+                    latencies.append(latency)
+                    if not ok:
+                        errors[0] += 1
+
+        begin = time.perf_counter()
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(int(level))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return latencies, errors[0], time.perf_counter() - begin
+
+    def _run_rate(self, level):
+        interval = 1.0 / level
+        total = int(level * self.duration)
+        begin = time.perf_counter()
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for i in range(total):
+                scheduled = begin + i * interval
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(self._call, scheduled))
+            results = [f.result() for f in futures]
+        elapsed = time.perf_counter() - begin
+        latencies = [r[0] for r in results]
+        errors = sum(1 for r in results if not r[1])
+        return latencies, errors, elapsed
+
+    def run_level(self, level):
+        '''
+        在指定压力等级下运行 duration 秒
+        :return: 统计结果字典，附带 level 与 passed（是否满足 SLO）
+        '''
+        if self.mode == "concurrency":
+            latencies, errors, elapsed = self._run_concurrency(level)
+        else:
+            latencies, errors, elapsed = self._run_rate(level)
+        result = summarize(latencies, errors, elapsed)
+        # 吞吐只统计成功请求
+        result["throughput"] = (result["count"] - errors) / elapsed if elapsed else 0.0
+        result["level"] = level
+        result["passed"] = result["count"] > 0 and result["p99"] <= self.slo_p99 \
+            and result["error_rate"] <= self.slo_error_rate
+        print(f"压力等级{level}: 吞吐 {result['throughput']:.2f} 次/秒, P99 {result['p99']:.3f}秒, "
+              f"错误率 {result['error_rate'] * 100:.2f}%, {'通过' if result['passed'] else '突破SLO'}")
+        return result
+
+    def step_search(self, start, max_level, step=None, factor=2):
+        '''
+        逐级加压，直到突破 SLO 或达到 max_level；最后一级截断为 max_level，保证上限本身被探测
+        :param step: 若指定，则每级线性增加 step，忽略 factor
+        :param factor: 每级按倍数增长（如 2 表示翻倍）
+        :return: 各等级结果列表
+        '''
+        results = []
+        level = start
+        while level <= max_level:
+            result = self.run_level(level)
+            results.append(result)
+            if not result["passed"] or level >= max_level:
+                break
+            level = min(level + step if step else level * factor, max_level)
+        return results
+
+    def binary_search(self, low, high, tolerance=1):
+        '''
+        在 [low, high] 内二分查找满足 SLO 的最大压力等级
+        :param tolerance: 区间收敛到该宽度时停止
+        :return: 各探测点结果列表（按探测顺序）
+        '''
+        results = []
+        result = self.run_level(low)
+        results.append(result)
+        if not result["passed"]:
+            return results
+        result = self.run_level(high)
+        results.append(result)
+        if result["passed"]:
+            return results
+        while high - low > tolerance:
+            # 压力等级取整，便于报告阅读和复现
+            mid = int((low + high) / 2)
+            if mid in (low, high):
+                break
+            result = self.run_level(mid)
+            results.append(result)
+            if result["passed"]:
+                low = mid
+            else:
+                high = mid
+        return results
+
+
+def knee_point(results, key="p99"):
+    '''
+    基于 Kneedle 思路求延迟曲线拐点：
+    将压力等级与延迟归一化到 [0, 1]，凸增曲线的拐点为 (x - y) 最大处
+    :return: 拐点对应的结果字典，点数不足 3 个时返回 None
+    '''
+    points = sorted(results, key=lambda r: r["level"])
+    if len(points) < 3:
+        return None
+    xs = [r["level"] for r in points]
+    ys = [r[key] for r in points]
+    x_span = (xs[-1] - xs[0]) or 1
+    y_span = (max(ys) - min(ys)) or 1
+    diffs = [(x - xs[0]) / x_span - (y - min(ys)) / y_span for x, y in zip(xs, ys)]
+    best = max(range(len(points)), key=lambda i: diffs[i])
+    if best in (0, len(points) - 1):
+        return None
+    return points[best]
+
+
+def capacity_report(name, results, slo_p99, slo_error_rate):
+    '''
+    汇总容量探测结果
+    :return: (报告文本, 报告字典)
+    '''
+    passed = [r for r in results if r["passed"]]
+    best = max(passed, key=lambda r: r["throughput"]) if passed else None
+    knee = knee_point(results)
+    breach = next((r for r in sorted(results, key=lambda r: r["level"]) if not r["passed"]), None)
+    report = {
+        "name": name,
+        "slo_p99": slo_p99,
+        "slo_error_rate": slo_error_rate,
+        "max_sustainable_throughput": best["throughput"] if best else 0.0,
+        "max_sustainable_level": best["level"] if best else None,
+        "knee_level": knee["level"] if knee else None,
+        "knee_throughput": knee["throughput"] if knee else None,
+        "breach_level": breach["level"] if breach else None,
+        "levels": sorted(results, key=lambda r: r["level"])
+    }
+    lines = [f"{name}容量探测结果:",
+             f"SLO: P99 <= {slo_p99:.3f}秒, 错误率 <= {slo_error_rate * 100:.2f}%",
+             f"最大可持续吞吐: {report['max_sustainable_throughput']:.2f} 次/秒 (压力等级 {report['max_sustainable_level']})",
+             f"拐点压力等级: {report['knee_level']}",
+             f"突破SLO压力等级: {report['breach_level']}",
+             "压力等级 | 吞吐(次/秒) | P50(秒) | P99(秒) | 错误率"]
+    for r in report["levels"]:
+        lines.append(f"{r['level']} | {r['throughput']:.2f} | {r['p50']:.3f} | {r['p99']:.3f} | {r['error_rate'] * 100:.2f}%")
+    return "\n".join(lines), report
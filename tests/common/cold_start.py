@@ -0,0 +1,123 @@
+# -*- coding:UTF-8 -*-
+
+import subprocess
+import time
+
+import requests
+
+from common.perf_stats import percentile
+from urllib3 import disable_warnings
+from urllib3.exceptions import InsecureRequestWarning
+disable_warnings(InsecureRequestWarning)
+
+
+class ServiceController():
+    '''
+    冷启动控制器：在每轮迭代之前把被测服务恢复到“刚部署”状态
+    restart_cmd: 重启本地服务的 shell 命令（如 docker restart / systemctl restart），清空全部进程内状态
+    flush_url: 缓存清理接口（如调试模式下的 /health/debug/flush），只清空进程内缓存，不重启
+    ready_url: 就绪检查接口，重启后轮询至返回 200
+    两者均未配置时不做任何处理，此时测得的是热缓存延迟
+    '''
+    def __init__(self, restart_cmd=None, flush_url=None, ready_url=None, ready_timeout=120, settle=0):
+        self.restart_cmd = restart_cmd
+        self.flush_url = flush_url
+        self.ready_url = ready_url
+        self.ready_timeout = ready_timeout
+        self.settle = settle  # 就绪后额外等待时间（秒），等待后台初始化任务完成
+
+    @property
+    def mode(self):
+        if self.restart_cmd:
+            return "restart"
+        if self.flush_url:
+            return "flush"
+        return "warm"
+
+    def wait_ready(self):
+        '''轮询就绪接口，返回等待时间（秒）'''
+        start = time.perf_counter()
+        deadline = start + self.ready_timeout
+        while time.perf_counter() < deadline:
+            try:
+                if requests.get(self.ready_url, verify=False, timeout=2).status_code == 200:
+                    return time.perf_counter() - start
+            except requests.RequestException:
+                pass
+            time.sleep(0.2)
+        raise TimeoutError(f"服务在 {self.ready_timeout} 秒内未就绪: {self.ready_url}")
+
+    def reset(self):
+        '''
+        恢复到冷状态
+        :return: 重启到就绪的耗时（秒），仅清缓存或未配置时返回 0
+        '''
+        if self.restart_cmd:
+            start = time.perf_counter()
+            subprocess.run(self.restart_cmd, shell=True, check=True)
+            if self.ready_url:
+                self.wait_ready()
+            elapsed = time.perf_counter() - start
+        elif self.flush_url:
+            requests.post(self.flush_url, verify=False, timeout=10).raise_for_status()
+            elapsed = 0.0
+        else:
+            return 0.0
+        if self.settle:
+            time.sleep(self.settle)
+        return elapsed
+
+
+def measure_warmup(func, controller, iterations=5, requests_per_iteration=50, is_success=None):
+    '''
+    每轮迭代先 reset 服务，再顺序请求 requests_per_iteration 次，按请求序号记录延迟
+    :param func: 被测函数，返回 [status_code, response]
+    :return: {"latencies": 每个序号的延迟列表, "errors": 每个序号的失败次数, "startup": 每轮重启耗时}
+    '''
+    is_success = is_success or (lambda result: result[0] == 200)
+    latencies = [[] for _ in range(requests_per_iteration)]
+    errors = [0] * requests_per_iteration
+    startup = []
+    for _ in range(iterations):
+        startup.append(controller.reset())
+        for n in range(requests_per_iteration):
+            start = time.perf_counter()
+            try:
+                ok = is_success(func())
+            except Exception:
+                ok = False
+            latencies[n].append(time.perf_counter() - start)
+            if not ok:
+                errors[n] += 1
+    return {"latencies": latencies, "errors": errors, "startup": startup}
+
+
+def warmup_summary(result, steady_fraction=0.2):
+    '''
+    汇总预热成本：第 1 次、第 10 次与稳态（最后 steady_fraction 比例请求）的中位延迟
+    :return: {"n1", "n10", "steady", "n1_ratio", "n10_ratio", "errors", "startup"}
+    '''
+    latencies = result["latencies"]
+    count = len(latencies)
+    steady_start = min(count - 1, int(count * (1 - steady_fraction)))
+    steady = percentile([v for values in latencies[steady_start:] for v in values], 50)
+    n1 = percentile(latencies[0], 50)
+    n10 = percentile(latencies[min(9, count - 1)], 50)
+    return {
+        "n1": n1,
+        "n10": n10,
+        "steady": steady,
+        "n1_ratio": n1 / steady if steady else 0.0,
+        "n10_ratio": n10 / steady if steady else 0.0,
+        "errors": sum(result["errors"]),
+        "startup": percentile(result["startup"], 50) if result["startup"] else 0.0
+    }
+
+
+def format_warmup(name, mode, summary):
+    return (f"{name} 预热成本（模式: {mode}）:\n" +
+            f"第1次请求中位延迟: {summary['n1']:.3f}秒（稳态的 {summary['n1_ratio']:.1f} 倍）\n" +
+            f"第10次请求中位延迟: {summary['n10']:.3f}秒（稳态的 {summary['n10_ratio']:.1f} 倍）\n" +
+            f"稳态中位延迟: {summary['steady']:.3f}秒\n" +
+            f"重启到就绪耗时: {summary['startup']:.3f}秒\n" +
+            f"失败次数: {summary['errors']}")
@@ -0,0 +1,185 @@
+# -*- coding:UTF-8 -*-
+
+import math
+import random
+import threading
+import time
+
+from collections import deque
+
+# 沙箱过载的判定：HTTP 503/429，或 200 响应中 stderr 提示沙箱池已满（"System error: 沙箱池已满"）
+# 执行超时、进程崩溃等其他系统错误不是容量问题，收缩并发与重试都无济于事，不算过载
+OVERLOAD_STATUS = (429, 503)
+POOL_FULL = "沙箱池已满"
+
+
+def is_overloaded(result):
+    '''判断 [status_code, response] 是否为沙箱过载，用户代码自身的异常与其他系统错误不算过载'''
+    if result[0] in OVERLOAD_STATUS:
+        return True
+    body = result[1]
+    return result[0] == 200 and isinstance(body, dict) and POOL_FULL in (body.get("stderr") or "")
+
+
+class LimitExceeded(Exception):
+    '''等待在途名额超时'''
+
+
+class AdaptiveLimiter():
+    '''
+    客户端自适应并发限制：限制同时在途的请求数，并根据延迟与过载响应动态调整上限，
+    使调用方持续以沙箱池的实际容量执行，而不是在空闲与过载之间来回振荡
+    两种调整算法：
+        aimd: 未过载且在途请求用满上限一半以上时每次成功 +1/limit（约每轮 +1），过载时乘以 backoff
+        gradient: 以长期平均延迟与短期延迟之比为梯度，limit = limit * gradient + sqrt(limit)，
+                  延迟稳定时持续增长、排队使延迟上升时收缩；过载时同样乘以 backoff
+    过载的请求按指数退避加随机抖动重试，最多 max_retries 次
+    '''
+    def __init__(self, initial=4, min_limit=1, max_limit=64, algorithm="gradient", backoff=0.5, tolerance=1.5,
+                 smoothing=0.2, long_window=100, max_retries=5, retry_base=0.05, retry_max=2.0, acquire_timeout=300,
+                 is_overloaded=is_overloaded):
+        '''
+        :param initial: 初始在途请求上限
+        :param algorithm: 调整算法，aimd 或 gradient
+        :param backoff: 过载时上限的乘法系数
+        :param tolerance: gradient 算法允许短期延迟超出长期平均的倍数，超出后开始收缩
+        :param smoothing: gradient 算法新上限的平滑系数，取值 0~1
+        :param long_window: 长期平均延迟的样本窗口
+        :param max_retries: 过载请求的最大重试次数
+        :param retry_base: 首次重试的退避时间（秒），之后按 2 倍增长且不超过 retry_max
+        :param acquire_timeout: 等待在途名额的超时（秒）
+        '''
+        if algorithm not in ("aimd", "gradient"):
+            raise ValueError(f"unsupported algorithm: {algorithm}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.algorithm = algorithm
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.long_window = long_window
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.acquire_timeout = acquire_timeout
+        self.is_overloaded = is_overloaded
+        self.cond = threading.Condition()
+        self.limit = float(max(min_limit, min(max_limit, initial)))
+        self.in_flight = 0
+        self.rtt_long = 0.0
+        self.rtt_short = 0.0
+        self.rtt_min = 0.0
+        self.samples = 0
+        self.last_drop = 0.0
+        self.start = time.perf_counter()
+        self.counts = {"requests": 0, "successes": 0, "overloads": 0, "retries": 0, "gave_up": 0, "drops": 0}
+        self.peak_in_flight = 0
+        self.waited = 0.0
+        self.history = deque(maxlen=10000)
+
+    def acquire(self):
+        '''等待在途请求数低于当前上限，返回等待耗时（秒）'''
+        begin = time.perf_counter()
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.in_flight < int(self.limit), timeout=self.acquire_timeout):
+                raise LimitExceeded(f"在途请求已达上限 {int(self.limit)}，等待超过 {self.acquire_timeout} 秒")
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            waited = time.perf_counter() - begin
+            self.waited += waited
+            return waited
+
+    def release(self, rtt, overloaded, in_flight):
+        '''
+        归还名额并以本次请求的结果调整上限
+        :param rtt: 请求耗时（秒）
+        :param overloaded: 是否为过载响应
+        :param in_flight: 请求发起时的在途请求数，用于判断上限是否被用满
+        '''
+        with self.cond:
+            self.in_flight -= 1
+            self.counts["requests"] += 1
+            if overloaded:
+                self.counts["overloads"] += 1
+                # 同一批在途请求的过载只收缩一次，避免一次排队高峰把上限压到最小
+                now = time.perf_counter()
+                if now - self.last_drop > max(self.rtt_short, 0.001):
+                    self.last_drop = now
+                    self.counts["drops"] += 1
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+            else:
+                self.counts["successes"] += 1
+                self.update(rtt, in_flight)
+            self.history.append((time.perf_counter() - self.start, self.limit, self.in_flight))
+            self.cond.notify_all()
+
+    def update(self, rtt, in_flight):
+        self.samples += 1
+        self.rtt_min = rtt if not self.rtt_min else min(self.rtt_min, rtt)
+        self.rtt_short = rtt if not self.rtt_short else self.rtt_short * 0.9 + rtt * 0.1
+        window = min(self.samples, self.long_window)
+        self.rtt_long = self.rtt_long + (rtt - self.rtt_long) / window
+        # 调用方并发不足时上限未被用满，此时的延迟无法说明能否承受更多请求
+        if in_flight * 2 < self.limit:
+            return
+        if self.algorithm == "aimd":
+            limit = self.limit + 1.0 / self.limit
+        else:
+            gradient = max(0.5, min(1.0, self.tolerance * self.rtt_long / self.rtt_short))
+            target = self.limit * gradient + math.sqrt(self.limit)
+            limit = self.limit * (1 - self.smoothing) + target * self.smoothing
+        self.limit = max(self.min_limit, min(self.max_limit, limit))
+
+    def call(self, func, *args, **kwargs):
+        '''在限流下调用 func（返回 [status_code, response]），过载时退避重试，返回最后一次结果'''
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            with self.cond:
+                in_flight = self.in_flight
+            begin = time.perf_counter()
+            overloaded = True
+            try:
+                result = func(*args, **kwargs)
+                overloaded = self.is_overloaded(result)
+            finally:
+                self.release(time.perf_counter() - begin, overloaded, in_flight)
+            if not overloaded:
+                return result
+            if attempt == self.max_retries:
+                break
+            with self.cond:
+                self.counts["retries"] += 1
+            time.sleep(random.uniform(0, min(self.retry_max, self.retry_base * 2 ** attempt)))
+        with self.cond:
+            self.counts["gave_up"] += 1
+        return result
+
+    def metrics(self):
+        '''限流器当前状态：上限、在途请求数、延迟估计与计数'''
+        with self.cond:
+            return dict(self.counts, limit=self.limit, in_flight=self.in_flight, peak_in_flight=self.peak_in_flight,
+                        rtt_min=self.rtt_min, rtt_short=self.rtt_short, rtt_long=self.rtt_long, waited=self.waited,
+                        algorithm=self.algorithm)
+
+    def series(self):
+        '''上限与在途请求数随时间的变化 [(秒, 上限, 在途请求数)]，用于绘制曲线'''
+        with self.cond:
+            return list(self.history)
+
+
+def limiter_from_config(config, **overrides):
+    '''按 env.ini 的 [performance] 段 limiter_* 参数创建限流器'''
+    section = "performance"
+    params = {
+        "initial": config.getint(section, "limiter_initial", fallback=4),
+        "min_limit": config.getint(section, "limiter_min", fallback=1),
+        "max_limit": config.getint(section, "limiter_max", fallback=64),
+        "algorithm": config.get(section, "limiter_algorithm", fallback="gradient"),
+        "backoff": config.getfloat(section, "limiter_backoff", fallback=0.5),
+        "tolerance": config.getfloat(section, "limiter_tolerance", fallback=1.5),
+        "max_retries": config.getint(section, "limiter_max_retries", fallback=5),
+        "retry_base": config.getfloat(section, "limiter_retry_base", fallback=0.05),
+        "retry_max": config.getfloat(section, "limiter_retry_max", fallback=2.0)
+    }
+    params.update(overrides)
+    return AdaptiveLimiter(**params)
@@ -0,0 +1,275 @@
+# -*- coding:UTF-8 -*-
+
+import gzip
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+
+import pymysql
+
+from common.db_seeder import (connect, escape_infile, grant_visibility, upsert_clause, BulkWriter, host,
+                              RESOURCE_OPERATOR, RESOURCE_TOOLBOX, RESOURCE_MCP)
+
+# 快照覆盖的 adp 表（outbox 消息为瞬时数据，不纳入快照）
+SNAPSHOT_TABLES = [
+    "t_category",
+    "t_metadata_api",
+    "t_metadata_function",
+    "t_op_registry",
+    "t_operator_release",
+    "t_operator_release_history",
+    "t_toolbox",
+    "t_tool",
+    "t_mcp_server_config",
+    "t_mcp_tool",
+    "t_mcp_server_release",
+    "t_mcp_server_release_history",
+    "t_internal_component_config"
+]
+
+# 归属用户列，恢复时改归当前用户
+OWNER_COLUMNS = ["f_create_user", "f_update_user", "f_release_user"]
+
+# 需要权限策略的资源表：表 -> (资源类型, 资源ID列)
+OWNED_RESOURCES = {
+    "t_op_registry": (RESOURCE_OPERATOR, "f_op_id"),
+    "t_toolbox": (RESOURCE_TOOLBOX, "f_box_id"),
+    "t_mcp_server_config": (RESOURCE_MCP, "f_mcp_id")
+}
+
+MANIFEST = "manifest.json"
+
+UNESCAPE = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r", "0": "\0"}
+
+
+def unescape_infile(value):
+    '''escape_infile 的逆过程'''
+    if value == "\\N":
+        return None
+    return re.sub(r"\\(.)", lambda m: UNESCAPE.get(m.group(1), m.group(1)), value)
+
+
+def snapshot_dir(root, name):
+    return os.path.join(root, name)
+
+
+def read_manifest(directory):
+    with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_manifest(directory, manifest):
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def list_snapshots(root):
+    '''列出 root 下的全部快照清单'''
+    if not os.path.isdir(root):
+        return []
+    manifests = []
+    for name in sorted(os.listdir(root)):
+        if os.path.exists(os.path.join(root, name, MANIFEST)):
+            manifests.append(read_manifest(os.path.join(root, name)))
+    return manifests
+
+
+def find_snapshot(root, kind=None, **tags):
+    '''按类型与标签（数据规模、分布参数、数据集版本等）查找快照，多个匹配时取最新的'''
+    matched = [m for m in list_snapshots(root)
+               if (kind is None or m["kind"] == kind) and all(m["tags"].get(k) == v for k, v in tags.items())]
+    return max(matched, key=lambda m: m["created"]) if matched else None
+
+
+def snapshot_db(root, name, tags, tables=None, owner=None):
+    '''
+    表级导出：逐表流式读取，写入 gzip 压缩的 LOAD DATA 格式文件（含自增主键，恢复后与原数据完全一致）
+    权限策略与业务域关联保存在其他服务中，快照只在同一环境内恢复
+    owner: 造数用户 ID，测试用户每次运行重建、ID 会变化，恢复时据此把资源改归当前用户
+    :return: 快照清单
+    '''
+    directory = snapshot_dir(root, name)
+    os.makedirs(directory, exist_ok=True)
+    manifest = {"name": name, "kind": "db", "tags": tags, "host": host, "owner": owner, "created": time.time(),
+                "tables": {}}
+    start = time.perf_counter()
+    conn = connect()
+    try:
+        for table in tables or SNAPSHOT_TABLES:
+            path = os.path.join(directory, f"{table}.tsv.gz")
+            rows = 0
+            with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+                cursor.execute(f"SELECT * FROM `{table}`")
+                columns = [d[0] for d in cursor.description]
+                with gzip.open(path, "wt", encoding="utf-8", newline="") as f:
+                    for row in cursor:
+                        f.write("\t".join(escape_infile(v) for v in row) + "\n")
+                        rows += 1
+            manifest["tables"][table] = {"rows": rows, "columns": columns, "file": os.path.basename(path)}
+    finally:
+        conn.close()
+    manifest["elapsed"] = time.perf_counter() - start
+    write_manifest(directory, manifest)
+    return manifest
+
+
+def read_rows(directory, info):
+    '''逐行读取快照文件，产出 {列名: 值}'''
+    with gzip.open(os.path.join(directory, info["file"]), "rt", encoding="utf-8", newline="") as f:
+        for line in f:
+            yield dict(zip(info["columns"], (unescape_infile(v) for v in line.rstrip("\n").split("\t"))))
+
+
+def server_local_infile(conn):
+    '''数据库是否开启 local_infile，未开启时 LOAD DATA LOCAL INFILE 会被拒绝'''
+    with conn.cursor() as cursor:
+        cursor.execute("SHOW GLOBAL VARIABLES LIKE 'local_infile'")
+        row = cursor.fetchone()
+    return bool(row) and str(row[1]).upper() in ("ON", "1")
+
+
+def snapshot_resources(directory, manifest, owner):
+    '''快照中造数用户创建的资源，{资源类型: [(资源ID, 名称, owner, 状态)]}，用于为当前用户补齐权限策略'''
+    resources = {}
+    for table, (rtype, id_column) in OWNED_RESOURCES.items():
+        info = manifest["tables"].get(table)
+        if not info:
+            continue
+        seen = set()
+        rows = resources.setdefault(rtype, [])
+        for row in read_rows(directory, info):
+            if row["f_create_user"] == manifest["owner"] and row[id_column] not in seen:
+                seen.add(row[id_column])
+                rows.append((row[id_column], row["f_name"], owner, row["f_status"]))
+    return resources
+
+
+def restore_db(directory, local_infile=None, truncate=False, owner=None, batch_rows=2000):
+    '''
+    恢复快照中的表：LOAD DATA LOCAL INFILE，数据库未开启 local_infile 时回退为多行 INSERT（local_infile 为 None 时自动检测）
+    truncate=True 时先清空快照中的全部表，恢复后与快照完全一致；默认保留快照外的数据，不写自增主键，
+    唯一键已存在的行按快照覆盖（快照后被修改的行同样恢复）
+    owner: 当前用户 ID，快照记录了造数用户时，把该用户的创建、更新、发布人改为 owner
+    :return: (恢复耗时（秒）, {表: 写入行数})
+    '''
+    manifest = read_manifest(directory)
+    if manifest.get("host") != host:
+        print(f"警告: 快照 {manifest['name']} 创建于 {manifest.get('host')}，当前环境为 {host}")
+    start = time.perf_counter()
+    conn = connect(local_infile=local_infile is not False)
+    counts = {}
+    try:
+        if local_infile is None:
+            local_infile = server_local_infile(conn)
+            if not local_infile:
+                print("数据库未开启 local_infile，改用多行 INSERT 恢复快照")
+        with conn.cursor() as cursor:
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+            for table, info in manifest["tables"].items():
+                columns = info["columns"] if truncate else [c for c in info["columns"] if c != "f_id"]
+                if truncate:
+                    cursor.execute(f"TRUNCATE TABLE `{table}`")
+                if local_infile:
+                    # 不写自增主键时以 @变量 读取并丢弃该列
+                    targets = [f"`{c}`" if c in columns else "@skip" for c in info["columns"]]
+                    # LOAD DATA 不支持按唯一键更新：覆盖写入时先载入同结构的临时表，再 INSERT ... SELECT 合并
+                    into = table if truncate else f"tmp_restore_{table}"
+                    if not truncate:
+                        cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS `{into}`")
+                        cursor.execute(f"CREATE TEMPORARY TABLE `{into}` LIKE `{table}`")
+                    fd, plain = tempfile.mkstemp(suffix=".tsv")
+                    os.close(fd)
+                    try:
+                        with gzip.open(os.path.join(directory, info["file"]), "rb") as src, open(plain, "wb") as dst:
+                            shutil.copyfileobj(src, dst)
+                        counts[table] = cursor.execute(
+                            f"LOAD DATA LOCAL INFILE %s INTO TABLE `{into}` CHARACTER SET utf8mb4 "
+                            "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' (" +
+                            ", ".join(targets) + ")", (plain,))
+                        if not truncate:
+                            names = ", ".join(f"`{c}`" for c in columns)
+                            cursor.execute(f"INSERT INTO `{table}` ({names}) SELECT {names} FROM `{into}`" +
+                                           upsert_clause(columns))
+                    finally:
+                        os.remove(plain)
+                        if not truncate:
+                            cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS `{into}`")
+                else:
+                    writer = BulkWriter(conn, batch_rows=batch_rows, upsert=not truncate)
+                    for row in read_rows(directory, info):
+                        writer.add(table, {c: row[c] for c in columns})
+                    writer.flush()
+                    counts[table] = writer.counts.get(table, 0)
+                if owner and manifest.get("owner") and owner != manifest["owner"]:
+                    for column in OWNER_COLUMNS:
+                        if column in columns:
+                            cursor.execute(f"UPDATE `{table}` SET `{column}` = %s WHERE `{column}` = %s",
+                                           (owner, manifest["owner"]))
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        conn.commit()
+    finally:
+        conn.close()
+    return time.perf_counter() - start, counts
+
+
+def snapshot_impex(root, name, tags, components, headers):
+    '''
+    导出包快照：逐个导出组件，跨环境可移植，但恢复时经由导入接口，速度慢于表级快照
+    :param components: [(组件类型 operator/toolbox/mcp, 组件ID), ...]
+    '''
+    from lib.impex import Impex
+    client = Impex()
+    directory = snapshot_dir(root, name)
+    os.makedirs(directory, exist_ok=True)
+    manifest = {"name": name, "kind": "impex", "tags": tags, "host": host, "created": time.time(), "bundles": []}
+    start = time.perf_counter()
+    for component_type, component_id in components:
+        result = client.export(component_type, component_id, headers)
+        assert result[0] == 200, f"导出 {component_type} {component_id} 失败: {result}"
+        file_name = f"{component_type}_{component_id}.json"
+        with open(os.path.join(directory, file_name), "w", encoding="utf-8") as f:
+            json.dump(result[1], f, ensure_ascii=False)
+        manifest["bundles"].append({"type": component_type, "id": component_id, "file": file_name})
+    manifest["elapsed"] = time.perf_counter() - start
+    write_manifest(directory, manifest)
+    return manifest
+
+
+def restore_impex(directory, headers, mode="upsert"):
+    '''
+    逐个导入导出包，返回 (恢复耗时（秒）, 失败列表)
+    导入不会删除快照之外的数据，需要完全一致的数据集时使用表级快照
+    '''
+    from lib.impex import Impex
+    client = Impex()
+    manifest = read_manifest(directory)
+    start = time.perf_counter()
+    failures = []
+    for bundle in manifest["bundles"]:
+        result = client.import_from_file(bundle["type"], os.path.join(directory, bundle["file"]), {"mode": mode}, headers)
+        if result[0] != 200:
+            failures.append({"bundle": bundle["file"], "status_code": result[0], "response": str(result[1])[:200]})
+    return time.perf_counter() - start, failures
+
+
+def restore_snapshot(manifest, root, headers=None, local_infile=None, truncate=False, owner=None,
+                     auth_url=None, bd_url=None):
+    '''
+    按快照类型恢复，返回恢复耗时（秒）
+    表级快照指定 owner 时资源改归当前用户，并经 auth_url / bd_url 为其补齐所有者权限策略与业务域关联
+    '''
+    directory = snapshot_dir(root, manifest["name"])
+    if manifest["kind"] == "db":
+        elapsed, counts = restore_db(directory, local_infile=local_infile, truncate=truncate, owner=owner)
+        print(f"已恢复表级快照 {manifest['name']}（{sum(counts.values())} 行），耗时 {elapsed:.1f}秒")
+        if owner and manifest.get("owner") and (auth_url or bd_url):
+            failures = grant_visibility(snapshot_resources(directory, manifest, owner), auth_url, bd_url)
+            assert not failures, f"为快照资源补齐权限策略或业务域关联失败 {failures} 次"
+    else:
+        elapsed, failures = restore_impex(directory, headers)
+        assert not failures, f"导入快照失败: {failures}"
+        print(f"已恢复导出包快照 {manifest['name']}（{len(manifest['bundles'])} 个组件），耗时 {elapsed:.1f}秒")
+    return elapsed
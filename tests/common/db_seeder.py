@@ -0,0 +1,284 @@
+# -*- coding:UTF-8 -*-
+
+import os
+import random
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pymysql
+import requests
+
+from common.get_content import GetContent
+from urllib3 import disable_warnings
+from urllib3.exceptions import InsecureRequestWarning
+disable_warnings(InsecureRequestWarning)
+
+configfile = "./config/env.ini"
+file = GetContent(configfile)
+config = file.config()
+
+host = config["server"]["host"]
+db_port = config["server"]["db_port"]
+db_user = config["server"]["db_user"]
+db_pwd = config["server"]["db_pwd"]
+
+# 所有者权限，与服务端 interfaces.OwnerPolicyList 保持一致
+OWNER_OPERATIONS = ["create", "modify", "delete", "view", "publish", "unpublish", "authorize", "public_access", "execute"]
+
+# 资源类型，与服务端 interfaces.AuthResourceType 保持一致
+RESOURCE_OPERATOR = "operator"
+RESOURCE_TOOLBOX = "tool_box"
+RESOURCE_MCP = "mcp"
+
+DAY_NS = 24 * 3600 * 10 ** 9
+
+
+def connect(local_infile=False):
+    return pymysql.connect(host=host, user=db_user, password=db_pwd, port=int(db_port), database="adp",
+                           charset="utf8mb4", local_infile=local_infile)
+
+
+def escape_infile(value):
+    '''LOAD DATA 默认转义规则：NULL 写为 \\N，反斜杠、制表符、换行需转义'''
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+class BulkWriter():
+    '''
+    按表缓冲待写入的行，攒够 batch_rows 后批量写入
+    mode: insert 多行 INSERT；load 写临时文件后 LOAD DATA LOCAL INFILE（需服务端开启 local_infile）
+    ignore: 唯一键已存在的行跳过而不报错
+    upsert: 唯一键已存在的行按新值更新（仅 insert 模式），写入行数按提交的行计
+    '''
+    def __init__(self, conn, mode="insert", batch_rows=1000, ignore=False, upsert=False):
+        self.conn = conn
+        self.mode = mode
+        self.batch_rows = batch_rows
+        self.ignore = "IGNORE " if ignore else ""
+        self.upsert = upsert
+        self.buffers = {}
+        self.columns = {}
+        self.counts = {}
+        self.elapsed = 0.0
+
+    def add(self, table, row):
+        if table not in self.columns:
+            self.columns[table] = list(row)
+            self.buffers[table] = []
+        self.buffers[table].append([row[c] for c in self.columns[table]])
+        if len(self.buffers[table]) >= self.batch_rows:
+            self.flush(table)
+
+    def flush(self, table=None):
+        tables = [table] if table else list(self.buffers)
+        start = time.perf_counter()
+        with self.conn.cursor() as cursor:
+            for name in tables:
+                rows = self.buffers.get(name)
+                if not rows:
+                    continue
+                if self.mode == "load":
+                    written = self._load(cursor, name, rows)
+                else:
+                    written = self._insert(cursor, name, rows)
+                self.counts[name] = self.counts.get(name, 0) + written
+                self.buffers[name] = []
+        self.conn.commit()
+        self.elapsed += time.perf_counter() - start
+
+    def _insert(self, cursor, table, rows):
+        columns = self.columns[table]
+        placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        sql = (f"INSERT {self.ignore}INTO `{table}` (" + ", ".join(f"`{c}`" for c in columns) + ") VALUES " +
+               ", ".join([placeholder] * len(rows)))
+        if self.upsert:
+            # ON DUPLICATE KEY UPDATE 的影响行数对更新的行计 2、未变化的行计 0，不能作为写入行数
+            cursor.execute(sql + upsert_clause(columns), [value for row in rows for value in row])
+            return len(rows)
+        return cursor.execute(sql, [value for row in rows for value in row])
+
+    def _load(self, cursor, table, rows):
+        columns = self.columns[table]
+        fd, path = tempfile.mkstemp(suffix=".tsv")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                for row in rows:
+                    f.write("\t".join(escape_infile(v) for v in row) + "\n")
+            return cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s {self.ignore}INTO TABLE `{table}` CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' (" +
+                ", ".join(f"`{c}`" for c in columns) + ")", (path,))
+        finally:
+            os.remove(path)
+
+
+def upsert_clause(columns):
+    '''INSERT 语句的 ON DUPLICATE KEY UPDATE 子句，唯一键冲突时以新值覆盖全部列'''
+    return " ON DUPLICATE KEY UPDATE " + ", ".join(f"`{c}` = VALUES(`{c}`)" for c in columns)
+
+
+def select_rows(cursor, table, column, values):
+    '''按列取模板行（去掉自增主键），返回字典列表'''
+    if not values:
+        return []
+    cursor.execute(f"SELECT * FROM `{table}` WHERE `{column}` IN (" + ", ".join(["%s"] * len(values)) + ")",
+                   list(values))
+    names = [d[0] for d in cursor.description]
+    rows = []
+    for values in cursor.fetchall():
+        row = dict(zip(names, values))
+        row.pop("f_id", None)
+        rows.append(row)
+    return rows
+
+
+class Templates():
+    '''
+    从数据库读取经由 API 创建并发布的模板资源，批量造数时复制模板行，只替换 ID、名称、时间、归属等字段，
+    保证行结构与 dbaccess 写入的一致
+    '''
+    def __init__(self, conn, operator_id, box_id, mcp_id):
+        with conn.cursor() as cursor:
+            self.operator = select_rows(cursor, "t_op_registry", "f_op_id", [operator_id])[0]
+            self.operator_metadata = select_rows(cursor, "t_metadata_api", "f_version",
+                                                 [self.operator["f_metadata_version"]])[0]
+            releases = select_rows(cursor, "t_operator_release", "f_op_id", [operator_id])
+            self.operator_release = max(releases, key=lambda r: r["f_tag"])
+
+            self.toolbox = select_rows(cursor, "t_toolbox", "f_box_id", [box_id])[0]
+            self.tools = select_rows(cursor, "t_tool", "f_box_id", [box_id])
+            metadatas = select_rows(cursor, "t_metadata_api", "f_version", [t["f_source_id"] for t in self.tools])
+            self.tool_metadata = {m["f_version"]: m for m in metadatas}
+
+            self.mcp = select_rows(cursor, "t_mcp_server_config", "f_mcp_id", [mcp_id])[0]
+            releases = select_rows(cursor, "t_mcp_server_release", "f_mcp_id", [mcp_id])
+            self.mcp_release = max(releases, key=lambda r: r["f_version"])
+
+
+class DBSeeder():
+    '''
+    直接写库的批量造数器，每个方法生成一个资源的全部关联行，未指定名称与描述时使用 “前缀_标识_序号” 和模板描述
+    创建/更新时间在最近 span_days 天内随机分布，便于按时间排序的列表测试
+    '''
+    def __init__(self, writer, templates, seed=0, span_days=30, tag=None):
+        self.writer = writer
+        self.templates = templates
+        self.rng = random.Random(seed)
+        self.span_ns = span_days * DAY_NS
+        self.now = time.time_ns()
+        self.tag = tag or uuid.uuid4().hex[:6]
+        self.resources = {RESOURCE_OPERATOR: [], RESOURCE_TOOLBOX: [], RESOURCE_MCP: []}
+
+    def times(self):
+        create = self.now - self.rng.randrange(self.span_ns)
+        update = create + self.rng.randrange(max(1, self.now - create))
+        return create, update
+
+    def name(self, prefix, index):
+        return f"{prefix}_{self.tag}_{index}"
+
+    def clone_metadata(self, template, summary, user, create, update, description=None):
+        row = dict(template, f_version=str(uuid.uuid4()), f_summary=summary,
+                   f_create_user=user, f_create_time=create, f_update_user=user, f_update_time=update)
+        if description is not None:
+            row["f_description"] = description
+        self.writer.add("t_metadata_api", row)
+        return row["f_version"]
+
+    def operator(self, index, user, category, status, name=None, description=None):
+        '''算子：t_metadata_api + t_op_registry，已发布/已下架的同时写 t_operator_release'''
+        t = self.templates
+        create, update = self.times()
+        name = name or self.name("bulk_op", index)
+        version = self.clone_metadata(t.operator_metadata, name, user, create, update, description)
+        op_id = str(uuid.uuid4())
+        registry = dict(t.operator, f_op_id=op_id, f_name=name, f_metadata_version=version, f_status=status,
+                        f_category=category, f_create_user=user, f_create_time=create,
+                        f_update_user=user, f_update_time=update, f_is_deleted=0)
+        self.writer.add("t_op_registry", registry)
+        if status != "unpublish":
+            release = dict(t.operator_release, **{k: registry[k] for k in t.operator_release if k in registry})
+            release.update(f_tag=1, f_release_user=user, f_release_time=update)
+            self.writer.add("t_operator_release", release)
+        self.resources[RESOURCE_OPERATOR].append((op_id, name, user, status))
+        return op_id
+
+    def toolbox(self, index, user, category, status, name=None, description=None):
+        '''工具箱：t_toolbox + 模板中的全部 t_tool 及其 t_metadata_api'''
+        t = self.templates
+        create, update = self.times()
+        name = name or self.name("bulk_box", index)
+        box_id = str(uuid.uuid4())
+        released = status != "unpublish"
+        self.writer.add("t_toolbox", dict(
+            t.toolbox, f_box_id=box_id, f_name=name, f_status=status, f_category=category,
+            f_description=t.toolbox["f_description"] if description is None else description,
+            f_create_user=user, f_create_time=create, f_update_user=user, f_update_time=update,
+            f_release_user=user if released else "", f_release_time=update if released else 0))
+        for tool in t.tools:
+            source_id = tool["f_source_id"]
+            if source_id in t.tool_metadata:
+                source_id = self.clone_metadata(t.tool_metadata[source_id], tool["f_name"], user, create, update)
+            self.writer.add("t_tool", dict(
+                tool, f_tool_id=str(uuid.uuid4()), f_box_id=box_id, f_source_id=source_id, f_use_count=0,
+                f_create_user=user, f_create_time=create, f_update_user=user, f_update_time=update, f_is_deleted=0))
+        self.resources[RESOURCE_TOOLBOX].append((box_id, name, user, status))
+        return box_id
+
+    def mcp(self, index, user, category, status, name=None, description=None):
+        '''MCP：t_mcp_server_config，已发布/已下架的同时写 t_mcp_server_release'''
+        t = self.templates
+        create, update = self.times()
+        name = name or self.name("bulk_mcp", index)
+        mcp_id = str(uuid.uuid4())
+        config_row = dict(t.mcp, f_mcp_id=mcp_id, f_name=name, f_status=status, f_category=category,
+                          f_create_user=user, f_create_time=create, f_update_user=user, f_update_time=update,
+                          f_description=t.mcp["f_description"] if description is None else description,
+                          f_version=1)
+        self.writer.add("t_mcp_server_config", config_row)
+        if status != "unpublish":
+            release = dict(t.mcp_release, **{k: config_row[k] for k in t.mcp_release if k in config_row})
+            release.update(f_release_user=user, f_release_time=update)
+            self.writer.add("t_mcp_server_release", release)
+        self.resources[RESOURCE_MCP].append((mcp_id, name, user, status))
+        return mcp_id
+
+
+def grant_visibility(resources, auth_url=None, bd_url=None, bd_id="bd_public", workers=16, batch=500):
+    '''
+    直接写库的资源没有权限策略与业务域关联，公开接口列表不可见
+    auth_url: 授权服务地址（如 http://authorization-private:30920/api/authorization），批量创建所有者策略
+    bd_url: 业务域服务地址（如 http://business-system:8080/internal/api/business-system/v1），逐个关联业务域
+    :param resources: {资源类型: [(资源ID, 名称, 所有者用户ID, 状态)]}
+    :return: 失败次数
+    '''
+    failures = 0
+    items = [(rtype, rid, name, user) for rtype, rows in resources.items() for rid, name, user, _ in rows]
+    if auth_url:
+        for i in range(0, len(items), batch):
+            policies = [{
+                "accessor": {"id": user, "type": "user", "name": user},
+                "resource": {"id": rid, "type": rtype, "name": name},
+                "operation": {"allow": [{"id": op, "name": op} for op in OWNER_OPERATIONS], "deny": []}
+            } for rtype, rid, name, user in items[i:i + batch]]
+            resp = requests.post(f"{auth_url}/v1/policy", json=policies, verify=False, timeout=60)
+            if resp.status_code >= 300:
+                failures += len(policies)
+                print(f"创建权限策略失败: {resp.status_code} {resp.text[:200]}")
+
+    def associate(item):
+        rtype, rid, _, _ = item
+        resp = requests.post(f"{bd_url}/resource", json={"bd_id": bd_id, "id": rid, "type": rtype},
+                             verify=False, timeout=30)
+        return resp.status_code < 300 or resp.status_code == 409
+
+    if bd_url:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            failures += sum(1 for ok in executor.map(associate, items) if not ok)
+    return failures
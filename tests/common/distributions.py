@@ -0,0 +1,158 @@
+# -*- coding:UTF-8 -*-
+
+import bisect
+import itertools
+import math
+import random
+import string
+
+# 共享名称前缀的词表，组合生成 “领域_动作” 形式的前缀
+PREFIX_DOMAINS = ["data", "sales", "user", "order", "report", "model", "file", "search", "graph", "agent",
+                  "log", "metric", "image", "text", "audio", "vector", "task", "flow", "doc", "table"]
+PREFIX_ACTIONS = ["query", "export", "sync", "parse", "clean", "split", "merge", "index", "train", "predict",
+                  "convert", "extract", "summary", "check"]
+
+
+def zipf_weights(n, s=1.1):
+    '''Zipf 分布权重：第 k 名权重与 1 / k^s 成正比，s 越大越集中于头部，s=0 为均匀分布'''
+    return [1.0 / (k ** s) for k in range(1, n + 1)]
+
+
+class WeightedChoice():
+    '''按权重抽样（累积权重 + 二分查找），items 按权重从高到低排列'''
+    def __init__(self, items, weights, rng):
+        self.items = list(items)
+        self.cumulative = list(itertools.accumulate(weights))
+        self.rng = rng
+
+    def __call__(self):
+        value = self.rng.random() * self.cumulative[-1]
+        return self.items[bisect.bisect_right(self.cumulative, value)]
+
+    def share(self, index):
+        '''第 index 个元素的抽样概率'''
+        prev = self.cumulative[index - 1] if index else 0
+        return (self.cumulative[index] - prev) / self.cumulative[-1]
+
+
+def zipf_choice(items, s, rng):
+    return WeightedChoice(items, zipf_weights(len(items), s), rng)
+
+
+def lognormal_int(rng, median, sigma, low=1, high=None):
+    '''对数正态分布整数：多数值靠近中位数，少量长尾大值'''
+    value = int(round(rng.lognormvariate(math.log(median), sigma)))
+    value = max(low, value)
+    return min(high, value) if high else value
+
+
+def allocate(total, items, weights):
+    '''按权重把 total 分配给各元素（最大余数法，合计严格等于 total）'''
+    weight_sum = sum(weights)
+    quotas = [total * w / weight_sum for w in weights]
+    counts = [int(q) for q in quotas]
+    for i in sorted(range(len(items)), key=lambda i: quotas[i] - counts[i], reverse=True)[:total - sum(counts)]:
+        counts[i] += 1
+    return dict(zip(items, counts))
+
+
+class SeedProfile():
+    '''
+    造数数据分布：分类、归属用户、名称前缀按 Zipf 分布倾斜，描述长度按对数正态分布（不超过 desc_max，
+    默认与服务端描述长度上限 255 字节一致），状态按比例
+    skew=False 时退化为当前的均匀分布（分类轮询、随机名称、固定描述），作为对照基线
+    '''
+    def __init__(self, categories, users, seed=0, skew=True, category_s=1.2, owner_s=1.0, prefixes=50,
+                 prefix_s=1.1, desc_median=80, desc_sigma=1.0, desc_max=255, status_ratio=None):
+        self.rng = random.Random(seed)
+        self.skew = skew
+        self.categories = list(categories)
+        self.users = list(users)
+        self.status_ratio = status_ratio or {"published": 0.7, "offline": 0.2, "unpublish": 0.1}
+        self.desc_median = desc_median
+        self.desc_sigma = desc_sigma
+        self.desc_max = desc_max
+        s = lambda value: value if skew else 0
+        # 打乱顺序后再分配权重，避免总是列表第一个分类最热
+        shuffled = self.categories[:]
+        self.rng.shuffle(shuffled)
+        self.category = zipf_choice(shuffled, s(category_s), self.rng)
+        self.owner_weights = zipf_weights(len(self.users), s(owner_s))
+        self.owner = WeightedChoice(self.users, self.owner_weights, self.rng)
+        pool = [f"{d}_{a}" for d in PREFIX_DOMAINS for a in PREFIX_ACTIONS]
+        self.rng.shuffle(pool)
+        self.prefix = zipf_choice(pool[:prefixes], s(prefix_s), self.rng)
+        self.status = WeightedChoice(list(self.status_ratio), list(self.status_ratio.values()), self.rng)
+        self.counter = 0
+
+    def hot_categories(self):
+        '''按热度排序的分类'''
+        return self.category.items
+
+    def hot_prefixes(self):
+        return self.prefix.items
+
+    def owners(self, total):
+        '''把 total 个资源按归属倾斜分配给用户，返回 {用户: 数量}'''
+        return allocate(total, self.users, self.owner_weights)
+
+    def next_category(self):
+        if not self.skew:
+            self.counter += 1
+            return self.categories[(self.counter - 1) % len(self.categories)]
+        return self.category()
+
+    def name(self, suffix=""):
+        '''共享前缀名称，如 sales_export_k3jd9a；skew=False 时为随机 8 位字符串'''
+        word = ''.join(self.rng.choice(string.ascii_lowercase + string.digits) for _ in range(6))
+        if not self.skew:
+            return word + suffix
+        return f"{self.prefix()}_{word}{suffix}"
+
+    def description(self):
+        if not self.skew:
+            return "test description"
+        length = lognormal_int(self.rng, self.desc_median, self.desc_sigma, low=8, high=self.desc_max)
+        words = []
+        size = 0
+        while size < length:
+            words.append(''.join(self.rng.choice(string.ascii_lowercase) for _ in range(self.rng.randint(2, 10))))
+            size += len(words[-1]) + 1
+        return ' '.join(words)[:length]
+
+    def next_status(self):
+        return self.status()
+
+    def summary(self):
+        '''分布概况，写入报告与快照标签'''
+        return {
+            "skew": self.skew,
+            "top_category": self.category.items[0],
+            "top_category_share": round(self.category.share(0), 3),
+            "top_owner_share": round(self.owner_weights[0] / sum(self.owner_weights), 3),
+            "top_prefix": self.prefix.items[0],
+            "top_prefix_share": round(self.prefix.share(0), 3),
+            "status_ratio": self.status_ratio
+        }
+
+
+def profile_from_config(config, categories, users):
+    '''从 env.ini 的 [performance] 段读取分布参数'''
+    section = "performance"
+    ratio = {}
+    for item in config.get(section, "dist_status_ratio", fallback="published:0.7,offline:0.2,unpublish:0.1").split(","):
+        status, weight = item.split(":")
+        ratio[status.strip()] = float(weight)
+    return SeedProfile(
+        categories, users,
+        seed=config.getint(section, "dist_seed", fallback=0),
+        skew=config.getboolean(section, "dist_skew", fallback=True),
+        category_s=config.getfloat(section, "dist_category_s", fallback=1.2),
+        owner_s=config.getfloat(section, "dist_owner_s", fallback=1.0),
+        prefixes=config.getint(section, "dist_prefixes", fallback=50),
+        prefix_s=config.getfloat(section, "dist_prefix_s", fallback=1.1),
+        desc_median=config.getint(section, "dist_desc_median", fallback=80),
+        desc_sigma=config.getfloat(section, "dist_desc_sigma", fallback=1.0),
+        desc_max=config.getint(section, "dist_desc_max", fallback=255),
+        status_ratio=ratio
+    )
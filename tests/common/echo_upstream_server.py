@@ -0,0 +1,378 @@
+# -*- coding:UTF-8 -*-
+
+import argparse
+import asyncio
+import json
+import socket
+import threading
+import time
+from urllib.parse import urlparse, parse_qs
+
+ECHO_PATH = "/echo"
+STREAM_PATH = "/stream"
+
+# 运行时可通过 POST /_stub/config 调整的默认响应参数，单次请求可用同名 query 参数覆盖
+CONFIG_KEYS = ["size", "delay_ms", "status"]
+
+# 流式响应参数（query）：事件数、事件间隔、单个事件字节数、首个事件前的等待；mode 为 sse 或 http（NDJSON）
+STREAM_KEYS = {"events": 100, "interval_ms": 0, "event_size": 64, "delay_ms": 0}
+STREAM_CONTENT_TYPES = {"sse": "text/event-stream", "http": "application/x-ndjson"}
+
+REASONS = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+           411: "Length Required", 429: "Too Many Requests", 500: "Internal Server Error",
+           502: "Bad Gateway", 503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+def echo_operation(name):
+    '''回显接口的 OpenAPI 操作描述，name 用作工具名'''
+    return {
+        "post": {
+            "summary": name,
+            "description": "回显请求体；size 指定时返回约 size 字节的 JSON，delay_ms 延迟响应，status 指定状态码",
+            "operationId": name,
+            "parameters": [
+                {"name": key, "in": "query", "required": False, "schema": {"type": "integer"}}
+                for key in CONFIG_KEYS
+            ],
+            "requestBody": {"content": {"application/json": {"schema": {
+                "type": "object", "properties": {"data": {"type": "string"}}}}}},
+            "responses": {"200": {"description": "回显结果", "content": {"application/json": {"schema": {
+                "type": "object", "properties": {"data": {"type": "string"}}}}}}}
+        }
+    }
+
+
+def echo_spec(base_url, title="echo upstream", paths=None):
+    '''
+    上游的 OpenAPI 描述，注册为算子或工具箱后每个路径即一个工具：POST /echo 回显，POST /stream 流式事件
+    :param paths: 只描述其中的路径，默认全部
+    '''
+    operations = {
+        ECHO_PATH: echo_operation("echo"),
+        STREAM_PATH: {
+            "post": {
+                "summary": "stream",
+                "description": "按 interval_ms 间隔输出 events 个约 event_size 字节的事件，mode 为 sse 或 http（NDJSON）",
+                "operationId": "stream",
+                "parameters": [{"name": "mode", "in": "query", "required": False, "schema": {"type": "string"}}] + [
+                    {"name": name, "in": "query", "required": False, "schema": {"type": "integer"}}
+                    for name in STREAM_KEYS
+                ],
+                "responses": {"200": {"description": "事件流 {seq, ts, data}", "content": {
+                    mime: {"schema": {"type": "string"}} for mime in STREAM_CONTENT_TYPES.values()}}}
+            }
+        }
+    }
+    return {
+        "openapi": "3.0.1",
+        "info": {"title": title, "version": "1.0.0", "description": "本地回显上游，用于代理开销测试"},
+        "servers": [{"url": base_url}],
+        "paths": {path: operations[path] for path in (paths or operations)}
+    }
+
+
+def echo_tools_spec(base_url, tools, title="echo tools"):
+    '''含 tools 个回显工具的 OpenAPI 描述：POST /echo/tool_{i}，上游对 /echo 下的任意路径都回显'''
+    return {
+        "openapi": "3.0.1",
+        "info": {"title": title, "version": "1.0.0", "description": "本地回显上游，用于多工具代理测试"},
+        "servers": [{"url": base_url}],
+        "paths": {f"{ECHO_PATH}/tool_{i}": echo_operation(f"echo_tool_{i}") for i in range(tools)}
+    }
+
+
+def padded_body(size):
+    '''约 size 字节的 JSON 响应体 {"data": "xxx..."}'''
+    return json.dumps({"data": "x" * max(0, size - 12)}).encode()
+
+
+class Stats():
+    '''请求数、收发字节数与按状态码的计数'''
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.counts = {"requests": 0, "connections": 0, "bytes_in": 0, "bytes_out": 0, "streams": 0,
+                           "events": 0}
+            self.statuses = {}
+
+    def add(self, key, n=1):
+        with self.lock:
+            self.counts[key] += n
+
+    def status(self, code):
+        with self.lock:
+            self.statuses[str(code)] = self.statuses.get(str(code), 0) + 1
+
+    def snapshot(self):
+        with self.lock:
+            return {"counts": dict(self.counts), "statuses": dict(self.statuses)}
+
+
+class EchoUpstreamServer():
+    '''
+    本地异步回显上游（asyncio，HTTP/1.1 keep-alive），作为代理测试的被代理服务：
+    POST /echo（及 /echo 下的任意路径）默认原样返回请求体；size 大于 0 时改为返回约 size 字节的 JSON；delay_ms 延迟响应（不占用线程），
+    status 指定响应状态码；三者的默认值可通过 POST /_stub/config 调整，单次请求可用同名 query 参数覆盖
+    POST /stream 慢速生产者：等待 delay_ms 后每隔 interval_ms 输出一个事件 {seq, ts, data}（ts 为生产时刻的 time.time()），
+    共 events 个，每个约 event_size 字节，以 chunked 编码逐个发送；mode=sse 时为 "data: ...\\n\\n" 并以 [DONE] 结束，
+    mode=http 时为 NDJSON，未指定时按 Accept 头判断
+    延迟在事件循环中等待，上游自身不成为并发瓶颈，测得的吞吐上限即代理的上限
+    统计与控制接口：GET /_stub/stats，POST /_stub/reset，POST /_stub/config
+    '''
+    def __init__(self, host="0.0.0.0", port=0, advertise_host=None, size=0, delay_ms=0, status=200,
+                 max_body=128 * 1024 * 1024):
+        self.host = host
+        self.port = port
+        self.advertise_host = advertise_host
+        self.defaults = {}
+        self.configure(size=size, delay_ms=delay_ms, status=status)
+        self.max_body = max_body
+        self.stats_ = Stats()
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.ready = threading.Event()
+
+    def configure(self, **params):
+        '''调整默认响应参数，未知参数抛出 ValueError'''
+        unknown = set(params) - set(CONFIG_KEYS)
+        if unknown:
+            raise ValueError(f"未知的配置参数: {sorted(unknown)}")
+        self.defaults.update({k: int(v) for k, v in params.items()})
+        return dict(self.defaults)
+
+    def config(self):
+        return dict(self.defaults)
+
+    def start(self):
+        '''在后台线程运行事件循环，port=0 时使用随机端口'''
+        self.ready.clear()
+        self.thread = threading.Thread(target=self.run, name="echo-upstream", daemon=True)
+        self.thread.start()
+        self.ready.wait(10)
+        return self
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = self.loop.run_until_complete(
+            asyncio.start_server(self.serve, self.host, self.port, backlog=1024, limit=1024 * 1024))
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.server.close()
+            # 取消仍保持着的 keep-alive 连接，再关闭事件循环
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+
+    def stop(self):
+        if self.loop and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(10)
+        self.loop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def base_url(self):
+        host = self.advertise_host or (socket.gethostname() if self.host == "0.0.0.0" else self.host)
+        return f"http://{host}:{self.port}"
+
+    def url(self, path=ECHO_PATH):
+        return self.base_url() + path
+
+    def spec(self, title="echo upstream", paths=None):
+        return echo_spec(self.base_url(), title, paths)
+
+    def stats(self):
+        return dict(self.stats_.snapshot(), config=self.config())
+
+    def reset(self):
+        self.stats_.reset()
+
+    # ---------- HTTP 处理 ----------
+
+    async def serve(self, reader, writer):
+        self.stats_.add("connections")
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                keep_alive = await self.dispatch(request, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError,
+                asyncio.CancelledError):
+            # 停止服务时取消连接任务，按正常结束处理
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader):
+        '''读取一个请求，连接关闭时返回 None；支持 Content-Length 与 chunked 请求体'''
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ", 2)
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = bytearray()
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                body += await reader.readexactly(size)
+                await reader.readexactly(2)
+                if len(body) > self.max_body:
+                    raise ValueError("request body too large")
+            body = bytes(body)
+        else:
+            length = int(headers.get("content-length") or 0)
+            if length > self.max_body:
+                raise ValueError("request body too large")
+            body = await reader.readexactly(length) if length else b""
+        self.stats_.add("bytes_in", len(head) + len(body))
+        return {"method": method, "target": target, "version": version, "headers": headers, "body": body}
+
+    async def respond(self, writer, status, body=b"", content_type="application/json", keep_alive=True):
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode()
+        writer.write(head)
+        writer.write(body)
+        await writer.drain()
+        self.stats_.add("bytes_out", len(head) + len(body))
+
+    async def stream(self, request, query, writer, keep_alive):
+        '''按事件逐块输出流式响应'''
+        params = dict(STREAM_KEYS, **{k: int(query[k]) for k in STREAM_KEYS if k in query})
+        mode = query.get("mode") or ("sse" if "text/event-stream" in request["headers"].get("accept", "") else "http")
+        if mode not in STREAM_CONTENT_TYPES:
+            raise ValueError(f"unsupported stream mode: {mode}")
+        self.stats_.add("streams")
+        head = (f"HTTP/1.1 200 OK\r\n"
+                f"Content-Type: {STREAM_CONTENT_TYPES[mode]}\r\n"
+                f"Cache-Control: no-cache\r\n"
+                f"Transfer-Encoding: chunked\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode()
+        writer.write(head)
+        await writer.drain()
+        sent = len(head)
+        if params["delay_ms"] > 0:
+            await asyncio.sleep(params["delay_ms"] / 1000.0)
+        pad = "x" * max(0, params["event_size"] - 48)
+        for seq in range(params["events"]):
+            if seq and params["interval_ms"] > 0:
+                await asyncio.sleep(params["interval_ms"] / 1000.0)
+            event = json.dumps({"seq": seq, "ts": time.time(), "data": pad})
+            sent += await self.write_chunk(writer, f"data: {event}\n\n" if mode == "sse" else event + "\n")
+            self.stats_.add("events")
+        if mode == "sse":
+            sent += await self.write_chunk(writer, "data: [DONE]\n\n")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        self.stats_.add("bytes_out", sent + 5)
+        self.stats_.status(200)
+
+    @staticmethod
+    async def write_chunk(writer, text):
+        data = text.encode()
+        chunk = b"%x\r\n%s\r\n" % (len(data), data)
+        writer.write(chunk)
+        await writer.drain()
+        return len(chunk)
+
+    async def dispatch(self, request, writer):
+        '''处理请求，返回是否保持连接'''
+        url = urlparse(request["target"])
+        route = url.path.rstrip("/") or "/"
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        keep_alive = request["headers"].get("connection", "").lower() != "close" and request["version"] != "HTTP/1.0"
+        if route == ECHO_PATH or route.startswith(ECHO_PATH + "/"):
+            self.stats_.add("requests")
+            try:
+                params = dict(self.defaults, **{k: int(query[k]) for k in CONFIG_KEYS if k in query})
+            except ValueError as e:
+                await self.respond(writer, 400, json.dumps({"error": str(e)}).encode(), keep_alive=keep_alive)
+                return keep_alive
+            if params["delay_ms"] > 0:
+                await asyncio.sleep(params["delay_ms"] / 1000.0)
+            if params["size"] > 0:
+                body, content_type = padded_body(params["size"]), "application/json"
+            else:
+                body = request["body"]
+                content_type = request["headers"].get("content-type", "application/json")
+            self.stats_.status(params["status"])
+            await self.respond(writer, params["status"], body, content_type, keep_alive)
+        elif route == STREAM_PATH:
+            self.stats_.add("requests")
+            try:
+                await self.stream(request, query, writer, keep_alive)
+            except ValueError as e:
+                await self.respond(writer, 400, json.dumps({"error": str(e)}).encode(), keep_alive=keep_alive)
+        elif route == "/_stub/stats" and request["method"] == "GET":
+            await self.respond(writer, 200, json.dumps(self.stats()).encode(), keep_alive=keep_alive)
+        elif route == "/_stub/reset" and request["method"] == "POST":
+            self.reset()
+            await self.respond(writer, 200, b"{}", keep_alive=keep_alive)
+        elif route == "/_stub/config" and request["method"] == "POST":
+            try:
+                config = self.configure(**(json.loads(request["body"] or b"{}")))
+            except (ValueError, TypeError) as e:
+                await self.respond(writer, 400, json.dumps({"error": str(e)}).encode(), keep_alive=keep_alive)
+                return keep_alive
+            await self.respond(writer, 200, json.dumps(config).encode(), keep_alive=keep_alive)
+        else:
+            await self.respond(writer, 404, b"{}", keep_alive=keep_alive)
+        return keep_alive
+
+
+def upstream_from_config(config, **overrides):
+    '''按 env.ini 的 [performance] 段 echo_upstream_* 参数创建回显上游（未启动）'''
+    section = "performance"
+    params = {
+        "host": config.get(section, "echo_upstream_bind", fallback="0.0.0.0"),
+        "port": config.getint(section, "echo_upstream_port", fallback=0),
+        "advertise_host": config.get(section, "echo_upstream_advertise_host", fallback="") or None,
+        "delay_ms": config.getint(section, "echo_upstream_delay_ms", fallback=0)
+    }
+    params.update(overrides)
+    return EchoUpstreamServer(**params)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="本地异步回显上游（POST /echo、POST /stream）")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8932)
+    parser.add_argument("--advertise-host", default=None)
+    parser.add_argument("--size", type=int, default=0)
+    parser.add_argument("--delay-ms", type=int, default=0)
+    parser.add_argument("--status", type=int, default=200)
+    args = parser.parse_args()
+    upstream = EchoUpstreamServer(**vars(args)).start()
+    print(f"回显上游已启动: {upstream.url()}", flush=True)
+    try:
+        while upstream.thread.is_alive():
+            time.sleep(1)
+    except KeyboardInterrupt:
+        upstream.stop()
@@ -0,0 +1,47 @@
+# -*- coding:UTF-8 -*-
+
+import json
+
+import requests
+
+from urllib3 import disable_warnings
+from urllib3.exceptions import InsecureRequestWarning
+disable_warnings(InsecureRequestWarning)
+
+NDJSON = "application/x-ndjson"
+
+
+class BatchExecuteError(Exception):
+    '''批量执行请求被拒绝（如 400 参数错误、503 沙箱池已满），此时尚未返回任何事件结果'''
+    def __init__(self, status_code, body):
+        super().__init__(f"batch execute failed: {status_code} {body}")
+        self.status_code = status_code
+        self.body = body
+
+
+def request_lines(code, events, chunk_size):
+    '''NDJSON 请求体：首行为代码与分批大小，之后每行一个事件，按需从 events 中读取'''
+    yield (json.dumps({"code": code, "chunk_size": chunk_size}, ensure_ascii=False) + "\n").encode()
+    for event in events:
+        yield (json.dumps(event, ensure_ascii=False) + "\n").encode()
+
+
+def execute_many(url, code, events, headers, chunk_size=100, timeout=None, request_timeout=600, session=None):
+    '''
+    批量执行函数（POST /function/execute/batch），生成器
+    events 可以是列表或任意可迭代对象（如逐行读取的数据集），以 NDJSON 请求体分块上传，无需整体载入内存；
+    服务端每 chunk_size 个事件在一次沙箱执行中完成，结果按事件顺序逐个返回
+    :param timeout: 每次沙箱执行的超时时间（毫秒），不传使用服务端默认值
+    :return: 逐个 yield {"index", "stdout", "stderr", "result", "error", "metrics"}
+    :raises BatchExecuteError: 请求被拒绝时
+    '''
+    headers = dict(headers, **{"Content-Type": NDJSON})
+    params = {"timeout": timeout} if timeout else None
+    http = session or requests
+    with http.post(url, params=params, data=request_lines(code, events, chunk_size), headers=headers,
+                   timeout=request_timeout, stream=True, verify=False, allow_redirects=False) as resp:
+        if resp.status_code != 200:
+            raise BatchExecuteError(resp.status_code, resp.text[:500])
+        for line in resp.iter_lines():
+            if line:
+                yield json.loads(line)
@@ -0,0 +1,120 @@
+# -*- coding:UTF-8 -*-
+
+import copy
+import json
+import random
+import time
+import uuid
+
+# 导入包的固定字段，与 /impex/export/toolbox 导出内容的结构一致
+USER_ID = "impex_bundle_generator"
+
+
+def tool_item(rng, box_name, index, server_url, fields=3):
+    '''生成一个 OpenAPI 工具的导入项，请求体含 fields 个字符串字段'''
+    version = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    now = time.time_ns()
+    path = f"/{box_name}/tool_{index}"
+    schema = {
+        "type": "object",
+        "properties": {f"field_{i}": {"type": "string", "description": f"field {i} of tool {index}"} for i in range(fields)}
+    }
+    return {
+        "tool_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "name": f"tool_{index}",
+        "description": f"generated tool {index} of {box_name}",
+        "status": "enabled",
+        "metadata_type": "openapi",
+        "metadata": {
+            "version": version,
+            "summary": f"tool_{index}",
+            "description": f"generated tool {index} of {box_name}",
+            "server_url": server_url,
+            "path": path,
+            "method": "POST",
+            "create_time": now,
+            "update_time": now,
+            "create_user": USER_ID,
+            "update_user": USER_ID,
+            "api_spec": {
+                "parameters": [],
+                "request_body": {
+                    "description": "",
+                    "content": {"application/json": {"schema": schema}},
+                    "required": True
+                },
+                "responses": [{
+                    "status_code": "200",
+                    "description": "ok",
+                    "content": {"application/json": {"schema": {"type": "object"}}}
+                }],
+                "components": {"schemas": {}},
+                "callbacks": None,
+                "security": None,
+                "tags": [],
+                "external_docs": None
+            }
+        },
+        "use_rule": "",
+        "global_parameters": None,
+        "extend_info": {},
+        "resource_object": "tool",
+        "source_id": version,
+        "source_type": "openapi"
+    }
+
+
+def toolbox_bundle(tools, boxes=1, server_url="http://127.0.0.1:1", prefix=None, seed=None, fields=3):
+    '''
+    生成工具箱导入包：boxes 个工具箱，共 tools 个工具（平均分配），可直接写入文件后调用 /impex/import/toolbox
+    同一 seed 与 prefix 生成的内容相同（时间字段除外，导入时不参与比较），便于重复导入
+    :return: {"toolbox": {"configs": [...]}}
+    '''
+    rng = random.Random(seed)
+    prefix = prefix or "bundle_" + "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for i in range(6))
+    configs = []
+    for b in range(boxes):
+        box_name = f"{prefix}_{b}"
+        count = tools // boxes + (1 if b < tools % boxes else 0)
+        now = time.time_ns()
+        configs.append({
+            "box_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "box_name": box_name,
+            "box_desc": f"generated toolbox {b} with {count} tools",
+            "box_svc_url": server_url,
+            "status": "unpublish",
+            "category_type": "other_category",
+            "category_name": "",
+            "is_internal": False,
+            "source": "custom",
+            "tools": [tool_item(rng, box_name, i, server_url, fields) for i in range(count)],
+            "create_time": now,
+            "update_time": now,
+            "create_user": USER_ID,
+            "update_user": USER_ID,
+            "metadata_type": "openapi"
+        })
+    return {"toolbox": {"configs": configs}}
+
+
+def modify_bundle(bundle, boxes=1, tools_per_box=1, tag="modified"):
+    '''复制导入包，修改前 boxes 个工具箱中前 tools_per_box 个工具的描述，模拟大部分内容不变的再次导入'''
+    changed = copy.deepcopy(bundle)
+    for config in changed["toolbox"]["configs"][:boxes]:
+        for tool in config["tools"][:tools_per_box]:
+            tool["description"] = f"{tool['description']} ({tag})"
+    return changed
+
+
+def bundle_stats(bundle):
+    '''导入包的工具箱数与工具数'''
+    configs = bundle["toolbox"]["configs"]
+    return {"boxes": len(configs), "tools": sum(len(c["tools"]) for c in configs)}
+
+
+def write_bundle(bundle, path):
+    '''写入导入文件，返回文件大小（字节）'''
+    data = json.dumps(bundle, ensure_ascii=False).encode()
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
@@ -0,0 +1,514 @@
+# -*- coding:UTF-8 -*-
+
+import abc
+import asyncio
+import codecs
+import itertools
+import json
+import ssl
+import time
+from urllib.parse import urljoin, urlsplit
+
+from common.perf_stats import summarize
+
+PROTOCOL_VERSION = "2025-03-26"
+CLIENT_INFO = {"name": "operator-hub-perf", "version": "1.0.0"}
+
+
+class MCPError(Exception):
+    '''JSON-RPC 错误响应或 HTTP 层错误，code 为 JSON-RPC 错误码，status 为 HTTP 状态码'''
+    def __init__(self, message, code=None, status=None):
+        super().__init__(message)
+        self.code = code
+        self.status = status
+
+
+# ---------- 最小 HTTP/1.1 客户端（标准库 asyncio，无第三方依赖） ----------
+
+class Response():
+    def __init__(self, connection, status, headers):
+        self.connection = connection
+        self.status = status
+        self.headers = headers
+        self.reusable = headers.get("connection", "").lower() != "close"
+
+    async def chunks(self):
+        '''按传输编码逐块读取响应体，读完后连接可复用'''
+        reader = self.connection.reader
+        if self.headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                data = await reader.readexactly(size)
+                await reader.readexactly(2)
+                yield data
+        elif "content-length" in self.headers:
+            remaining = int(self.headers["content-length"])
+            while remaining > 0:
+                data = await reader.read(min(remaining, 65536))
+                if not data:
+                    raise ConnectionError("连接在响应体读完前关闭")
+                remaining -= len(data)
+                yield data
+        else:
+            self.reusable = False
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                yield data
+
+    async def read(self):
+        return b"".join([chunk async for chunk in self.chunks()])
+
+    async def events(self):
+        '''解析 text/event-stream，逐个产出 (event, data)；多字节字符可能跨块，按增量方式解码'''
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        buffer = ""
+        async for chunk in self.chunks():
+            buffer = (buffer + decoder.decode(chunk)).replace("\r\n", "\n")
+            while "\n\n" in buffer:
+                block, buffer = buffer.split("\n\n", 1)
+                event, data = "message", []
+                for line in block.split("\n"):
+                    if line.startswith(":"):
+                        continue
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "event":
+                        event = value
+                    elif field == "data":
+                        data.append(value)
+                if data:
+                    yield event, "\n".join(data)
+
+
+class HTTPConnection():
+    def __init__(self, host, port, tls):
+        self.host = host
+        self.port = port
+        self.tls = tls
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        context = None
+        if self.tls:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=context,
+                                                                 limit=2 ** 24)
+
+    async def request(self, method, target, headers, body=b""):
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("连接已被服务端关闭")
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = (await self.reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+        return Response(self, status, response_headers)
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+
+class ConnectionPool():
+    '''同一主机的 keep-alive 连接池，size 为最大并发连接数（即单个会话的最大在途请求数）'''
+    def __init__(self, url, size=4):
+        parts = urlsplit(url)
+        self.tls = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.tls else 80)
+        self.idle = []
+        self.semaphore = asyncio.Semaphore(size)
+        self.opened = 0
+
+    async def acquire(self):
+        await self.semaphore.acquire()
+        if self.idle:
+            return self.idle.pop()
+        connection = HTTPConnection(self.host, self.port, self.tls)
+        try:
+            await connection.connect()
+        except BaseException:
+            self.semaphore.release()
+            raise
+        self.opened += 1
+        return connection
+
+    def release(self, connection, reusable):
+        if reusable:
+            self.idle.append(connection)
+        else:
+            connection.close()
+        self.semaphore.release()
+
+    async def send(self, method, url, headers, body=b""):
+        '''发送请求并读完响应体，返回 (状态码, 响应头, 响应体)'''
+        connection = await self.acquire()
+        reusable = False
+        try:
+            response = await connection.request(method, target(url), headers, body)
+            data = await response.read()
+            reusable = response.reusable
+            return response.status, response.headers, data
+        finally:
+            self.release(connection, reusable)
+
+    def close(self):
+        for connection in self.idle:
+            connection.close()
+        self.idle = []
+
+
+def target(url):
+    parts = urlsplit(url)
+    return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+
+# ---------- 调用指标 ----------
+
+class CallMetrics():
+    '''记录每次 JSON-RPC 调用的方法、传输方式、延迟、结果与响应字节数，可在多个会话间共享'''
+    def __init__(self):
+        self.records = []
+
+    def add(self, method, transport, latency, ok, size=0, error=None):
+        self.records.append({"method": method, "transport": transport, "latency": latency, "ok": ok,
+                             "bytes": size, "error": error, "time": time.time()})
+
+    def summary(self, elapsed=None):
+        '''按方法汇总延迟统计'''
+        result = {}
+        for method in sorted({r["method"] for r in self.records}):
+            rows = [r for r in self.records if r["method"] == method]
+            result[method] = summarize([r["latency"] for r in rows], sum(1 for r in rows if not r["ok"]), elapsed)
+        return result
+
+    def errors(self, limit=10):
+        return [r for r in self.records if not r["ok"]][:limit]
+
+
+# ---------- MCP 会话 ----------
+
+class MCPSession(abc.ABC):
+    '''
+    MCP 会话基类：initialize 建立会话后可重复调用 tools/list、tools/call，
+    pipeline 为单个会话允许的最大在途请求数，并发调用同一会话即可实现流水线
+    '''
+    transport = None
+
+    def __init__(self, url, headers=None, metrics=None, pipeline=4, timeout=60):
+        self.url = url
+        self.headers = dict(headers or {})
+        self.metrics = metrics if metrics is not None else CallMetrics()
+        self.pool = ConnectionPool(url, pipeline)
+        self.inflight = asyncio.Semaphore(pipeline)
+        self.timeout = timeout
+        self.ids = itertools.count(1)
+        self.init_result = None
+
+    async def __aenter__(self):
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def request(self, method, params=None):
+        '''发送请求并等待响应，记录调用指标，错误响应抛出 MCPError'''
+        message = {"jsonrpc": "2.0", "id": next(self.ids), "method": method}
+        if params is not None:
+            message["params"] = params
+        async with self.inflight:
+            return await self.timed(method, message)
+
+    async def timed(self, method, message):
+        start = time.perf_counter()
+        size = 0
+        try:
+            response, size = await asyncio.wait_for(self.exchange(message), self.timeout)
+        except asyncio.TimeoutError:
+            self.metrics.add(method, self.transport, time.perf_counter() - start, False, error="timeout")
+            raise MCPError(f"{method} 超时（{self.timeout}秒）")
+        except (OSError, ConnectionError, asyncio.IncompleteReadError) as e:
+            self.metrics.add(method, self.transport, time.perf_counter() - start, False, error=type(e).__name__)
+            raise MCPError(f"{method} 连接异常: {e!r}")
+        except MCPError as e:
+            self.metrics.add(method, self.transport, time.perf_counter() - start, False, error=f"http {e.status}")
+            raise
+        except ValueError as e:
+            # 响应体不是合法的 UTF-8 或 JSON
+            self.metrics.add(method, self.transport, time.perf_counter() - start, False, error="invalid response")
+            raise MCPError(f"{method} 响应解析失败: {e!r}")
+        latency = time.perf_counter() - start
+        if "error" in response:
+            error = response["error"]
+            self.metrics.add(method, self.transport, latency, False, size, error=error.get("code"))
+            raise MCPError(error.get("message", ""), code=error.get("code"))
+        self.metrics.add(method, self.transport, latency, True, size)
+        return response.get("result")
+
+    async def initialize(self):
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.open(), self.timeout)
+        except (OSError, ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+            self.metrics.add("connect", self.transport, time.perf_counter() - start, False, error=type(e).__name__)
+            raise MCPError(f"建立连接失败: {e!r}")
+        self.metrics.add("connect", self.transport, time.perf_counter() - start, True)
+        self.init_result = await self.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": CLIENT_INFO
+        })
+        await self.notify("notifications/initialized")
+        return self.init_result
+
+    async def ping(self):
+        return await self.request("ping")
+
+    async def list_tools(self):
+        return (await self.request("tools/list", {}))["tools"]
+
+    async def call_tool(self, name, arguments=None):
+        return await self.request("tools/call", {"name": name, "arguments": arguments or {}})
+
+    async def open(self):
+        pass
+
+    @abc.abstractmethod
+    async def exchange(self, message):
+        '''发送请求并返回 (响应, 响应字节数)'''
+
+    @abc.abstractmethod
+    async def notify(self, method, params=None):
+        '''发送通知，不等待响应'''
+
+    async def close(self):
+        self.pool.close()
+
+
+class StreamableSession(MCPSession):
+    '''Streamable HTTP 传输：每个请求一次 POST，响应为 JSON 或事件流，会话以 Mcp-Session-Id 标识'''
+    transport = "stream"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session_id = None
+
+    def request_headers(self):
+        headers = dict(self.headers, **{"Content-Type": "application/json",
+                                        "Accept": "application/json, text/event-stream"})
+        if self.session_id:
+            headers["Mcp-Session-Id"] = self.session_id
+        return headers
+
+    async def post(self, message):
+        connection = await self.pool.acquire()
+        reusable = False
+        try:
+            response = await connection.request("POST", target(self.url), self.request_headers(),
+                                                json.dumps(message).encode())
+            if "mcp-session-id" in response.headers:
+                self.session_id = response.headers["mcp-session-id"]
+            if response.status >= 300:
+                body = await response.read()
+                reusable = response.reusable
+                raise MCPError(f"HTTP {response.status}: {body[:200]!r}", status=response.status)
+            if "text/event-stream" in response.headers.get("content-type", ""):
+                size = 0
+                result = None
+                async for _, data in response.events():
+                    size += len(data)
+                    payload = json.loads(data)
+                    if payload.get("id") == message.get("id"):
+                        result = payload
+                reusable = response.reusable
+                return result, size
+            body = await response.read()
+            reusable = response.reusable
+            return (json.loads(body) if body else None), len(body)
+        finally:
+            self.pool.release(connection, reusable)
+
+    async def exchange(self, message):
+        response, size = await self.post(message)
+        if response is None:
+            raise MCPError(f"{message['method']} 未返回响应")
+        return response, size
+
+    async def notify(self, method, params=None):
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        await self.post(message)
+
+    async def close(self):
+        if self.session_id:
+            try:
+                await self.pool.send("DELETE", self.url, self.request_headers())
+            except (OSError, ConnectionError, asyncio.IncompleteReadError):
+                pass
+        await super().close()
+
+
+class SSESession(MCPSession):
+    '''
+    SSE 传输：GET 建立事件流并取得 endpoint 事件中的消息地址，请求经 POST 发送，
+    响应经事件流按 id 返回，因此单个事件流上可有多个在途请求
+    '''
+    transport = "sse"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stream = None
+        self.reader_task = None
+        self.endpoint = None
+        self.pending = {}
+
+    async def open(self):
+        self.stream = HTTPConnection(self.pool.host, self.pool.port, self.pool.tls)
+        await self.stream.connect()
+        headers = dict(self.headers, Accept="text/event-stream")
+        response = await self.stream.request("GET", target(self.url), headers)
+        if response.status != 200:
+            body = await response.read()
+            self.stream.close()
+            raise MCPError(f"建立 SSE 连接失败 HTTP {response.status}: {body[:200]!r}", status=response.status)
+        events = response.events()
+        loop = asyncio.get_running_loop()
+        endpoint = loop.create_future()
+        self.reader_task = asyncio.ensure_future(self.read_events(events, endpoint))
+        self.endpoint = urljoin(self.url, await asyncio.wait_for(endpoint, self.timeout))
+
+    async def read_events(self, events, endpoint):
+        error = MCPError("SSE 连接已关闭")
+        try:
+            async for event, data in events:
+                if event == "endpoint":
+                    if not endpoint.done():
+                        endpoint.set_result(data.strip())
+                    continue
+                if event != "message":
+                    continue
+                payload = json.loads(data)
+                future = self.pending.pop(payload.get("id"), None)
+                if future and not future.done():
+                    future.set_result((payload, len(data)))
+        except (OSError, ConnectionError, asyncio.IncompleteReadError) as e:
+            error = MCPError(f"SSE 连接异常: {e!r}")
+        except ValueError as e:
+            # 事件不是合法的 UTF-8 或 JSON，事件流无法继续解析
+            error = MCPError(f"SSE 事件解析失败: {e!r}")
+        finally:
+            # 事件流断开时，所有在途请求立即失败，不必等到超时
+            if not endpoint.done():
+                endpoint.set_exception(error)
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self.pending.clear()
+
+    async def post(self, message):
+        headers = dict(self.headers, **{"Content-Type": "application/json"})
+        status, _, body = await self.pool.send("POST", self.endpoint, headers, json.dumps(message).encode())
+        if status >= 300:
+            raise MCPError(f"HTTP {status}: {body[:200]!r}", status=status)
+
+    async def exchange(self, message):
+        if self.reader_task.done():
+            raise MCPError("SSE 连接已关闭")
+        future = asyncio.get_running_loop().create_future()
+        self.pending[message["id"]] = future
+        try:
+            await self.post(message)
+            return await future
+        finally:
+            self.pending.pop(message["id"], None)
+            # POST 失败时 future 未被等待：事件流可能已为其设置异常，需取出异常，否则取消
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                future.exception()
+
+    async def notify(self, method, params=None):
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        await self.post(message)
+
+    async def close(self):
+        if self.reader_task:
+            self.reader_task.cancel()
+        if self.stream:
+            self.stream.close()
+        await super().close()
+
+
+def open_session(url, mode="stream", **kwargs):
+    '''按传输方式创建会话（未初始化），mode: sse / stream'''
+    return (SSESession if mode == "sse" else StreamableSession)(url, **kwargs)
+
+
+async def run_load(url, mode, headers, sessions=10, calls=100, tool=None, arguments=None, pipeline=4,
+                   reuse=True, timeout=60):
+    '''
+    并发压测一个 MCP 端点：sessions 个会话并发，每个会话发起 calls 次调用，会话内最多 pipeline 个在途请求
+    tool 为空时调用 tools/list，否则调用 tools/call；reuse=False 时每次调用都新建会话（测量会话建立成本）
+    :return: (CallMetrics, 总耗时（秒）, 会话建立失败列表)
+    '''
+    metrics = CallMetrics()
+    failures = []
+
+    async def invoke(session):
+        try:
+            if tool:
+                await session.call_tool(tool, arguments)
+            else:
+                await session.list_tools()
+        except MCPError:
+            pass
+
+    async def worker(index):
+        kwargs = {"headers": headers, "metrics": metrics, "pipeline": pipeline, "timeout": timeout}
+        if not reuse:
+            for _ in range(calls):
+                session = open_session(url, mode, **kwargs)
+                try:
+                    await session.initialize()
+                    await invoke(session)
+                except MCPError as e:
+                    failures.append({"session": index, "error": str(e)})
+                finally:
+                    await session.close()
+            return
+        session = open_session(url, mode, **kwargs)
+        try:
+            await session.initialize()
+        except MCPError as e:
+            failures.append({"session": index, "error": str(e)})
+            await session.close()
+            return
+        try:
+            await asyncio.gather(*(invoke(session) for _ in range(calls)))
+        finally:
+            await session.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(sessions)))
+    return metrics, time.perf_counter() - start, failures
@@ -0,0 +1,515 @@
+# -*- coding:UTF-8 -*-
+
+import argparse
+import json
+import queue
+import random
+import socket
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+PROTOCOL_VERSION = "2025-03-26"
+
+# JSON-RPC 错误码
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# 运行时可通过 POST /_stub/config 调整的故障参数
+FAULT_KEYS = ["latency_ms", "jitter_ms", "slow_stream_ms", "stream_chunk_size", "disconnect_rate", "error_rate",
+              "fault_methods"]
+
+
+def generate_tools(count, properties=5, description_size=100):
+    '''按数量与规模生成确定的工具列表，入参 schema 含 properties 个字段，描述长度为 description_size'''
+    types = ["string", "integer", "number", "boolean"]
+    tools = []
+    for i in range(count):
+        schema = {"type": "object", "properties": {}, "required": []}
+        for j in range(properties):
+            schema["properties"][f"arg_{j}"] = {"type": types[j % len(types)], "description": f"argument {j}"}
+            if j % 2 == 0:
+                schema["required"].append(f"arg_{j}")
+        text = f"stub tool {i} "
+        tools.append({
+            "name": f"tool_{i:04d}",
+            "description": (text * (description_size // len(text) + 1))[:description_size],
+            "inputSchema": schema
+        })
+    return tools
+
+
+class Counters():
+    '''按方法、工具、传输方式统计调用次数、服务端处理耗时与注入的故障次数'''
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.methods = {}
+            self.tools = {}
+            self.transports = {}
+            self.faults = {}
+            self.sessions = {"opened": 0, "closed": 0}
+
+    def add(self, group, key, elapsed=None):
+        with self.lock:
+            item = group.setdefault(key, {"count": 0, "seconds": 0.0})
+            item["count"] += 1
+            if elapsed is not None:
+                item["seconds"] += elapsed
+
+    def fault(self, name):
+        with self.lock:
+            self.faults[name] = self.faults.get(name, 0) + 1
+
+    def session(self, event):
+        with self.lock:
+            self.sessions[event] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return json.loads(json.dumps({
+                "methods": self.methods,
+                "tools": self.tools,
+                "transports": self.transports,
+                "faults": self.faults,
+                "sessions": dict(self.sessions, active=self.sessions["opened"] - self.sessions["closed"])
+            }))
+
+
+def valid_message(message):
+    '''JSON-RPC 消息须为对象，method 为字符串，params 为对象（可省略）'''
+    if not isinstance(message, dict):
+        return False
+    params = message.get("params")
+    return isinstance(message.get("method", ""), str) and (params is None or isinstance(params, dict))
+
+
+class Disconnect(Exception):
+    '''注入断连故障：不返回响应直接关闭连接'''
+
+
+class SSESession():
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.queue = queue.Queue()
+        self.closed = threading.Event()
+
+
+class MCPStubServer():
+    '''
+    本地 MCP Server 替身，同时提供两种传输方式：
+    SSE：GET /sse 建立事件流并下发 endpoint 事件，POST /message?sessionId= 发送请求，响应经事件流返回
+    Streamable HTTP：POST /mcp，initialize 时下发 Mcp-Session-Id，stream_response=sse 时以事件流返回响应
+    支持 initialize、ping、tools/list、tools/call；tools/call 回显入参，result_size 大于 0 时补齐结果到指定字节数
+    故障注入（fault_methods 中的方法生效）：
+    latency_ms/jitter_ms 固定延迟加均匀抖动；slow_stream_ms 响应按 stream_chunk_size 字节分块、块间等待；
+    disconnect_rate 按概率不返回响应直接断开；error_rate 按概率返回 JSON-RPC 内部错误
+    统计与控制接口：GET /_stub/stats，POST /_stub/reset，POST /_stub/config
+    '''
+    def __init__(self, host="0.0.0.0", port=0, advertise_host=None, tools=10, schema_properties=5,
+                 description_size=100, result_size=0, latency_ms=0, jitter_ms=0, slow_stream_ms=0,
+                 stream_chunk_size=64, disconnect_rate=0.0, error_rate=0.0, fault_methods="tools/call,tools/list",
+                 stream_response="json", seed=0):
+        self.host = host
+        self.port = port
+        self.advertise_host = advertise_host
+        self.tools = generate_tools(tools, schema_properties, description_size)
+        self.tool_names = {t["name"] for t in self.tools}
+        self.result_size = result_size
+        self.stream_response = stream_response
+        self.faults = {}
+        self.configure(latency_ms=latency_ms, jitter_ms=jitter_ms, slow_stream_ms=slow_stream_ms,
+                       stream_chunk_size=stream_chunk_size, disconnect_rate=disconnect_rate, error_rate=error_rate,
+                       fault_methods=fault_methods)
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.counters = Counters()
+        self.sse_sessions = {}
+        self.http_sessions = set()
+        self.lock = threading.Lock()
+        self.httpd = None
+        self.thread = None
+        self.stopping = threading.Event()
+
+    def configure(self, **faults):
+        '''调整故障参数，未知参数抛出 ValueError'''
+        unknown = set(faults) - set(FAULT_KEYS)
+        if unknown:
+            raise ValueError(f"未知的故障参数: {sorted(unknown)}")
+        if isinstance(faults.get("fault_methods"), str):
+            faults["fault_methods"] = [m.strip() for m in faults["fault_methods"].split(",") if m.strip()]
+        self.faults.update(faults)
+        return dict(self.faults)
+
+    def start(self):
+        '''在后台线程启动服务，port=0 时使用随机端口'''
+        server = self
+
+        class Handler(StubHandler):
+            stub = server
+
+        self.stopping.clear()
+        self.httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="mcp-stub", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopping.set()
+        with self.lock:
+            for session in self.sse_sessions.values():
+                session.closed.set()
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def base_url(self):
+        host = self.advertise_host or (socket.gethostname() if self.host == "0.0.0.0" else self.host)
+        return f"http://{host}:{self.port}"
+
+    def url(self, mode="sse"):
+        '''被测服务注册 MCP 时使用的地址，mode 与服务端一致：sse / stream'''
+        return self.base_url() + ("/sse" if mode == "sse" else "/mcp")
+
+    def stats(self):
+        return self.counters.snapshot()
+
+    def reset(self):
+        self.counters.reset()
+
+    # ---------- JSON-RPC 处理 ----------
+
+    def random(self):
+        with self.rng_lock:
+            return self.rng.random()
+
+    def inject(self, method):
+        '''按故障参数注入延迟、断连与错误，返回需要返回的错误（无则为 None）'''
+        faults = self.faults
+        if method not in faults["fault_methods"]:
+            return None
+        delay = faults["latency_ms"] + (self.random() * faults["jitter_ms"] if faults["jitter_ms"] else 0)
+        if delay > 0:
+            self.counters.fault("latency")
+            time.sleep(delay / 1000.0)
+        if faults["disconnect_rate"] and self.random() < faults["disconnect_rate"]:
+            self.counters.fault("disconnect")
+            raise Disconnect()
+        if faults["error_rate"] and self.random() < faults["error_rate"]:
+            self.counters.fault("error")
+            return {"code": INTERNAL_ERROR, "message": "injected error"}
+        return None
+
+    def call_tool(self, params):
+        name = params.get("name")
+        if name not in self.tool_names:
+            return None, {"code": INVALID_PARAMS, "message": f"unknown tool: {name}"}
+        text = json.dumps({"tool": name, "arguments": params.get("arguments") or {}}, ensure_ascii=False)
+        if self.result_size > len(text):
+            text += " " * (self.result_size - len(text))
+        return {"content": [{"type": "text", "text": text}], "isError": False}, None
+
+    def handle(self, message, transport):
+        '''处理单条 JSON-RPC 消息，通知返回 None'''
+        start = time.perf_counter()
+        if not valid_message(message):
+            return {"jsonrpc": "2.0", "id": message.get("id") if isinstance(message, dict) else None,
+                    "error": {"code": INVALID_REQUEST, "message": "invalid request"}}
+        method = message.get("method")
+        if method is None:
+            # 客户端对服务端请求的响应，替身不发起请求，直接忽略
+            return None
+        if "id" not in message:
+            self.counters.add(self.counters.methods, method)
+            return None
+        try:
+            error = self.inject(method)
+        except Disconnect:
+            self.counters.add(self.counters.methods, method, time.perf_counter() - start)
+            raise
+        result = None
+        if error is None:
+            if method == "initialize":
+                result = {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {"tools": {"listChanged": False}},
+                    "serverInfo": {"name": "mcp-stub-server", "version": "1.0.0"}
+                }
+            elif method == "ping":
+                result = {}
+            elif method == "tools/list":
+                result = {"tools": self.tools}
+            elif method == "tools/call":
+                result, error = self.call_tool(message.get("params") or {})
+            else:
+                error = {"code": METHOD_NOT_FOUND, "message": f"method not found: {method}"}
+        elapsed = time.perf_counter() - start
+        self.counters.add(self.counters.methods, method, elapsed)
+        self.counters.add(self.counters.transports, transport, elapsed)
+        if method == "tools/call" and error is None:
+            self.counters.add(self.counters.tools, message["params"]["name"], elapsed)
+        response = {"jsonrpc": "2.0", "id": message["id"]}
+        if error is not None:
+            response["error"] = error
+        else:
+            response["result"] = result
+        return response
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    stub = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def route(self):
+        return urlparse(self.path).path.rstrip("/") or "/"
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        return json.loads(body) if body else None
+
+    def send_body(self, status, body=b"", content_type="application/json", headers=None, slow=False):
+        '''发送响应，slow=True 且配置了 slow_stream_ms 时按块慢速写出'''
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if slow:
+            self.write_slow(body)
+        else:
+            self.wfile.write(body)
+        self.wfile.flush()
+
+    def write_slow(self, data):
+        faults = self.stub.faults
+        if not faults["slow_stream_ms"]:
+            self.wfile.write(data)
+            return
+        self.stub.counters.fault("slow_stream")
+        size = max(1, int(faults["stream_chunk_size"]))
+        for i in range(0, len(data), size):
+            self.wfile.write(data[i:i + size])
+            self.wfile.flush()
+            time.sleep(faults["slow_stream_ms"] / 1000.0)
+
+    def abort(self):
+        '''断连故障：直接关闭底层连接'''
+        self.close_connection = True
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def do_GET(self):
+        route = self.route()
+        if route == "/sse":
+            self.serve_sse()
+        elif route == "/_stub/stats":
+            self.send_body(200, json.dumps(self.stub.stats()).encode())
+        elif route == "/mcp":
+            # 替身不主动推送消息，不提供独立的 GET 事件流
+            self.send_body(405, b"")
+        else:
+            self.send_body(404, b"")
+
+    def do_POST(self):
+        route = self.route()
+        if route == "/message":
+            self.post_sse_message()
+        elif route == "/mcp":
+            self.post_streamable()
+        elif route == "/_stub/reset":
+            self.stub.reset()
+            self.send_body(200, b"{}")
+        elif route == "/_stub/config":
+            try:
+                faults = self.stub.configure(**(self.read_json() or {}))
+            except (ValueError, TypeError) as e:
+                self.send_body(400, json.dumps({"error": str(e)}, ensure_ascii=False).encode())
+                return
+            self.send_body(200, json.dumps(faults).encode())
+        else:
+            self.send_body(404, b"")
+
+    def do_DELETE(self):
+        if self.route() != "/mcp":
+            self.send_body(404, b"")
+            return
+        session_id = self.headers.get("Mcp-Session-Id")
+        with self.stub.lock:
+            known = session_id in self.stub.http_sessions
+            self.stub.http_sessions.discard(session_id)
+        if known:
+            self.stub.counters.session("closed")
+        self.send_body(200 if known else 404, b"")
+
+    # ---------- SSE 传输 ----------
+
+    def serve_sse(self):
+        session = SSESession()
+        with self.stub.lock:
+            self.stub.sse_sessions[session.id] = session
+        self.stub.counters.session("opened")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "keep-alive")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            self.wfile.write(f"event: endpoint\ndata: /message?sessionId={session.id}\n\n".encode())
+            self.wfile.flush()
+            while not session.closed.is_set() and not self.stub.stopping.is_set():
+                try:
+                    message = session.queue.get(timeout=15)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+                    continue
+                if message is None:
+                    break
+                self.write_slow(f"event: message\ndata: {json.dumps(message, ensure_ascii=False)}\n\n".encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with self.stub.lock:
+                self.stub.sse_sessions.pop(session.id, None)
+            self.stub.counters.session("closed")
+            if session.closed.is_set():
+                self.abort()
+
+    def post_sse_message(self):
+        session_id = parse_qs(urlparse(self.path).query).get("sessionId", [""])[0]
+        with self.stub.lock:
+            session = self.stub.sse_sessions.get(session_id)
+        if session is None:
+            self.send_body(404, b"")
+            return
+        try:
+            message = self.read_json()
+        except ValueError:
+            self.send_body(400, b"")
+            return
+        # 先确认接收，再处理并经由事件流返回响应
+        self.send_body(202, b"Accepted", content_type="text/plain")
+        try:
+            response = self.stub.handle(message, "sse")
+        except Disconnect:
+            session.closed.set()
+            session.queue.put(None)
+            return
+        if response is not None:
+            session.queue.put(response)
+
+    # ---------- Streamable HTTP 传输 ----------
+
+    def post_streamable(self):
+        try:
+            payload = self.read_json()
+        except ValueError:
+            error = {"jsonrpc": "2.0", "id": None, "error": {"code": PARSE_ERROR, "message": "parse error"}}
+            self.send_body(400, json.dumps(error).encode())
+            return
+        messages = payload if isinstance(payload, list) else [payload]
+        if not messages:
+            error = {"jsonrpc": "2.0", "id": None, "error": {"code": INVALID_REQUEST, "message": "empty batch"}}
+            self.send_body(400, json.dumps(error).encode())
+            return
+        headers = {}
+        session_id = self.headers.get("Mcp-Session-Id")
+        if any(isinstance(m, dict) and m.get("method") == "initialize" for m in messages):
+            session_id = uuid.uuid4().hex
+            with self.stub.lock:
+                self.stub.http_sessions.add(session_id)
+            self.stub.counters.session("opened")
+            headers["Mcp-Session-Id"] = session_id
+        elif session_id:
+            with self.stub.lock:
+                known = session_id in self.stub.http_sessions
+            if not known:
+                self.send_body(404, b"")
+                return
+        try:
+            responses = [r for r in (self.stub.handle(m, "stream") for m in messages) if r is not None]
+        except Disconnect:
+            self.abort()
+            return
+        if not responses:
+            self.send_body(202, b"", headers=headers)
+            return
+        if self.stub.stream_response == "sse" and "text/event-stream" in (self.headers.get("Accept") or ""):
+            body = "".join(f"event: message\ndata: {json.dumps(r, ensure_ascii=False)}\n\n" for r in responses)
+            self.send_body(200, body.encode(), content_type="text/event-stream", headers=headers, slow=True)
+        else:
+            body = responses if isinstance(payload, list) else responses[0]
+            self.send_body(200, json.dumps(body, ensure_ascii=False).encode(), headers=headers, slow=True)
+
+
+def stub_from_config(config, **overrides):
+    '''按 env.ini 的 [performance] 段 mcp_stub_* 参数创建替身（未启动）'''
+    section = "performance"
+    params = {
+        "host": config.get(section, "mcp_stub_bind", fallback="0.0.0.0"),
+        "port": config.getint(section, "mcp_stub_port", fallback=0),
+        "advertise_host": config.get(section, "mcp_stub_advertise_host", fallback="") or None,
+        "tools": config.getint(section, "mcp_stub_tools", fallback=10),
+        "schema_properties": config.getint(section, "mcp_stub_schema_properties", fallback=5),
+        "description_size": config.getint(section, "mcp_stub_description_size", fallback=100),
+        "result_size": config.getint(section, "mcp_stub_result_size", fallback=0),
+        "latency_ms": config.getfloat(section, "mcp_stub_latency_ms", fallback=0),
+        "jitter_ms": config.getfloat(section, "mcp_stub_jitter_ms", fallback=0),
+        "stream_response": config.get(section, "mcp_stub_stream_response", fallback="json"),
+        "seed": config.getint(section, "mcp_stub_seed", fallback=0)
+    }
+    params.update(overrides)
+    return MCPStubServer(**params)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="本地 MCP Server 替身（SSE 与 Streamable HTTP）")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8931)
+    parser.add_argument("--advertise-host", default=None)
+    parser.add_argument("--tools", type=int, default=10)
+    parser.add_argument("--schema-properties", type=int, default=5)
+    parser.add_argument("--description-size", type=int, default=100)
+    parser.add_argument("--result-size", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--slow-stream-ms", type=float, default=0)
+    parser.add_argument("--stream-chunk-size", type=int, default=64)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fault-methods", default="tools/call,tools/list")
+    parser.add_argument("--stream-response", choices=["json", "sse"], default="json")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    stub = MCPStubServer(**vars(args)).start()
+    print(f"MCP 替身已启动: SSE {stub.url('sse')}，Streamable HTTP {stub.url('stream')}", flush=True)
+    try:
+        stub.thread.join()
+    except KeyboardInterrupt:
+        stub.stop()
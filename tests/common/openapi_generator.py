@@ -0,0 +1,143 @@
+# -*- coding:UTF-8 -*-
+
+import json
+import random
+import string
+
+# 生成操作时轮流使用的 HTTP 方法
+METHODS = ["get", "post", "put", "delete", "patch"]
+# 叶子属性类型
+SCALAR_TYPES = ["string", "integer", "number", "boolean"]
+
+
+class OpenAPIGenerator():
+    '''
+    合成 OpenAPI 3.0 文档生成器，相同参数与种子生成完全相同的文档
+    可控维度：
+        paths: 路径数量
+        methods: 每个路径的操作数量（1~5，依次为 get/post/put/delete/patch）
+        depth: 组件 schema 的嵌套层数，第 n 层 schema 通过 $ref 引用第 n+1 层
+        fanout: 每个 schema 引用下一层 schema 的数量（共享 $ref 图的扇出）
+        schemas: 每层组件 schema 数量，越小则 $ref 共享越多
+        properties: 每个 schema 的标量属性数量
+        enum_size: 字符串属性的枚举值数量，0 表示不生成枚举
+        string_length: summary 之外的描述文本长度
+    '''
+    def __init__(self, seed=0, paths=10, methods=1, depth=2, fanout=2, schemas=5, properties=4,
+                 enum_size=0, string_length=32):
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.paths = paths
+        self.methods = max(1, min(methods, len(METHODS)))
+        self.depth = max(1, depth)
+        self.fanout = fanout
+        self.schemas = max(1, schemas)
+        self.properties = properties
+        self.enum_size = enum_size
+        self.string_length = string_length
+
+    def word(self, length=8):
+        return ''.join(self.rng.choice(string.ascii_lowercase) for _ in range(length))
+
+    def text(self, length=None):
+        '''生成指定长度、由随机单词组成的描述文本'''
+        length = self.string_length if length is None else length
+        words = []
+        size = 0
+        while size < length:
+            words.append(self.word(self.rng.randint(3, 10)))
+            size += len(words[-1]) + 1
+        return ' '.join(words)[:length]
+
+    def scalar(self):
+        kind = self.rng.choice(SCALAR_TYPES)
+        schema = {"type": kind, "description": self.text()}
+        if kind == "string" and self.enum_size:
+            schema["enum"] = [f"{self.word(6)}_{i}" for i in range(self.enum_size)]
+        return schema
+
+    def component_name(self, level, index):
+        return f"Schema{level}_{index}"
+
+    def components(self):
+        '''按层生成组件 schema，最后一层只有标量属性'''
+        schemas = {}
+        for level in range(self.depth):
+            for index in range(self.schemas):
+                props = {f"field_{i}": self.scalar() for i in range(self.properties)}
+                if level + 1 < self.depth:
+                    for i in range(self.fanout):
+                        target = self.component_name(level + 1, self.rng.randrange(self.schemas))
+                        ref = {"$ref": f"#/components/schemas/{target}"}
+                        # 交替生成对象引用与数组引用
+                        props[f"child_{i}"] = ref if i % 2 == 0 else {"type": "array", "items": ref}
+                schemas[self.component_name(level, index)] = {
+                    "type": "object",
+                    "description": self.text(),
+                    "required": list(props)[:1],
+                    "properties": props
+                }
+        return schemas
+
+    def operation(self, path_index, method):
+        ref = {"$ref": f"#/components/schemas/{self.component_name(0, self.rng.randrange(self.schemas))}"}
+        op = {
+            "summary": f"{self.word(6)}_{path_index}_{method}",
+            "description": self.text(),
+            "operationId": f"op_{self.seed}_{path_index}_{method}",
+            "parameters": [{
+                "name": "limit",
+                "in": "query",
+                "required": False,
+                "description": self.text(),
+                "schema": {"type": "integer"}
+            }],
+            "responses": {
+                "200": {
+                    "description": "success",
+                    "content": {"application/json": {"schema": ref}}
+                }
+            }
+        }
+        if method in ("post", "put", "patch"):
+            body = {"$ref": f"#/components/schemas/{self.component_name(0, self.rng.randrange(self.schemas))}"}
+            op["requestBody"] = {
+                "required": True,
+                "content": {"application/json": {"schema": body}}
+            }
+        return op
+
+    def generate(self):
+        '''生成 OpenAPI 文档（dict）'''
+        components = self.components()
+        paths = {}
+        for i in range(self.paths):
+            item = {
+                "parameters": [{
+                    "name": "id",
+                    "in": "path",
+                    "required": True,
+                    "description": self.text(),
+                    "schema": {"type": "string"}
+                }]
+            }
+            for method in METHODS[:self.methods]:
+                item[method] = self.operation(i, method)
+            paths[f"/{self.word(6)}/resource_{i}/{{id}}"] = item
+        return {
+            "openapi": "3.0.2",
+            "info": {
+                "title": f"synthetic-{self.seed}",
+                "version": "1.0.0",
+                "description": self.text()
+            },
+            "servers": [{"url": "http://127.0.0.1:8080/api"}],
+            "paths": paths,
+            "components": {"schemas": components}
+        }
+
+
+def generate_spec(seed=0, **dimensions):
+    '''生成合成 OpenAPI 文档，返回 (文档 dict, JSON 字符串)'''
+    spec = OpenAPIGenerator(seed=seed, **dimensions).generate()
+    return spec, json.dumps(spec, ensure_ascii=False)
@@ -0,0 +1,82 @@
+# -*- coding:UTF-8 -*-
+
+import time
+
+from common.perf_stats import percentile
+
+
+def sample_pages(total_pages, points=20):
+    '''
+    在 [1, total_pages] 内选取扫描页码：前段按 2 的幂加密（浅分页最常用），其余均匀分布，必含首页和末页
+    :param points: 均匀分布的页码数量
+    '''
+    if total_pages <= 1:
+        return [1]
+    pages = {1, total_pages}
+    page = 2
+    while page < total_pages:
+        pages.add(page)
+        page *= 2
+    step = max(1, total_pages // points)
+    pages.update(range(1, total_pages + 1, step))
+    return sorted(pages)
+
+
+def sweep(func, params, page_size, pages, repeats=3):
+    '''
+    依次请求指定页码，记录每页的延迟
+    :param func: 列表查询函数，入参为查询参数字典，返回 [status_code, response]
+    :param params: 公共查询参数（过滤、排序条件）
+    :return: [{"page", "offset", "median", "p99", "status"}]，失败时 status 为非 200 的状态码
+    '''
+    results = []
+    for page in pages:
+        query = dict(params, page=page, page_size=page_size)
+        latencies = []
+        status = 200
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = func(query)
+            latencies.append(time.perf_counter() - start)
+            if result[0] != 200:
+                status = result[0]
+        results.append({
+            "page": page,
+            "offset": (page - 1) * page_size,
+            "median": percentile(latencies, 50),
+            "p99": percentile(latencies, 99),
+            "status": status
+        })
+    return results
+
+
+def linear_fit(points):
+    '''
+    最小二乘线性拟合 y = a + b * x
+    :param points: [(x, y), ...]
+    :return: (截距 a, 斜率 b, 决定系数 R²)
+    '''
+    n = len(points)
+    if n < 2:
+        return (points[0][1] if points else 0.0), 0.0, 0.0
+    mean_x = sum(p[0] for p in points) / n
+    mean_y = sum(p[1] for p in points) / n
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    syy = sum((y - mean_y) ** 2 for _, y in points)
+    slope = sxy / sxx if sxx else 0.0
+    intercept = mean_y - slope * mean_x
+    r2 = (sxy * sxy) / (sxx * syy) if sxx and syy else 0.0
+    return intercept, slope, r2
+
+
+def find_cliff(points, ratio=2.0):
+    '''
+    查找相邻两点间延迟突增（超过 ratio 倍）的位置
+    :param points: [(x, y), ...]，按 x 升序
+    :return: 突增后的第一个点 (x, y)，不存在时返回 None
+    '''
+    for prev, cur in zip(points, points[1:]):
+        if prev[1] > 0 and cur[1] / prev[1] >= ratio:
+            return cur
+    return None
@@ -0,0 +1,92 @@
+# -*- coding:UTF-8 -*-
+
+import math
+import allure
+
+from xml.sax.saxutils import escape
+
+# 折线颜色，按曲线顺序循环使用
+COLORS = ["#1f77b4", "#d62728", "#2ca02c", "#ff7f0e", "#9467bd", "#8c564b", "#e377c2", "#17becf"]
+
+
+def _nice_max(value):
+    '''坐标轴上限取整，避免曲线贴边'''
+    if value <= 0:
+        return 1.0
+    magnitude = 10 ** math.floor(math.log10(value))
+    for step in [1, 2, 2.5, 5, 10]:
+        if step * magnitude >= value:
+            return step * magnitude
+    return value
+
+
+def line_chart(series, title, x_label, y_label, width=800, height=400, markers=None):
+    '''
+    生成 SVG 折线图，无需额外绘图依赖
+    :param series: {曲线名: [(x, y), ...]}
+    :param title: 图表标题
+    :param x_label: 横轴名称
+    :param y_label: 纵轴名称
+    :param markers: 需要标注的竖线 {标注名: x}，如拐点、SLO 突破点
+    :return: SVG 文本
+    '''
+    left, right, top, bottom = 70, 160, 40, 50
+    plot_w = width - left - right
+    plot_h = height - top - bottom
+
+    points = [p for values in series.values() for p in values]
+    x_min = min([p[0] for p in points], default=0)
+    x_max = max([p[0] for p in points], default=1)
+    if x_max == x_min:
+        x_max = x_min + 1
+    y_max = _nice_max(max([p[1] for p in points], default=1))
+
+    def sx(x):
+        return left + (x - x_min) / (x_max - x_min) * plot_w
+
+    def sy(y):
+        return top + plot_h - y / y_max * plot_h
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" font-family="sans-serif" font-size="12">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<text x="{width / 2}" y="20" text-anchor="middle" font-size="14">{escape(title)}</text>',
+        f'<line x1="{left}" y1="{top + plot_h}" x2="{left + plot_w}" y2="{top + plot_h}" stroke="black"/>',
+        f'<line x1="{left}" y1="{top}" x2="{left}" y2="{top + plot_h}" stroke="black"/>',
+        f'<text x="{left + plot_w / 2}" y="{height - 10}" text-anchor="middle">{escape(x_label)}</text>',
+        f'<text x="15" y="{top + plot_h / 2}" text-anchor="middle" transform="rotate(-90 15 {top + plot_h / 2})">{escape(y_label)}</text>'
+    ]
+
+    # 坐标刻度
+    for i in range(5):
+        y_val = y_max * i / 4
+        x_val = x_min + (x_max - x_min) * i / 4
+        parts.append(f'<line x1="{left}" y1="{sy(y_val):.1f}" x2="{left + plot_w}" y2="{sy(y_val):.1f}" stroke="#eeeeee"/>')
+        parts.append(f'<text x="{left - 5}" y="{sy(y_val) + 4:.1f}" text-anchor="end">{y_val:.3g}</text>')
+        parts.append(f'<text x="{sx(x_val):.1f}" y="{top + plot_h + 18}" text-anchor="middle">{x_val:.4g}</text>')
+
+    for name, x in (markers or {}).items():
+        parts.append(f'<line x1="{sx(x):.1f}" y1="{top}" x2="{sx(x):.1f}" y2="{top + plot_h}" stroke="#999999" stroke-dasharray="4,4"/>')
+        parts.append(f'<text x="{sx(x) + 3:.1f}" y="{top + 12}" fill="#666666">{escape(name)}</text>')
+
+    for i, (name, values) in enumerate(series.items()):
+        color = COLORS[i % len(COLORS)]
+        values = sorted(values)
+        if values:
+            path = " ".join(f"{sx(x):.1f},{sy(y):.1f}" for x, y in values)
+            parts.append(f'<polyline points="{path}" fill="none" stroke="{color}" stroke-width="2"/>')
+            if len(values) <= 50:
+                for x, y in values:
+                    parts.append(f'<circle cx="{sx(x):.1f}" cy="{sy(y):.1f}" r="3" fill="{color}"/>')
+        parts.append(f'<rect x="{left + plot_w + 15}" y="{top + i * 20}" width="12" height="12" fill="{color}"/>')
+        parts.append(f'<text x="{left + plot_w + 32}" y="{top + i * 20 + 10}">{escape(name)}</text>')
+
+    parts.append('</svg>')
+    return "\n".join(parts)
+
+
+def attach_line_chart(series, title, x_label, y_label, markers=None):
+    '''生成折线图并作为 SVG 附件添加到 allure 报告'''
+    svg = line_chart(series, title, x_label, y_label, markers=markers)
+    allure.attach(svg, name=title, attachment_type=allure.attachment_type.SVG)
+    return svg
@@ -0,0 +1,76 @@
+# -*- coding:UTF-8 -*-
+
+import math
+import statistics
+
+
+def percentile(values, p):
+    '''
+    计算百分位数（线性插值）
+    :param values: 数值列表，无需预先排序
+    :param p: 百分位，取值 0~100
+    :return: 百分位数，values 为空时返回 0
+    '''
+    if not values:
+        return 0.0
+    data = sorted(values)
+    if len(data) == 1:
+        return float(data[0])
+    rank = (len(data) - 1) * p / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(data[int(rank)])
+    return data[lower] + (data[upper] - data[lower]) * (rank - lower)
+
+
+def summarize(latencies, errors=0, elapsed=None):
+    '''
+    汇总一组请求的延迟统计
+    :param latencies: 所有请求的延迟（秒），包含失败请求
+    :param errors: 失败请求数
+    :param elapsed: 本轮压测实际耗时（秒），用于计算吞吐
+    :return: 包含 count/avg/min/max/p50/p90/p95/p99/error_rate/throughput 的字典
+    '''
+    count = len(latencies)
+    summary = {
+        "count": count,
+        "errors": errors,
+        "error_rate": errors / count if count else 0.0,
+        "avg": statistics.mean(latencies) if count else 0.0,
+        "min": min(latencies) if count else 0.0,
+        "max": max(latencies) if count else 0.0,
+        "p50": percentile(latencies, 50),
+        "p90": percentile(latencies, 90),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "throughput": 0.0
+    }
+    if elapsed:
+        summary["throughput"] = count / elapsed
+    return summary
+
+
+def format_summary(name, summary):
+    '''将统计结果格式化为报告文本'''
+    return (f"{name}统计:\n" +
+            f"请求数: {summary['count']}\n" +
+            f"错误率: {summary['error_rate'] * 100:.2f}%\n" +
+            f"吞吐: {summary['throughput']:.2f} 次/秒\n" +
+            f"平均延迟: {summary['avg']:.3f}秒\n" +
+            f"P50延迟: {summary['p50']:.3f}秒\n" +
+            f"P90延迟: {summary['p90']:.3f}秒\n" +
+            f"P99延迟: {summary['p99']:.3f}秒\n" +
+            f"最大延迟: {summary['max']:.3f}秒")
+
+
+def parse_server_timing(header):
+    '''解析 "auth;dur=1.2, proxy;dur=3.4" 形式的 Server-Timing 响应头，返回 {阶段: 秒}'''
+    timings = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if name and key == "dur":
+                timings[name] = float(value) / 1000.0
+    return timings
@@ -0,0 +1,291 @@
+# -*- coding:UTF-8 -*-
+
+import csv
+import os
+import re
+import threading
+import time
+
+import allure
+import requests
+
+from common.perf_chart import attach_line_chart
+from urllib3 import disable_warnings
+from urllib3.exceptions import InsecureRequestWarning
+disable_warnings(InsecureRequestWarning)
+
+# Prometheus 指标名到采样字段的映射
+PROMETHEUS_FIELDS = {
+    "process_cpu_seconds_total": "cpu_seconds",
+    "process_resident_memory_bytes": "rss_bytes",
+    "process_open_fds": "open_fds",
+    "go_goroutines": "goroutines",
+    "go_memstats_heap_inuse_bytes": "heap_inuse_bytes",
+    "go_gc_duration_seconds_count": "num_gc",
+    "go_sql_in_use_connections": "db_in_use",
+    "go_sql_open_connections": "db_open",
+    "go_sql_wait_count_total": "db_wait_count"
+}
+
+# 累计型计数器，采样时换算为每秒增量
+COUNTER_FIELDS = {
+    "num_gc": "gc_per_second",
+    "db_wait_count": "db_wait_per_second",
+    "lock_contended": "lock_contended_per_second"
+}
+
+# 报告中绘制的资源指标：(字段, 图表名称, 单位换算系数)
+CHART_FIELDS = [
+    ("cpu_cores", "CPU使用(核)", 1),
+    ("rss_bytes", "RSS内存(MB)", 1 / 1024 / 1024),
+    ("heap_inuse_bytes", "堆内存(MB)", 1 / 1024 / 1024),
+    ("goroutines", "协程数", 1),
+    ("open_fds", "打开文件描述符数", 1),
+    ("gc_per_second", "GC次数(次/秒)", 1),
+    ("db_in_use", "数据库使用中连接数", 1),
+    ("db_wait_per_second", "数据库连接等待(次/秒)", 1),
+    ("lock_contended_per_second", "分布式锁竞争(次/秒)", 1)
+]
+
+PROMETHEUS_LINE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{[^}]*\})?\s+([-+0-9.eE]+|NaN|[+-]Inf)')
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def read_stats_endpoint(url):
+    '''读取服务 /health/stats 接口（Go runtime、数据库连接池、分布式锁统计）'''
+    data = requests.get(url, verify=False, timeout=5).json()
+    sample = {
+        "goroutines": data.get("goroutines"),
+        "heap_inuse_bytes": data.get("memory", {}).get("heap_inuse"),
+        "num_gc": data.get("memory", {}).get("num_gc"),
+        "gc_pause_total_ns": data.get("memory", {}).get("pause_total_ns"),
+        "lock_contended": data.get("lock", {}).get("contended"),
+        "lock_wait_nanos": data.get("lock", {}).get("wait_nanos")
+    }
+    if data.get("db"):
+        sample["db_open"] = data["db"].get("open_connections")
+        sample["db_in_use"] = data["db"].get("in_use")
+        sample["db_max_open"] = data["db"].get("max_open_connections")
+        sample["db_wait_count"] = data["db"].get("wait_count")
+    return sample
+
+
+def read_prometheus(url):
+    '''读取 Prometheus 文本格式的 metrics 接口，同名指标多个标签时取合计'''
+    sample = {}
+    text = requests.get(url, verify=False, timeout=5).text
+    for line in text.splitlines():
+        match = PROMETHEUS_LINE.match(line)
+        if not match or match.group(1) not in PROMETHEUS_FIELDS:
+            continue
+        field = PROMETHEUS_FIELDS[match.group(1)]
+        sample[field] = sample.get(field, 0) + float(match.group(3))
+    return sample
+
+
+def read_proc(pid):
+    '''读取本地进程的 /proc 信息：CPU 时间、RSS、线程数、打开的文件描述符数'''
+    sample = {}
+    with open(f"/proc/{pid}/stat") as f:
+        # 进程名可能包含空格，从最后一个右括号之后开始切分
+        fields = f.read().rsplit(")", 1)[1].split()
+    sample["cpu_seconds"] = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                sample["rss_bytes"] = int(line.split()[1]) * 1024
+            elif line.startswith("Threads:"):
+                sample["threads"] = int(line.split()[1])
+    sample["open_fds"] = len(os.listdir(f"/proc/{pid}/fd"))
+    return sample
+
+
+def read_cgroup(path):
+    '''读取容器 cgroup 的 CPU 与内存用量，兼容 cgroup v1 与 v2'''
+    sample = {}
+    if os.path.exists(os.path.join(path, "cpu.stat")):
+        with open(os.path.join(path, "cpu.stat")) as f:
+            for line in f:
+                key, value = line.split()
+                if key == "usage_usec":
+                    sample["cpu_seconds"] = int(value) / 1e6
+    if "cpu_seconds" not in sample and os.path.exists(os.path.join(path, "cpuacct.usage")):
+        with open(os.path.join(path, "cpuacct.usage")) as f:
+            sample["cpu_seconds"] = int(f.read()) / 1e9
+    for name in ("memory.current", "memory.usage_in_bytes"):
+        if os.path.exists(os.path.join(path, name)):
+            with open(os.path.join(path, name)) as f:
+                sample["rss_bytes"] = int(f.read())
+            break
+    return sample
+
+
+class ResourceSampler():
+    '''
+    被测服务资源采样器：在后台线程中按固定间隔采样，与请求延迟共用 time.time() 时间轴
+    采样来源（可组合，同名字段以后者为准）：
+        stats_url: 服务 /health/stats 接口
+        metrics_url: Prometheus 文本格式的 metrics 接口
+        pid: 本地运行的服务进程号，读取 /proc
+        cgroup: 容器 cgroup 目录，读取 CPU 与内存用量
+    '''
+    def __init__(self, stats_url=None, metrics_url=None, pid=None, cgroup=None, interval=1.0, csv_path=None):
+        self.sources = []
+        if stats_url:
+            self.sources.append(("stats", lambda: read_stats_endpoint(stats_url)))
+        if metrics_url:
+            self.sources.append(("prometheus", lambda: read_prometheus(metrics_url)))
+        if pid:
+            self.sources.append(("proc", lambda: read_proc(pid)))
+        if cgroup:
+            self.sources.append(("cgroup", lambda: read_cgroup(cgroup)))
+        self.interval = interval
+        self.csv_path = csv_path
+        self.samples = []
+        self.errors = {}
+        self.reported = False  # 用例已输出资源报告时置为 True，避免 fixture 重复输出
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def enabled(self):
+        return bool(self.sources)
+
+    def sample_once(self):
+        '''采样一次，并根据上一次采样计算 CPU 使用率（核数）和计数器每秒增量'''
+        sample = {"timestamp": time.time()}
+        for name, read in self.sources:
+            try:
+                sample.update({k: v for k, v in read().items() if v is not None})
+            except Exception as e:
+                # 采样失败不影响压测本身，只记录失败次数
+                self.errors[name] = self.errors.get(name, 0) + 1
+                if self.errors[name] == 1:
+                    print(f"资源采样失败({name}): {e}")
+        if self.samples:
+            prev = self.samples[-1]
+            wall = sample["timestamp"] - prev["timestamp"]
+            if wall > 0 and "cpu_seconds" in sample and "cpu_seconds" in prev:
+                sample["cpu_cores"] = (sample["cpu_seconds"] - prev["cpu_seconds"]) / wall
+            for field, rate_field in COUNTER_FIELDS.items():
+                if wall > 0 and field in sample and field in prev:
+                    sample[rate_field] = (sample[field] - prev[field]) / wall
+        self.samples.append(sample)
+        return sample
+
+    def _run(self):
+        while not self._stop.is_set():
+            begin = time.time()
+            self.sample_once()
+            self._stop.wait(max(0, self.interval - (time.time() - begin)))
+
+    def start(self):
+        if not self.enabled:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            if self.csv_path:
+                self.write_csv(self.csv_path)
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def fields(self):
+        '''所有采样中出现过的指标字段'''
+        names = []
+        for sample in self.samples:
+            for key in sample:
+                if key not in names:
+                    names.append(key)
+        return names
+
+    def write_csv(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self.fields())
+            writer.writeheader()
+            writer.writerows(self.samples)
+
+    def series(self, field, start=None):
+        '''
+        返回 [(elapsed, value), ...]
+        :param start: 时间起点（time.time()），与 TimeSeriesRecorder.start 对齐；默认为首次采样时间
+        '''
+        if not self.samples:
+            return []
+        start = start if start is not None else self.samples[0]["timestamp"]
+        return [(s["timestamp"] - start, s[field]) for s in self.samples if field in s]
+
+
+def correlate(latency_points, resource_points):
+    '''
+    计算延迟序列与资源序列的皮尔逊相关系数，资源序列按最近时间点对齐到延迟序列
+    :param latency_points: [(elapsed, latency), ...]
+    :param resource_points: [(elapsed, value), ...]
+    :return: 相关系数，样本不足或方差为 0 时返回 None
+    '''
+    if len(latency_points) < 3 or len(resource_points) < 3:
+        return None
+    resource_points = sorted(resource_points)
+    pairs = []
+    j = 0
+    for t, latency in sorted(latency_points):
+        while j + 1 < len(resource_points) and abs(resource_points[j + 1][0] - t) <= abs(resource_points[j][0] - t):
+            j += 1
+        pairs.append((latency, resource_points[j][1]))
+    n = len(pairs)
+    mean_x = sum(p[0] for p in pairs) / n
+    mean_y = sum(p[1] for p in pairs) / n
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+    var_x = sum((x - mean_x) ** 2 for x, _ in pairs)
+    var_y = sum((y - mean_y) ** 2 for _, y in pairs)
+    if var_x == 0 or var_y == 0:
+        return None
+    return cov / (var_x * var_y) ** 0.5
+
+
+def attach_resource_report(name, sampler, start=None, latency_points=None):
+    '''
+    将资源采样结果写入 allure：CSV、各指标折线图，以及与延迟序列的相关系数
+    :param start: 时间起点，与延迟时间序列对齐
+    :param latency_points: [(elapsed, latency), ...]，如 TimeSeriesRecorder.series("p99")
+    :return: {字段: 相关系数}
+    '''
+    if not sampler.samples:
+        return {}
+    if sampler.csv_path and os.path.exists(sampler.csv_path):
+        allure.attach.file(sampler.csv_path, name=f"{name}资源采样", attachment_type=allure.attachment_type.CSV)
+
+    correlations = {}
+    for field, title, scale in CHART_FIELDS:
+        points = [(t, v * scale) for t, v in sampler.series(field, start)]
+        if not points:
+            continue
+        series = {title: points}
+        if latency_points:
+            correlations[field] = correlate(latency_points, points)
+        attach_line_chart(series, f"{name}{title}", "运行时间(秒)", title)
+
+    if correlations:
+        lines = [f"{name}延迟与资源指标相关系数（皮尔逊，绝对值越接近 1 相关性越强）:"]
+        for field, value in correlations.items():
+            lines.append(f"{field}: {'样本不足' if value is None else f'{value:.3f}'}")
+        text = "\n".join(lines)
+        print(text)
+        allure.attach(text, name=f"{name}延迟归因", attachment_type=allure.attachment_type.TEXT)
+    if sampler.errors:
+        allure.attach(str(sampler.errors), name=f"{name}资源采样失败次数", attachment_type=allure.attachment_type.TEXT)
+    return correlations
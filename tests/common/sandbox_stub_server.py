@@ -0,0 +1,527 @@
+# -*- coding:UTF-8 -*-
+
+import argparse
+import hashlib
+import json
+import queue
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+EXECUTE_CODE_PATH = "/workspace/se/v2/execute_code"
+POOL_FULL_MESSAGE = "沙箱池已满"
+CODE_NOT_CACHED = "CodeNotCached"
+
+# 运行时可通过 POST /_stub/config 调整的参数
+CONFIG_KEYS = ["pool_size", "queue_depth", "queue_timeout_ms", "timeout_ms", "max_requests_per_worker",
+               "pool_full_status", "code_cache_size"]
+
+# 工作进程：真实 Python 解释器，按行读取 JSON 请求，执行 handler_code 并按行返回 JSON 结果
+# 用户代码的 stdout/stderr 被重定向捕获，协议使用启动时复制的标准输出
+# 带 code_hash 的请求按哈希缓存编译结果，同一进程再次执行时跳过编译
+WORKER_SOURCE = r'''
+import contextlib, inspect, io, json, os, resource, sys, time, traceback
+out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+sys.stdout = io.StringIO()
+compiled = {}
+def reply(data):
+    out.write(json.dumps(data, ensure_ascii=False, default=str) + "\n")
+    out.flush()
+reply({"ready": True, "pid": os.getpid()})
+for line in sys.stdin:
+    req = json.loads(line)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    result, error, compile_ms = None, False, 0.0
+    begin, cpu = time.perf_counter(), time.process_time()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            scope = {"__name__": "__sandbox__"}
+            code = compiled.get(req.get("code_hash"))
+            if code is None:
+                code = compile(req.get("handler_code") or "", "<handler>", "exec")
+                compile_ms = (time.perf_counter() - begin) * 1000
+                if req.get("code_hash"):
+                    compiled[req["code_hash"]] = code
+            exec(code, scope)
+            func = scope.get("handler") or scope.get("main")
+            if not callable(func):
+                raise NameError("handler function not found: define handler(event) or main(event)")
+            params = inspect.signature(func).parameters
+            args = [req.get("event") or {}, req.get("context") or {}][:max(1, min(2, len(params)))]
+            result = func(*args)
+            json.dumps(result, default=str)
+        except BaseException:
+            result, error = None, True
+            etype, value, tb = sys.exc_info()
+            traceback.print_exception(etype, value, tb.tb_next)
+    reply({"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "result": result, "error": error,
+           "duration_ms": (time.perf_counter() - begin) * 1000, "compile_ms": compile_ms,
+           "cpu_time_ms": (time.process_time() - cpu) * 1000,
+           "memory_peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024})
+'''
+
+
+class SandboxError(Exception):
+    '''工作进程异常（超时、崩溃），以 System error 形式返回'''
+
+
+class PoolFull(Exception):
+    '''执行池与等待队列均已满或排队超时'''
+
+
+class Worker():
+    '''一个常驻的 Python 解释器进程，启动耗时即冷启动时间'''
+    def __init__(self):
+        begin = time.perf_counter()
+        self.proc = subprocess.Popen([sys.executable, "-u", "-c", WORKER_SOURCE], stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding="utf-8")
+        self.lines = queue.Queue()
+        self.reader = threading.Thread(target=self.read, name="sandbox-worker-reader", daemon=True)
+        self.reader.start()
+        ready = self.lines.get(timeout=30)
+        if ready is None:
+            raise SandboxError("worker exited during startup")
+        self.pid = ready["pid"]
+        self.cold_start = time.perf_counter() - begin
+        self.requests = 0
+
+    def read(self):
+        for line in self.proc.stdout:
+            self.lines.put(json.loads(line))
+        self.lines.put(None)
+
+    def execute(self, request, timeout):
+        '''执行一次请求，超时或进程退出时抛出 SandboxError'''
+        self.requests += 1
+        try:
+            self.proc.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+            self.proc.stdin.flush()
+            response = self.lines.get(timeout=timeout)
+        except (BrokenPipeError, OSError):
+            response = None
+        except queue.Empty:
+            raise SandboxError(f"execution timed out after {timeout * 1000:.0f}ms")
+        if response is None:
+            raise SandboxError(f"worker {self.pid} exited unexpectedly")
+        return response
+
+    def kill(self):
+        self.proc.kill()
+        self.proc.wait()
+
+
+class Stats():
+    '''请求结果计数与冷启动、排队、执行耗时明细（秒）'''
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.counts = {"requests": 0, "ok": 0, "user_errors": 0, "system_errors": 0, "timeouts": 0,
+                           "pool_full": 0, "queue_timeouts": 0, "request_bytes": 0, "code_uploads": 0,
+                           "code_hits": 0, "code_misses": 0, "compiles": 0}
+            self.cold_starts = []
+            self.queue_waits = []
+            self.executions = []
+            self.peak = {"busy": 0, "queued": 0}
+
+    def add(self, key, n=1):
+        with self.lock:
+            self.counts[key] += n
+
+    def record(self, name, seconds):
+        with self.lock:
+            getattr(self, name).append(seconds)
+
+    def observe(self, busy, queued):
+        with self.lock:
+            self.peak["busy"] = max(self.peak["busy"], busy)
+            self.peak["queued"] = max(self.peak["queued"], queued)
+
+    def snapshot(self):
+        with self.lock:
+            return {"counts": dict(self.counts), "cold_starts": list(self.cold_starts),
+                    "queue_waits": list(self.queue_waits), "executions": list(self.executions),
+                    "peak": dict(self.peak)}
+
+
+class WorkerPool():
+    '''
+    固定上限的解释器进程池：pool_size 个进程并行执行，最多 queue_depth 个请求排队等待空闲进程，
+    超出或排队超过 queue_timeout_ms（0 为不限）时拒绝；进程按需启动（冷启动），执行 max_requests_per_worker 次后回收重建
+    '''
+    def __init__(self, stats, pool_size, queue_depth, queue_timeout_ms, max_requests_per_worker):
+        self.stats = stats
+        self.pool_size = pool_size
+        self.queue_depth = queue_depth
+        self.queue_timeout_ms = queue_timeout_ms
+        self.max_requests_per_worker = max_requests_per_worker
+        self.idle = queue.LifoQueue()
+        self.lock = threading.Lock()
+        # 归还、回收进程或调整池大小时唤醒等待者，等待者重新检查是否有空闲进程或可启动新进程
+        self.changed = threading.Condition(self.lock)
+        self.spawned = 0
+        self.busy = 0
+        self.waiting = 0
+
+    def spawn(self):
+        try:
+            worker = Worker()
+        except Exception:
+            with self.changed:
+                self.spawned -= 1
+                self.changed.notify()
+            raise
+        self.stats.record("cold_starts", worker.cold_start)
+        return worker
+
+    def prewarm(self):
+        '''预先启动全部进程，使首批请求不受冷启动影响'''
+        with self.lock:
+            count = self.pool_size - self.spawned
+            self.spawned += count
+        for worker in [self.spawn() for _ in range(count)]:
+            self.idle.put(worker)
+        self.wakeup()
+
+    def wakeup(self):
+        '''唤醒全部等待者，用于池参数调整后'''
+        with self.changed:
+            self.changed.notify_all()
+
+    def acquire(self):
+        '''取得空闲进程，返回 (进程, 是否冷启动)；池满时抛出 PoolFull'''
+        begin = time.perf_counter()
+        deadline = begin + self.queue_timeout_ms / 1000.0 if self.queue_timeout_ms > 0 else None
+        grow = False
+        with self.changed:
+            if self.busy + self.waiting >= self.pool_size + self.queue_depth:
+                raise PoolFull()
+            self.waiting += 1
+            self.stats.observe(self.busy, self.waiting)
+            try:
+                while True:
+                    try:
+                        worker = self.idle.get_nowait()
+                        break
+                    except queue.Empty:
+                        pass
+                    if self.spawned < self.pool_size:
+                        self.spawned += 1
+                        grow = True
+                        break
+                    remaining = deadline - time.perf_counter() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        self.stats.add("queue_timeouts")
+                        raise PoolFull()
+                    self.changed.wait(remaining)
+            finally:
+                self.waiting -= 1
+            self.busy += 1
+            self.stats.observe(self.busy, self.waiting)
+        cold = False
+        if grow:
+            try:
+                worker, cold = self.spawn(), True
+            except BaseException:
+                with self.lock:
+                    self.busy -= 1
+                raise
+        self.stats.record("queue_waits", time.perf_counter() - begin)
+        return worker, cold
+
+    def release(self, worker, broken=False):
+        '''归还进程；异常、达到复用上限或池已缩小时回收，并唤醒一个等待者（取得归还的进程或启动替代进程）'''
+        with self.changed:
+            retire = broken or self.spawned > self.pool_size or \
+                (self.max_requests_per_worker and worker.requests >= self.max_requests_per_worker)
+            if retire:
+                self.spawned -= 1
+            else:
+                self.idle.put(worker)
+            self.busy -= 1
+            self.changed.notify()
+        if retire:
+            worker.kill()
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().kill()
+            except queue.Empty:
+                break
+        with self.lock:
+            self.spawned = 0
+
+
+class SandboxStubServer():
+    '''
+    本地沙箱运行时替身，实现被测服务调用的 POST /workspace/se/v2/execute_code：
+    请求 {handler_code, event, context}，在真实 Python 解释器进程中执行 handler(event) 或 main(event)，
+    返回 {stdout, stderr, result, metrics}；用户代码异常时返回 200 并在 stderr 中给出堆栈，
+    执行超时或进程崩溃时返回 200 且 stderr 以 "System error:" 开头
+    执行池与等待队列均满时按 pool_full_status 返回 503（默认）或 200 + stderr "System error: 沙箱池已满"
+    代码缓存：请求带 code_hash 与 handler_code 时按哈希保存代码（最多 code_cache_size 段，按最近使用淘汰），
+    之后只带 code_hash 即可执行；哈希未保存时返回 404 {"code": "CodeNotCached"}，由调用方回退发送完整代码
+    metrics：duration_ms 执行耗时，cpu_time_ms CPU 时间，memory_peak_mb 进程内存峰值，queue_ms 排队耗时，
+    cold_start 是否新启动进程，cold_start_ms 进程启动耗时，worker_pid 工作进程号，compile_ms 编译耗时（命中编译缓存时为 0）
+    统计与控制接口：GET /_stub/stats，POST /_stub/reset，POST /_stub/config，POST /_stub/flush（清空代码缓存）
+    '''
+    def __init__(self, host="0.0.0.0", port=0, pool_size=4, queue_depth=0, queue_timeout_ms=0, timeout_ms=30000,
+                 max_requests_per_worker=0, pool_full_status=503, prewarm=True, code_cache_size=1000):
+        self.host = host
+        self.port = port
+        self.stats_ = Stats()
+        self.pool = WorkerPool(self.stats_, pool_size, queue_depth, queue_timeout_ms, max_requests_per_worker)
+        self.timeout_ms = timeout_ms
+        self.pool_full_status = pool_full_status
+        self.prewarm = prewarm
+        self.code_cache_size = code_cache_size
+        self.codes = OrderedDict()
+        self.codes_lock = threading.Lock()
+        self.httpd = None
+        self.thread = None
+
+    def configure(self, **params):
+        '''调整执行池参数，未知参数抛出 ValueError；增大 pool_size 时按需启动新进程，减小时归还的进程被回收'''
+        unknown = set(params) - set(CONFIG_KEYS)
+        if unknown:
+            raise ValueError(f"未知的配置参数: {sorted(unknown)}")
+        for key, value in params.items():
+            target = self if key in ("timeout_ms", "pool_full_status", "code_cache_size") else self.pool
+            setattr(target, key, int(value))
+        self.pool.wakeup()
+        return self.config()
+
+    def config(self):
+        return {"pool_size": self.pool.pool_size, "queue_depth": self.pool.queue_depth,
+                "queue_timeout_ms": self.pool.queue_timeout_ms, "timeout_ms": self.timeout_ms,
+                "max_requests_per_worker": self.pool.max_requests_per_worker,
+                "pool_full_status": self.pool_full_status, "code_cache_size": self.code_cache_size}
+
+    def start(self):
+        '''启动服务（prewarm 时先启动全部工作进程），port=0 时使用随机端口'''
+        server = self
+
+        class Handler(SandboxHandler):
+            stub = server
+
+        if self.prewarm:
+            self.pool.prewarm()
+        self.httpd = SandboxHTTPServer((self.host, self.port), Handler)
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="sandbox-stub", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+        self.pool.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def url(self):
+        host = socket.gethostname() if self.host == "0.0.0.0" else self.host
+        return f"http://{host}:{self.port}{EXECUTE_CODE_PATH}"
+
+    def stats(self):
+        return dict(self.stats_.snapshot(), config=self.config(),
+                    pool={"spawned": self.pool.spawned, "busy": self.pool.busy, "waiting": self.pool.waiting})
+
+    def reset(self):
+        self.stats_.reset()
+
+    def flush(self):
+        '''清空保存的代码，模拟沙箱重启后只带哈希的请求全部未命中，返回清空的代码数'''
+        with self.codes_lock:
+            count = len(self.codes)
+            self.codes.clear()
+        return count
+
+    def resolve_code(self, request):
+        '''
+        处理 code_hash：带代码时校验并保存，只带哈希时取回保存的代码
+        返回 None 表示可以执行，否则返回 (HTTP 状态码, 响应体)
+        '''
+        code_hash = request.get("code_hash")
+        if not code_hash:
+            return None
+        code = request.get("handler_code")
+        with self.codes_lock:
+            if code:
+                if hashlib.sha256(code.encode()).hexdigest() != code_hash:
+                    return 400, {"code": "InvalidParameter", "message": "code_hash does not match handler_code"}
+                self.stats_.add("code_uploads")
+                self.codes[code_hash] = code
+                self.codes.move_to_end(code_hash)
+                while len(self.codes) > self.code_cache_size:
+                    self.codes.popitem(last=False)
+                return None
+            if code_hash not in self.codes:
+                self.stats_.add("code_misses")
+                return 404, {"code": CODE_NOT_CACHED, "message": f"code {code_hash} is not cached"}
+            self.stats_.add("code_hits")
+            self.codes.move_to_end(code_hash)
+            request["handler_code"] = self.codes[code_hash]
+        return None
+
+    def execute(self, request):
+        '''执行一次 execute_code 请求，返回 (HTTP 状态码, 响应体)'''
+        self.stats_.add("requests")
+        rejected = self.resolve_code(request)
+        if rejected:
+            return rejected
+        begin = time.perf_counter()
+        try:
+            worker, cold = self.pool.acquire()
+        except PoolFull:
+            self.stats_.add("pool_full")
+            message = f"System error: {POOL_FULL_MESSAGE}"
+            if self.pool_full_status == 503:
+                return 503, {"code": "SandboxPoolFull", "message": message}
+            return 200, {"stdout": "", "stderr": message, "result": None, "metrics": {}}
+        queue_ms = (time.perf_counter() - begin) * 1000
+        remaining = (request.get("context") or {}).get("remaining_time_in_millis") or self.timeout_ms
+        broken = False
+        try:
+            response = worker.execute(request, remaining / 1000.0)
+        except SandboxError as e:
+            broken = True
+            self.stats_.add("timeouts" if "timed out" in str(e) else "system_errors")
+            response = {"stdout": "", "stderr": f"System error: {e}", "result": None, "duration_ms": remaining}
+        finally:
+            self.pool.release(worker, broken)
+        if not broken:
+            self.stats_.add("user_errors" if response["error"] else "ok")
+            if response["compile_ms"]:
+                self.stats_.add("compiles")
+        self.stats_.record("executions", response["duration_ms"] / 1000.0)
+        metrics = {
+            "duration_ms": round(response["duration_ms"], 3),
+            "cpu_time_ms": round(response.get("cpu_time_ms", 0.0), 3),
+            "memory_peak_mb": round(response.get("memory_peak_mb", 0.0), 3),
+            "queue_ms": round(queue_ms, 3),
+            "cold_start": cold,
+            "cold_start_ms": round(worker.cold_start * 1000, 3) if cold else 0.0,
+            "worker_pid": worker.pid,
+            "compile_ms": round(response.get("compile_ms", 0.0), 3)
+        }
+        return 200, {"stdout": response["stdout"], "stderr": response["stderr"], "result": response["result"],
+                     "metrics": metrics}
+
+
+class SandboxHTTPServer(ThreadingHTTPServer):
+    # 默认监听队列只有 5，突发并发超过时连接被重置，掩盖了执行池的池满行为
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class SandboxHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    stub = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def route(self):
+        return urlparse(self.path).path.rstrip("/") or "/"
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.stub.stats_.add("request_bytes", len(body))
+        return json.loads(body) if body else None
+
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False, default=str).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.route() == "/_stub/stats":
+            self.send_json(200, self.stub.stats())
+        else:
+            self.send_json(404, {})
+
+    def do_POST(self):
+        route = self.route()
+        if route == EXECUTE_CODE_PATH:
+            try:
+                request = self.read_json()
+            except ValueError:
+                request = None
+            if not isinstance(request, dict):
+                self.send_json(400, {"code": "InvalidParameter", "message": "invalid request body"})
+                return
+            self.send_json(*self.stub.execute(request))
+        elif route == "/_stub/reset":
+            self.stub.reset()
+            self.send_json(200, {})
+        elif route == "/_stub/flush":
+            self.send_json(200, {"codes": self.stub.flush()})
+        elif route == "/_stub/config":
+            try:
+                config = self.stub.configure(**(self.read_json() or {}))
+            except (ValueError, TypeError) as e:
+                self.send_json(400, {"error": str(e)})
+                return
+            self.send_json(200, config)
+        else:
+            self.send_json(404, {})
+
+
+def stub_from_config(config, **overrides):
+    '''按 env.ini 的 [performance] 段 sandbox_stub_* 参数创建替身（未启动）'''
+    section = "performance"
+    params = {
+        "host": config.get(section, "sandbox_stub_bind", fallback="0.0.0.0"),
+        "port": config.getint(section, "sandbox_stub_port", fallback=9101),
+        "pool_size": config.getint(section, "sandbox_stub_pool_size", fallback=4),
+        "queue_depth": config.getint(section, "sandbox_stub_queue_depth", fallback=0),
+        "queue_timeout_ms": config.getint(section, "sandbox_stub_queue_timeout_ms", fallback=0),
+        "timeout_ms": config.getint(section, "sandbox_stub_timeout_ms", fallback=30000),
+        "max_requests_per_worker": config.getint(section, "sandbox_stub_max_requests_per_worker", fallback=0),
+        "pool_full_status": config.getint(section, "sandbox_stub_pool_full_status", fallback=503),
+        "prewarm": config.getboolean(section, "sandbox_stub_prewarm", fallback=True),
+        "code_cache_size": config.getint(section, "sandbox_stub_code_cache_size", fallback=1000)
+    }
+    params.update(overrides)
+    return SandboxStubServer(**params)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="本地沙箱运行时替身（/workspace/se/v2/execute_code）")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=9101)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--queue-depth", type=int, default=0)
+    parser.add_argument("--queue-timeout-ms", type=int, default=0)
+    parser.add_argument("--timeout-ms", type=int, default=30000)
+    parser.add_argument("--max-requests-per-worker", type=int, default=0)
+    parser.add_argument("--pool-full-status", type=int, choices=[200, 503], default=503)
+    parser.add_argument("--no-prewarm", dest="prewarm", action="store_false")
+    parser.add_argument("--code-cache-size", type=int, default=1000)
+    args = parser.parse_args()
+    stub = SandboxStubServer(**vars(args)).start()
+    print(f"沙箱替身已启动: {stub.url()}，执行池 {args.pool_size}，等待队列 {args.queue_depth}", flush=True)
+    try:
+        stub.thread.join()
+    except KeyboardInterrupt:
+        stub.stop()
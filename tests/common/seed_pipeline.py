@@ -0,0 +1,156 @@
+# -*- coding:UTF-8 -*-
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class RateLimiter():
+    '''令牌桶限速器（线程安全），rate 为每秒请求数，0 或 None 表示不限速'''
+    def __init__(self, rate=None, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, rate or 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class Checkpoint():
+    '''
+    JSONL 检查点清单：每行记录一个已完成的任务 {"user", "stage", "index", "ids"}
+    中断后重新运行时跳过清单中已完成的任务；删除清单文件即从头开始
+    '''
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 中断时最后一行可能写入不完整
+                        continue
+                    self.entries[(entry["user"], entry["stage"], entry["index"])] = entry
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.file = open(path, "a", encoding="utf-8")
+
+    def done(self, user, stage, index):
+        return (user, stage, index) in self.entries
+
+    def ids(self, user, stage):
+        '''某用户某阶段已记录的全部资源 ID'''
+        result = []
+        for (u, s, _), entry in self.entries.items():
+            if u == user and s == stage:
+                result.extend(entry["ids"])
+        return result
+
+    def record(self, user, stage, index, ids):
+        entry = {"user": user, "stage": stage, "index": index, "ids": ids}
+        with self.lock:
+            self.entries[(user, stage, index)] = entry
+            self.file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class Progress():
+    '''阶段进度与剩余时间估算，按固定间隔输出到标准输出'''
+    def __init__(self, stage, total, skipped=0, interval=5):
+        self.stage = stage
+        self.total = total
+        self.skipped = skipped
+        self.done = 0
+        self.failed = 0
+        self.interval = interval
+        self.start = time.monotonic()
+        self.printed = 0
+        self.lock = threading.Lock()
+
+    def update(self, ok):
+        with self.lock:
+            self.done += 1
+            if not ok:
+                self.failed += 1
+            now = time.monotonic()
+            if now - self.printed >= self.interval or self.done == self.total:
+                self.printed = now
+                print(self.line(now), flush=True)
+
+    def line(self, now=None):
+        elapsed = (now or time.monotonic()) - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0
+        eta = (self.total - self.done) / rate if rate else 0
+        percent = self.done * 100 / self.total if self.total else 100
+        return (f"[{self.stage}] {self.done}/{self.total} ({percent:.1f}%) 已跳过 {self.skipped} "
+                f"失败 {self.failed} 速率 {rate:.1f}/秒 已用 {format_duration(elapsed)} 剩余 {format_duration(eta)}")
+
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def run_stage(stage, tasks, func, checkpoint, workers=8, limiter=None, retries=3, backoff=1.0):
+    '''
+    并发执行一个阶段的任务，已在检查点中完成的任务直接跳过
+    :param tasks: [(user, index, payload), ...]，(user, stage, index) 唯一标识一个任务
+    :param func: func(user, payload) -> 资源 ID 列表，失败时抛出异常
+    :param limiter: RateLimiter，所有阶段可共用同一个限速器
+    :return: 失败任务列表 [(user, index, 错误信息)]
+    '''
+    pending = [task for task in tasks if not checkpoint.done(task[0], stage, task[1])]
+    progress = Progress(stage, len(pending), skipped=len(tasks) - len(pending))
+    print(f"[{stage}] 共 {len(tasks)} 个任务，检查点中已完成 {progress.skipped} 个", flush=True)
+    failures = []
+
+    def execute(user, index, payload):
+        for attempt in range(retries + 1):
+            if limiter:
+                limiter.acquire()
+            try:
+                ids = func(user, payload)
+                checkpoint.record(user, stage, index, ids)
+                return None
+            except Exception as e:
+                error = str(e)
+                if attempt < retries:
+                    time.sleep(backoff * (2 ** attempt))
+        return error
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(execute, *task): task for task in pending}
+        for future in as_completed(futures):
+            error = future.result()
+            progress.update(error is None)
+            if error is not None:
+                user, index, _ = futures[future]
+                failures.append((user, index, error))
+    return failures
+
+
+def chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
@@ -0,0 +1,279 @@
+# -*- coding:UTF-8 -*-
+
+import csv
+import math
+import os
+import threading
+import time
+
+from common.perf_stats import percentile
+
+CSV_FIELDS = ["elapsed", "throughput", "error_rate", "p50", "p90", "p99", "max"]
+
+
+class TimeSeriesRecorder():
+    '''
+    按秒聚合请求结果的时间序列记录器，适用于数小时的浸泡测试：
+        1. 每秒的原始延迟只在该秒结束前保存在内存中，聚合后立即写入 CSV 并释放
+        2. 没有请求完成的秒同样写入一行（吞吐为 0，延迟为空），服务停顿与吞吐崩溃在序列中可见
+        3. 用于趋势检验和绘图的序列点数不超过 max_points，超出后相邻点两两合并降采样
+    '''
+    def __init__(self, csv_path, max_points=1000, start=None):
+        '''
+        :param csv_path: 每秒聚合结果的 CSV 输出路径
+        :param max_points: 内存中保留的序列最大点数
+        :param start: 时间起点（time.time()），默认为创建时刻
+        '''
+        self.csv_path = csv_path
+        self.max_points = max_points
+        self.start = start if start is not None else time.time()
+        self.points = []
+        self.seconds_per_point = 1  # 当前每个序列点代表的秒数
+        self._pending = []  # 尚未凑满 _merge 秒的聚合行
+        self._buckets = {}
+        self._next_second = 0  # 下一个待写出的秒
+        self._lock = threading.Lock()
+        self._rows = 0
+        os.makedirs(os.path.dirname(os.path.abspath(csv_path)), exist_ok=True)
+        self._file = open(csv_path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDS)
+        self._writer.writeheader()
+
+    def record(self, latency, ok, timestamp=None):
+        '''
+        记录一次请求
+        :param latency: 延迟（秒）
+        :param ok: 是否成功
+        :param timestamp: 请求完成时间（time.time()），默认为当前时间
+        '''
+        timestamp = timestamp if timestamp is not None else time.time()
+        second = int(timestamp - self.start)
+        with self._lock:
+            # 乱序超过 1 秒的完成记录并入最早未写出的秒
+            second = max(second, self._next_second)
+            bucket = self._buckets.setdefault(second, [[], 0])
+            bucket[0].append(latency)
+            if not ok:
+                bucket[1] += 1
+            # 完成时间乱序最多 1 秒，早于此的桶已不会再有新数据
+            for key in sorted(k for k in self._buckets if k < second - 1):
+                self._flush_bucket(key)
+
+    def _flush_bucket(self, second):
+        self._fill_empty(second)
+        latencies, errors = self._buckets.pop(second)
+        self._write_row({
+            "elapsed": second,
+            "throughput": len(latencies),
+            "error_rate": errors / len(latencies),
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "max": max(latencies)
+        })
+
+    def _fill_empty(self, until):
+        '''为 [_next_second, until) 内没有请求完成的秒写入吞吐为 0 的行'''
+        for second in range(self._next_second, until):
+            self._write_row({"elapsed": second, "throughput": 0, "error_rate": 0.0,
+                             "p50": None, "p90": None, "p99": None, "max": None})
+
+    def _write_row(self, row):
+        self._next_second = row["elapsed"] + 1
+        self._writer.writerow(row)
+        self._rows += 1
+        if self._rows % 60 == 0:
+            self._file.flush()
+        self._append_point(row)
+
+    def _append_point(self, row):
+        self._pending.append(row)
+        if len(self._pending) < self.seconds_per_point:
+            return
+        self.points.append(_merge_rows(self._pending))
+        self._pending = []
+        if len(self.points) > self.max_points:
+            # 点数超限时分辨率减半，内存占用与测试时长无关
+            self.points = [_merge_rows(self.points[i:i + 2]) for i in range(0, len(self.points), 2)]
+            self.seconds_per_point *= 2
+
+    def close(self, end=None):
+        '''
+        写出剩余的桶并关闭 CSV 文件
+        :param end: 结束时间（time.time()），默认为当前时间，最后一次完成之后的秒按吞吐为 0 补齐
+        '''
+        end = end if end is not None else time.time()
+        with self._lock:
+            for key in sorted(self._buckets):
+                self._flush_bucket(key)
+            self._fill_empty(int(end - self.start))
+            if self._pending:
+                self.points.append(_merge_rows(self._pending))
+                self._pending = []
+            self._file.close()
+
+    def series(self, field):
+        '''返回 [(elapsed, value), ...] 形式的序列，用于绘图和趋势检验；延迟序列不含没有请求完成的时间点'''
+        return [(p["elapsed"], p[field]) for p in self.points if p[field] is not None]
+
+
+def _merge_rows(rows):
+    '''合并相邻时间点：吞吐与错误率按请求数加权，百分位取各点最大值（保守估计），均无请求完成时为空'''
+    if len(rows) == 1:
+        return rows[0]
+    total = sum(r["throughput"] for r in rows)
+    merged = {
+        "elapsed": rows[0]["elapsed"],
+        "throughput": total / len(rows),
+        "error_rate": sum(r["error_rate"] * r["throughput"] for r in rows) / total if total else 0.0
+    }
+    for field in ("p50", "p90", "p99", "max"):
+        values = [r[field] for r in rows if r[field] is not None]
+        merged[field] = max(values) if values else None
+    return merged
+
+
+def mann_kendall(values):
+    '''
+    Mann-Kendall 单调趋势检验（正态近似，含结值修正）
+    :return: (z 统计量, 双侧 p 值)，z > 0 表示上升趋势
+    '''
+    n = len(values)
+    if n < 10:
+        return 0.0, 1.0
+    s = 0
+    for i in range(n - 1):
+        vi = values[i]
+        for j in range(i + 1, n):
+            diff = values[j] - vi
+            if diff > 0:
+                s += 1
+            elif diff < 0:
+                s -= 1
+    ties = {}
+    for v in values:
+        ties[v] = ties.get(v, 0) + 1
+    var = (n * (n - 1) * (2 * n + 5) - sum(t * (t - 1) * (2 * t + 5) for t in ties.values())) / 18.0
+    if var <= 0:
+        return 0.0, 1.0
+    if s > 0:
+        z = (s - 1) / math.sqrt(var)
+    elif s < 0:
+        z = (s + 1) / math.sqrt(var)
+    else:
+        z = 0.0
+    p = math.erfc(abs(z) / math.sqrt(2))
+    return z, p
+
+
+def sen_slope(points):
+    '''
+    Theil-Sen 斜率估计：所有点对斜率的中位数，对离群点稳健
+    点数较多时按固定步长抽样点对，控制计算量
+    :param points: [(x, y), ...]
+    '''
+    n = len(points)
+    if n < 2:
+        return 0.0
+    stride = max(1, n // 300)
+    sample = points[::stride]
+    slopes = []
+    for i in range(len(sample) - 1):
+        xi, yi = sample[i]
+        for j in range(i + 1, len(sample)):
+            xj, yj = sample[j]
+            if xj != xi:
+                slopes.append((yj - yi) / (xj - xi))
+    return percentile(slopes, 50)
+
+
+def detect_trend(points, increase_bad=True, alpha=0.05, min_change=0.2):
+    '''
+    检测序列是否存在显著的劣化趋势
+    :param points: [(elapsed, value), ...]
+    :param increase_bad: True 表示上升为劣化（延迟、错误率），False 表示下降为劣化（吞吐）
+    :param alpha: 显著性水平
+    :param min_change: 整个时间窗口内的最小相对变化幅度，过滤统计显著但幅度可忽略的趋势
+    :return: 检验结果字典，degraded 为 True 表示检测到劣化
+    '''
+    values = [p[1] for p in points]
+    z, p = mann_kendall(values)
+    slope = sen_slope(points)
+    span = points[-1][0] - points[0][0] if len(points) > 1 else 0
+    baseline = percentile(values[:max(1, len(values) // 10)], 50)
+    change = slope * span / baseline if baseline else 0.0
+    direction = 1 if increase_bad else -1
+    degraded = p < alpha and z * direction > 0 and change * direction >= min_change
+    return {
+        "z": z,
+        "p_value": p,
+        "slope_per_second": slope,
+        "relative_change": change,
+        "degraded": degraded
+    }
+
+
+def run_soak(func, csv_path, duration, workers=10, rate=None, is_success=None, max_points=1000):
+    '''
+    持续浸泡压测：在 duration 秒内不间断发起请求，结果逐秒写入时间序列
+    :param func: 单次请求函数，入参为请求序号，返回 [status_code, response]
+    :param workers: 并发线程数
+    :param rate: 若指定，则各线程合计按该速率（次/秒）匀速发起请求，否则线程全速循环
+    :param is_success: 成功判定函数，默认判定 HTTP 状态码为 200
+    :return: TimeSeriesRecorder（已关闭）
+    '''
+    is_success = is_success or (lambda result: result[0] == 200)
+    recorder = TimeSeriesRecorder(csv_path, max_points=max_points)
+    deadline = time.time() + duration
+    interval = workers / rate if rate else 0
+    counter = [0]
+    lock = threading.Lock()
+
+    def worker(offset):
+        next_start = time.time() + offset
+        while True:
+            if interval:
+                delay = next_start - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                next_start += interval
+            if time.time() >= deadline:
+                return
+            with lock:
+                counter[0] += 1
+                index = counter[0]
+            begin = time.perf_counter()
+            try:
+                ok = bool(is_success(func(index)))
+            except Exception as e:
+                print(f"请求异常: {e}")
+                ok = False
+            recorder.record(time.perf_counter() - begin, ok)
+
+    threads = [threading.Thread(target=worker, args=(i * interval / workers,), daemon=True) for i in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    recorder.close()
+    return recorder
+
+
+def soak_report(name, recorder, alpha=0.05, min_change=0.2):
+    '''
+    对浸泡测试时间序列做趋势检验
+    :return: (报告文本, 检验结果字典)
+    '''
+    checks = {
+        "p50": detect_trend(recorder.series("p50"), True, alpha, min_change),
+        "p99": detect_trend(recorder.series("p99"), True, alpha, min_change),
+        "throughput": detect_trend(recorder.series("throughput"), False, alpha, min_change),
+        "error_rate": detect_trend(recorder.series("error_rate"), True, alpha, min_change)
+    }
+    lines = [f"{name}浸泡测试趋势检验 (Mann-Kendall, alpha={alpha}, 最小相对变化 {min_change * 100:.0f}%):",
+             f"时间序列点数: {len(recorder.points)}, 每点代表 {recorder.seconds_per_point} 秒, CSV: {recorder.csv_path}"]
+    for field, check in checks.items():
+        lines.append(f"{field}: z={check['z']:.2f}, p={check['p_value']:.4f}, "
+                     f"斜率={check['slope_per_second']:.6f}/秒, 相对变化={check['relative_change'] * 100:.1f}%, "
+                     f"{'检测到劣化趋势' if check['degraded'] else '稳定'}")
+    return "\n".join(lines), checks
@@ -0,0 +1,180 @@
+# -*- coding:UTF-8 -*-
+
+import os
+import re
+import time
+
+import requests
+
+from urllib3 import disable_warnings
+from urllib3.exceptions import InsecureRequestWarning
+disable_warnings(InsecureRequestWarning)
+
+try:
+    import ijson
+except ImportError:  # 可选依赖，未安装时使用结构校验
+    ijson = None
+
+# 结构校验只关心括号、引号与转义符
+STRUCTURAL = re.compile(rb'[\[\]{}"\\]')
+CLOSING = {ord("}"): ord("{"), ord("]"): ord("[")}
+
+
+class JSONStructureValidator():
+    '''
+    逐块校验 JSON 的结构：根为对象或数组、括号成对匹配、字符串闭合、根之后无多余内容
+    不校验标量的语法，内存占用只与嵌套深度有关
+    '''
+    def __init__(self):
+        self.stack = []
+        self.in_string = False
+        self.escape = False
+        self.started = False
+        self.closed = False
+        self.max_depth = 0
+        self.objects = 0
+        self.arrays = 0
+        self.error = None
+
+    def feed(self, chunk):
+        if self.error:
+            return
+        start = 0
+        if self.escape:
+            # 上一块以转义符结尾，跳过本块第一个字符
+            self.escape = False
+            start = 1
+        if self.closed:
+            if chunk[start:].strip():
+                self.error = "根元素之后存在多余内容"
+            return
+        if not self.started:
+            head = chunk[start:].lstrip()
+            if not head:
+                return
+            if head[:1] not in (b"{", b"["):
+                self.error = "根元素不是对象或数组"
+                return
+            self.started = True
+        skip = -1
+        for match in STRUCTURAL.finditer(chunk, start):
+            pos, char = match.start(), chunk[match.start()]
+            if pos == skip:
+                continue
+            if self.in_string:
+                if char == ord("\\"):
+                    if pos + 1 < len(chunk):
+                        skip = pos + 1
+                    else:
+                        self.escape = True
+                elif char == ord('"'):
+                    self.in_string = False
+            elif char == ord('"'):
+                self.in_string = True
+            elif char in (ord("{"), ord("[")):
+                self.stack.append(char)
+                self.max_depth = max(self.max_depth, len(self.stack))
+                if char == ord("{"):
+                    self.objects += 1
+                else:
+                    self.arrays += 1
+            elif char in CLOSING:
+                if not self.stack or self.stack.pop() != CLOSING[char]:
+                    self.error = f"括号不匹配: {chr(char)}"
+                    return
+                if not self.stack:
+                    self.closed = True
+                    if chunk[pos + 1:].strip():
+                        self.error = "根元素之后存在多余内容"
+                    return
+
+    def close(self):
+        '''结束校验，返回 {"valid", "error", "max_depth", "objects", "arrays"}'''
+        if not self.error and not self.closed:
+            self.error = "内容为空" if not self.started else "JSON 未结束"
+        return {"validator": "structure", "valid": self.error is None, "error": self.error,
+                "max_depth": self.max_depth, "objects": self.objects, "arrays": self.arrays}
+
+
+class IJSONValidator():
+    '''基于 ijson 推送接口的增量解析校验，逐块解析、事件随即丢弃'''
+    def __init__(self):
+        self.events = ijson.sendable_list()
+        self.coro = ijson.basic_parse_coro(self.events)
+        self.count = 0
+        self.max_depth = 0
+        self.depth = 0
+        self.error = None
+
+    def feed(self, chunk):
+        if self.error:
+            return
+        try:
+            self.coro.send(chunk)
+        except ijson.JSONError as e:
+            self.error = str(e)
+        self.consume()
+
+    def consume(self):
+        for event, _ in self.events:
+            if event in ("start_map", "start_array"):
+                self.depth += 1
+                self.max_depth = max(self.max_depth, self.depth)
+            elif event in ("end_map", "end_array"):
+                self.depth -= 1
+        self.count += len(self.events)
+        del self.events[:]
+
+    def close(self):
+        if not self.error:
+            try:
+                self.coro.close()
+            except ijson.JSONError as e:
+                self.error = str(e)
+            self.consume()
+        return {"validator": "ijson", "valid": self.error is None, "error": self.error,
+                "max_depth": self.max_depth, "events": self.count}
+
+
+def json_validator():
+    '''已安装 ijson 时完整解析校验，否则只做结构校验'''
+    return IJSONValidator() if ijson else JSONStructureValidator()
+
+
+def download(url, path, headers, chunk_size=64 * 1024, validate=False, timeout=600, session=None):
+    '''
+    流式下载：响应按块直接写入 path，不在内存中保留完整响应
+    :param validate: 写入的同时增量校验 JSON，结果在返回值的 validation 中
+    :return: (状态码, 结果)；200 时结果为 {"path", "bytes", "chunks", "ttfb", "elapsed", "mb_per_second",
+             "content_type", "validation"}，否则为解析后的错误响应，且不保留文件
+    '''
+    http = session or requests
+    begin = time.perf_counter()
+    with http.get(url, headers=headers, stream=True, verify=False, allow_redirects=False, timeout=timeout) as resp:
+        ttfb = time.perf_counter() - begin
+        if resp.status_code != 200:
+            try:
+                return resp.status_code, resp.json()
+            except ValueError:
+                return resp.status_code, resp.text[:2000]
+        validator = json_validator() if validate else None
+        size, chunks = 0, 0
+        try:
+            with open(path, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    if validator:
+                        validator.feed(chunk)
+                    size += len(chunk)
+                    chunks += 1
+        except BaseException:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+        elapsed = time.perf_counter() - begin
+        return resp.status_code, {
+            "path": path, "bytes": size, "chunks": chunks, "ttfb": ttfb, "elapsed": elapsed,
+            "mb_per_second": size / 1024 / 1024 / elapsed if elapsed else 0.0,
+            "content_type": resp.headers.get("Content-Type", ""),
+            "validation": validator.close() if validator else None
+        }
@@ -0,0 +1,85 @@
+# -*- coding:UTF-8 -*-
+
+import http.client
+import json
+import ssl
+import time
+
+from urllib.parse import urlsplit
+
+DONE = "[DONE]"
+
+
+def parse_line(line):
+    '''
+    解析一行流式输出：SSE 的 "data: {...}" 或 NDJSON 的 "{...}"
+    :return: 事件 dict；结束标记返回 DONE；空行、注释等返回 None
+    '''
+    text = line.decode(errors="replace").strip()
+    if text.startswith("data:"):
+        text = text[len("data:"):].strip()
+    if not text or text.startswith(":"):
+        return None
+    if text == DONE:
+        return DONE
+    try:
+        event = json.loads(text)
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+def read_stream(url, body, headers, timeout=60):
+    '''
+    POST 请求流式接口并逐行读取，记录每个事件的到达时刻
+    不用 requests 的 iter_lines：其按块读取，会把到达时刻不同的事件合并；这里按行读取 chunked 响应
+    事件需包含生产时刻 ts（time.time()），事件延迟 = 到达时刻 - ts，要求生产者与本进程在同一台机器上
+    :return: {"status", "headers_s", "ttfb_s", "elapsed_s", "events": [(seq, ts, arrival)], "done", "bytes", "error"}
+    '''
+    parts = urlsplit(url)
+    if parts.scheme == "https":
+        conn = http.client.HTTPSConnection(parts.netloc, timeout=timeout, context=ssl._create_unverified_context())
+    else:
+        conn = http.client.HTTPConnection(parts.netloc, timeout=timeout)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    result = {"status": 0, "headers_s": None, "ttfb_s": None, "elapsed_s": None, "events": [], "done": False,
+              "bytes": 0, "error": None}
+    begin = time.time()
+    try:
+        conn.request("POST", target, body=body, headers=headers)
+        resp = conn.getresponse()
+        result["status"] = resp.status
+        result["headers_s"] = time.time() - begin
+        if resp.status != 200:
+            result["error"] = resp.read()[:500].decode(errors="replace")
+            return result
+        while True:
+            line = resp.readline()
+            if not line:
+                break
+            arrival = time.time()
+            if result["ttfb_s"] is None:
+                result["ttfb_s"] = arrival - begin
+            result["bytes"] += len(line)
+            event = parse_line(line)
+            if event == DONE:
+                result["done"] = True
+            elif event is not None and "seq" in event:
+                result["events"].append((event["seq"], event.get("ts"), arrival))
+    except (OSError, http.client.HTTPException) as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        result["elapsed_s"] = time.time() - begin
+        conn.close()
+    return result
+
+
+def event_latencies(result):
+    '''每个事件从生产到被客户端读到的延迟（秒）'''
+    return [arrival - ts for _, ts, arrival in result["events"] if ts is not None]
+
+
+def arrival_gaps(result):
+    '''相邻事件的到达间隔（秒）；代理缓冲时表现为多数间隔接近 0、少数间隔很大'''
+    arrivals = [arrival for _, _, arrival in result["events"]]
+    return [b - a for a, b in zip(arrivals, arrivals[1:])]
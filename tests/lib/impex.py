@@ -1,8 +1,15 @@
 # -*- coding:UTF-8 -*-
+import allure
+import json
 import os
+import time
+
+import requests
 
 from common.get_content import GetContent
+from common.perf_stats import parse_server_timing
 from common.request import Request
+from common.stream_download import download
 
 class Impex():
     def __init__(self):
@@ -15,6 +22,14 @@ class Impex():
         url = f"{self.base_url}/export/{component_type}/{component_id}"
         return Request.get(self, url, headers)
 
+    '''流式导出到文件（不解析、不附加响应内容，适用于大组件）'''
+    def export_to_file(self, component_type, component_id, file_path, headers, validate=False, chunk_size=64 * 1024):
+        url = f"{self.base_url}/export/{component_type}/{component_id}"
+        allure.attach(url, name="Request URL")
+        status, result = download(url, file_path, headers, chunk_size=chunk_size, validate=validate)
+        allure.attach(str(status), name="Response Code")
+        allure.attach(json.dumps(result, ensure_ascii=False, indent=2), name="Response Result")
+        return [status, result]
 
     '''从文件路径导入（自动处理文件打开和关闭）'''
     def import_from_file(self, type, file_path, data, headers):
@@ -34,6 +49,33 @@ class Impex():
             ]
             return self.importation(type, files, {}, headers)
 
+    '''导入大文件并记录耗时（不附加文件内容，适用于大导入包）'''
+    def import_bundle(self, type, file_path, mode, headers, timeout=600):
+        """
+        :return: [状态码, {"elapsed", "bytes", "server_timing", "result"}]，server_timing 为 Server-Timing 响应头解析出的 {阶段: 秒}
+        """
+        url = f"{self.base_url}/import/{type}"
+        allure.attach(url, name="Request URL")
+        request_headers = {k: v for k, v in headers.items() if k != "Content-Type"}
+        with open(file_path, "rb") as f:
+            files = [
+                ("data", (os.path.basename(file_path), f, "application/octet-stream")),
+                ("mode", (None, mode))
+            ]
+            begin = time.perf_counter()
+            resp = requests.post(url, files=files, headers=request_headers, verify=False, allow_redirects=False,
+                                 timeout=timeout)
+            elapsed = time.perf_counter() - begin
+        try:
+            result = resp.json() if resp.text else ""
+        except ValueError:
+            result = resp.text[:2000]
+        data = {"elapsed": elapsed, "bytes": os.path.getsize(file_path),
+                "server_timing": parse_server_timing(resp.headers.get("Server-Timing")), "result": result}
+        allure.attach(str(resp.status_code), name="Response Code")
+        allure.attach(json.dumps(data, ensure_ascii=False, indent=2), name="Response Result")
+        return [resp.status_code, data]
+
     '''导入底层调用'''
     def importation(self, type, files, data, headers, params=None):
         url = f"{self.base_url}/import/{type}"
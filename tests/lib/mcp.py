@@ -89,4 +89,13 @@ class MCP():
     '''批量获取已发布的MCP服务市场详情'''
     def BatchGetMCPMarketDetail(self, mcp_ids, fields, headers):
         url = f"{self.base_url}/market/batch/{mcp_ids}/{fields}"
-        return Request.get(self, url, headers)
\ No newline at end of file
+        return Request.get(self, url, headers)
+
+    '''批量获取已发布的MCP服务市场详情（请求体传参，data: {"mcp_ids": [...], "fields": [...]}）'''
+    def BatchQueryMCPMarketDetail(self, data, headers, params=None):
+        url = f"{self.base_url}/market/batch"
+        return Request.query_post(self, url, params, data, headers)
+
+    '''MCP Server 对外协议端点（mode: sse / stream），协议调用见 common/mcp_client.py'''
+    def AppEndpoint(self, mcp_id, mode):
+        return f"{self.base_url}/app/{mcp_id}/{'sse' if mode == 'sse' else 'mcp'}"
@@ -65,10 +65,12 @@ class Operator():
 
         return Request.post(self, url, data, headers)
 
-    '''算子调试'''
-    def OperatorDebug(self, data, headers):
+    '''算子调试，limiter 为可选的自适应限流器（函数算子调试经沙箱执行）'''
+    def OperatorDebug(self, data, headers, limiter=None):
         url = self.base_url + "/debug"
 
+        if limiter:
+            return limiter.call(Request.post, self, url, data, headers)
         return Request.post(self, url, data, headers)
 
     '''获取算子历史版本详情'''
@@ -93,6 +95,11 @@ class Operator():
     def GetOperatorMarketDetail(self, operator_id, headers):
         url = self.base_url + f"/market/{operator_id}"
         return Request.get(self, url, headers)
+
+    '''批量获取算子市场详情（请求体传参，data: {"operator_ids": [...], "fields": [...]}）'''
+    def BatchGetOperatorMarketDetail(self, data, headers, params=None):
+        url = self.base_url + "/market/batch"
+        return Request.query_post(self, url, params, data, headers)
     
     '''注册或更新内置算子'''
     def RegisterBuiltinOperator(self, data, headers):
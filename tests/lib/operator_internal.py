@@ -25,7 +25,9 @@ class InternalOperator():
         url = f"{self.base_url}/category/{category_type}"
         return Request.pathdelete(self, url, headers)
 
-    '''代理执行算子'''
-    def ProxyOperator(self, operator_id, data, headers):
+    '''代理执行算子，limiter 为可选的自适应限流器（函数算子经沙箱执行）'''
+    def ProxyOperator(self, operator_id, data, headers, limiter=None):
         url = f"{self.base_url}/proxy/{operator_id}"
+        if limiter:
+            return limiter.call(Request.post, self, url, data, headers)
         return Request.post(self, url, data, headers)
\ No newline at end of file
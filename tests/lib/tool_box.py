@@ -1,5 +1,6 @@
 # -*- coding:UTF-8 -*-
 
+from common.function_batch import execute_many
 from common.get_content import GetContent
 from common.request import Request
 
@@ -128,6 +129,11 @@ class ToolBox():
         url = f"{self.base_url}/market/{box_id}/{fields}"
         return Request.get(self, url, headers)
 
+    '''批量获取工具箱市场详情（请求体传参，data: {"box_ids": [...], "fields": [...]}）'''
+    def BatchGetMarketDetail(self, data, headers, params=None):
+        url = f"{self.base_url}/market/batch"
+        return Request.query_post(self, url, params, data, headers)
+
     '''创建/更新内置工具（内部接口）'''
     def InternalBuiltin(self, data, headers):
         url = "http://agent-operator-integration:9000/api/agent-operator-integration/internal-v1/tool-box/intcomp"
@@ -158,13 +164,30 @@ class ToolBox():
         return Request.get(self, url, headers)
 
     '''执行函数'''
-    def ExecuteFunction(self, data, headers):
+    def ExecuteFunction(self, data, headers, limiter=None):
         """
         执行函数块
         根据最新API文档：/v1/function/execute
         :param data: 请求数据，包含 code (string) 和 event (object)
         :param headers: 请求头
+        :param limiter: 可选的 common.concurrency_limiter.AdaptiveLimiter，沙箱过载时自适应限流并退避重试
         :return: (status_code, response_data) 响应包含 stdout, stderr, result, metrics
         """
         url = f"{self.base_url.replace('/tool-box', '/function/execute')}"
-        return Request.post(self, url, data, headers)
\ No newline at end of file
+        if limiter:
+            return limiter.call(Request.post, self, url, data, headers)
+        return Request.post(self, url, data, headers)
+
+    '''批量执行函数'''
+    def ExecuteMany(self, code, events, headers, chunk_size=100, timeout=None):
+        """
+        批量执行函数块：一段代码、多个事件
+        接口：/v1/function/execute/batch，请求体与响应均为 NDJSON
+        :param code: 函数代码
+        :param events: 事件列表或可迭代对象
+        :param chunk_size: 每次沙箱执行的事件数
+        :param timeout: 每次沙箱执行的超时时间（毫秒）
+        :return: 生成器，按事件顺序逐个返回 {index, stdout, stderr, result, error, metrics}
+        """
+        url = f"{self.base_url.replace('/tool-box', '/function/execute/batch')}"
+        return execute_many(url, code, events, headers, chunk_size=chunk_size, timeout=timeout)
\ No newline at end of file
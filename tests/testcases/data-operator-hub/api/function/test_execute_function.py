@@ -3,6 +3,7 @@
 import allure
 import pytest
 
+from common.concurrency_limiter import AdaptiveLimiter
 from common.get_content import GetContent
 from lib.tool_box import ToolBox
 
@@ -11,6 +12,7 @@ from lib.tool_box import ToolBox
 class TestExecuteFunction:
     
     client = ToolBox()
+    limiter = AdaptiveLimiter(initial=1, max_retries=2, retry_base=2, retry_max=8)
 
     @pytest.fixture(scope="class", autouse=True)
     def load_test_data(self):
@@ -21,29 +23,16 @@ class TestExecuteFunction:
 
     def _execute_test_case(self, test_case, Headers):
         """执行测试用例的通用方法"""
-        import time
-        
         data = {}
         if test_case.get("code") is not None:
             data["code"] = test_case["code"]
         if test_case.get("event") is not None:
             data["event"] = test_case["event"]
         
-        # 添加重试机制处理503错误（沙箱池满）
-        max_retries = 3
-        wait_time = 2
-        result = None
-        
-        for attempt in range(max_retries):
-            result = self.client.ExecuteFunction(data, Headers)
-            if result[0] != 503:
-                break
-            if attempt < max_retries - 1:
-                print(f"警告: 收到503错误（沙箱池满），等待{wait_time}秒后重试... (尝试 {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
-                wait_time *= 2  # 指数退避
+        # 沙箱池满（503 或 stderr 中的系统错误）时由自适应限流器收缩在途请求数并退避重试
+        result = self.client.ExecuteFunction(data, Headers, limiter=self.limiter)
         
-        # 如果仍然返回503，跳过测试
+        # 重试后仍然返回503，跳过测试
         if result[0] == 503:
             pytest.skip(f"沙箱池已满，无法执行测试用例。响应: {result[1]}")
         
@@ -0,0 +1,96 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import random
+import string
+import time
+import pytest
+
+from common.get_content import GetContent
+from common.resource_sampler import ResourceSampler, attach_resource_report
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 代理与 MCP 性能用例统一调用的工具，toolbox.yaml 中该工具回调被测服务自身的工具箱列表接口
+PROXY_TOOL_NAME = "获取工具箱列表"
+
+
+@pytest.fixture(scope="function", autouse=True)
+def ResourceSampling(request):
+    '''
+    性能用例执行期间后台采样被测服务资源（CPU、内存、协程、文件描述符、数据库连接、锁竞争）
+    采样来源在 env.ini 的 [performance] 段配置，均未配置时不采样
+    用例可通过 ResourceSampling.series(field, start) 取得与延迟时间序列对齐的资源序列
+    '''
+    pid = config.get("performance", "sampler_pid", fallback="")
+    sampler = ResourceSampler(
+        stats_url=config.get("performance", "sampler_stats_url", fallback=""),
+        metrics_url=config.get("performance", "sampler_metrics_url", fallback=""),
+        pid=int(pid) if pid else None,
+        cgroup=config.get("performance", "sampler_cgroup", fallback=""),
+        interval=config.getfloat("performance", "sampler_interval", fallback=1.0),
+        csv_path=f"./report/resource/{request.node.name}_{time.strftime('%Y%m%d%H%M%S')}.csv"
+    )
+    sampler.start()
+
+    yield sampler
+
+    sampler.stop()
+    # 用例已自行输出带延迟归因的报告时不再重复输出
+    if sampler.enabled and not sampler.reported:
+        attach_resource_report(request.node.name, sampler)
+
+
+@pytest.fixture(scope="class")
+def ProxyToolbox(Headers):
+    '''
+    创建并发布代理测试用工具箱，服务地址指向被测服务，并启用“获取工具箱列表”工具，结束后下线并删除
+    返回 {"box_id": 工具箱ID, "box_name": 工具箱名称, "tool": 工具信息（含 tool_id、name、description）}
+    '''
+    client = ToolBox()
+    yaml_data = GetContent("./resource/openapi/compliant/toolbox.yaml").yamlfile()
+    name = ''.join(random.choice(string.ascii_letters) for i in range(8))
+    result = client.CreateToolbox({"box_name": name, "data": yaml_data, "metadata_type": "openapi"}, Headers)
+    assert result[0] == 200
+    box_id = result[1]["box_id"]
+
+    host = config["server"]["host"]
+    result = client.UpdateToolbox(box_id, {
+        "box_name": name,
+        "box_desc": "performance test toolbox",
+        "box_svc_url": f"https://{host}/api/agent-operator-integration",
+        "box_icon": "icon-color-tool-FADB14",
+        "box_category": "data_process",
+        "metadata_type": "openapi"
+    }, Headers)
+    assert result[0] == 200
+
+    result = client.GetBoxToolsList(box_id, {"page_size": 20}, Headers)
+    assert result[0] == 200
+    tool = next(tool for tool in result[1]["tools"] if tool["name"] == PROXY_TOOL_NAME)
+    result = client.UpdateToolStatus(box_id, [{"tool_id": tool["tool_id"], "status": "enabled"}], Headers)
+    assert result[0] == 200
+    result = client.UpdateToolboxStatus(box_id, {"status": "published"}, Headers)
+    assert result[0] == 200
+
+    yield {"box_id": box_id, "box_name": name, "tool": tool}
+
+    client.UpdateToolboxStatus(box_id, {"status": "offline"}, Headers)
+    client.DeleteToolbox(box_id, Headers)
+
+
+@pytest.fixture(scope="session")
+def PerfReport():
+    '''
+    输出性能报告：打印报告文本，并以 name 与 “{name}数据” 将文本和结构化数据附加到 allure
+    用法：PerfReport(name, text, data)
+    '''
+    def report(name, text, data):
+        print(text)
+        allure.attach(text, name=name, attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(data, indent=2, ensure_ascii=False), name=f"{name}数据",
+                      attachment_type=allure.attachment_type.JSON)
+    return report
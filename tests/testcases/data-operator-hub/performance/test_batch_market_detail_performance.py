@@ -0,0 +1,199 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import time
+import uuid
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from common.batch_lookup import BatchLookup, chunked
+from common.get_content import GetContent
+from common.perf_chart import attach_line_chart
+from common.perf_stats import percentile
+from lib.mcp import MCP
+from lib.operator import Operator
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 批量详情查询测试参数，可在 env.ini 的 [performance] 段覆盖
+batch_sizes = [int(n) for n in config.get("performance", "batch_sizes", fallback="100,1000,5000").split(",")]
+batch_chunk_size = config.getint("performance", "batch_chunk_size", fallback=1000)
+batch_workers = config.getint("performance", "batch_workers", fallback=4)
+batch_path_chunk = config.getint("performance", "batch_path_chunk", fallback=50)
+batch_repeats = config.getint("performance", "batch_repeats", fallback=3)
+
+mcp_client = MCP()
+tb_client = ToolBox()
+op_client = Operator()
+
+# 资源类型 -> 市场列表、请求体 ID 字段、结果 ID 字段、查询字段、路径传参批量查询
+KINDS = {
+    "mcp": {
+        "list": mcp_client.GetMCPMarketList,
+        "url": f"{mcp_client.base_url}/market/batch",
+        "id_key": "mcp_ids",
+        "result_key": "mcp_id",
+        "fields": ["name", "description"],
+        "path": lambda ids, fields, headers: mcp_client.BatchGetMCPMarketDetail(",".join(ids), ",".join(fields), headers),
+        "body": mcp_client.BatchQueryMCPMarketDetail
+    },
+    "toolbox": {
+        "list": tb_client.GetMarketToolboxList,
+        "url": f"{tb_client.base_url}/market/batch",
+        "id_key": "box_ids",
+        "result_key": "box_id",
+        "fields": ["box_name", "box_desc"],
+        "path": lambda ids, fields, headers: tb_client.GetMarketDetail(",".join(ids), ",".join(fields), headers),
+        "body": tb_client.BatchGetMarketDetail
+    },
+    "operator": {
+        "list": op_client.GetOperatorMarketList,
+        "url": f"{op_client.base_url}/market/batch",
+        "id_key": "operator_ids",
+        "result_key": "operator_id",
+        "fields": ["name"],
+        # 算子没有路径传参的批量接口，以逐个查询详情作为基线；不存在（404）或无公开访问权限（403）的 ID
+        # 在请求体批量查询中只是被过滤，逐个查询时同样计为未命中而不是失败
+        "path": lambda ids, fields, headers: op_client.GetOperatorMarketDetail(ids[0], headers),
+        "miss_status": (403, 404),
+        "body": op_client.BatchGetOperatorMarketDetail
+    }
+}
+
+
+def published_ids(kind, headers):
+    '''查询市场中全部已发布资源的 ID'''
+    result = KINDS[kind]["list"]({"all": "true"}, headers)
+    assert result[0] == 200, f"查询 {kind} 市场列表失败: {result}"
+    return [item[KINDS[kind]["result_key"]] for item in result[1]["data"]]
+
+
+def id_set(ids, size):
+    '''取 size 个 ID，已发布资源不足时补充不存在的 ID（仍会参与 IN 查询，只是无结果）'''
+    ids = ids[:size]
+    return ids + [str(uuid.uuid4()) for _ in range(size - len(ids))]
+
+
+def run_path(kind, ids, headers):
+    '''路径传参基线：每次请求 batch_path_chunk 个 ID（算子为 1 个），batch_workers 个线程并发'''
+    info = KINDS[kind]
+    per_call = 1 if kind == "operator" else batch_path_chunk
+    chunks = chunked(ids, per_call)
+    start = time.perf_counter()
+
+    def call(chunk):
+        begin = time.perf_counter()
+        result = info["path"](chunk, info["fields"], headers)
+        items = result[1] if result[0] == 200 else []
+        if isinstance(items, dict):
+            items = [items]
+        return {"status": result[0], "latency": time.perf_counter() - begin, "items": items,
+                "miss": result[0] in info.get("miss_status", ())}
+
+    with ThreadPoolExecutor(max_workers=batch_workers) as pool:
+        results = list(pool.map(call, chunks))
+    elapsed = time.perf_counter() - start
+    items = [item for r in results for item in r["items"]]
+    return row("路径传参", ids, items, results, elapsed)
+
+
+def run_body(kind, ids, headers, stream):
+    '''请求体传参：自动按 batch_chunk_size 分批、batch_workers 并发，stream 时以 NDJSON 返回'''
+    info = KINDS[kind]
+    lookup = BatchLookup(info["url"], info["id_key"], headers, chunk_size=batch_chunk_size,
+                         workers=batch_workers, stream=stream)
+    items, results, elapsed = lookup.fetch(ids, info["fields"])
+    data = row("请求体NDJSON" if stream else "请求体JSON", ids, items, results, elapsed)
+    firsts = [r["first_item"] for r in results if r["first_item"] is not None]
+    data["first_item"] = min(firsts) if firsts else None
+    data["bytes"] = sum(r["bytes"] for r in results)
+    return data
+
+
+def row(variant, ids, items, results, elapsed):
+    latencies = [r["latency"] for r in results]
+    failed = [r for r in results if r["status"] != 200 and not r.get("miss")]
+    return {
+        "variant": variant,
+        "ids": len(ids),
+        "requests": len(results),
+        "found": len(items),
+        "elapsed": elapsed,
+        "ids_per_second": len(ids) / elapsed if elapsed else 0.0,
+        "request_p50": percentile(latencies, 50),
+        "request_p99": percentile(latencies, 99),
+        "failed": len(failed),
+        "failure_samples": [{"status": r["status"], "error": r.get("error")} for r in failed[:3]],
+        "result_ids": sorted(str(item.get("mcp_id") or item.get("box_id") or item.get("operator_id")) for item in items)
+    }
+
+
+def best(rows):
+    '''多次重复取耗时最短的一次，排除偶发抖动'''
+    return min(rows, key=lambda r: r["elapsed"])
+
+
+@allure.feature("市场批量详情性能测试：路径传参与请求体传参")
+class TestBatchMarketDetailPerformance:
+    '''
+    对比 GET /market/batch/{ids}/{fields}（ID 放在 URL 中，受 URL 长度限制需客户端拆成小批）与
+    POST /market/batch（ID 放在请求体中，服务端按 1000 个一批执行 IN 查询，可选 NDJSON 流式返回）的吞吐
+    '''
+
+    @allure.title("批量详情：不同 ID 数量下的吞吐对比")
+    @pytest.mark.parametrize("kind", list(KINDS))
+    def test_batch_throughput(self, kind, Headers):
+        available = published_ids(kind, Headers)
+        rows = []
+        for size in batch_sizes:
+            ids = id_set(available, size)
+            variants = [lambda: run_path(kind, ids, Headers),
+                        lambda: run_body(kind, ids, Headers, False),
+                        lambda: run_body(kind, ids, Headers, True)]
+            results = [best([variant() for _ in range(batch_repeats)]) for variant in variants]
+            for r in results:
+                assert r["failed"] == 0, f"{kind} {r['variant']} {size} 个 ID 存在失败请求: {r['failure_samples']}"
+            path, body, stream = results
+            # 三种方式返回的资源集合应一致（均已按权限过滤）
+            assert body["result_ids"] == stream["result_ids"], f"{kind} {size} 个 ID: JSON 与 NDJSON 结果不一致"
+            if kind != "operator":
+                assert path["result_ids"] == body["result_ids"], f"{kind} {size} 个 ID: 路径传参与请求体传参结果不一致"
+            for r in results:
+                r.pop("result_ids")
+                rows.append(dict(r, size=size))
+
+        lines = [f"{kind} 已发布资源 {len(available)} 个，请求体分批 {batch_chunk_size}，并发 {batch_workers}，"
+                 f"路径传参每次 {1 if kind == 'operator' else batch_path_chunk} 个 ID:"]
+        for r in rows:
+            line = (f"{r['size']} 个 ID {r['variant']}: 请求 {r['requests']} 次, 命中 {r['found']}, "
+                    f"耗时 {r['elapsed']:.3f}秒, {r['ids_per_second']:.0f} ID/秒, "
+                    f"单次请求 P50 {r['request_p50']:.3f}秒 P99 {r['request_p99']:.3f}秒")
+            if r.get("first_item") is not None:
+                line += f", 首条结果 {r['first_item']:.3f}秒, 响应 {r['bytes'] / 1024:.1f}KB"
+            lines.append(line)
+        for size in batch_sizes:
+            path, body, stream = [r for r in rows if r["size"] == size]
+            if body["elapsed"] > 0 and stream["elapsed"] > 0:
+                lines.append(f"{size} 个 ID: 请求体JSON 比路径传参快 {path['elapsed'] / body['elapsed']:.2f} 倍, "
+                             f"NDJSON 快 {path['elapsed'] / stream['elapsed']:.2f} 倍")
+        text = "\n".join(lines)
+        print(text)
+        allure.attach(text, name=f"{kind}批量详情吞吐", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(rows, indent=2, ensure_ascii=False), name=f"{kind}批量详情吞吐数据",
+                      attachment_type=allure.attachment_type.JSON)
+        variants = sorted({r["variant"] for r in rows})
+        attach_line_chart({v: [(r["size"], r["ids_per_second"]) for r in rows if r["variant"] == v] for v in variants},
+                          f"{kind}吞吐-ID数量曲线", "ID数量", "吞吐(ID/秒)")
+
+    @allure.title("请求体批量详情：超过上限的 ID 数量被拒绝")
+    @pytest.mark.parametrize("kind", list(KINDS))
+    def test_batch_limit(self, kind, Headers):
+        '''单次请求体最多 10000 个 ID，客户端需按上限分批'''
+        info = KINDS[kind]
+        data = {info["id_key"]: [str(uuid.uuid4()) for _ in range(10001)], "fields": info["fields"]}
+        result = info["body"](data, Headers)
+        assert result[0] == 400, f"{kind} 超过上限未被拒绝: {result}"
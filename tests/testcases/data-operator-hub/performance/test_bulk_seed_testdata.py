@@ -0,0 +1,174 @@
+# -*- coding:UTF-8 -*-
+
+import json
+import random
+import string
+import time
+
+from common.dataset_snapshot import find_snapshot, restore_snapshot, snapshot_db
+from common.db_seeder import (connect, BulkWriter, Templates, DBSeeder, grant_visibility,
+                              RESOURCE_OPERATOR, RESOURCE_TOOLBOX, RESOURCE_MCP)
+from common.distributions import profile_from_config
+from common.get_content import GetContent
+from common.get_token import GetToken
+from lib.operator import Operator
+from lib.tool_box import ToolBox
+from lib.mcp import MCP
+
+op_client = Operator()
+tb_client = ToolBox()
+mcp_client = MCP()
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 直接写库造数参数，可在 env.ini 的 [performance] 段覆盖
+bulk_users = config.getint("performance", "bulk_users", fallback=100)
+bulk_operators = config.getint("performance", "bulk_operators", fallback=1000000)
+bulk_toolboxes = config.getint("performance", "bulk_toolboxes", fallback=100000)
+bulk_mcps = config.getint("performance", "bulk_mcps", fallback=100000)
+bulk_mode = config.get("performance", "bulk_mode", fallback="insert")
+bulk_batch_rows = config.getint("performance", "bulk_batch_rows", fallback=1000)
+bulk_seed = config.getint("performance", "bulk_seed", fallback=0)
+bulk_auth_url = config.get("performance", "bulk_auth_url", fallback="")
+bulk_bd_url = config.get("performance", "bulk_bd_url", fallback="")
+bulk_verify_samples = config.getint("performance", "bulk_verify_samples", fallback=50)
+snapshot_enabled = config.getboolean("performance", "snapshot_enabled", fallback=False)
+snapshot_root = config.get("performance", "snapshot_root", fallback="./report/snapshot")
+snapshot_truncate = config.getboolean("performance", "snapshot_truncate", fallback=False)
+
+categories = [
+    "other_category",
+    "data_process",
+    "data_transform",
+    "data_store",
+    "data_analysis",
+    "data_query",
+    "data_extract",
+    "data_split",
+    "model_train"
+]
+
+
+def random_name(prefix):
+    return prefix + ''.join(random.choice(string.ascii_letters + string.digits) for i in range(8))
+
+
+def create_templates(headers):
+    '''经由 API 创建并发布模板算子、工具箱和 MCP，批量造数时复制其数据库行'''
+    api_data = GetContent("./resource/openapi/compliant/test3.yaml").yamlfile()
+    result = op_client.RegisterOperator({"data": str(api_data), "operator_metadata_type": "openapi"}, headers)
+    assert result[0] == 200, f"注册模板算子失败: {result}"
+    operator = next(op for op in result[1] if op["status"] == "success")
+    result = op_client.UpdateOperatorStatus([{
+        "operator_id": operator["operator_id"],
+        "version": operator["version"],
+        "status": "published"
+    }], headers)
+    assert result[0] == 200, f"发布模板算子失败: {result}"
+
+    yaml_data = GetContent("./resource/openapi/compliant/toolbox.yaml").yamlfile()
+    result = tb_client.CreateToolbox({"box_name": random_name("tpl_box_"), "data": yaml_data,
+                                      "metadata_type": "openapi"}, headers)
+    assert result[0] == 200, f"创建模板工具箱失败: {result}"
+    box_id = result[1]["box_id"]
+    result = tb_client.UpdateToolboxStatus(box_id, {"status": "published"}, headers)
+    assert result[0] == 200, f"发布模板工具箱失败: {result}"
+
+    result = mcp_client.RegisterMCP({
+        "name": random_name("tpl_mcp_"),
+        "description": "bulk seed template mcp server",
+        "mode": "sse",
+        "url": "https://mcp.map.baidu.com/sse?ak=bW9A9vyhGcYmdKRvWJCkySpekiBUTeUL",
+        "source": "custom",
+        "category": "data_analysis"
+    }, headers)
+    assert result[0] == 200, f"注册模板MCP失败: {result}"
+    mcp_id = result[1]["mcp_id"]
+    result = mcp_client.MCPReleaseAction(mcp_id, {"status": "published"}, headers)
+    assert result[0] == 200, f"发布模板MCP失败: {result}"
+    return operator["operator_id"], box_id, mcp_id
+
+
+def verify(seeder, headers_by_user, samples):
+    '''抽样经由 API 读取直接写库的资源，确认名称与状态一致，返回不一致的记录'''
+    rng = random.Random(bulk_seed)
+    mismatches = []
+    checks = {
+        RESOURCE_OPERATOR: (op_client.GetOperatorInfo, lambda r: (r["name"], r["status"])),
+        RESOURCE_TOOLBOX: (tb_client.GetToolbox, lambda r: (r["box_name"], r["status"])),
+        RESOURCE_MCP: (mcp_client.GetMCPDetail, lambda r: (r["base_info"]["name"], r["base_info"]["status"]))
+    }
+    for rtype, rows in seeder.resources.items():
+        get, extract = checks[rtype]
+        for rid, name, user, status in rng.sample(rows, min(samples, len(rows))):
+            result = get(rid, headers_by_user[user])
+            if result[0] != 200:
+                mismatches.append({"type": rtype, "id": rid, "status_code": result[0]})
+            elif extract(result[1]) != (name, status):
+                mismatches.append({"type": rtype, "id": rid, "expected": (name, status), "actual": extract(result[1])})
+    return mismatches
+
+
+def bulk_seed_testdata():
+    """
+    直接写库批量造数：复制模板资源的数据库行生成百万级算子、工具箱和 MCP
+    归属用户、分类、名称前缀、描述长度与状态按 dist_* 参数倾斜分布（见 common/distributions.py）
+    写入后可选补齐权限策略与业务域关联，最后抽样经由 API 校验
+    """
+    users = [str(i) for i in range(1, bulk_users + 1)]
+    profile = profile_from_config(config, categories, users)
+    # 同一规模与分布参数的数据集只造一次，之后直接恢复表级快照
+    tags = {"dataset": "bulk", "users": bulk_users, "operators": bulk_operators, "toolboxes": bulk_toolboxes,
+            "mcps": bulk_mcps, "seed": bulk_seed, "distribution": profile.summary()}
+    if snapshot_enabled:
+        manifest = find_snapshot(snapshot_root, kind="db", **tags)
+        if manifest:
+            restore_snapshot(manifest, snapshot_root, truncate=snapshot_truncate)
+            return
+    # 详情接口需要所有者权限策略与业务域关联，缺少任一地址时直接写库的资源经由 API 不可见，也无法抽样校验
+    assert bulk_auth_url and bulk_bd_url, "直接写库造数需配置 [performance] 段的 bulk_auth_url 与 bulk_bd_url"
+
+    host = config["server"]["host"]
+    user_password = config.get("user", "default_password", fallback="111111")
+    headers_by_user = {}
+    user_ids = {}
+    for user in users:
+        token = GetToken(host=host).get_token(host, user, user_password)
+        user_ids[user] = token[0]
+        headers_by_user[token[0]] = {"Authorization": f"Bearer {token[1]}"}
+
+    templates = create_templates(headers_by_user[user_ids[users[0]]])
+    conn = connect(local_infile=bulk_mode == "load")
+    writer = BulkWriter(conn, mode=bulk_mode, batch_rows=bulk_batch_rows)
+    seeder = DBSeeder(writer, Templates(conn, *templates), seed=bulk_seed)
+    print(f"数据分布: {json.dumps(profile.summary(), ensure_ascii=False)}")
+
+    start = time.perf_counter()
+    for create, count in ((seeder.operator, bulk_operators), (seeder.toolbox, bulk_toolboxes), (seeder.mcp, bulk_mcps)):
+        owners = [user for user, n in profile.owners(count).items() for _ in range(n)]
+        for i, user in enumerate(owners):
+            create(i, user_ids[user], profile.next_category(), profile.next_status(),
+                   name=profile.name(f"_{seeder.tag}_{i}"), description=profile.description())
+            if (i + 1) % 100000 == 0:
+                print(f"[{create.__name__}] 已生成 {i + 1}/{count}，耗时 {time.perf_counter() - start:.1f}秒", flush=True)
+    writer.flush()
+    elapsed = time.perf_counter() - start
+    rows = sum(writer.counts.values())
+    print(f"直接写库完成（{bulk_mode}，批次 {bulk_batch_rows} 行，标识 {seeder.tag}）: 共 {rows} 行，"
+          f"耗时 {elapsed:.1f}秒（写库 {writer.elapsed:.1f}秒），{rows / elapsed:.0f} 行/秒")
+    print(json.dumps(writer.counts, indent=2))
+
+    failures = grant_visibility(seeder.resources, bulk_auth_url, bulk_bd_url)
+    conn.close()
+    assert not failures, f"权限策略或业务域关联失败 {failures} 次"
+
+    mismatches = verify(seeder, headers_by_user, bulk_verify_samples)
+    assert not mismatches, f"抽样校验不一致: {json.dumps(mismatches[:20], ensure_ascii=False)}"
+
+    if snapshot_enabled:
+        manifest = snapshot_db(snapshot_root, f"bulk_{seeder.tag}", tags)
+        print(f"已保存表级快照 {manifest['name']}，耗时 {manifest['elapsed']:.1f}秒")
+
+if __name__ == '__main__':
+    bulk_seed_testdata()
@@ -0,0 +1,121 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import pytest
+
+from common.get_content import GetContent
+from common.capacity_finder import CapacityFinder, capacity_report
+from common.perf_chart import attach_line_chart
+from lib.operator import Operator
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 容量探测参数，可在 env.ini 的 [performance] 段覆盖
+slo_p99 = config.getfloat("performance", "capacity_slo_p99", fallback=2.0)
+slo_error_rate = config.getfloat("performance", "capacity_slo_error_rate", fallback=0.01)
+level_duration = config.getint("performance", "capacity_level_duration", fallback=30)
+search = config.get("performance", "capacity_search", fallback="step")
+load_mode = config.get("performance", "capacity_mode", fallback="concurrency")
+max_level = config.getint("performance", "capacity_max_level", fallback=200)
+
+
+@allure.feature("容量探测性能测试：逐级加压直到突破SLO")
+class TestCapacityPerformance:
+    op_client = Operator()
+    tb_client = ToolBox()
+    registered = []
+
+    @pytest.fixture(scope="class", autouse=True)
+    def cleanup(self, Headers):
+        yield
+        # 分批删除容量探测期间注册的算子
+        for i in range(0, len(self.registered), 100):
+            self.op_client.DeleteOperator(self.registered[i:i + 100], Headers)
+
+    def find_capacity(self, perf_report, name, func, is_success=None):
+        '''按配置执行容量探测，并将报告和延迟-负载曲线写入 allure'''
+        kwargs = {"is_success": is_success} if is_success else {}
+        finder = CapacityFinder(func, slo_p99, slo_error_rate, duration=level_duration, mode=load_mode, **kwargs)
+        if search == "binary":
+            results = finder.binary_search(1, max_level)
+        else:
+            results = finder.step_search(1, max_level, factor=2)
+
+        text, report = capacity_report(name, results, slo_p99, slo_error_rate)
+        perf_report(f"{name}容量探测", text, report)
+
+        x_label = "并发数" if load_mode == "concurrency" else "到达速率(次/秒)"
+        markers = {}
+        if report["knee_level"] is not None:
+            markers["拐点"] = report["knee_level"]
+        if report["breach_level"] is not None:
+            markers["突破SLO"] = report["breach_level"]
+        attach_line_chart(
+            {
+                "P50延迟": [(r["level"], r["p50"]) for r in report["levels"]],
+                "P99延迟": [(r["level"], r["p99"]) for r in report["levels"]],
+                "P99 SLO": [(r["level"], slo_p99) for r in report["levels"]]
+            },
+            f"{name}延迟-负载曲线", x_label, "延迟(秒)", markers=markers)
+        attach_line_chart(
+            {"吞吐": [(r["level"], r["throughput"]) for r in report["levels"]]},
+            f"{name}吞吐-负载曲线", x_label, "吞吐(次/秒)", markers=markers)
+
+        assert report["levels"], "未执行任何压力等级"
+        return report
+
+    @allure.title("注册算子容量探测")
+    def test_register_operator_capacity(self, Headers, PerfReport):
+        api_data = GetContent("./resource/openapi/compliant/test3.yaml").yamlfile()
+        data = {
+            "data": str(api_data),
+            "operator_metadata_type": "openapi",
+            "operator_info": {
+                "category": "data_process"
+            }
+        }
+
+        def register(i):
+            result = self.op_client.RegisterOperator(data, Headers)
+            if result[0] == 200:
+                self.registered.extend({"operator_id": op["operator_id"], "version": op["version"]}
+                                       for op in result[1] if op.get("status") == "success")
+            return result
+
+        self.find_capacity(PerfReport, "注册算子", register)
+
+    @allure.title("获取算子列表容量探测")
+    def test_get_operator_list_capacity(self, Headers, PerfReport):
+        self.find_capacity(PerfReport, "获取算子列表", lambda i: self.op_client.GetOperatorList({}, Headers))
+
+    @allure.title("工具执行代理容量探测")
+    def test_proxy_tool_capacity(self, Headers, ProxyToolbox, PerfReport):
+        proxy_data = {
+            "header": Headers
+        }
+
+        def is_success(result):
+            return result[0] == 200 and isinstance(result[1], dict) and result[1].get("status_code") == 200
+
+        box_id, tool_id = ProxyToolbox["box_id"], ProxyToolbox["tool"]["tool_id"]
+        self.find_capacity(PerfReport, "工具执行代理",
+                           lambda i: self.tb_client.ProxyTool(box_id, tool_id, proxy_data, Headers),
+                           is_success=is_success)
+
+    @allure.title("函数执行容量探测")
+    def test_execute_function_capacity(self, Headers, PerfReport):
+        data = {
+            "code": "def main(event):\n    return {'output': event.get('input', '')}",
+            "event": {"input": "capacity"}
+        }
+
+        def is_success(result):
+            # 沙箱池满时返回503或在stderr中提示系统错误，均视为失败
+            if result[0] != 200 or not isinstance(result[1], dict):
+                return False
+            return "System error:" not in (result[1].get("stderr") or "")
+
+        self.find_capacity(PerfReport, "函数执行", lambda i: self.tb_client.ExecuteFunction(data, Headers),
+                           is_success=is_success)
@@ -0,0 +1,126 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import random
+import string
+import pytest
+
+from common.cold_start import ServiceController, measure_warmup, warmup_summary, format_warmup
+from common.get_content import GetContent
+from common.perf_chart import attach_line_chart
+from common.perf_stats import percentile
+from lib.mcp import MCP
+from lib.operator import Operator
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 冷启动测试参数，可在 env.ini 的 [performance] 段覆盖
+coldstart_restart_cmd = config.get("performance", "coldstart_restart_cmd", fallback="")
+coldstart_flush_url = config.get("performance", "coldstart_flush_url", fallback="")
+coldstart_ready_url = config.get("performance", "coldstart_ready_url", fallback="")
+coldstart_ready_timeout = config.getint("performance", "coldstart_ready_timeout", fallback=120)
+coldstart_settle = config.getfloat("performance", "coldstart_settle", fallback=0)
+coldstart_iterations = config.getint("performance", "coldstart_iterations", fallback=5)
+coldstart_requests = config.getint("performance", "coldstart_requests", fallback=50)
+
+box_id = ""
+tool_id = ""
+mcp_id = ""
+
+@allure.feature("冷启动性能测试：首次请求与热缓存延迟对比")
+class TestColdStartPerformance:
+    '''
+    每轮迭代前重启服务或清理缓存，分别统计第 1 次、第 10 次与稳态请求延迟
+    未配置 coldstart_restart_cmd / coldstart_flush_url 时只测热缓存延迟，作为对照基线
+    '''
+    op_client = Operator()
+    tb_client = ToolBox()
+    mcp_client = MCP()
+    controller = ServiceController(
+        restart_cmd=coldstart_restart_cmd or None,
+        flush_url=coldstart_flush_url or None,
+        ready_url=coldstart_ready_url or None,
+        ready_timeout=coldstart_ready_timeout,
+        settle=coldstart_settle
+    )
+
+    @pytest.fixture(scope="class", autouse=True)
+    def setup(self, Headers, ProxyToolbox):
+        '''基于代理测试用工具箱的“获取工具箱列表”工具创建 MCP 服务'''
+        global box_id, tool_id, mcp_id
+
+        box_id = ProxyToolbox["box_id"]
+        tool = ProxyToolbox["tool"]
+        tool_id = tool["tool_id"]
+
+        data = {
+            "name": ''.join(random.choice(string.ascii_letters) for i in range(8)),
+            "description": "cold start test mcp",
+            "mode": "sse",
+            "url": "http://localhost:8080/api/v1/tools",
+            "category": "data_analysis",
+            "creation_type": "tool_imported",
+            "tool_configs": [{
+                "box_id": box_id,
+                "box_name": ProxyToolbox["box_name"],
+                "tool_id": tool_id,
+                "tool_name": tool["name"],
+                "description": tool["description"],
+                "use_rule": "all"
+            }]
+        }
+        result = self.mcp_client.RegisterMCP(data, Headers)
+        assert result[0] == 200
+        mcp_id = result[1]["mcp_id"]
+
+        yield
+
+        self.mcp_client.DeleteMCP(mcp_id, Headers)
+
+    def warmup(self, perf_report, name, func, is_success=None):
+        '''执行冷启动测试并输出预热曲线'''
+        result = measure_warmup(func, self.controller, coldstart_iterations, coldstart_requests, is_success)
+        summary = warmup_summary(result)
+        text = format_warmup(name, self.controller.mode, summary)
+        perf_report(f"{name}预热成本", text, dict(summary, mode=self.controller.mode))
+        attach_line_chart(
+            {
+                "中位延迟": [(n + 1, percentile(values, 50)) for n, values in enumerate(result["latencies"])],
+                "最大延迟": [(n + 1, max(values)) for n, values in enumerate(result["latencies"])]
+            },
+            f"{name}预热曲线", "请求序号", "延迟(秒)", markers={"第10次": 10})
+        assert summary["errors"] == 0, f"{name}预热期间出现失败请求: {result['errors']}"
+
+    @allure.title("获取算子列表冷启动测试")
+    def test_list_cold_start(self, Headers, PerfReport):
+        self.warmup(PerfReport, "获取算子列表", lambda: self.op_client.GetOperatorList({"page_size": 20}, Headers))
+
+    @allure.title("获取工具箱详情冷启动测试")
+    def test_detail_cold_start(self, Headers, PerfReport):
+        self.warmup(PerfReport, "获取工具箱详情", lambda: self.tb_client.GetToolbox(box_id, Headers))
+
+    @allure.title("工具执行代理冷启动测试，观察代理客户端池创建成本")
+    def test_proxy_cold_start(self, Headers, PerfReport):
+        def is_success(result):
+            return result[0] == 200 and isinstance(result[1], dict) and result[1].get("status_code") == 200
+
+        self.warmup(PerfReport, "工具执行代理",
+                    lambda: self.tb_client.ProxyTool(box_id, tool_id, {"header": Headers}, Headers),
+                    is_success=is_success)
+
+    @allure.title("MCP工具调用冷启动测试")
+    def test_mcp_tool_call_cold_start(self, Headers, PerfReport):
+        data = {
+            "tool_name": "获取工具箱列表",
+            "parameters": {
+                "header": Headers
+            }
+        }
+
+        def is_success(result):
+            return result[0] == 200 and isinstance(result[1], dict) and not result[1].get("is_error")
+
+        self.warmup(PerfReport, "MCP工具调用", lambda: self.mcp_client.CallMCPtool(mcp_id, data, Headers),
+                    is_success=is_success)
@@ -0,0 +1,140 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import os
+import random
+import shutil
+import string
+import tempfile
+import time
+import tracemalloc
+import pytest
+
+from common.echo_upstream_server import echo_tools_spec
+from common.get_content import GetContent
+from common.perf_chart import attach_line_chart
+from common.perf_stats import percentile
+from common.stream_download import ijson
+from lib.impex import Impex
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 流式导出测试参数，可在 env.ini 的 [performance] 段覆盖
+tool_counts = [int(n) for n in config.get("performance", "export_stream_tool_counts", fallback="10,100,1000,3000").split(",")]
+export_repeats = config.getint("performance", "export_stream_repeats", fallback=3)
+chunk_size = config.getint("performance", "export_stream_chunk_kb", fallback=64) * 1024
+
+MODES = ["内存导出", "流式导出", "流式导出+校验"]
+
+
+@allure.feature("导入导出性能测试：流式导出的内存与耗时")
+class TestExportStreamPerformance:
+    '''
+    创建工具数逐级增大的工具箱，分别以 Impex.export（经 Request.get 整体读入、解析并附加到报告）
+    与 Impex.export_to_file（按块写入文件，可选增量校验 JSON）导出，对比客户端内存峰值（tracemalloc）、
+    耗时与导出大小；配置了资源采样时同时记录被测服务的堆内存峰值
+    '''
+    impex_client = Impex()
+    tb_client = ToolBox()
+
+    @pytest.fixture(scope="class")
+    def toolboxes(self, Headers):
+        '''按 export_stream_tool_counts 创建工具箱，返回 {工具数: box_id}，创建失败的规模不参与测试'''
+        prefix = "export_stream_" + ''.join(random.choice(string.ascii_lowercase) for i in range(6))
+        boxes, failures = {}, {}
+        for count in tool_counts:
+            spec = echo_tools_spec("http://127.0.0.1:1", count, title=f"{prefix}_{count}")
+            result = self.tb_client.CreateToolbox({"box_name": f"{prefix}_{count}", "data": spec,
+                                                   "metadata_type": "openapi"}, Headers)
+            if result[0] == 200:
+                boxes[count] = result[1]["box_id"]
+            else:
+                failures[count] = result
+        if failures:
+            allure.attach(json.dumps({str(k): str(v)[:500] for k, v in failures.items()}, ensure_ascii=False),
+                          name="创建失败的工具箱规模", attachment_type=allure.attachment_type.JSON)
+        if not boxes:
+            pytest.skip(f"工具箱全部创建失败: {failures}")
+        work_dir = tempfile.mkdtemp(prefix="export_stream_")
+
+        yield boxes, work_dir
+
+        shutil.rmtree(work_dir, ignore_errors=True)
+        for box_id in boxes.values():
+            self.tb_client.DeleteToolbox(box_id, Headers)
+
+    def export(self, mode, box_id, path, headers):
+        '''按 mode 导出一次，返回 (状态码, 导出字节数, 耗时, 客户端内存峰值, 校验结果)'''
+        tracemalloc.start()
+        begin = time.perf_counter()
+        try:
+            if mode == "内存导出":
+                status, data = self.impex_client.export("toolbox", box_id, headers)
+                elapsed = time.perf_counter() - begin
+                size = len(json.dumps(data, ensure_ascii=False).encode()) if status == 200 else 0
+                validation = None
+            else:
+                status, data = self.impex_client.export_to_file("toolbox", box_id, path, headers,
+                                                                validate=mode == "流式导出+校验", chunk_size=chunk_size)
+                elapsed = time.perf_counter() - begin
+                size = data["bytes"] if status == 200 else 0
+                validation = data["validation"] if status == 200 else None
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return status, size, elapsed, peak, validation
+
+    @allure.title("流式导出：不同规模工具箱导出的客户端内存与耗时")
+    def test_export_stream(self, toolboxes, Headers, ResourceSampling, PerfReport):
+        '''每种规模与导出方式重复 export_stream_repeats 次，内存导出的大小为解析后重新序列化的近似值'''
+        boxes, work_dir = toolboxes
+        rows = []
+        for count, box_id in sorted(boxes.items()):
+            for mode in MODES:
+                path = os.path.join(work_dir, f"toolbox_{count}.json")
+                start = time.time()
+                runs = [self.export(mode, box_id, path, Headers) for i in range(export_repeats)]
+                ok = [r for r in runs if r[0] == 200]
+                row = {
+                    "tools": count, "mode": mode, "statuses": sorted({r[0] for r in runs}),
+                    "bytes": max((r[1] for r in ok), default=0),
+                    "elapsed_p50": percentile([r[2] for r in ok], 50),
+                    "peak_memory": max((r[3] for r in ok), default=0),
+                    "validation": next((r[4] for r in ok if r[4]), None)
+                }
+                row["mb_per_second"] = row["bytes"] / 1024 / 1024 / row["elapsed_p50"] if row["elapsed_p50"] else 0.0
+                if ResourceSampling.enabled:
+                    ResourceSampling.sample_once()
+                    values = [s["heap_inuse_bytes"] for s in ResourceSampling.samples
+                              if s["timestamp"] >= start and s.get("heap_inuse_bytes")]
+                    if values:
+                        row["peak_heap_inuse_bytes"] = max(values)
+                rows.append(row)
+
+        lines = [f"每种规模与方式导出 {export_repeats} 次，流式块大小 {chunk_size // 1024}KB，"
+                 f"校验方式 {'ijson 增量解析' if ijson else '结构校验（未安装 ijson）'}:"]
+        for r in rows:
+            line = (f"{r['tools']} 个工具 {r['mode']}: 大小 {r['bytes'] / 1024:.1f}KB, 耗时 P50 {r['elapsed_p50'] * 1000:.1f}毫秒 "
+                    f"({r['mb_per_second']:.1f}MB/秒), 客户端内存峰值 {r['peak_memory'] / 1024 / 1024:.2f}MB "
+                    f"（为导出大小的 {r['peak_memory'] / max(1, r['bytes']):.1f} 倍）")
+            if r["validation"]:
+                line += f", 校验 {'通过' if r['validation']['valid'] else '失败: ' + str(r['validation']['error'])}"
+            if "peak_heap_inuse_bytes" in r:
+                line += f", 服务端堆内存峰值 {r['peak_heap_inuse_bytes'] / 1024 / 1024:.1f}MB"
+            lines.append(line)
+        PerfReport("流式导出", "\n".join(lines), rows)
+        attach_line_chart({mode: [(r["tools"], r["peak_memory"] / 1024 / 1024) for r in rows if r["mode"] == mode]
+                           for mode in MODES}, "客户端内存峰值-工具数曲线", "工具数", "内存峰值(MB)")
+        attach_line_chart({mode: [(r["tools"], r["elapsed_p50"] * 1000) for r in rows if r["mode"] == mode]
+                           for mode in MODES}, "导出耗时-工具数曲线", "工具数", "耗时P50(毫秒)")
+
+        for r in rows:
+            assert r["statuses"] == [200], f"{r['tools']} 个工具 {r['mode']} 导出失败: {r['statuses']}"
+            if r["validation"]:
+                assert r["validation"]["valid"], f"{r['tools']} 个工具导出内容校验失败: {r['validation']}"
+        largest = {r["mode"]: r for r in rows if r["tools"] == max(boxes)}
+        assert largest["流式导出"]["peak_memory"] < largest["内存导出"]["peak_memory"], \
+            f"{max(boxes)} 个工具时流式导出的客户端内存峰值不低于内存导出: {largest}"
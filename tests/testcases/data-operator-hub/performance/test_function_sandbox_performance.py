@@ -0,0 +1,420 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import time
+import pytest
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+
+from common.concurrency_limiter import is_overloaded, limiter_from_config
+from common.get_content import GetContent
+from common.perf_chart import attach_line_chart
+from common.perf_stats import percentile, summarize
+from common.sandbox_stub_server import POOL_FULL_MESSAGE, stub_from_config
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 函数执行测试参数，可在 env.ini 的 [performance] 段覆盖
+sandbox_calls = config.getint("performance", "sandbox_calls", fallback=200)
+sandbox_concurrency = [int(n) for n in config.get("performance", "sandbox_concurrency", fallback="1,4,8,16").split(",")]
+sandbox_exhaust_sleep_ms = config.getint("performance", "sandbox_exhaust_sleep_ms", fallback=500)
+sandbox_exhaust_queue_depth = config.getint("performance", "sandbox_exhaust_queue_depth", fallback=4)
+sandbox_cold_calls = config.getint("performance", "sandbox_cold_calls", fallback=20)
+limiter_calls = config.getint("performance", "limiter_calls", fallback=400)
+limiter_offered_concurrency = config.getint("performance", "limiter_offered_concurrency", fallback=32)
+limiter_sleep_ms = config.getint("performance", "limiter_sleep_ms", fallback=50)
+batch_events = config.getint("performance", "function_batch_events", fallback=1000)
+batch_chunk_sizes = [int(n) for n in config.get("performance", "function_batch_chunk_sizes", fallback="10,100,1000").split(",")]
+batch_percall_workers = config.getint("performance", "function_batch_percall_workers", fallback=4)
+code_cache_calls = config.getint("performance", "code_cache_calls", fallback=100)
+code_cache_code_kb = config.getint("performance", "code_cache_code_kb", fallback=64)
+code_cache_flush_url = config.get("performance", "code_cache_flush_url", fallback="")
+stats_url = config.get("performance", "sampler_stats_url", fallback="")
+
+CODE = "def handler(event):\n    return {'output': sum(event.get('numbers', []))}"
+SLEEP_CODE = "import time\n\ndef handler(event):\n    time.sleep(event['sleep_ms'] / 1000)\n    return {'slept': event['sleep_ms']}"
+EVENT = {"numbers": list(range(100))}
+
+client = ToolBox()
+
+
+def execute(headers, code=CODE, event=EVENT):
+    '''调用被测服务 /function/execute，返回 (状态码, 响应, 延迟)'''
+    begin = time.perf_counter()
+    result = client.ExecuteFunction({"code": code, "event": event}, headers)
+    return result[0], result[1], time.perf_counter() - begin
+
+
+def burst(headers, calls, concurrency, **kwargs):
+    '''concurrency 个线程并发共执行 calls 次，返回 (结果列表, 总耗时)'''
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda i: execute(headers, **kwargs), range(calls)))
+    return results, time.perf_counter() - start
+
+
+def metric(results, key):
+    '''取成功响应中替身返回的 metrics 字段'''
+    return [r[1]["metrics"][key] for r in results
+            if r[0] == 200 and isinstance(r[1], dict) and isinstance(r[1].get("metrics"), dict) and key in r[1]["metrics"]]
+
+
+def heavy_code(kb):
+    '''约 kb KB 的函数代码（大字典常量），编译耗时与请求体大小随之增长；返回 (代码, 常量条数)'''
+    lines, size, count = ["TABLE = {"], 0, 0
+    while size < kb * 1024:
+        line = f"    'key_{count:06d}': {count} * 3 + 1,"
+        lines.append(line)
+        size += len(line) + 1
+        count += 1
+    lines += ["}", "", "def handler(event):", "    return {'output': sum(event.get('numbers', [])) + len(TABLE)}"]
+    return "\n".join(lines), count
+
+
+def code_cache_stats():
+    '''被测服务 /health/stats 中的沙箱代码缓存统计，未配置 sampler_stats_url 时返回 None'''
+    if not stats_url:
+        return None
+    return requests.get(stats_url, verify=False, timeout=5).json().get("sandbox_code_cache")
+
+
+@allure.feature("函数执行性能测试：本地沙箱运行时替身")
+class TestFunctionSandboxPerformance:
+    '''
+    被测服务的 sandbox-runtime 指向本地沙箱替身（common/sandbox_stub_server.py），函数在替身的 Python 解释器进程池中执行，
+    不再依赖外部沙箱，可离线测量 /function/execute 的吞吐、池满时的 503 行为与冷启动开销
+    需将被测服务配置中 sandbox-runtime 的 private_host/private_port 指向本机的 sandbox_stub_port
+    '''
+
+    @pytest.fixture(scope="class")
+    def stub(self, Headers):
+        stub = stub_from_config(config).start()
+        status, body, _ = execute(Headers)
+        if stub.stats()["counts"]["requests"] == 0:
+            stub.stop()
+            pytest.skip(f"被测服务未调用本地沙箱替身，请将 sandbox-runtime 指向 {stub.url()}（响应 {status}: {body}）")
+
+        yield stub
+
+        stub.stop()
+
+    @pytest.fixture(autouse=True)
+    def restore(self, stub):
+        '''每个用例从配置的初始参数开始，用例内的调整不影响后续用例'''
+        defaults = stub.config()
+        stub.reset()
+
+        yield
+
+        stub.configure(**defaults)
+
+    @allure.title("函数执行：不同并发数下的吞吐与服务端开销")
+    def test_execute_throughput(self, stub, Headers, PerfReport):
+        '''等待队列足够容纳全部并发，不触发池满；服务端开销 = 端到端延迟 - 替身排队耗时 - 执行耗时'''
+        pool_size = stub.config()["pool_size"]
+        stub.configure(queue_depth=max(sandbox_concurrency))
+        rows = []
+        for concurrency in sandbox_concurrency:
+            stub.reset()
+            results, elapsed = burst(Headers, sandbox_calls, concurrency)
+            failures = [r for r in results if r[0] != 200 or r[1].get("stderr")]
+            latencies = [r[2] for r in results]
+            overhead = [r[2] * 1000 - r[1]["metrics"]["queue_ms"] - r[1]["metrics"]["duration_ms"]
+                        for r in results if metric([r], "duration_ms")]
+            summary = summarize(latencies, len(failures), elapsed)
+            rows.append({
+                "concurrency": concurrency,
+                "summary": summary,
+                "sandbox_queue_p50_ms": percentile(metric(results, "queue_ms"), 50),
+                "sandbox_exec_p50_ms": percentile(metric(results, "duration_ms"), 50),
+                "overhead_p50_ms": percentile(overhead, 50),
+                "peak_busy": stub.stats()["peak"]["busy"],
+                "failure_samples": [r[:2] for r in failures[:3]]
+            })
+
+        lines = [f"沙箱替身执行池 {pool_size} 个进程，每组 {sandbox_calls} 次调用:"]
+        for r in rows:
+            s = r["summary"]
+            lines.append(f"并发 {r['concurrency']}: 吞吐 {s['throughput']:.2f} 次/秒, P50 {s['p50']:.3f}秒, "
+                         f"P99 {s['p99']:.3f}秒, 错误率 {s['error_rate'] * 100:.2f}%, "
+                         f"替身排队 P50 {r['sandbox_queue_p50_ms']:.1f}毫秒, 执行 P50 {r['sandbox_exec_p50_ms']:.2f}毫秒, "
+                         f"服务端开销 P50 {r['overhead_p50_ms']:.1f}毫秒, 峰值占用进程 {r['peak_busy']}")
+        PerfReport("函数执行吞吐", "\n".join(lines), rows)
+        attach_line_chart({"吞吐(次/秒)": [(r["concurrency"], r["summary"]["throughput"]) for r in rows]},
+                          "函数执行吞吐-并发数曲线", "并发数", "吞吐(次/秒)")
+        attach_line_chart({"P50延迟": [(r["concurrency"], r["summary"]["p50"]) for r in rows],
+                           "P99延迟": [(r["concurrency"], r["summary"]["p99"]) for r in rows]},
+                          "函数执行延迟-并发数曲线", "并发数", "延迟(秒)")
+        for r in rows:
+            assert r["summary"]["errors"] == 0, f"并发 {r['concurrency']} 存在失败调用: {r['failure_samples']}"
+
+    @allure.title("函数执行：沙箱池满时的拒绝行为")
+    @pytest.mark.parametrize("pool_full_status", [503, 200])
+    def test_pool_exhaustion(self, stub, pool_full_status, Headers, PerfReport):
+        '''
+        每次调用占用进程 sandbox_exhaust_sleep_ms，并发数为执行池加等待队列容量的两倍，超出部分被替身拒绝
+        503：被测服务应透传 503；200：沙箱以 stderr "System error: 沙箱池已满" 返回，被测服务应原样返回
+        '''
+        stub.configure(queue_depth=sandbox_exhaust_queue_depth, pool_full_status=pool_full_status)
+        capacity = stub.config()["pool_size"] + sandbox_exhaust_queue_depth
+        concurrency = capacity * 2
+        results, elapsed = burst(Headers, concurrency, concurrency, code=SLEEP_CODE,
+                                 event={"sleep_ms": sandbox_exhaust_sleep_ms})
+        stats = stub.stats()
+
+        def rejected(r):
+            if pool_full_status == 503:
+                return r[0] == 503
+            return r[0] == 200 and POOL_FULL_MESSAGE in (r[1].get("stderr") or "")
+
+        accepted = [r for r in results if r[0] == 200 and not rejected(r)]
+        rejections = [r for r in results if rejected(r)]
+        others = [r for r in results if r not in accepted and r not in rejections]
+        data = {
+            "pool_full_status": pool_full_status,
+            "capacity": capacity,
+            "concurrency": concurrency,
+            "accepted": len(accepted),
+            "rejected": len(rejections),
+            "other": len(others),
+            "stub_pool_full": stats["counts"]["pool_full"],
+            "stub_peak": stats["peak"],
+            "accepted_p99": percentile([r[2] for r in accepted], 99),
+            "rejected_p99": percentile([r[2] for r in rejections], 99),
+            "elapsed": elapsed,
+            "other_samples": [r[:2] for r in others[:3]]
+        }
+        text = (f"池满返回 {pool_full_status}：执行池加等待队列容量 {capacity}，并发 {concurrency}，"
+                f"接受 {data['accepted']} 次（P99 {data['accepted_p99']:.3f}秒），"
+                f"拒绝 {data['rejected']} 次（P99 {data['rejected_p99']:.3f}秒），其他 {data['other']} 次，"
+                f"替身记录池满 {data['stub_pool_full']} 次，峰值占用 {stats['peak']['busy']} 个进程")
+        PerfReport(f"沙箱池满{pool_full_status}", text, data)
+        assert not others, f"存在非预期响应: {data['other_samples']}"
+        assert data["rejected"] == data["stub_pool_full"], "被测服务返回的拒绝次数与替身记录的池满次数不一致"
+        assert data["rejected"] > 0, "并发超过执行池容量时应有请求被拒绝"
+        # 拒绝应立即返回，不等待占用进程的调用执行完
+        assert data["rejected_p99"] < sandbox_exhaust_sleep_ms / 1000.0, "池满拒绝未立即返回"
+
+    @allure.title("函数执行：解释器进程冷启动开销")
+    def test_cold_start(self, stub, Headers, PerfReport):
+        '''对比复用常驻进程与每次调用后回收进程（下次调用冷启动）的端到端延迟，冷启动耗时取自响应 metrics'''
+        rows = {}
+        for label, max_requests in (("常驻进程", 0), ("每次冷启动", 1)):
+            stub.configure(max_requests_per_worker=max_requests)
+            # 先用完预热的进程，使进程池进入对应状态
+            for _ in range(stub.config()["pool_size"]):
+                execute(Headers)
+            results = [execute(Headers) for _ in range(sandbox_cold_calls)]
+            failures = [r for r in results if r[0] != 200]
+            assert not failures, f"{label}存在失败调用: {[r[:2] for r in failures[:3]]}"
+            cold = [r for r in results if r[1]["metrics"].get("cold_start")]
+            rows[label] = {
+                "summary": summarize([r[2] for r in results]),
+                "cold_calls": len(cold),
+                "cold_start_p50_ms": percentile(metric(cold, "cold_start_ms"), 50),
+                "cold_start_p99_ms": percentile(metric(cold, "cold_start_ms"), 99),
+                "memory_peak_mb": percentile(metric(results, "memory_peak_mb"), 50)
+            }
+
+        warm, cold = rows["常驻进程"], rows["每次冷启动"]
+        lines = [f"{label}: {sandbox_cold_calls} 次串行调用, 其中冷启动 {r['cold_calls']} 次, "
+                 f"端到端 P50 {r['summary']['p50']:.3f}秒 P99 {r['summary']['p99']:.3f}秒, "
+                 f"冷启动 P50 {r['cold_start_p50_ms']:.1f}毫秒 P99 {r['cold_start_p99_ms']:.1f}毫秒, "
+                 f"进程内存峰值 {r['memory_peak_mb']:.1f}MB" for label, r in rows.items()]
+        lines.append(f"冷启动使端到端 P50 增加 {(cold['summary']['p50'] - warm['summary']['p50']) * 1000:.1f}毫秒")
+        PerfReport("沙箱冷启动", "\n".join(lines), rows)
+        assert warm["cold_calls"] == 0, "常驻进程模式不应出现冷启动"
+        assert cold["cold_calls"] == sandbox_cold_calls, "每次回收进程时每次调用都应冷启动"
+
+    @allure.title("函数执行：客户端自适应限流与固定重试对比")
+    def test_adaptive_limiter(self, stub, Headers, PerfReport):
+        '''
+        调用方并发 limiter_offered_concurrency 远超执行池容量，对比三种客户端策略的有效吞吐与过载率：
+        固定重试（原用例做法：最多 3 次，指数等待）、aimd 限流、gradient 限流
+        '''
+        capacity = stub.config()["pool_size"]
+        event = {"sleep_ms": limiter_sleep_ms}
+
+        def fixed(i):
+            wait = limiter_sleep_ms / 1000.0
+            for attempt in range(3):
+                result = client.ExecuteFunction({"code": SLEEP_CODE, "event": event}, Headers)
+                if not is_overloaded(result) or attempt == 2:
+                    return result
+                time.sleep(wait)
+                wait *= 2
+
+        strategies = {"固定重试": (None, fixed)}
+        for algorithm in ("aimd", "gradient"):
+            limiter = limiter_from_config(config, algorithm=algorithm)
+            strategies[algorithm] = (limiter, lambda i, limiter=limiter: client.ExecuteFunction(
+                {"code": SLEEP_CODE, "event": event}, Headers, limiter=limiter))
+
+        rows = []
+        series = {}
+        for name, (limiter, func) in strategies.items():
+            stub.reset()
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=limiter_offered_concurrency) as pool:
+                results = list(pool.map(func, range(limiter_calls)))
+            elapsed = time.perf_counter() - start
+            counts = stub.stats()["counts"]
+            ok = [r for r in results if r[0] == 200 and not is_overloaded(r)]
+            row = {
+                "strategy": name,
+                "succeeded": len(ok),
+                "failed": len(results) - len(ok),
+                "elapsed": elapsed,
+                "goodput": len(ok) / elapsed if elapsed else 0.0,
+                "ideal_goodput": capacity / (limiter_sleep_ms / 1000.0),
+                "sandbox_requests": counts["requests"],
+                "overload_rate": counts["pool_full"] / counts["requests"] if counts["requests"] else 0.0,
+                "sandbox_peak_busy": stub.stats()["peak"]["busy"]
+            }
+            if limiter:
+                row["limiter"] = limiter.metrics()
+                series[f"{name}上限"] = [(t, limit) for t, limit, _ in limiter.series()]
+            rows.append(row)
+
+        lines = [f"执行池 {capacity} 个进程，单次执行 {limiter_sleep_ms} 毫秒，调用方并发 {limiter_offered_concurrency}，"
+                 f"共 {limiter_calls} 次调用，理论有效吞吐 {rows[0]['ideal_goodput']:.1f} 次/秒:"]
+        for r in rows:
+            line = (f"{r['strategy']}: 成功 {r['succeeded']}, 失败 {r['failed']}, 有效吞吐 {r['goodput']:.1f} 次/秒, "
+                    f"沙箱收到 {r['sandbox_requests']} 次请求, 过载率 {r['overload_rate'] * 100:.1f}%, "
+                    f"峰值占用进程 {r['sandbox_peak_busy']}")
+            if "limiter" in r:
+                m = r["limiter"]
+                line += (f", 最终上限 {m['limit']:.1f}, 峰值在途 {m['peak_in_flight']}, 收缩 {m['drops']} 次, "
+                         f"重试 {m['retries']} 次, 放弃 {m['gave_up']} 次")
+            lines.append(line)
+        PerfReport("客户端自适应限流", "\n".join(lines), rows)
+        attach_line_chart(series, "限流器上限-时间曲线", "时间(秒)", "在途请求上限")
+        for r in rows[1:]:
+            assert r["failed"] == 0, f"{r['strategy']} 限流后仍有调用失败: {r['limiter']}"
+
+    @allure.title("函数执行：批量执行与逐个调用对比")
+    def test_execute_many(self, stub, Headers, PerfReport):
+        '''
+        同一段代码处理 function_batch_events 个事件：逐个调用 /function/execute（batch_percall_workers 个线程并发）
+        与 /function/execute/batch（每 chunk_size 个事件一次沙箱执行，NDJSON 流式返回）对比吞吐与沙箱请求数
+        '''
+        events = [{"numbers": list(range(i % 100))} for i in range(batch_events)]
+        expected = [sum(e["numbers"]) for e in events]
+        rows = []
+
+        stub.reset()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=batch_percall_workers) as pool:
+            results = list(pool.map(lambda e: client.ExecuteFunction({"code": CODE, "event": e}, Headers), events))
+        elapsed = time.perf_counter() - start
+        outputs = [r[1]["result"]["output"] if r[0] == 200 and isinstance(r[1], dict) and r[1].get("result") else None
+                   for r in results]
+        rows.append({"mode": f"逐个调用({batch_percall_workers}并发)", "chunk_size": 1, "elapsed": elapsed,
+                     "first_result": None, "sandbox_requests": stub.stats()["counts"]["requests"],
+                     "mismatched": sum(1 for o, e in zip(outputs, expected) if o != e)})
+
+        for chunk_size in batch_chunk_sizes:
+            stub.reset()
+            start = time.perf_counter()
+            first = None
+            outputs = []
+            for item in client.ExecuteMany(CODE, iter(events), Headers, chunk_size=chunk_size):
+                if first is None:
+                    first = time.perf_counter() - start
+                outputs.append((item["result"] or {}).get("output") if not item["error"] else None)
+            elapsed = time.perf_counter() - start
+            rows.append({"mode": "批量执行", "chunk_size": chunk_size, "elapsed": elapsed, "first_result": first,
+                         "sandbox_requests": stub.stats()["counts"]["requests"],
+                         "mismatched": sum(1 for o, e in zip(outputs, expected) if o != e) + batch_events - len(outputs)})
+
+        for r in rows:
+            r["events_per_second"] = batch_events / r["elapsed"] if r["elapsed"] else 0.0
+        base = rows[0]["elapsed"]
+        lines = [f"{batch_events} 个事件:"]
+        for r in rows:
+            line = (f"{r['mode']} 每批 {r['chunk_size']}: 耗时 {r['elapsed']:.3f}秒, {r['events_per_second']:.0f} 事件/秒, "
+                    f"沙箱请求 {r['sandbox_requests']} 次, 结果不一致 {r['mismatched']}, 相对逐个调用 {base / r['elapsed']:.1f} 倍")
+            if r["first_result"] is not None:
+                line += f", 首个结果 {r['first_result']:.3f}秒"
+            lines.append(line)
+        PerfReport("批量函数执行", "\n".join(lines), rows)
+        attach_line_chart({"批量执行": [(r["chunk_size"], r["events_per_second"]) for r in rows[1:]],
+                           "逐个调用": [(size, rows[0]["events_per_second"]) for size in batch_chunk_sizes]},
+                          "批量执行吞吐-每批事件数曲线", "每批事件数", "吞吐(事件/秒)")
+        for r in rows:
+            assert r["mismatched"] == 0, f"{r['mode']} 每批 {r['chunk_size']} 存在结果不一致的事件"
+        for r in rows[1:]:
+            assert r["sandbox_requests"] == -(-batch_events // r["chunk_size"]), "批量执行的沙箱请求数应为事件数除以每批事件数"
+
+    @allure.title("函数执行：沙箱代码缓存的延迟与请求体节省")
+    def test_code_cache(self, stub, Headers, PerfReport):
+        '''
+        同一段约 code_cache_code_kb KB 的函数顺序调用 code_cache_calls 次：
+        缓存命中：被测服务只发送 code_hash，替身复用已保存的代码与工作进程的编译结果；
+        完整代码（需配置 code_cache_flush_url）：每次调用前清空被测服务的缓存，每次发送完整代码；
+        缓存失效：替身清空保存的代码（模拟沙箱重启），被测服务收到 CodeNotCached 后回退发送完整代码
+        '''
+        code, entries = heavy_code(code_cache_code_kb)
+        expected = sum(EVENT["numbers"]) + entries
+        stub.flush()
+        execute(Headers, code=code)
+        if stub.stats()["counts"]["code_uploads"] == 0:
+            pytest.skip("被测服务未发送 code_hash，请在被测服务配置中开启 sandbox_code_cache")
+
+        def phase(name, before_call=None):
+            stub.reset()
+            service_before = code_cache_stats()
+            results = []
+            for _ in range(code_cache_calls):
+                if before_call:
+                    before_call()
+                results.append(execute(Headers, code=code))
+            counts = stub.stats()["counts"]
+            service_after = code_cache_stats()
+            row = {
+                "phase": name,
+                "p50": percentile([r[2] for r in results], 50),
+                "p99": percentile([r[2] for r in results], 99),
+                "compile_p50_ms": percentile(metric(results, "compile_ms"), 50),
+                "bytes_per_call": counts["request_bytes"] / max(1, counts["requests"]),
+                "sandbox_requests": counts["requests"],
+                "stub_counts": {k: counts[k] for k in ("code_uploads", "code_hits", "code_misses", "compiles")},
+                "mismatched": sum(1 for r in results if r[0] != 200 or (r[1].get("result") or {}).get("output") != expected)
+            }
+            if service_before is not None and service_after is not None:
+                row["service"] = {k: service_after[k] - service_before[k]
+                                  for k in ("hits", "misses", "uploads", "saved_bytes")}
+            return row
+
+        rows = [phase("缓存命中")]
+        if code_cache_flush_url:
+            rows.append(phase("完整代码", lambda: requests.post(code_cache_flush_url, verify=False, timeout=10)))
+        stub.flush()
+        rows.append(phase("缓存失效"))
+
+        lines = [f"函数代码 {len(code.encode()) / 1024:.1f}KB，每组顺序调用 {code_cache_calls} 次:"]
+        for r in rows:
+            c = r["stub_counts"]
+            line = (f"{r['phase']}: P50 {r['p50'] * 1000:.1f}毫秒, P99 {r['p99'] * 1000:.1f}毫秒, "
+                    f"编译 P50 {r['compile_p50_ms']:.2f}毫秒, 沙箱请求体 {r['bytes_per_call'] / 1024:.1f}KB/次, "
+                    f"沙箱请求 {r['sandbox_requests']} 次（完整代码 {c['code_uploads']}, 命中 {c['code_hits']}, "
+                    f"未命中 {c['code_misses']}, 编译 {c['compiles']}）, 结果不一致 {r['mismatched']}")
+            if "service" in r:
+                s = r["service"]
+                line += (f", 服务端计数 命中 {s['hits']} 未命中 {s['misses']} 完整发送 {s['uploads']} "
+                         f"节省 {s['saved_bytes'] / 1024 / 1024:.2f}MB")
+            lines.append(line)
+        if not code_cache_flush_url:
+            lines.append("未配置 code_cache_flush_url，未测量每次发送完整代码的基线")
+        PerfReport("沙箱代码缓存", "\n".join(lines), rows)
+
+        hit, missed = rows[0], rows[-1]
+        for r in rows:
+            assert r["mismatched"] == 0, f"{r['phase']} 存在失败或结果不一致的调用"
+        assert hit["stub_counts"]["code_hits"] == code_cache_calls, "缓存命中阶段每次调用都应只发送 code_hash"
+        assert hit["bytes_per_call"] < len(code.encode()), "只发送 code_hash 时沙箱请求体应小于函数代码"
+        assert missed["stub_counts"]["code_misses"] == 1 and missed["stub_counts"]["code_uploads"] == 1, \
+            "沙箱清空代码后应只有首次调用未命中并回退发送完整代码"
@@ -8,9 +8,23 @@ import json
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 
+from common.dataset_snapshot import find_snapshot, restore_snapshot, snapshot_db
 from common.get_content import GetContent
 from lib.operator import Operator
 
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 数据集快照：开启后首次运行造数并保存表级快照，后续运行直接恢复快照
+snapshot_enabled = config.getboolean("performance", "snapshot_enabled", fallback=False)
+snapshot_root = config.get("performance", "snapshot_root", fallback="./report/snapshot")
+snapshot_truncate = config.getboolean("performance", "snapshot_truncate", fallback=False)
+# 恢复的数据改归当前测试用户后，需经授权服务与业务域服务补齐可见性
+auth_url = config.get("performance", "bulk_auth_url", fallback="")
+bd_url = config.get("performance", "bulk_bd_url", fallback="")
+# 数据集标签：规模与状态分布变化时修改 version，旧快照不再匹配（version 2 起快照记录造数用户）
+dataset_tags = {"dataset": "operator_list", "version": 2, "operators": 1000, "published": 0.7, "offline": 0.2}
+
 @allure.feature("算子注册与管理性能测试：获取算子列表")
 class TestGetOperatorListPerformance:
     client = Operator()
@@ -21,8 +35,18 @@ class TestGetOperatorListPerformance:
         end_time = time.time()
         return end_time - start_time, result
 
-    def test_setup_class(self, Headers):
+    def test_setup_class(self, Headers, UserHeaders):
         """准备测试数据：注册1000个算子，发布700个，其中200个下架"""
+        # 测试用户每次运行重建，恢复的算子改归当前用户并补齐权限策略，否则列表接口看不到
+        owner = UserHeaders["x-account-id"]
+        if snapshot_enabled:
+            manifest = find_snapshot(snapshot_root, kind="db", **dataset_tags)
+            if manifest and not auth_url:
+                print("未配置 bulk_auth_url，无法为当前用户补齐快照数据的权限策略，改为经由 API 造数")
+            elif manifest:
+                restore_snapshot(manifest, snapshot_root, truncate=snapshot_truncate, owner=owner,
+                                 auth_url=auth_url, bd_url=bd_url or None)
+                return
         filepath = "./resource/openapi/compliant/test0.json"
         api_data = GetContent(filepath).jsonfile()
         
@@ -100,6 +124,9 @@ class TestGetOperatorListPerformance:
 
         re = self.client.UpdateOperatorStatus(update_data2, Headers)
         assert re[0] == 200    
+
+        if snapshot_enabled:
+            snapshot_db(snapshot_root, f"operator_list_{time.strftime('%Y%m%d%H%M%S')}", dataset_tags, owner=owner)
         
 
     @allure.title("不同分页大小下的性能测试")
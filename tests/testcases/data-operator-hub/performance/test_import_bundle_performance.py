@@ -0,0 +1,141 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import os
+import shutil
+import tempfile
+import time
+import pytest
+
+from common.get_content import GetContent
+from common.impex_bundle import bundle_stats, modify_bundle, toolbox_bundle, write_bundle
+from common.perf_chart import attach_line_chart
+from lib.impex import Impex
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 大导入包测试参数，可在 env.ini 的 [performance] 段覆盖
+tool_counts = [int(n) for n in config.get("performance", "import_bundle_tool_counts", fallback="100,1000,10000").split(",")]
+bundle_boxes = config.getint("performance", "import_bundle_boxes", fallback=10)
+changed_boxes = config.getint("performance", "import_bundle_changed_boxes", fallback=1)
+import_timeout = config.getint("performance", "import_bundle_timeout", fallback=600)
+
+# 每种规模依次执行的导入：首次创建、相同内容 upsert、相同内容增量导入、部分工具箱变化后增量导入
+PHASES = [("创建", "create", False), ("全量更新", "upsert", False), ("增量-未变化", "incremental", False),
+          ("增量-部分变化", "incremental", True)]
+# Server-Timing 中的阶段：parse 解析校验，auth 鉴权，import 事务内导入，commit 事务提交，total 服务端总耗时
+STAGES = ["parse", "auth", "import", "commit", "total"]
+
+
+@allure.feature("导入导出性能测试：大导入包的事务耗时与增量导入")
+class TestImportBundlePerformance:
+    '''
+    生成工具数逐级增大的工具箱导入包（import_bundle_boxes 个工具箱平均分配工具），依次以 create、upsert、
+    incremental 模式导入，记录客户端耗时、服务端各阶段耗时（Server-Timing 响应头，import 为事务内导入耗时）
+    与服务端堆内存峰值（需开启资源采样），并校验增量导入跳过了内容未变化的工具箱
+    '''
+    impex_client = Impex()
+    tb_client = ToolBox()
+
+    @pytest.fixture(scope="class")
+    def work_dir(self, Headers):
+        '''临时目录，记录导入的工具箱并在结束时删除'''
+        path = tempfile.mkdtemp(prefix="import_bundle_")
+        box_ids = []
+
+        yield path, box_ids
+
+        shutil.rmtree(path, ignore_errors=True)
+        for box_id in box_ids:
+            self.tb_client.DeleteToolbox(box_id, Headers)
+
+    def update_times(self, box_ids, headers):
+        '''工具箱当前的更新时间，{box_id: update_time}'''
+        times = {}
+        for box_id in box_ids:
+            result = self.tb_client.GetToolbox(box_id, headers)
+            times[box_id] = result[1].get("update_time") if result[0] == 200 else None
+        return times
+
+    def heap_peak(self, sampling, start):
+        '''start 之后采样到的服务端堆内存峰值，未开启采样时返回 None'''
+        if not sampling.enabled:
+            return None
+        sampling.sample_once()
+        values = [s["heap_inuse_bytes"] for s in sampling.samples
+                  if s["timestamp"] >= start and s.get("heap_inuse_bytes")]
+        return max(values) if values else None
+
+    def run_phase(self, name, mode, path, headers, sampling):
+        start = time.time()
+        status, data = self.impex_client.import_bundle("toolbox", path, mode, headers, timeout=import_timeout)
+        return {
+            "phase": name, "mode": mode, "status": status, "elapsed": data["elapsed"],
+            "server_timing": data["server_timing"], "peak_heap_inuse_bytes": self.heap_peak(sampling, start),
+            "error": data["result"] if status != 201 else None
+        }
+
+    @allure.title("大导入包：create、upsert 与增量导入的事务耗时及内存")
+    def test_import_bundle(self, work_dir, Headers, ResourceSampling, PerfReport):
+        '''每种规模生成新的导入包，增量导入前后比较工具箱更新时间，确认未变化的工具箱未被重写'''
+        path_dir, box_ids = work_dir
+        rows, checks = [], []
+        for count in tool_counts:
+            bundle = toolbox_bundle(count, boxes=min(bundle_boxes, count))
+            stats = bundle_stats(bundle)
+            ids = [c["box_id"] for c in bundle["toolbox"]["configs"]]
+            box_ids.extend(ids)
+            changed = modify_bundle(bundle, boxes=changed_boxes)
+            path = os.path.join(path_dir, f"toolbox_{count}.json")
+            changed_path = os.path.join(path_dir, f"toolbox_{count}_changed.json")
+            size = write_bundle(bundle, path)
+            write_bundle(changed, changed_path)
+
+            before = None
+            for name, mode, use_changed in PHASES:
+                if mode == "incremental":
+                    before = self.update_times(ids, Headers)
+                row = self.run_phase(name, mode, changed_path if use_changed else path, Headers, ResourceSampling)
+                row.update(stats, bytes=size)
+                rows.append(row)
+                if mode == "incremental" and row["status"] == 201:
+                    after = self.update_times(ids, Headers)
+                    expect = set(ids[:changed_boxes]) if use_changed else set()
+                    rewritten = {box_id for box_id in ids if after[box_id] != before[box_id]}
+                    checks.append({"tools": count, "phase": name, "expect_rewritten": len(expect),
+                                   "rewritten": len(rewritten), "ok": rewritten == expect})
+
+        lines = [f"每个导入包 {bundle_boxes} 个工具箱，部分变化时修改 {changed_boxes} 个工具箱:"]
+        for r in rows:
+            t = r["server_timing"]
+            line = (f"{r['tools']} 个工具（{r['bytes'] / 1024 / 1024:.1f}MB）{r['phase']}: 状态 {r['status']}, "
+                    f"客户端耗时 {r['elapsed'] * 1000:.0f}毫秒")
+            if t:
+                line += ", 服务端 " + " / ".join(f"{s} {t[s] * 1000:.0f}" for s in STAGES if s in t) + " 毫秒"
+            if r["peak_heap_inuse_bytes"]:
+                line += f", 服务端堆内存峰值 {r['peak_heap_inuse_bytes'] / 1024 / 1024:.1f}MB"
+            if r["error"]:
+                line += f", 错误: {str(r['error'])[:200]}"
+            lines.append(line)
+        for c in checks:
+            lines.append(f"{c['tools']} 个工具{c['phase']}: 重写 {c['rewritten']} 个工具箱（预期 {c['expect_rewritten']}）")
+        PerfReport("大导入包导入", "\n".join(lines), {"rows": rows, "checks": checks})
+
+        def duration(r):
+            return r["server_timing"].get("import", r["elapsed"])
+        attach_line_chart({name: [(r["tools"], duration(r) * 1000) for r in rows if r["phase"] == name]
+                           for name, _, _ in PHASES}, "事务内导入耗时-工具数曲线", "工具数", "耗时(毫秒)")
+        if ResourceSampling.enabled:
+            attach_line_chart({name: [(r["tools"], (r["peak_heap_inuse_bytes"] or 0) / 1024 / 1024) for r in rows
+                                      if r["phase"] == name] for name, _, _ in PHASES},
+                              "服务端堆内存峰值-工具数曲线", "工具数", "堆内存峰值(MB)")
+
+        for r in rows:
+            assert r["status"] == 201, f"{r['tools']} 个工具{r['phase']}导入失败: {r['error']}"
+        for c in checks:
+            assert c["ok"], f"{c['tools']} 个工具{c['phase']}重写的工具箱数不符合预期: {c}"
+        largest = {r["phase"]: r for r in rows if r["tools"] == max(tool_counts)}
+        assert duration(largest["增量-未变化"]) < duration(largest["全量更新"]), \
+            f"{max(tool_counts)} 个工具时未变化内容的增量导入不快于全量更新: {largest}"
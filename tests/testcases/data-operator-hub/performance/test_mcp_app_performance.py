@@ -0,0 +1,142 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import asyncio
+import random
+import string
+import pytest
+
+from common.get_content import GetContent
+from common.mcp_client import run_load
+from common.perf_chart import attach_line_chart
+from common.perf_stats import format_summary
+from lib.mcp import MCP
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# MCP 协议端点测试参数，可在 env.ini 的 [performance] 段覆盖
+app_calls = config.getint("performance", "mcp_app_calls", fallback=100)
+app_pipeline_depths = [int(n) for n in config.get("performance", "mcp_app_pipeline_depths", fallback="1,2,4,8,16").split(",")]
+app_sessions = [int(n) for n in config.get("performance", "mcp_app_sessions", fallback="1,10,50").split(",")]
+app_timeout = config.getint("performance", "mcp_app_timeout", fallback=60)
+
+MODES = ["sse", "stream"]
+TOOL_NAME = "获取工具箱列表"
+
+mcp_client = MCP()
+mcp_id = ""
+
+
+def load(mode, headers, **kwargs):
+    '''对已发布 MCP 的协议端点压测，工具入参与 MCP 工具调用接口一致'''
+    kwargs.setdefault("tool", TOOL_NAME)
+    kwargs.setdefault("arguments", {"header": headers})
+    return asyncio.run(run_load(mcp_client.AppEndpoint(mcp_id, mode), mode, headers, timeout=app_timeout, **kwargs))
+
+
+@allure.feature("MCP协议端点性能测试：会话复用与流水线")
+class TestMCPAppPerformance:
+    '''
+    通过 common/mcp_client.py 以 MCP 协议（initialize、tools/list、tools/call）访问被测服务对外暴露的
+    /mcp/app/{mcp_id}/sse 与 /mcp/app/{mcp_id}/mcp 端点，即智能体实际使用的调用路径
+    '''
+
+    @pytest.fixture(scope="class", autouse=True)
+    def setup(self, Headers, ProxyToolbox):
+        '''基于代理测试用工具箱的“获取工具箱列表”工具创建并发布 MCP 服务'''
+        global mcp_id
+
+        tool = ProxyToolbox["tool"]
+        result = mcp_client.RegisterMCP({
+            "name": ''.join(random.choice(string.ascii_letters) for i in range(8)),
+            "description": "mcp app performance test",
+            "mode": "sse",
+            "url": "http://localhost:8080/api/v1/tools",
+            "category": "data_analysis",
+            "creation_type": "tool_imported",
+            "tool_configs": [{
+                "box_id": ProxyToolbox["box_id"],
+                "box_name": ProxyToolbox["box_name"],
+                "tool_id": tool["tool_id"],
+                "tool_name": tool["name"],
+                "description": tool["description"],
+                "use_rule": "all"
+            }]
+        }, Headers)
+        assert result[0] == 200
+        mcp_id = result[1]["mcp_id"]
+        result = mcp_client.MCPReleaseAction(mcp_id, {"status": "published"}, Headers)
+        assert result[0] == 200
+
+        yield
+
+        mcp_client.MCPReleaseAction(mcp_id, {"status": "offline"}, Headers)
+        mcp_client.DeleteMCP(mcp_id, Headers)
+
+    @allure.title("会话复用：复用会话与每次调用新建会话")
+    @pytest.mark.parametrize("mode", MODES)
+    def test_session_reuse(self, mode, Headers, PerfReport):
+        '''新建会话需额外的连接、initialize 与 notifications/initialized 往返，对比两种方式下的调用延迟'''
+        lines = []
+        data = {}
+        for reuse in (True, False):
+            metrics, elapsed, failures = load(mode, Headers, sessions=1, calls=app_calls, pipeline=1, reuse=reuse)
+            summary = metrics.summary(elapsed)
+            label = "复用会话" if reuse else "每次新建会话"
+            data[label] = summary
+            assert not failures, f"{mode} {label}建立会话失败: {failures[:3]}"
+            assert summary["tools/call"]["errors"] == 0, f"{mode} {label}调用失败: {metrics.errors()}"
+            lines.append(format_summary(f"{mode} {label} tools/call", summary["tools/call"]))
+            lines.append(f"建立连接 P50 {summary['connect']['p50']:.3f}秒, initialize P50 {summary['initialize']['p50']:.3f}秒, "
+                         f"端到端吞吐 {app_calls / elapsed:.2f} 次/秒")
+        PerfReport(f"{mode}会话复用", "\n".join(lines), data)
+
+    @allure.title("流水线：单会话在途请求数与吞吐、延迟")
+    @pytest.mark.parametrize("mode", MODES)
+    def test_pipeline_depth(self, mode, Headers, PerfReport):
+        '''单个会话内并发发起请求，观察吞吐是否随在途请求数提升，以及尾延迟的代价'''
+        rows = []
+        for depth in app_pipeline_depths:
+            metrics, elapsed, failures = load(mode, Headers, sessions=1, calls=app_calls, pipeline=depth)
+            assert not failures, f"{mode} 建立会话失败: {failures}"
+            summary = metrics.summary(elapsed)["tools/call"]
+            rows.append({"pipeline": depth, "summary": summary, "errors": metrics.errors()})
+        text = "\n".join(f"{mode} 在途 {r['pipeline']}: 吞吐 {r['summary']['throughput']:.2f} 次/秒, "
+                         f"P50 {r['summary']['p50']:.3f}秒, P99 {r['summary']['p99']:.3f}秒, "
+                         f"错误率 {r['summary']['error_rate'] * 100:.2f}%" for r in rows)
+        PerfReport(f"{mode}流水线", text, rows)
+        attach_line_chart({"吞吐(次/秒)": [(r["pipeline"], r["summary"]["throughput"]) for r in rows]},
+                          f"{mode}吞吐-在途请求数曲线", "在途请求数", "吞吐(次/秒)")
+        attach_line_chart({"P50延迟": [(r["pipeline"], r["summary"]["p50"]) for r in rows],
+                           "P99延迟": [(r["pipeline"], r["summary"]["p99"]) for r in rows]},
+                          f"{mode}延迟-在途请求数曲线", "在途请求数", "延迟(秒)")
+        assert all(r["summary"]["errors"] == 0 for r in rows), f"{mode} 流水线调用存在失败: {rows[-1]['errors']}"
+
+    @allure.title("并发会话：同一 MCP 实例上的多个会话")
+    @pytest.mark.parametrize("mode", MODES)
+    def test_concurrent_sessions(self, mode, Headers, PerfReport):
+        '''多个会话并发访问同一 MCP 实例，每个会话串行调用，观察会话建立失败与调用延迟随会话数的变化'''
+        rows = []
+        for sessions in app_sessions:
+            calls = max(1, app_calls // sessions)
+            metrics, elapsed, failures = load(mode, Headers, sessions=sessions, calls=calls, pipeline=1)
+            summary = metrics.summary(elapsed)
+            rows.append({"sessions": sessions, "calls_per_session": calls, "summary": summary,
+                         "session_failures": len(failures), "failure_samples": failures[:3],
+                         "errors": metrics.errors()})
+        lines = []
+        for r in rows:
+            call = r["summary"].get("tools/call")
+            initialize = r["summary"].get("initialize", {"p99": 0.0})
+            lines.append(f"{mode} {r['sessions']} 个会话: 会话建立失败 {r['session_failures']}, "
+                         f"initialize P99 {initialize['p99']:.3f}秒, " +
+                         (f"调用吞吐 {call['throughput']:.2f} 次/秒, P99 {call['p99']:.3f}秒, "
+                          f"错误率 {call['error_rate'] * 100:.2f}%" if call else "无成功会话"))
+        PerfReport(f"{mode}并发会话", "\n".join(lines), rows)
+        attach_line_chart({"tools/call P99": [(r["sessions"], r["summary"]["tools/call"]["p99"])
+                                              for r in rows if "tools/call" in r["summary"]],
+                           "initialize P99": [(r["sessions"], r["summary"]["initialize"]["p99"])
+                                              for r in rows if "initialize" in r["summary"]]},
+                          f"{mode}延迟-并发会话数曲线", "会话数", "延迟(秒)")
+        assert all(r["session_failures"] == 0 for r in rows), f"{mode} 存在会话建立失败"
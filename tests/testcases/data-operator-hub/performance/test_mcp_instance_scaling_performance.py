@@ -0,0 +1,304 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import asyncio
+import random
+import string
+import time
+import pytest
+import requests
+
+from common.get_content import GetContent
+from common.mcp_client import MCPError, CallMetrics, open_session
+from common.perf_chart import attach_line_chart
+from common.perf_stats import summarize, format_summary
+from lib.mcp import MCP
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# MCP 实例与会话规模测试参数，可在 env.ini 的 [performance] 段覆盖
+scale_instances = [int(n) for n in config.get("performance", "mcpscale_instances", fallback="10,100,1000").split(",")]
+scale_sessions = [int(n) for n in config.get("performance", "mcpscale_sessions", fallback="100,1000,10000").split(",")]
+calls_per_session = config.getint("performance", "mcpscale_calls_per_session", fallback=1)
+open_concurrency = config.getint("performance", "mcpscale_open_concurrency", fallback=200)
+churn_count = config.getint("performance", "mcpscale_churn", fallback=20)
+scale_mode = config.get("performance", "mcpscale_mode", fallback="sse")
+scale_timeout = config.getint("performance", "mcpscale_timeout", fallback=120)
+# operator-app 的运行时统计接口，如 http://agent-operator-app:9000/health/stats，未配置时不统计内存与协程
+app_stats_url = config.get("performance", "mcpscale_app_stats_url", fallback="")
+
+TOOL_NAME = "获取工具箱列表"
+
+mcp_client = MCP()
+
+
+def app_stats():
+    '''采样 operator-app 运行时统计，未配置或不可达时返回 None'''
+    if not app_stats_url:
+        return None
+    try:
+        return requests.get(app_stats_url, timeout=10).json()
+    except (requests.RequestException, ValueError):
+        return None
+
+
+def delta(before, after, count):
+    '''两次采样间堆内存、协程数的差值，按 count 均摊'''
+    if not before or not after or not count:
+        return None
+    return {
+        "heap_inuse_bytes": (after["memory"]["heap_inuse"] - before["memory"]["heap_inuse"]) / count,
+        "heap_alloc_bytes": (after["memory"]["heap_alloc"] - before["memory"]["heap_alloc"]) / count,
+        "goroutines": (after["goroutines"] - before["goroutines"]) / count,
+        "instances": after["mcp"]["instances"],
+        "sse_sessions": after["mcp"]["sse_sessions"]
+    }
+
+
+def describe(cost):
+    if not cost:
+        return "资源占用: 未配置 mcpscale_app_stats_url"
+    return (f"堆内存 {cost['heap_inuse_bytes'] / 1024:.1f}KB, 协程 {cost['goroutines']:.2f}, "
+            f"实例数 {cost['instances']}, SSE 连接数 {cost['sse_sessions']}")
+
+
+def raise_fd_limit(needed):
+    '''每个会话至少占用一个连接，按需调高当前进程的文件描述符软限制'''
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+    if target > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+async def hold_sessions(urls, total, headers):
+    '''
+    按轮询方式在各 MCP 上建立 total 个会话并全部保持，采样资源后每个会话发起 calls_per_session 次工具调用，
+    再次采样后关闭全部会话
+    :return: (调用指标, 建立会话耗时, 会话建立失败列表, 保持期间采样, 调用结束采样)
+    '''
+    metrics = CallMetrics()
+    failures = []
+    sessions = []
+    limit = asyncio.Semaphore(open_concurrency)
+
+    async def connect(index):
+        session = open_session(urls[index % len(urls)], scale_mode, headers=headers, metrics=metrics,
+                               pipeline=1, timeout=scale_timeout)
+        async with limit:
+            try:
+                await session.initialize()
+                sessions.append(session)
+            except MCPError as e:
+                failures.append({"session": index, "error": str(e)})
+                await session.close()
+
+    async def invoke(session):
+        for _ in range(calls_per_session):
+            try:
+                await session.call_tool(TOOL_NAME, {"header": headers})
+            except MCPError:
+                pass
+
+    start = time.perf_counter()
+    await asyncio.gather(*(connect(i) for i in range(total)))
+    open_elapsed = time.perf_counter() - start
+    try:
+        held = await asyncio.to_thread(app_stats)
+        await asyncio.gather(*(invoke(s) for s in sessions))
+        called = await asyncio.to_thread(app_stats)
+    finally:
+        await asyncio.gather(*(s.close() for s in sessions))
+    return metrics, open_elapsed, failures, held, called
+
+
+@allure.feature("MCP实例管理性能测试：实例数与会话数扩展")
+class TestMCPInstanceScalingPerformance:
+    '''
+    基于工具箱工具（tool_imported）注册并发布 N 个 MCP，operator-app 为每个 MCP 在内存中创建实例；
+    再将 M 个会话轮询分布到这些 MCP 上并保持，测量实例创建、会话内存、工具调用以及实例释放与重建的代价
+    用例按实例数 -> 会话数 -> 释放重建的顺序执行，后续用例复用前面创建的 MCP
+    '''
+
+    @pytest.fixture(scope="class", autouse=True)
+    def state(self, Headers, ProxyToolbox):
+        '''基于代理测试用工具箱注册 MCP，结束后删除创建的 MCP'''
+        state = dict(ProxyToolbox, mcp_ids=[])
+
+        yield state
+
+        for mcp_id in state["mcp_ids"]:
+            mcp_client.MCPReleaseAction(mcp_id, {"status": "offline"}, Headers)
+            mcp_client.DeleteMCP(mcp_id, Headers)
+
+    def mcp_data(self, state, name=None):
+        tool = state["tool"]
+        return {
+            "name": name or ''.join(random.choice(string.ascii_letters) for i in range(12)),
+            "description": "mcp instance scaling test",
+            "mode": scale_mode,
+            "url": "http://localhost:8080/api/v1/tools",
+            "category": "data_analysis",
+            "creation_type": "tool_imported",
+            "tool_configs": [{
+                "box_id": state["box_id"],
+                "box_name": state["box_name"],
+                "tool_id": tool["tool_id"],
+                "tool_name": tool["name"],
+                "description": tool["description"],
+                "use_rule": "all"
+            }]
+        }
+
+    def publish(self, state, headers):
+        '''注册并发布一个 MCP，注册时 operator-app 同步创建实例，返回 (注册耗时, 发布耗时)'''
+        result, register_latency = timed(mcp_client.RegisterMCP, self.mcp_data(state), headers)
+        assert result[0] == 200, f"注册 MCP 失败: {result}"
+        mcp_id = result[1]["mcp_id"]
+        state["mcp_ids"].append(mcp_id)
+        result, publish_latency = timed(mcp_client.MCPReleaseAction, mcp_id, {"status": "published"}, headers)
+        assert result[0] == 200, f"发布 MCP 失败: {result}"
+        return register_latency, publish_latency
+
+    @allure.title("实例创建：注册与发布延迟、单实例内存随实例数变化")
+    def test_instance_scaling(self, state, Headers, PerfReport):
+        '''实例数逐级累加到 N，每一级统计新增 MCP 的注册（含实例创建）与发布延迟，以及 operator-app 的单实例资源占用'''
+        rows = []
+        for target in scale_instances:
+            added = target - len(state["mcp_ids"])
+            if added <= 0:
+                continue
+            before = app_stats()
+            registers, publishes = [], []
+            start = time.perf_counter()
+            for _ in range(added):
+                register_latency, publish_latency = self.publish(state, Headers)
+                registers.append(register_latency)
+                publishes.append(publish_latency)
+            elapsed = time.perf_counter() - start
+            rows.append({"instances": target, "added": added,
+                         "register": summarize(registers, 0, elapsed), "publish": summarize(publishes, 0, elapsed),
+                         "cost": delta(before, app_stats(), added)})
+
+        lines = []
+        for r in rows:
+            lines.append(format_summary(f"实例数 {r['instances']}（新增 {r['added']}）注册", r["register"]))
+            lines.append(format_summary(f"实例数 {r['instances']}（新增 {r['added']}）发布", r["publish"]))
+            lines.append(f"单实例{describe(r['cost'])}")
+        PerfReport("实例创建", "\n".join(lines), rows)
+        attach_line_chart({"注册 P50": [(r["instances"], r["register"]["p50"]) for r in rows],
+                           "注册 P99": [(r["instances"], r["register"]["p99"]) for r in rows],
+                           "发布 P50": [(r["instances"], r["publish"]["p50"]) for r in rows]},
+                          "注册发布延迟-实例数曲线", "实例数", "延迟(秒)")
+        if all(r["cost"] for r in rows):
+            attach_line_chart({"单实例堆内存(KB)": [(r["instances"], r["cost"]["heap_inuse_bytes"] / 1024) for r in rows]},
+                              "单实例内存-实例数曲线", "实例数", "堆内存(KB)")
+
+    @allure.title("会话规模：保持 M 个会话时的单会话内存与工具调用延迟")
+    def test_session_scaling(self, state, Headers, PerfReport):
+        '''会话轮询分布在已发布的 MCP 上，保持期间采样资源占用，随后每个会话调用工具，关闭后确认连接数回落'''
+        if not state["mcp_ids"]:
+            self.publish(state, Headers)
+        urls = [mcp_client.AppEndpoint(mcp_id, scale_mode) for mcp_id in state["mcp_ids"]]
+        # 每个会话保持一个事件流连接与一个请求连接
+        raise_fd_limit(max(scale_sessions) * 2 + 256)
+        rows = []
+        for total in scale_sessions:
+            before = app_stats()
+            metrics, open_elapsed, failures, held, called = asyncio.run(hold_sessions(urls, total, Headers))
+            time.sleep(1)
+            after = app_stats()
+            summary = metrics.summary()
+            opened = total - len(failures)
+            rows.append({
+                "sessions": total,
+                "mcps": len(urls),
+                "opened": opened,
+                "open_elapsed": open_elapsed,
+                "session_failures": len(failures),
+                "failure_samples": failures[:3],
+                "initialize": summary.get("initialize"),
+                "call": summary.get("tools/call"),
+                "held": delta(before, held, opened),
+                "after_call": delta(before, called, opened),
+                "released": after["mcp"]["sse_sessions"] if after else None,
+                "errors": metrics.errors()
+            })
+
+        lines = []
+        for r in rows:
+            lines.append(f"{r['sessions']} 个会话分布在 {r['mcps']} 个 MCP 上: 建立成功 {r['opened']}, "
+                         f"失败 {r['session_failures']}, 建立耗时 {r['open_elapsed']:.2f}秒")
+            if r["initialize"]:
+                lines.append(format_summary("  initialize", r["initialize"]))
+            if r["call"]:
+                lines.append(format_summary("  tools/call", r["call"]))
+            lines.append(f"  保持期间单会话{describe(r['held'])}")
+            lines.append(f"  调用结束单会话{describe(r['after_call'])}")
+            if r["released"] is not None:
+                lines.append(f"  关闭后 SSE 连接数 {r['released']}")
+        PerfReport("会话规模", "\n".join(lines), rows)
+        attach_line_chart({"initialize P99": [(r["sessions"], r["initialize"]["p99"]) for r in rows if r["initialize"]],
+                           "tools/call P50": [(r["sessions"], r["call"]["p50"]) for r in rows if r["call"]],
+                           "tools/call P99": [(r["sessions"], r["call"]["p99"]) for r in rows if r["call"]]},
+                          "延迟-会话数曲线", "会话数", "延迟(秒)")
+        if all(r["held"] for r in rows):
+            attach_line_chart({"单会话堆内存(KB)": [(r["sessions"], r["held"]["heap_inuse_bytes"] / 1024) for r in rows],
+                               "单会话协程数": [(r["sessions"], r["held"]["goroutines"]) for r in rows]},
+                              "单会话资源-会话数曲线", "会话数", "占用")
+        assert all(r["session_failures"] == 0 for r in rows), f"存在会话建立失败: {rows[-1]['failure_samples']}"
+
+    @allure.title("实例释放与重建：编辑、下线、删除与重新注册的代价")
+    def test_release_recreate(self, state, Headers, PerfReport):
+        '''
+        编辑 MCP 会升级版本并重建实例，删除 MCP 会释放全部实例版本；
+        在当前实例规模下抽取若干 MCP 依次编辑、下线、删除再重新注册发布，统计各操作延迟与实例数、内存变化
+        '''
+        while len(state["mcp_ids"]) < churn_count:
+            self.publish(state, Headers)
+        samples = random.sample(state["mcp_ids"], churn_count)
+        latencies = {"编辑重建": [], "下线": [], "删除释放": [], "重新注册": [], "重新发布": []}
+        failures = []
+        before = app_stats()
+        for mcp_id in samples:
+            result, latency = timed(mcp_client.EditMCP, mcp_id, self.mcp_data(state, f"churn_{mcp_id[:8]}"), Headers)
+            latencies["编辑重建"].append(latency)
+            if result[0] != 200:
+                failures.append({"mcp_id": mcp_id, "action": "edit", "result": result})
+            result, latency = timed(mcp_client.MCPReleaseAction, mcp_id, {"status": "offline"}, Headers)
+            latencies["下线"].append(latency)
+            result, latency = timed(mcp_client.DeleteMCP, mcp_id, Headers)
+            latencies["删除释放"].append(latency)
+            if result[0] != 200:
+                failures.append({"mcp_id": mcp_id, "action": "delete", "result": result})
+                continue
+            state["mcp_ids"].remove(mcp_id)
+        released = app_stats()
+        for _ in samples:
+            register_latency, publish_latency = self.publish(state, Headers)
+            latencies["重新注册"].append(register_latency)
+            latencies["重新发布"].append(publish_latency)
+        recreated = app_stats()
+
+        data = {action: summarize(values) for action, values in latencies.items()}
+        lines = [f"在 {len(state['mcp_ids'])} 个实例规模下释放并重建 {churn_count} 个 MCP:"]
+        lines += [format_summary(action, summary) for action, summary in data.items()]
+        if before and released and recreated:
+            lines.append(f"实例数: 释放前 {before['mcp']['instances']}, 释放后 {released['mcp']['instances']}, "
+                         f"重建后 {recreated['mcp']['instances']}")
+            lines.append(f"堆内存: 释放前 {before['memory']['heap_inuse'] / 1048576:.1f}MB, "
+                         f"释放后 {released['memory']['heap_inuse'] / 1048576:.1f}MB, "
+                         f"重建后 {recreated['memory']['heap_inuse'] / 1048576:.1f}MB")
+        PerfReport("实例释放与重建", "\n".join(lines),
+                   {"latency": data, "stats": [before, released, recreated], "failures": failures})
+        assert not failures, f"释放或重建失败: {failures[:3]}"
@@ -0,0 +1,207 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import pytest
+import random
+import string
+import time
+
+from common.get_content import GetContent
+from common.mcp_stub_server import stub_from_config
+from common.perf_chart import attach_line_chart
+from common.perf_stats import summarize, format_summary
+from lib.mcp import MCP
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 本地 MCP 替身测试参数，可在 env.ini 的 [performance] 段覆盖
+iterations = config.getint("performance", "mcp_stub_iterations", fallback=50)
+tool_counts = [int(n) for n in config.get("performance", "mcp_stub_tool_counts", fallback="10,100,500").split(",")]
+injected_latency_ms = config.getfloat("performance", "mcp_stub_fault_latency_ms", fallback=200)
+
+MODES = ["sse", "stream"]
+
+client = MCP()
+mcp_ids = {}
+
+
+def call_data(tool="tool_0000"):
+    return {"tool_name": tool, "parameters": {"arg_0": "value", "arg_2": 1.5}}
+
+
+def is_success(result):
+    return result[0] == 200 and isinstance(result[1], dict) and not result[1].get("is_error")
+
+
+def measure(func, count, check=is_success):
+    '''串行调用 count 次，返回 (延迟统计, 失败响应样例)'''
+    latencies = []
+    failures = []
+    start = time.perf_counter()
+    for _ in range(count):
+        begin = time.perf_counter()
+        result = func()
+        latencies.append(time.perf_counter() - begin)
+        if not check(result):
+            failures.append(result)
+    return summarize(latencies, len(failures), time.perf_counter() - start), failures
+
+
+def stub_seconds(stats, method):
+    '''替身侧某方法的平均处理耗时（含注入的延迟）'''
+    item = stats["methods"].get(method)
+    return item["seconds"] / item["count"] if item and item["count"] else 0.0
+
+
+@allure.feature("MCP代理性能测试：本地 MCP 替身")
+class TestMCPStubPerformance:
+    '''
+    被测服务访问本地 MCP 替身（common/mcp_stub_server.py）而非公网 MCP Server，结果可复现且无需外网
+    需配置 mcp_stub_advertise_host 为被测服务可访问的本机地址
+    '''
+
+    @pytest.fixture(scope="class", autouse=True)
+    def stub(self, Headers):
+        stub = stub_from_config(config).start()
+        for mode in MODES:
+            name = ''.join(random.choice(string.ascii_letters) for i in range(8))
+            result = client.RegisterMCP({
+                "name": f"stub_{mode}_{name}",
+                "description": "local mcp stub server",
+                "mode": mode,
+                "url": stub.url(mode),
+                "source": "custom",
+                "category": "data_analysis"
+            }, Headers)
+            assert result[0] == 200, f"注册 {mode} 模式 MCP 失败: {result}"
+            mcp_ids[mode] = result[1]["mcp_id"]
+
+        yield stub
+
+        for mode in MODES:
+            client.DeleteMCP(mcp_ids.pop(mode), Headers)
+        stub.stop()
+
+    @allure.title("解析MCP Server：延迟随工具数量变化")
+    @pytest.mark.parametrize("mode", MODES)
+    def test_parse_scaling(self, mode, Headers):
+        '''每种工具数量启动一个替身，解析接口每次都会新建会话，统计 initialize + ping + tools/list 的整体代价'''
+        rows = []
+        for count in tool_counts:
+            stub = stub_from_config(config, tools=count, port=0).start()
+            try:
+                data = {"mode": mode, "url": stub.url(mode)}
+                summary, failures = measure(lambda: client.ParseSSE(data, Headers), iterations,
+                                            check=lambda r: r[0] == 200 and len(r[1]["tools"]) == count)
+                stats = stub.stats()
+            finally:
+                stub.stop()
+            assert not failures, f"解析 {count} 个工具的 {mode} MCP 失败: {failures[:3]}"
+            rows.append({"tools": count, "summary": summary, "sessions": stats["sessions"]["opened"],
+                         "stub_list_seconds": stub_seconds(stats, "tools/list")})
+
+        text = "\n".join(f"{mode} 模式 {r['tools']} 个工具: P50 {r['summary']['p50']:.3f}秒, "
+                         f"P99 {r['summary']['p99']:.3f}秒, 替身会话数 {r['sessions']}" for r in rows)
+        print(text)
+        allure.attach(text, name=f"{mode}解析延迟", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(rows, indent=2), name=f"{mode}解析延迟数据", attachment_type=allure.attachment_type.JSON)
+        attach_line_chart({
+            "P50延迟": [(r["tools"], r["summary"]["p50"]) for r in rows],
+            "P99延迟": [(r["tools"], r["summary"]["p99"]) for r in rows]
+        }, f"{mode}解析延迟-工具数量曲线", "工具数量", "延迟(秒)")
+
+    @allure.title("工具列表与工具调用：代理开销")
+    @pytest.mark.parametrize("mode", MODES)
+    def test_proxy_overhead(self, mode, stub, Headers):
+        '''替身不注入延迟，客户端延迟减去替身处理耗时即为被测服务的代理开销'''
+        stub.configure(latency_ms=0, jitter_ms=0, slow_stream_ms=0, disconnect_rate=0, error_rate=0)
+        mcp_id = mcp_ids[mode]
+        lines = []
+        data = {}
+        for name, func, method in (
+                ("工具列表", lambda: client.GetMCPToolList(mcp_id, Headers), "tools/list"),
+                ("工具调用", lambda: client.CallMCPtool(mcp_id, call_data(), Headers), "tools/call")):
+            stub.reset()
+            check = (lambda r: r[0] == 200) if method == "tools/list" else is_success
+            summary, failures = measure(func, iterations, check=check)
+            assert not failures, f"{mode} {name}失败: {failures[:3]}"
+            stats = stub.stats()
+            overhead = summary["avg"] - stub_seconds(stats, method)
+            data[name] = {"summary": summary, "stub": stats}
+            lines.append(format_summary(f"{mode} {name}", summary))
+            lines.append(f"替身会话: 新建 {stats['sessions']['opened']} 个（{iterations} 次请求）")
+            lines.append(f"代理开销（平均延迟 - 替身处理耗时）: {overhead * 1000:.1f}毫秒")
+        text = "\n".join(lines)
+        print(text)
+        allure.attach(text, name=f"{mode}代理开销", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(data, indent=2), name=f"{mode}代理开销数据", attachment_type=allure.attachment_type.JSON)
+
+    @allure.title("工具调用：注入延迟与抖动")
+    @pytest.mark.parametrize("mode", MODES)
+    def test_injected_latency(self, mode, stub, Headers):
+        '''注入固定延迟后，客户端延迟应整体平移，代理开销保持不变'''
+        mcp_id = mcp_ids[mode]
+        rows = []
+        for latency, jitter in ((0, 0), (injected_latency_ms, 0), (injected_latency_ms, injected_latency_ms / 2)):
+            stub.configure(latency_ms=latency, jitter_ms=jitter, fault_methods="tools/call")
+            stub.reset()
+            summary, failures = measure(lambda: client.CallMCPtool(mcp_id, call_data(), Headers), iterations)
+            assert not failures, f"{mode} 注入延迟 {latency}±{jitter}毫秒时调用失败: {failures[:3]}"
+            stats = stub.stats()
+            rows.append({"latency_ms": latency, "jitter_ms": jitter, "summary": summary,
+                         "overhead": summary["avg"] - stub_seconds(stats, "tools/call")})
+        stub.configure(latency_ms=0, jitter_ms=0, fault_methods="tools/call,tools/list")
+
+        text = "\n".join(f"{mode} 注入 {r['latency_ms']:.0f}+[0,{r['jitter_ms']:.0f})毫秒: "
+                         f"P50 {r['summary']['p50']:.3f}秒, P99 {r['summary']['p99']:.3f}秒, "
+                         f"代理开销 {r['overhead'] * 1000:.1f}毫秒" for r in rows)
+        print(text)
+        allure.attach(text, name=f"{mode}注入延迟", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(rows, indent=2), name=f"{mode}注入延迟数据", attachment_type=allure.attachment_type.JSON)
+        assert rows[1]["summary"]["min"] >= injected_latency_ms / 1000, "客户端延迟低于注入延迟，替身未生效"
+
+    @allure.title("工具调用：慢速流、断连与错误故障")
+    @pytest.mark.parametrize("mode", MODES)
+    def test_faults(self, mode, stub, Headers):
+        '''
+        记录各类故障下被测服务的返回与耗时，不约定具体错误码；
+        故障解除后调用需恢复成功，确认故障不会残留在被测服务的连接或会话中
+        '''
+        mcp_id = mcp_ids[mode]
+        count = max(1, iterations // 5)
+        faults = {
+            "慢速流": {"slow_stream_ms": 50, "stream_chunk_size": 64},
+            "断连": {"disconnect_rate": 1.0},
+            "错误": {"error_rate": 1.0}
+        }
+        rows = []
+        for name, params in faults.items():
+            stub.configure(**params)
+            stub.reset()
+            summary, failures = measure(lambda: client.CallMCPtool(mcp_id, call_data(), Headers), count)
+            stats = stub.stats()
+            stub.configure(slow_stream_ms=0, disconnect_rate=0, error_rate=0)
+            recovered, recover_failures = measure(lambda: client.CallMCPtool(mcp_id, call_data(), Headers), count)
+            rows.append({
+                "fault": name,
+                "summary": summary,
+                "responses": sorted({str(f[0]) for f in failures}),
+                # 客户端重试会使替身收到的调用数多于请求数
+                "stub_calls": stats["methods"].get("tools/call", {}).get("count", 0),
+                "stub_faults": stats["faults"],
+                "recovered": recovered
+            })
+            assert not recover_failures, f"{mode} {name}故障解除后调用仍失败: {recover_failures[:3]}"
+
+        lines = []
+        for r in rows:
+            lines.append(f"{mode} {r['fault']}: 失败 {r['summary']['errors']}/{count}, 状态码 {r['responses']}, "
+                         f"P50 {r['summary']['p50']:.3f}秒, 最大 {r['summary']['max']:.3f}秒, "
+                         f"替身收到调用 {r['stub_calls']} 次, 故障计数 {r['stub_faults']}; "
+                         f"恢复后 P50 {r['recovered']['p50']:.3f}秒")
+        text = "\n".join(lines)
+        print(text)
+        allure.attach(text, name=f"{mode}故障注入", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(rows, indent=2), name=f"{mode}故障注入数据", attachment_type=allure.attachment_type.JSON)
@@ -0,0 +1,129 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import time
+import pytest
+
+from common.get_content import GetContent
+from common.openapi_generator import generate_spec
+from common.perf_chart import attach_line_chart
+from common.perf_stats import percentile
+from lib.operator import Operator
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 每个取值重复注册次数（每次使用不同种子，结构相同、名称不同）
+openapi_repeats = config.getint("performance", "openapi_scaling_repeats", fallback=5)
+openapi_seed = config.getint("performance", "openapi_scaling_seed", fallback=20240601)
+
+# 基准维度，扫描某一维度时其余维度保持基准值
+BASE_DIMENSIONS = {
+    "paths": 10,
+    "methods": 1,
+    "depth": 2,
+    "fanout": 2,
+    "schemas": 5,
+    "properties": 4,
+    "enum_size": 0,
+    "string_length": 32
+}
+
+# 扫描维度：维度 -> (取值列表, 图表名称)
+SWEEP_DIMENSIONS = {
+    "paths": ([1, 10, 50, 100, 200], "路径数"),
+    "depth": ([1, 2, 4, 6, 8], "组件嵌套层数"),
+    "fanout": ([1, 2, 4, 8], "$ref扇出"),
+    "enum_size": ([0, 10, 100, 1000], "枚举值数量"),
+    "string_length": ([16, 256, 1024, 4096], "描述文本长度")
+}
+
+
+@allure.feature("算子注册性能测试：OpenAPI 规模扩展")
+class TestOpenAPIScalingPerformance:
+    '''使用合成 OpenAPI 文档逐一扫描各维度，观察解析与注册延迟、服务内存随规模的变化'''
+    client = Operator()
+    registered = []
+
+    @pytest.fixture(scope="class", autouse=True)
+    def cleanup(self, Headers):
+        yield
+        # 分批删除本次注册的算子
+        for i in range(0, len(self.registered), 100):
+            self.client.DeleteOperator(self.registered[i:i + 100], Headers)
+
+    def register_level(self, dimension, value, headers, sampler):
+        '''注册某一维度取值下的文档，返回延迟统计与该时间窗口内的服务内存峰值'''
+        dims = dict(BASE_DIMENSIONS, **{dimension: value})
+        latencies = []
+        statuses = []
+        size = 0
+        start = time.time()
+        for i in range(openapi_repeats):
+            _, content = generate_spec(seed=openapi_seed + i, **dims)
+            size = len(content.encode("utf-8"))
+            data = {
+                "data": content,
+                "operator_metadata_type": "openapi",
+                "operator_info": {
+                    "category": "data_process"
+                }
+            }
+            begin = time.perf_counter()
+            result = self.client.RegisterOperator(data, headers)
+            latencies.append(time.perf_counter() - begin)
+            statuses.append(result[0])
+            if result[0] == 200:
+                self.registered.extend({"operator_id": op["operator_id"], "version": op["version"]}
+                                       for op in result[1] if op.get("status") == "success")
+        row = {
+            "value": value,
+            "bytes": size,
+            "operations": dims["paths"] * dims["methods"],
+            "median": percentile(latencies, 50),
+            "p99": percentile(latencies, 99),
+            "statuses": sorted(set(statuses))
+        }
+        if sampler.enabled:
+            sampler.sample_once()
+            window = [s for s in sampler.samples if s["timestamp"] >= start]
+            for field in ("heap_inuse_bytes", "rss_bytes"):
+                values = [s[field] for s in window if field in s]
+                if values:
+                    row[f"peak_{field}"] = max(values)
+        return row
+
+    @allure.title("OpenAPI 规模扩展：逐维度扫描注册延迟与服务内存")
+    @pytest.mark.parametrize("dimension", list(SWEEP_DIMENSIONS))
+    def test_openapi_scaling(self, dimension, Headers, ResourceSampling):
+        values, label = SWEEP_DIMENSIONS[dimension]
+        rows = [self.register_level(dimension, value, Headers, ResourceSampling) for value in values]
+
+        lines = [f"OpenAPI {label}扫描（其余维度: {json.dumps(BASE_DIMENSIONS)}）:"]
+        for row in rows:
+            memory = ""
+            if "peak_heap_inuse_bytes" in row:
+                memory += f", 堆内存峰值 {row['peak_heap_inuse_bytes'] / 1024 / 1024:.1f}MB"
+            if "peak_rss_bytes" in row:
+                memory += f", RSS峰值 {row['peak_rss_bytes'] / 1024 / 1024:.1f}MB"
+            lines.append(f"{label}={row['value']}: 文档 {row['bytes'] / 1024:.1f}KB, "
+                         f"中位延迟 {row['median']:.3f}秒, P99延迟 {row['p99']:.3f}秒, 状态码 {row['statuses']}{memory}")
+        text = "\n".join(lines)
+        print(text)
+        allure.attach(text, name=f"{label}扫描", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(rows, indent=2), name=f"{label}扫描数据", attachment_type=allure.attachment_type.JSON)
+        attach_line_chart(
+            {
+                "中位延迟": [(row["value"], row["median"]) for row in rows],
+                "P99延迟": [(row["value"], row["p99"]) for row in rows]
+            },
+            f"注册延迟-{label}曲线", label, "延迟(秒)")
+        for field, title in (("peak_heap_inuse_bytes", "堆内存峰值(MB)"), ("peak_rss_bytes", "RSS峰值(MB)")):
+            points = [(row["value"], row[field] / 1024 / 1024) for row in rows if field in row]
+            if points:
+                attach_line_chart({title: points}, f"服务内存-{label}曲线", label, title)
+
+        # 超出文档大小限制时返回 400 属于预期，其余状态码视为失败
+        failed = [row for row in rows if set(row["statuses"]) - {200, 400}]
+        assert not failed, f"{label}扫描出现非预期状态码: {failed}"
@@ -0,0 +1,126 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import pytest
+
+from common.get_content import GetContent
+from common.get_token import GetToken
+from common.pagination_sweep import sample_pages, sweep, linear_fit, find_cliff
+from common.perf_chart import attach_line_chart
+from lib.operator import Operator
+from lib.tool_box import ToolBox
+from lib.mcp import MCP
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 深分页扫描参数，可在 env.ini 的 [performance] 段覆盖
+page_size = config.getint("performance", "pagination_page_size", fallback=100)
+sweep_points = config.getint("performance", "pagination_sweep_points", fallback=20)
+sweep_repeats = config.getint("performance", "pagination_repeats", fallback=3)
+# 用于对比可见资源数的用户列表（逗号分隔的用户名），为空时只扫描当前用户
+sweep_users = [u.strip() for u in config.get("performance", "pagination_users", fallback="").split(",") if u.strip()]
+
+op_client = Operator()
+tb_client = ToolBox()
+mcp_client = MCP()
+
+# 被扫描的列表接口：名称 -> 查询函数
+ENDPOINTS = {
+    "/operator/info/list": op_client.GetOperatorList,
+    "/operator/market": op_client.GetOperatorMarketList,
+    "/tool-box/list": tb_client.GetToolboxList,
+    "/tool-box/market/tools": tb_client.GetMarketToolsList,
+    "/mcp/list": mcp_client.GetMCPList
+}
+
+
+def user_headers(user):
+    host = config["server"]["host"]
+    password = config.get("user", "default_password", fallback="111111")
+    token = GetToken(host=host).get_token(host, user, password)
+    return {
+        "Authorization": f"Bearer {token[1]}",
+        "x-business-domain": "bd_public"
+    }
+
+
+@allure.feature("列表接口性能测试：深分页扫描")
+class TestPaginationSweepPerformance:
+
+    @allure.title("深分页扫描：延迟随偏移量变化")
+    @pytest.mark.parametrize("endpoint", list(ENDPOINTS))
+    def test_offset_sweep(self, endpoint, Headers):
+        '''从首页扫描到末页，拟合延迟与偏移量的线性关系，判断是否存在 O(offset) 退化和延迟突增'''
+        func = lambda params: ENDPOINTS[endpoint](params, Headers)
+        result = func({"page": 1, "page_size": page_size})
+        assert result[0] == 200, f"{endpoint} 查询失败: {result}"
+        total = result[1]["total"]
+        total_pages = max(1, result[1]["total_pages"])
+
+        results = sweep(func, {}, page_size, sample_pages(total_pages, sweep_points), sweep_repeats)
+        failed = [r for r in results if r["status"] != 200]
+        assert not failed, f"{endpoint} 部分页码查询失败: {failed}"
+
+        points = [(r["offset"], r["median"]) for r in results]
+        intercept, slope, r2 = linear_fit(points)
+        max_offset = results[-1]["offset"]
+        growth = slope * max_offset / intercept if intercept > 0 else 0.0
+        cliff = find_cliff(points)
+        report = (f"{endpoint} 深分页扫描（总数 {total}，每页 {page_size}，共 {total_pages} 页）:\n" +
+                  f"首页中位延迟: {results[0]['median']:.3f}秒\n" +
+                  f"末页中位延迟: {results[-1]['median']:.3f}秒\n" +
+                  f"线性拟合: 每万条偏移增加 {slope * 10000 * 1000:.2f}毫秒, R²={r2:.3f}\n" +
+                  f"末页相对首页增长: {growth * 100:.1f}%{'（疑似 O(offset) 退化）' if growth > 0.5 and r2 > 0.8 else ''}\n" +
+                  f"延迟突增点: {'无' if cliff is None else f'偏移 {cliff[0]}，{cliff[1]:.3f}秒'}")
+        print(report)
+        allure.attach(report, name=f"{endpoint}深分页扫描", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(results, indent=2), name=f"{endpoint}深分页扫描数据",
+                      attachment_type=allure.attachment_type.JSON)
+        attach_line_chart(
+            {
+                "中位延迟": points,
+                "P99延迟": [(r["offset"], r["p99"]) for r in results],
+                "线性拟合": [(0, intercept), (max_offset, intercept + slope * max_offset)]
+            },
+            f"{endpoint}延迟-偏移量曲线", "偏移量(条)", "延迟(秒)")
+
+    @allure.title("深分页扫描：延迟随用户可见资源数变化")
+    def test_visible_resources_sweep(self, Headers):
+        '''不同用户可见资源数不同，对比首页与末页延迟，定位权限过滤的性能拐点'''
+        users = [(u, user_headers(u)) for u in sweep_users] or [("A0", Headers)]
+        data = {endpoint: [] for endpoint in ENDPOINTS}
+        for user, headers in users:
+            for endpoint, query in ENDPOINTS.items():
+                func = lambda params: query(params, headers)
+                result = func({"page": 1, "page_size": page_size})
+                assert result[0] == 200, f"{endpoint} 用户 {user} 查询失败: {result}"
+                total_pages = max(1, result[1]["total_pages"])
+                rows = sweep(func, {}, page_size, sorted({1, total_pages}), sweep_repeats)
+                data[endpoint].append({
+                    "user": user,
+                    "visible": result[1]["total"],
+                    "first_page": rows[0]["median"],
+                    "last_page": rows[-1]["median"]
+                })
+
+        lines = ["用户可见资源数与列表延迟:"]
+        for endpoint, rows in data.items():
+            rows.sort(key=lambda r: r["visible"])
+            for row in rows:
+                lines.append(f"{endpoint} 用户{row['user']}: 可见 {row['visible']} 条, "
+                             f"首页 {row['first_page']:.3f}秒, 末页 {row['last_page']:.3f}秒")
+            cliff = find_cliff([(r["visible"], r["first_page"]) for r in rows])
+            if cliff:
+                lines.append(f"{endpoint} 首页延迟在可见资源数 {cliff[0]} 处突增至 {cliff[1]:.3f}秒")
+        text = "\n".join(lines)
+        print(text)
+        allure.attach(text, name="可见资源数扫描", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(data, indent=2), name="可见资源数扫描数据", attachment_type=allure.attachment_type.JSON)
+        attach_line_chart(
+            {f"{endpoint}首页": [(r["visible"], r["first_page"]) for r in rows] for endpoint, rows in data.items()},
+            "首页延迟-可见资源数曲线", "可见资源数(条)", "延迟(秒)")
+        attach_line_chart(
+            {f"{endpoint}末页": [(r["visible"], r["last_page"]) for r in rows] for endpoint, rows in data.items()},
+            "末页延迟-可见资源数曲线", "可见资源数(条)", "延迟(秒)")
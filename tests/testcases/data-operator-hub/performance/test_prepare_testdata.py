@@ -1,11 +1,16 @@
 # -*- coding:UTF-8 -*-
 
 from datetime import datetime
+import copy
+import json
 import random
 import string
+import threading
 
 from common.get_content import GetContent
 from common.get_token import GetToken
+from common.distributions import profile_from_config
+from common.seed_pipeline import Checkpoint, RateLimiter, run_stage, chunks
 from lib.operator import Operator
 from lib.tool_box import ToolBox
 from lib.mcp import MCP
@@ -14,109 +19,185 @@ op_client = Operator()
 tb_client = ToolBox()
 mcp_client = MCP()
 
-def prepare_testdata():
-    """准备测试数据：注册并发布算子/工具/mcp"""
-    filepath = "./resource/openapi/compliant/test0.json"
-    api_data = GetContent(filepath).jsonfile()
-    # 定义所有可能的category
-    categories = [
-        "other_category",
-        "data_process",
-        "data_transform",
-        "data_store",
-        "data_analysis",
-        "data_query",
-        "data_extract",
-        "data_split",
-        "model_train"
-    ]
-    for i in range(1,101):
-        configfile = "./config/env.ini"
-        file = GetContent(configfile)
-        config = file.config()
-        host = config["server"]["host"]
-        user_password = config.get("user", "default_password", fallback="111111")
-        token = GetToken(host=host).get_token(host, str(i), user_password)
-        headers = {
-            "Authorization": f"Bearer {token[1]}"
-        }
-        # 注册1000个算子（每次10个，共100次）
-        for i in range(100):
-            # 修改每个路径下的summary字段避免重名
-            for path in api_data["paths"]:
-                for method in api_data["paths"][path]:
-                    if "summary" in api_data["paths"][path][method]:
-                        now = datetime.now()
-                        timestamp_seconds = now.timestamp()
-                        timestamp_millis = str(int(timestamp_seconds * 1000))
-                        name = ''.join(random.choice(string.ascii_letters+string.digits) for i in range(8))
-                        api_data["paths"][path][method]["summary"] = f"Test_operator_{name}_{timestamp_millis}"
-            
-            # 设置category（每次注册10个算子，确保均匀分布）
-            current_category = categories[i % len(categories)]          
-            
-            data = {
-                "data": str(api_data),
-                "operator_metadata_type": "openapi",
-                "operator_info": {
-                    "category": current_category
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 造数规模与并发参数，可在 env.ini 的 [performance] 段覆盖
+seed_users = config.getint("performance", "seed_users", fallback=100)
+seed_operator_batches = config.getint("performance", "seed_operator_batches", fallback=100)
+seed_toolboxes = config.getint("performance", "seed_toolboxes", fallback=1000)
+seed_mcps = config.getint("performance", "seed_mcps", fallback=1000)
+seed_workers = config.getint("performance", "seed_workers", fallback=8)
+seed_rate = config.getfloat("performance", "seed_rate", fallback=0) or None
+seed_publish_batch = config.getint("performance", "seed_publish_batch", fallback=100)
+seed_manifest = config.get("performance", "seed_manifest", fallback="./report/seed/manifest.jsonl")
+
+api_data = GetContent("./resource/openapi/compliant/test0.json").jsonfile()
+
+# 定义所有可能的category
+categories = [
+    "other_category",
+    "data_process",
+    "data_transform",
+    "data_store",
+    "data_analysis",
+    "data_query",
+    "data_extract",
+    "data_split",
+    "model_train"
+]
+
+# 造数分布：归属用户、分类、名称前缀与描述长度按 dist_* 参数倾斜，dist_skew = false 时为均匀分布
+users = [str(i) for i in range(1, seed_users + 1)]
+profile = profile_from_config(config, categories, users)
+profile_lock = threading.Lock()
+
+
+def draw(func, *args):
+    '''并发任务共用同一个随机数发生器，加锁避免同时抽样；各任务的抽样先后取决于调度，seed_workers > 1 时每次运行的结果不保证相同'''
+    with profile_lock:
+        return func(*args)
+
+
+class UserTokens():
+    '''按用户缓存 token，过期（401）时重新获取'''
+    def __init__(self):
+        self.host = config["server"]["host"]
+        self.password = config.get("user", "default_password", fallback="111111")
+        self.headers = {}
+        self.lock = threading.Lock()
+
+    def get(self, user):
+        with self.lock:
+            if user not in self.headers:
+                token = GetToken(host=self.host).get_token(self.host, user, self.password)
+                self.headers[user] = {
+                    "Authorization": f"Bearer {token[1]}"
                 }
-            }
-            result = op_client.RegisterOperator(data, headers)
-            assert result[0] == 200
-            operators = result[1]            
-            # 处理每个算子
-            for operator in operators:
-                if operator["status"] == "success":       
-                    update_data = [{
-                        "operator_id": operator["operator_id"],
-                        "version": operator["version"],
-                        "status": "published"
-                    }]
-                    re = op_client.UpdateOperatorStatus(update_data, headers)
-                    assert re[0] == 200 
-        # 创建1000个工具箱并发布
-        for i in range(1000):
-            now = datetime.now()
-            timestamp_seconds = now.timestamp()
-            timestamp_millis = str(int(timestamp_seconds * 1000))
-            name = "toolbox_" + ''.join(random.choice(string.ascii_letters+string.digits) for i in range(8)) + timestamp_millis
-            data = {
-                "box_name": name,
-                "data": api_data,
-                "metadata_type": "openapi"
-            }
-            result = tb_client.CreateToolbox(data, headers)
-            assert result[0] == 200
-            box_id = result[1]["box_id"]
-            # 发布工具箱
-            update_data = {
-                "status": "published"
-            }
-            re = tb_client.UpdateToolboxStatus(box_id, update_data, headers)
-            assert re[0] == 200
-        # 注册1000个mcp并发布
-        for i in range(1000):
-            now = datetime.now()
-            timestamp_seconds = now.timestamp()
-            timestamp_millis = str(int(timestamp_seconds * 1000))
-            name = "mcp_" + ''.join(random.choice(string.ascii_letters+string.digits) for i in range(8)) + timestamp_millis
-            data = {
-                "name": name,
-                "description": "test mcp server",
-                "mode": "sse",
-                "url": "https://mcp.map.baidu.com/sse?ak=bW9A9vyhGcYmdKRvWJCkySpekiBUTeUL",
-                "source": "custom",
-                "category": "data_analysis"
-            }
-            result = mcp_client.RegisterMCP(data, headers)
-            assert result[0] == 200
-            mcp_id = result[1]["mcp_id"]
-            update_data = {
-                "status": "published"
-            }
-            result = mcp_client.MCPReleaseAction(mcp_id, update_data, headers)
-            assert result[0] == 200
+            return self.headers[user]
+
+    def invalidate(self, user):
+        with self.lock:
+            self.headers.pop(user, None)
+
+
+tokens = UserTokens()
+
+
+def call(user, func, *args):
+    '''以指定用户身份调用接口，非 200 时抛出异常交由流水线重试'''
+    result = func(*args, tokens.get(user))
+    if result[0] == 401:
+        tokens.invalidate(user)
+    if result[0] != 200:
+        raise RuntimeError(f"{func.__name__} 返回 {result[0]}: {result[1]}")
+    return result[1]
+
+
+def unique_name(prefix):
+    '''共享前缀名称（如 sales_export_k3jd9a）加毫秒时间戳避免重名，prefix 只在均匀分布时使用'''
+    timestamp_millis = str(int(datetime.now().timestamp() * 1000))
+    if profile.skew:
+        return draw(profile.name, "_" + timestamp_millis)
+    return prefix + ''.join(random.choice(string.ascii_letters + string.digits) for i in range(8)) + timestamp_millis
+
+
+def register_operators(user, index):
+    '''注册一批算子（test0.json 中的全部接口），修改每个路径下的 summary 字段避免重名'''
+    data = copy.deepcopy(api_data)
+    for path in data["paths"]:
+        for method in data["paths"][path]:
+            if "summary" in data["paths"][path][method]:
+                data["paths"][path][method]["summary"] = unique_name("Test_operator_")
+    result = call(user, op_client.RegisterOperator, {
+        "data": str(data),
+        "operator_metadata_type": "openapi",
+        "operator_info": {
+            # 设置category（每次注册的一批算子同属一个分类，分类热度按 Zipf 分布）
+            "category": draw(profile.next_category)
+        }
+    })
+    return [{"operator_id": op["operator_id"], "version": op["version"]} for op in result if op["status"] == "success"]
+
+
+def publish_operators(user, operators):
+    '''通过接受列表的 /operator/status 接口批量发布'''
+    call(user, op_client.UpdateOperatorStatus, [dict(op, status="published") for op in operators])
+    return [op["operator_id"] for op in operators]
+
+
+def create_toolbox(user, index):
+    result = call(user, tb_client.CreateToolbox, {
+        "box_name": unique_name("toolbox_"),
+        "box_category": draw(profile.next_category),
+        "data": api_data,
+        "metadata_type": "openapi"
+    })
+    return [result["box_id"]]
+
+
+def publish_toolbox(user, box_id):
+    call(user, tb_client.UpdateToolboxStatus, box_id, {"status": "published"})
+    return [box_id]
+
+
+def register_mcp(user, index):
+    result = call(user, mcp_client.RegisterMCP, {
+        "name": unique_name("mcp_"),
+        "description": draw(profile.description),
+        "mode": "sse",
+        "url": "https://mcp.map.baidu.com/sse?ak=bW9A9vyhGcYmdKRvWJCkySpekiBUTeUL",
+        "source": "custom",
+        "category": draw(profile.next_category)
+    })
+    return [result["mcp_id"]]
+
+
+def publish_mcp(user, mcp_id):
+    call(user, mcp_client.MCPReleaseAction, mcp_id, {"status": "published"})
+    return [mcp_id]
+
+
+def prepare_testdata():
+    """
+    准备测试数据：注册并发布算子/工具/mcp
+    各阶段并发执行并共用限速器，每完成一个任务写入检查点清单，中断后重新运行从断点继续
+    各用户的资源数按 profile.owners 倾斜分配（总量不变），分配结果由 dist_seed 决定，续跑时任务编号保持一致
+    """
+    print(f"数据分布: {json.dumps(profile.summary(), ensure_ascii=False)}")
+    checkpoint = Checkpoint(seed_manifest)
+    limiter = RateLimiter(seed_rate)
+    failures = {}
+
+    def stage(name, tasks, func):
+        failures[name] = run_stage(name, tasks, func, checkpoint, workers=seed_workers, limiter=limiter)
+
+    def tasks_by_owner(total):
+        return [(u, i, i) for u, count in profile.owners(total).items() for i in range(count)]
+
+    # 注册算子，共 seed_users * seed_operator_batches 次，每次注册 test0.json 中的全部接口
+    stage("register_operator", tasks_by_owner(seed_users * seed_operator_batches), register_operators)
+    # 批量发布：以批次首个算子 ID 作为任务标识，续跑时只发布尚未发布的算子
+    tasks = []
+    for u in users:
+        published = set(checkpoint.ids(u, "publish_operator"))
+        pending = [op for op in checkpoint.ids(u, "register_operator") if op["operator_id"] not in published]
+        tasks.extend((u, batch[0]["operator_id"], batch) for batch in chunks(pending, seed_publish_batch))
+    stage("publish_operator", tasks, publish_operators)
+
+    stage("create_toolbox", tasks_by_owner(seed_users * seed_toolboxes), create_toolbox)
+    stage("publish_toolbox", [(u, box_id, box_id) for u in users
+                              for box_id in checkpoint.ids(u, "create_toolbox")], publish_toolbox)
+
+    stage("register_mcp", tasks_by_owner(seed_users * seed_mcps), register_mcp)
+    stage("publish_mcp", [(u, mcp_id, mcp_id) for u in users
+                          for mcp_id in checkpoint.ids(u, "register_mcp")], publish_mcp)
+    checkpoint.close()
+
+    failed = {name: items for name, items in failures.items() if items}
+    if failed:
+        print(json.dumps({name: items[:10] for name, items in failed.items()}, ensure_ascii=False, indent=2))
+    assert not failed, f"造数存在失败任务，重新运行将从检查点继续: { {k: len(v) for k, v in failed.items()} }"
 
 if __name__ == '__main__':
-    prepare_testdata()
\ No newline at end of file
+    prepare_testdata()
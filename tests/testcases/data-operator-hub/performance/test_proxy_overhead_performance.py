@@ -0,0 +1,322 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import random
+import string
+import threading
+import time
+import pytest
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from common.echo_upstream_server import ECHO_PATH, upstream_from_config
+from common.get_content import GetContent
+from common.perf_chart import attach_line_chart
+from common.perf_stats import percentile, summarize
+from lib.operator import Operator
+from lib.operator_internal import InternalOperator
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+UNITS = {"KB": 1024, "MB": 1024 * 1024}
+
+
+def parse_size(text):
+    '''解析 1KB / 10MB 形式的大小，返回字节数'''
+    text = text.strip().upper()
+    for unit, factor in UNITS.items():
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * factor)
+    return int(text)
+
+
+def format_size(size):
+    return f"{size / UNITS['MB']:g}MB" if size >= UNITS["MB"] else f"{size / UNITS['KB']:g}KB"
+
+
+# 代理开销测试参数，可在 env.ini 的 [performance] 段覆盖
+payload_sizes = [parse_size(s) for s in
+                 config.get("performance", "proxy_payload_sizes", fallback="1KB,64KB,1MB,10MB,50MB").split(",")]
+proxy_calls = config.getint("performance", "proxy_overhead_calls", fallback=100)
+proxy_budget_mb = config.getint("performance", "proxy_overhead_budget_mb", fallback=500)
+proxy_concurrency = config.getint("performance", "proxy_overhead_concurrency", fallback=16)
+proxy_ceiling_concurrency = [int(n) for n in
+                             config.get("performance", "proxy_ceiling_concurrency", fallback="1,8,32,64").split(",")]
+proxy_ceiling_calls = config.getint("performance", "proxy_ceiling_calls", fallback=1000)
+proxy_timeout = config.getint("performance", "proxy_overhead_timeout", fallback=300)
+proxy_pool_calls = config.getint("performance", "proxy_pool_calls", fallback=500)
+proxy_pool_min_reuse = config.getfloat("performance", "proxy_pool_min_reuse", fallback=0.9)
+stats_url = config.get("performance", "sampler_stats_url", fallback="")
+
+ROUTES = ["直连上游", "算子代理", "工具代理"]
+
+local = threading.local()
+
+
+def session():
+    '''每个线程复用各自的连接池会话，避免建连耗时计入延迟'''
+    if not hasattr(local, "session"):
+        local.session = requests.Session()
+    return local.session
+
+
+def post(url, body, headers):
+    '''发送已序列化的请求体，返回 (状态码, 响应内容, 延迟, 请求字节数)；大请求体不经 lib 层，避免写入 allure 附件'''
+    begin = time.perf_counter()
+    try:
+        resp = session().post(url, data=body, headers=headers, verify=False, timeout=proxy_timeout)
+        return resp.status_code, resp.content, time.perf_counter() - begin, len(body)
+    except requests.RequestException as e:
+        return 0, str(e).encode(), time.perf_counter() - begin, len(body)
+
+
+def calls_for(size):
+    '''大请求体按流量预算减少调用次数，至少 3 次'''
+    return max(3, min(proxy_calls, proxy_budget_mb * UNITS["MB"] // (size * 2)))
+
+
+def direct_bytes(rows, size):
+    '''同一请求体直连上游时客户端收发的字节数'''
+    return next(r["client_bytes"] for r in rows if r["route"] == "直连上游" and r["size"] == size)
+
+
+def pool_stats():
+    '''被测服务 /health/stats 中的代理客户端池统计'''
+    return requests.get(stats_url, verify=False, timeout=5).json().get("proxy_pool")
+
+
+def host_stats(pool, host):
+    '''客户端池统计中某个上游（host:port）的连接统计，未出现时各项按 0 计'''
+    empty = {"requests": 0, "reused": 0, "dials": 0, "open": 0, "active": 0, "idle": 0}
+    return next((h for h in pool["hosts"] if h["host"] == host), empty)
+
+
+@allure.feature("代理性能测试：本地回显上游的代理开销")
+class TestProxyOverheadPerformance:
+    '''
+    本地异步回显上游（common/echo_upstream_server.py）分别注册为算子与工具箱，同一请求体依次
+    直连上游、经 /operator/proxy/{id}、经 /tool-box/{box}/proxy/{tool} 调用，对比：
+    代理增加的 P50/P99 延迟、固定并发下的吞吐、各段链路传输的字节数，以及小请求体下不同并发的吞吐上限
+    被测服务需能访问 echo_upstream_advertise_host:echo_upstream_port
+    '''
+    op_client = Operator()
+    internal_client = InternalOperator()
+    tb_client = ToolBox()
+
+    @pytest.fixture(scope="class")
+    def upstream(self, Headers, UserHeaders):
+        '''启动回显上游，注册并发布算子与工具箱；被测服务无法访问上游时跳过'''
+        upstream = upstream_from_config(config).start()
+        spec = upstream.spec(paths=[ECHO_PATH])
+        name = "proxy_echo_" + ''.join(random.choice(string.ascii_lowercase) for i in range(8))
+
+        result = self.op_client.RegisterOperator({
+            "data": json.dumps(spec), "operator_metadata_type": "openapi", "direct_publish": True,
+            "operator_info": {"category": "other_category"}
+        }, Headers)
+        assert result[0] == 200, f"注册算子失败: {result}"
+        operator_id, version = result[1][0]["operator_id"], result[1][0]["version"]
+
+        result = self.tb_client.CreateToolbox({"box_name": name, "data": spec, "metadata_type": "openapi"}, Headers)
+        assert result[0] == 200, f"创建工具箱失败: {result}"
+        box_id = result[1]["box_id"]
+        result = self.tb_client.UpdateToolbox(box_id, {
+            "box_name": name, "box_desc": "proxy overhead test toolbox", "box_svc_url": upstream.base_url(),
+            "box_icon": "icon-color-tool-FADB14", "box_category": "data_process", "metadata_type": "openapi"
+        }, Headers)
+        assert result[0] == 200, f"更新工具箱失败: {result}"
+        result = self.tb_client.GetBoxToolsList(box_id, {"page_size": 20}, Headers)
+        tool_id = result[1]["tools"][0]["tool_id"]
+        self.tb_client.UpdateToolStatus(box_id, [{"tool_id": tool_id, "status": "enabled"}], Headers)
+        self.tb_client.UpdateToolboxStatus(box_id, {"status": "published"}, Headers)
+
+        upstream.routes = {
+            "直连上游": (upstream.url(), {"Content-Type": "application/json"}, False),
+            "算子代理": (f"{self.internal_client.base_url}/proxy/{operator_id}",
+                         dict(UserHeaders, **{"Content-Type": "application/json"}), True),
+            "工具代理": (f"{self.tb_client.base_url}/{box_id}/proxy/{tool_id}",
+                         dict(Headers, **{"Content-Type": "application/json"}), True)
+        }
+        status, content = self.call(upstream, "算子代理", self.body(1024, True))[:2]
+        if upstream.stats()["counts"]["requests"] == 0:
+            upstream.stop()
+            pytest.skip(f"被测服务未调用本地回显上游，请确认其可访问 {upstream.base_url()}（响应 {status}: {content[:200]}）")
+
+        yield upstream
+
+        upstream.stop()
+        self.op_client.UpdateOperatorStatus([{"operator_id": operator_id, "status": "offline"}], Headers)
+        self.op_client.DeleteOperator([{"operator_id": operator_id, "version": version}], Headers)
+        self.tb_client.UpdateToolboxStatus(box_id, {"status": "offline"}, Headers)
+        self.tb_client.DeleteToolbox(box_id, Headers)
+
+    @staticmethod
+    def body(size, proxied):
+        '''约 size 字节的请求体；经代理时包装为 {header, body, timeout}'''
+        data = {"data": "x" * max(0, size - 12)}
+        if proxied:
+            data = {"header": {"Content-Type": "application/json"}, "body": data, "timeout": proxy_timeout}
+        return json.dumps(data).encode()
+
+    @staticmethod
+    def call(upstream, route, body):
+        url, headers, _ = upstream.routes[route]
+        return post(url, body, headers)
+
+    @staticmethod
+    def check(route, result, size):
+        '''校验回显结果：直连时响应即请求体，代理时为 {status_code, body, duration_ms}，返回上游耗时（秒）'''
+        status, content = result[:2]
+        if status != 200:
+            return False, None
+        data = json.loads(content)
+        if route == "直连上游":
+            return len(data.get("data", "")) == max(0, size - 12), None
+        echoed = data.get("body") or {}
+        ok = data.get("status_code") == 200 and isinstance(echoed, dict) and len(echoed.get("data", "")) == max(0, size - 12)
+        return ok, data.get("duration_ms", 0) / 1000.0
+
+    def measure(self, upstream, route, size, calls, concurrency):
+        '''concurrency 个线程共调用 calls 次，返回统计与各段链路字节数'''
+        body = self.body(size, upstream.routes[route][2])
+        upstream.reset()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda i: self.call(upstream, route, body), range(calls)))
+        elapsed = time.perf_counter() - start
+        checks = [self.check(route, r, size) for r in results]
+        counts = upstream.stats()["counts"]
+        summary = summarize([r[2] for r in results], sum(1 for ok, _ in checks if not ok), elapsed)
+        bytes_client = sum(r[3] + len(r[1]) for r in results)
+        upstream_times = [t for ok, t in checks if ok and t is not None]
+        return {
+            "route": route, "size": size, "calls": calls, "concurrency": concurrency, "summary": summary,
+            "upstream_p50": percentile(upstream_times, 50) if upstream_times else None,
+            "client_bytes": bytes_client,
+            # 直连时客户端即上游的对端，代理时上游收发的是被测服务转发的字节
+            "upstream_bytes": 0 if route == "直连上游" else counts["bytes_in"] + counts["bytes_out"],
+            "mb_per_second": bytes_client / UNITS["MB"] / elapsed if elapsed else 0.0,
+            "error_samples": [(r[0], r[1][:200].decode(errors="replace")) for r, c in zip(results, checks) if not c[0]][:3]
+        }
+
+    @allure.title("代理开销：不同请求体大小下代理增加的延迟、吞吐与传输字节")
+    def test_proxy_overhead(self, upstream, PerfReport):
+        '''每种请求体先顺序调用测延迟，再以 proxy_overhead_concurrency 并发测吞吐；响应为请求体的回显'''
+        rows = []
+        for size in payload_sizes:
+            calls = calls_for(size)
+            for route in ROUTES:
+                self.call(upstream, route, self.body(size, upstream.routes[route][2]))
+                latency = self.measure(upstream, route, size, calls, 1)
+                throughput = self.measure(upstream, route, size, calls, proxy_concurrency)
+                rows.append(dict(latency, throughput=throughput["summary"]["throughput"],
+                                 mb_per_second=throughput["mb_per_second"],
+                                 errors=latency["summary"]["errors"] + throughput["summary"]["errors"],
+                                 error_samples=latency["error_samples"] + throughput["error_samples"]))
+
+        direct = {r["size"]: r["summary"] for r in rows if r["route"] == "直连上游"}
+        lines = [f"请求体与响应体同为回显大小，顺序调用测延迟，{proxy_concurrency} 并发测吞吐:"]
+        for r in rows:
+            s, base = r["summary"], direct[r["size"]]
+            r["added_p50"] = s["p50"] - base["p50"]
+            r["added_p99"] = s["p99"] - base["p99"]
+            line = (f"{format_size(r['size'])} {r['route']}: P50 {s['p50'] * 1000:.1f}毫秒, P99 {s['p99'] * 1000:.1f}毫秒, "
+                    f"吞吐 {r['throughput']:.1f} 次/秒 ({r['mb_per_second']:.1f}MB/秒), "
+                    f"每次客户端收发 {r['client_bytes'] / r['calls'] / 1024:.1f}KB, 失败 {r['errors']}")
+            if r["route"] != "直连上游":
+                line += (f", 代理增加 P50 {r['added_p50'] * 1000:.1f}毫秒 P99 {r['added_p99'] * 1000:.1f}毫秒, "
+                         f"上游收发 {r['upstream_bytes'] / r['calls'] / 1024:.1f}KB/次, "
+                         f"链路总字节为直连的 {(r['client_bytes'] + r['upstream_bytes']) / max(1, direct_bytes(rows, r['size'])):.2f} 倍")
+                if r["upstream_p50"] is not None:
+                    line += f", 服务端记录的上游耗时 P50 {r['upstream_p50'] * 1000:.1f}毫秒"
+            lines.append(line)
+        PerfReport("代理开销", "\n".join(lines), rows)
+        attach_line_chart({route: [(r["size"] / UNITS["KB"], r["added_p50"] * 1000) for r in rows if r["route"] == route]
+                           for route in ROUTES[1:]}, "代理增加的P50延迟-请求体大小曲线", "请求体(KB)", "增加的延迟(毫秒)")
+        attach_line_chart({route: [(r["size"] / UNITS["KB"], r["mb_per_second"]) for r in rows if r["route"] == route]
+                           for route in ROUTES}, "吞吐-请求体大小曲线", "请求体(KB)", "吞吐(MB/秒)")
+        for r in rows:
+            assert r["errors"] == 0, f"{format_size(r['size'])} {r['route']} 存在失败调用: {r['error_samples']}"
+
+    @allure.title("代理开销：小请求体下不同并发的吞吐上限")
+    def test_proxy_ceiling(self, upstream, PerfReport):
+        '''1KB 请求体、上游无延迟，逐级提高并发，吞吐不再增长的并发数即代理的吞吐上限'''
+        rows = []
+        for concurrency in proxy_ceiling_concurrency:
+            for route in ROUTES:
+                rows.append(self.measure(upstream, route, 1024, proxy_ceiling_calls, concurrency))
+        ceilings = {route: max((r for r in rows if r["route"] == route), key=lambda r: r["summary"]["throughput"])
+                    for route in ROUTES}
+        lines = [f"1KB 请求体，每组 {proxy_ceiling_calls} 次调用:"]
+        for r in rows:
+            s = r["summary"]
+            lines.append(f"并发 {r['concurrency']} {r['route']}: 吞吐 {s['throughput']:.1f} 次/秒, "
+                         f"P50 {s['p50'] * 1000:.1f}毫秒, P99 {s['p99'] * 1000:.1f}毫秒, 错误率 {s['error_rate'] * 100:.2f}%")
+        for route, r in ceilings.items():
+            lines.append(f"{route} 吞吐上限: {r['summary']['throughput']:.1f} 次/秒（并发 {r['concurrency']}）")
+        PerfReport("代理吞吐上限", "\n".join(lines), rows)
+        attach_line_chart({route: [(r["concurrency"], r["summary"]["throughput"]) for r in rows if r["route"] == route]
+                           for route in ROUTES}, "代理吞吐-并发数曲线", "并发数", "吞吐(次/秒)")
+        for r in rows:
+            assert r["summary"]["errors"] == 0, f"并发 {r['concurrency']} {r['route']} 存在失败调用: {r['error_samples']}"
+
+
+    @allure.title("代理开销：客户端池命中率与上游连接复用")
+    def test_proxy_pool_metrics(self, upstream, PerfReport):
+        '''
+        压测期间采样被测服务 /health/stats 的 proxy_pool：同一超时的调用应复用同一客户端，
+        发往回显上游的请求应复用空闲连接，新建连接数不超过并发数，压测结束后连接全部回到空闲
+        '''
+        if not stats_url:
+            pytest.skip("未配置 sampler_stats_url，无法获取代理客户端池统计")
+        before = pool_stats()
+        if before is None:
+            pytest.skip("被测服务 /health/stats 未返回 proxy_pool 统计")
+        host = urlsplit(upstream.base_url()).netloc
+        samples = []
+        stop = threading.Event()
+
+        def sample():
+            while not stop.wait(0.2):
+                samples.append(host_stats(pool_stats(), host))
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        try:
+            result = self.measure(upstream, "工具代理", 1024, proxy_pool_calls, proxy_concurrency)
+        finally:
+            stop.set()
+            sampler.join()
+        after = pool_stats()
+
+        delta = {k: after[k] - before[k] for k in ["hits", "misses", "evictions", "expired"]}
+        host_before, host_after = host_stats(before, host), host_stats(after, host)
+        host_delta = {k: host_after[k] - host_before[k] for k in ["requests", "reused", "dials"]}
+        reuse = host_delta["reused"] / host_delta["requests"] if host_delta["requests"] else 0.0
+        peak_open = max([s["open"] for s in samples] + [host_after["open"]])
+        peak_active = max([s["active"] for s in samples] + [host_after["active"]])
+        data = {"calls": proxy_pool_calls, "concurrency": proxy_concurrency, "pool_delta": delta,
+                "live_clients": after["live_clients"], "host": host, "host_delta": host_delta, "reuse": reuse,
+                "peak_open": peak_open, "peak_active": peak_active, "host_after": host_after,
+                "upstream_connections": upstream.stats()["counts"]["connections"], "summary": result["summary"]}
+        PerfReport("代理客户端池", (
+            f"{proxy_pool_calls} 次工具代理调用，{proxy_concurrency} 并发:\n"
+            f"客户端池 命中 {delta['hits']}, 未命中 {delta['misses']}, 淘汰 {delta['evictions']}, "
+            f"过期清理 {delta['expired']}, 当前客户端 {after['live_clients']}\n"
+            f"上游 {host}: 请求 {host_delta['requests']}, 复用连接 {host_delta['reused']} ({reuse * 100:.1f}%), "
+            f"新建连接 {host_delta['dials']}（上游收到 {data['upstream_connections']} 个连接）, "
+            f"压测中最多打开 {peak_open} 个、使用中 {peak_active} 个, "
+            f"结束后打开 {host_after['open']} 个、空闲 {host_after['idle']} 个"), data)
+
+        assert result["summary"]["errors"] == 0, f"存在失败调用: {result['error_samples']}"
+        assert delta["hits"] >= proxy_pool_calls - delta["misses"], f"同一超时的调用未复用客户端: {delta}"
+        assert delta["evictions"] == 0, f"压测期间有客户端被淘汰，max_clients 过小: {delta}"
+        assert host_delta["requests"] >= proxy_pool_calls, f"客户端池未统计到发往 {host} 的请求: {host_delta}"
+        assert reuse >= proxy_pool_min_reuse, f"上游连接复用率 {reuse:.2f} 低于 {proxy_pool_min_reuse}"
+        assert host_delta["dials"] <= proxy_concurrency, f"新建连接数超过并发数: {host_delta}"
+        assert host_after["active"] == 0 and host_after["idle"] >= 1, f"压测结束后连接未回到空闲: {host_after}"
@@ -0,0 +1,167 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import pytest
+import time
+
+from common.distributions import profile_from_config
+from common.get_content import GetContent
+from common.get_token import GetToken
+from common.perf_chart import attach_line_chart
+from common.perf_stats import percentile
+from lib.operator import Operator
+from lib.tool_box import ToolBox
+from lib.mcp import MCP
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 倾斜过滤测试参数，可在 env.ini 的 [performance] 段覆盖
+repeats = config.getint("performance", "skew_repeats", fallback=5)
+page_size = config.getint("performance", "skew_page_size", fallback=20)
+seed_users = config.getint("performance", "seed_users", fallback=100)
+
+categories = [
+    "other_category",
+    "data_process",
+    "data_transform",
+    "data_store",
+    "data_analysis",
+    "data_query",
+    "data_extract",
+    "data_split",
+    "model_train"
+]
+
+# 与造数使用相同的 dist_* 参数，重建出同样的热门分类、前缀和用户归属顺序
+users = [str(i) for i in range(1, seed_users + 1)]
+profile = profile_from_config(config, categories, users)
+
+op_client = Operator()
+tb_client = ToolBox()
+mcp_client = MCP()
+
+# 被测的列表接口：名称 -> 查询函数，均支持 category / name / create_user / sort_by 参数
+ENDPOINTS = {
+    "/operator/info/list": op_client.GetOperatorList,
+    "/operator/market": op_client.GetOperatorMarketList,
+    "/tool-box/market": tb_client.GetMarketToolboxList,
+    "/mcp/market": mcp_client.GetMCPMarketList
+}
+
+
+def probe(func, params, headers):
+    '''重复查询首页，返回匹配总数与延迟统计'''
+    query = dict(params, page=1, page_size=page_size)
+    latencies = []
+    total = 0
+    status = 200
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(query, headers)
+        latencies.append(time.perf_counter() - start)
+        if result[0] != 200:
+            status = result[0]
+        else:
+            total = result[1]["total"]
+    return {
+        "params": params,
+        "total": total,
+        "median": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "status": status
+    }
+
+
+def ranked_sample(items):
+    '''按热度排名抽样：前 3 名逐个取，其余按 2 的幂间隔，必含最冷的一个，返回 [(排名, 元素)]'''
+    ranks = set(range(min(3, len(items))))
+    rank = 4
+    while rank < len(items):
+        ranks.add(rank - 1)
+        rank *= 2
+    ranks.add(len(items) - 1)
+    return [(r, items[r]) for r in sorted(ranks)]
+
+
+def report(endpoint, title, rows, label):
+    '''输出最热与最冷取值的延迟对比，附加数据与延迟-匹配数曲线'''
+    failed = [r for r in rows if r["status"] != 200]
+    assert not failed, f"{endpoint} {title} 部分查询失败: {failed}"
+    hot, cold = rows[0], rows[-1]
+    lines = [f"{endpoint} {title}（数据分布: {json.dumps(profile.summary(), ensure_ascii=False)}）:"]
+    for r in rows:
+        lines.append(f"{label} {r['value']}: 匹配 {r['total']} 条, 中位 {r['median']:.3f}秒, P99 {r['p99']:.3f}秒")
+    ratio = hot["median"] / cold["median"] if cold["median"] > 0 else 0.0
+    lines.append(f"最热/最冷: 匹配数 {hot['total']}/{cold['total']}, 中位延迟比 {ratio:.2f}")
+    if not profile.skew:
+        lines.append("注意: dist_skew = false，数据为均匀分布，结果仅作对照基线")
+    text = "\n".join(lines)
+    print(text)
+    allure.attach(text, name=f"{endpoint}{title}", attachment_type=allure.attachment_type.TEXT)
+    allure.attach(json.dumps(rows, ensure_ascii=False, indent=2), name=f"{endpoint}{title}数据",
+                  attachment_type=allure.attachment_type.JSON)
+    points = sorted((r["total"], r["median"]) for r in rows)
+    attach_line_chart({"中位延迟": points, "P99延迟": sorted((r["total"], r["p99"]) for r in rows)},
+                      f"{endpoint}{title}延迟-匹配数曲线", "匹配数(条)", "延迟(秒)")
+
+
+@allure.feature("列表接口性能测试：倾斜数据分布下的过滤、搜索与排序")
+class TestSkewedFilterPerformance:
+    '''
+    需先以 dist_skew = true 造数（test_prepare_testdata 或 test_bulk_seed_testdata），
+    对比热门与冷门取值下的延迟，检验索引选择性对过滤、搜索和排序的影响
+    '''
+
+    @allure.title("分类过滤：热门分类与冷门分类")
+    @pytest.mark.parametrize("endpoint", list(ENDPOINTS))
+    def test_category_filter(self, endpoint, Headers):
+        rows = [dict(probe(ENDPOINTS[endpoint], {"category": c}, Headers), value=c, rank=r)
+                for r, c in enumerate(profile.hot_categories())]
+        report(endpoint, "分类过滤", rows, "分类")
+
+    @allure.title("名称搜索：高频共享前缀与低频前缀")
+    @pytest.mark.parametrize("endpoint", list(ENDPOINTS))
+    def test_name_prefix_search(self, endpoint, Headers):
+        # 末尾追加一个不存在的前缀，测量零匹配时的扫描代价
+        samples = ranked_sample(profile.hot_prefixes()) + [(len(profile.hot_prefixes()), "zz_nomatch")]
+        rows = [dict(probe(ENDPOINTS[endpoint], {"name": p}, Headers), value=p, rank=r) for r, p in samples]
+        report(endpoint, "名称前缀搜索", rows, "前缀")
+
+    @allure.title("创建人过滤：资源最多的用户与最少的用户")
+    @pytest.mark.parametrize("endpoint", list(ENDPOINTS))
+    def test_owner_filter(self, endpoint, Headers):
+        host = config["server"]["host"]
+        password = config.get("user", "default_password", fallback="111111")
+        rows = []
+        for rank, user in ranked_sample(profile.users):
+            user_id = GetToken(host=host).get_token(host, user, password)[0]
+            rows.append(dict(probe(ENDPOINTS[endpoint], {"create_user": user_id}, Headers), value=user, rank=rank))
+        report(endpoint, "创建人过滤", rows, "用户")
+
+    @allure.title("排序：热门分类、冷门分类与不过滤下的各排序字段")
+    @pytest.mark.parametrize("endpoint", list(ENDPOINTS))
+    def test_sort_with_filter(self, endpoint, Headers):
+        '''排序字段无法走过滤索引时需对全部匹配行排序，热门分类下代价最高'''
+        hot, cold = profile.hot_categories()[0], profile.hot_categories()[-1]
+        rows = []
+        for label, params in (("不过滤", {}), (f"热门分类 {hot}", {"category": hot}), (f"冷门分类 {cold}", {"category": cold})):
+            for sort_by in ("update_time", "create_time", "name"):
+                for sort_order in ("desc", "asc"):
+                    query = dict(params, sort_by=sort_by, sort_order=sort_order)
+                    rows.append(dict(probe(ENDPOINTS[endpoint], query, Headers), value=label))
+        failed = [r for r in rows if r["status"] != 200]
+        assert not failed, f"{endpoint} 排序查询失败: {failed}"
+        lines = [f"{endpoint} 排序性能:"]
+        for r in rows:
+            lines.append(f"{r['value']} sort_by={r['params']['sort_by']} {r['params']['sort_order']}: "
+                         f"匹配 {r['total']} 条, 中位 {r['median']:.3f}秒, P99 {r['p99']:.3f}秒")
+        slowest = max(rows, key=lambda r: r["median"])
+        lines.append(f"最慢组合: {slowest['value']} sort_by={slowest['params']['sort_by']} "
+                     f"{slowest['params']['sort_order']}，中位 {slowest['median']:.3f}秒")
+        text = "\n".join(lines)
+        print(text)
+        allure.attach(text, name=f"{endpoint}排序性能", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(rows, ensure_ascii=False, indent=2), name=f"{endpoint}排序性能数据",
+                      attachment_type=allure.attachment_type.JSON)
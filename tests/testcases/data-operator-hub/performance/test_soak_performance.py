@@ -0,0 +1,105 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import time
+
+from common.get_content import GetContent
+from common.perf_chart import attach_line_chart
+from common.resource_sampler import attach_resource_report
+from common.soak_monitor import run_soak, soak_report
+from lib.operator import Operator
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 浸泡测试参数，可在 env.ini 的 [performance] 段覆盖
+soak_duration = config.getint("performance", "soak_duration", fallback=3600)
+soak_workers = config.getint("performance", "soak_workers", fallback=10)
+soak_rate = config.getfloat("performance", "soak_rate", fallback=0) or None
+soak_min_change = config.getfloat("performance", "soak_min_change", fallback=0.2)
+soak_output_dir = config.get("performance", "soak_output_dir", fallback="./report/soak")
+
+
+@allure.feature("浸泡性能测试：时间序列记录与劣化趋势检测")
+class TestSoakPerformance:
+    op_client = Operator()
+    tb_client = ToolBox()
+
+    def soak(self, perf_report, name, func, sampler, is_success=None):
+        '''执行浸泡测试，输出 CSV 与折线图，并对延迟、吞吐、错误率做趋势检验'''
+        csv_path = f"{soak_output_dir}/{name}_{time.strftime('%Y%m%d%H%M%S')}.csv"
+        recorder = run_soak(func, csv_path, soak_duration, workers=soak_workers, rate=soak_rate, is_success=is_success)
+        # 资源采样与延迟序列对齐到同一时间起点，便于归因延迟尖刺
+        if sampler.enabled:
+            sampler.stop()
+            attach_resource_report(name, sampler, start=recorder.start, latency_points=recorder.series("p99"))
+            sampler.reported = True
+
+        text, checks = soak_report(name, recorder, min_change=soak_min_change)
+        perf_report(f"{name}趋势检验", text, checks)
+        allure.attach.file(csv_path, name=f"{name}时间序列", attachment_type=allure.attachment_type.CSV)
+        attach_line_chart(
+            {
+                "P50延迟": recorder.series("p50"),
+                "P90延迟": recorder.series("p90"),
+                "P99延迟": recorder.series("p99")
+            },
+            f"{name}延迟时间序列", "运行时间(秒)", "延迟(秒)")
+        attach_line_chart({"吞吐": recorder.series("throughput")}, f"{name}吞吐时间序列", "运行时间(秒)", "吞吐(次/秒)")
+        attach_line_chart({"错误率": recorder.series("error_rate")}, f"{name}错误率时间序列", "运行时间(秒)", "错误率")
+
+        degraded = [field for field, check in checks.items() if check["degraded"]]
+        assert not degraded, f"{name}浸泡测试检测到劣化趋势: {degraded}"
+
+    @allure.title("获取算子列表浸泡测试")
+    def test_get_operator_list_soak(self, Headers, ResourceSampling, PerfReport):
+        test_cases = [
+            {},
+            {"page_size": 50},
+            {"status": "published"},
+            {"category": "data_process"},
+            {"sort_by": "update_time", "sort_order": "desc"},
+            {"page": 2, "page_size": 20}
+        ]
+        self.soak(PerfReport, "获取算子列表",
+                  lambda i: self.op_client.GetOperatorList(test_cases[i % len(test_cases)], Headers), ResourceSampling)
+
+    @allure.title("工具执行代理浸泡测试，观察代理客户端池缓存")
+    def test_proxy_tool_soak(self, Headers, ResourceSampling, ProxyToolbox, PerfReport):
+        proxy_data = {
+            "header": Headers
+        }
+
+        def is_success(result):
+            return result[0] == 200 and isinstance(result[1], dict) and result[1].get("status_code") == 200
+
+        box_id, tool_id = ProxyToolbox["box_id"], ProxyToolbox["tool"]["tool_id"]
+        self.soak(PerfReport, "工具执行代理",
+                  lambda i: self.tb_client.ProxyTool(box_id, tool_id, proxy_data, Headers),
+                  ResourceSampling, is_success=is_success)
+
+    @allure.title("注册并发布算子浸泡测试，观察 outbox 消息扫描")
+    def test_register_publish_soak(self, Headers, ResourceSampling, PerfReport):
+        '''每次注册后立即发布，审计日志经 outbox 消息异步投递，持续观察消息扫描是否拖慢写路径'''
+        api_data = GetContent("./resource/openapi/compliant/test3.yaml").yamlfile()
+        data = {
+            "data": str(api_data),
+            "operator_metadata_type": "openapi",
+            "operator_info": {
+                "category": "data_process"
+            }
+        }
+
+        def register_and_publish(i):
+            result = self.op_client.RegisterOperator(data, Headers)
+            if result[0] != 200:
+                return result
+            update_data = [{
+                "operator_id": op["operator_id"],
+                "version": op["version"],
+                "status": "published"
+            } for op in result[1] if op["status"] == "success"]
+            return self.op_client.UpdateOperatorStatus(update_data, Headers)
+
+        self.soak(PerfReport, "注册并发布算子", register_and_publish, ResourceSampling)
@@ -0,0 +1,228 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import random
+import string
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from common.echo_upstream_server import STREAM_PATH, upstream_from_config
+from common.get_content import GetContent
+from common.perf_chart import attach_line_chart
+from common.perf_stats import percentile
+from common.stream_probe import arrival_gaps, event_latencies, read_stream
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 流式代理测试参数，可在 env.ini 的 [performance] 段覆盖
+stream_events = config.getint("performance", "stream_events", fallback=50)
+stream_interval_ms = config.getint("performance", "stream_interval_ms", fallback=20)
+stream_event_size = config.getint("performance", "stream_event_size", fallback=256)
+stream_latency_runs = config.getint("performance", "stream_latency_runs", fallback=5)
+stream_rate_events = config.getint("performance", "stream_rate_events", fallback=5000)
+stream_concurrency = [int(n) for n in
+                      config.get("performance", "stream_concurrency", fallback="1,10,50,100,200").split(",")]
+stream_latency_budget_ms = config.getint("performance", "stream_latency_budget_ms", fallback=50)
+stream_timeout = config.getint("performance", "stream_timeout", fallback=120)
+
+MODES = ["sse", "http"]
+ROUTES = ["直连上游", "工具代理"]
+ACCEPT = {"sse": "text/event-stream", "http": "application/stream+json"}
+
+
+def summarize_streams(results, interval_ms):
+    '''
+    汇总一组流：首字节时间、事件延迟（到达 - 生产）、到达间隔与缓冲迹象
+    interval_ms > 0 时，到达间隔不足生产间隔十分之一的事件视为被缓冲后成批送达
+    '''
+    ok = [r for r in results if r["status"] == 200 and r["error"] is None and r["events"]]
+    latencies = [t for r in ok for t in event_latencies(r)]
+    gaps = [g for r in ok for g in arrival_gaps(r)]
+    batched = sum(1 for g in gaps if g < interval_ms / 10000.0) if interval_ms > 0 else 0
+    return {
+        "streams": len(results),
+        "errors": len(results) - len(ok),
+        "incomplete": sum(1 for r in ok if len(r["events"]) != r["expected"]),
+        "ttfb_p50": percentile([r["ttfb_s"] for r in ok], 50),
+        "ttfb_p99": percentile([r["ttfb_s"] for r in ok], 99),
+        "latency_p50": percentile(latencies, 50),
+        "latency_p99": percentile(latencies, 99),
+        "latency_max": max(latencies) if latencies else 0.0,
+        "gap_p50": percentile(gaps, 50),
+        "gap_p99": percentile(gaps, 99),
+        "batched_ratio": batched / len(gaps) if gaps else 0.0,
+        "error_samples": [(r["status"], r["error"]) for r in results if r not in ok][:3]
+    }
+
+
+@allure.feature("代理性能测试：流式代理的首字节时间与事件吞吐")
+class TestStreamProxyPerformance:
+    '''
+    本地慢速生产者（common/echo_upstream_server.py 的 POST /stream）注册为工具箱，按固定间隔与大小输出事件，
+    分别以 SSE 与 HTTP 流两种模式直连上游、经 /tool-box/{box}/proxy/{tool}?stream=true 调用，对比：
+    首字节时间、代理增加的事件延迟与缓冲、单流最大持续事件速率，以及延迟开始劣化前代理能承载的并发流数
+    事件携带生产时刻，客户端与上游需运行在同一台机器上；被测服务需能访问 echo_upstream_advertise_host:echo_upstream_port
+    '''
+    tb_client = ToolBox()
+
+    @pytest.fixture(scope="class")
+    def upstream(self, Headers):
+        '''启动上游，注册并发布只含流式工具的工具箱；被测服务无法访问上游时跳过'''
+        upstream = upstream_from_config(config).start()
+        spec = upstream.spec(title="stream upstream", paths=[STREAM_PATH])
+        name = "proxy_stream_" + ''.join(random.choice(string.ascii_lowercase) for i in range(8))
+
+        result = self.tb_client.CreateToolbox({"box_name": name, "data": spec, "metadata_type": "openapi"}, Headers)
+        assert result[0] == 200, f"创建工具箱失败: {result}"
+        box_id = result[1]["box_id"]
+        result = self.tb_client.UpdateToolbox(box_id, {
+            "box_name": name, "box_desc": "stream proxy test toolbox", "box_svc_url": upstream.base_url(),
+            "box_icon": "icon-color-tool-FADB14", "box_category": "data_process", "metadata_type": "openapi"
+        }, Headers)
+        assert result[0] == 200, f"更新工具箱失败: {result}"
+        result = self.tb_client.GetBoxToolsList(box_id, {"page_size": 20}, Headers)
+        tool_id = result[1]["tools"][0]["tool_id"]
+        self.tb_client.UpdateToolStatus(box_id, [{"tool_id": tool_id, "status": "enabled"}], Headers)
+        self.tb_client.UpdateToolboxStatus(box_id, {"status": "published"}, Headers)
+
+        upstream.proxy_url = f"{self.tb_client.base_url}/{box_id}/proxy/{tool_id}"
+        upstream.headers = Headers
+        result = self.stream(upstream, "工具代理", "http", events=1)
+        if upstream.stats()["counts"]["streams"] == 0:
+            upstream.stop()
+            pytest.skip(f"被测服务未调用本地上游，请确认其可访问 {upstream.base_url()}（响应 {result['status']}: {result['error']}）")
+
+        yield upstream
+
+        upstream.stop()
+        self.tb_client.UpdateToolboxStatus(box_id, {"status": "offline"}, Headers)
+        self.tb_client.DeleteToolbox(box_id, Headers)
+
+    @staticmethod
+    def stream(upstream, route, mode, events=stream_events, interval_ms=stream_interval_ms,
+               event_size=stream_event_size):
+        '''读取一条流；经代理时上游参数放在代理请求体的 query 中，流式模式由代理地址的 stream/mode 参数开启'''
+        params = {"mode": mode, "events": events, "interval_ms": interval_ms, "event_size": event_size}
+        if route == "直连上游":
+            url = f"{upstream.url(STREAM_PATH)}?{urlencode(params)}"
+            headers = {"Content-Type": "application/json", "Accept": ACCEPT[mode]}
+            body = "{}"
+        else:
+            url = f"{upstream.proxy_url}?{urlencode({'stream': 'true', 'mode': mode})}"
+            headers = dict(upstream.headers, **{"Content-Type": "application/json", "Accept": ACCEPT[mode]})
+            body = json.dumps({"header": {"Accept": ACCEPT[mode]}, "body": {},
+                               "query": {k: str(v) for k, v in params.items()}, "timeout": stream_timeout})
+        result = read_stream(url, body, headers, timeout=stream_timeout)
+        result["expected"] = events
+        return result
+
+    def concurrent(self, upstream, route, mode, streams, **kwargs):
+        with ThreadPoolExecutor(max_workers=streams) as pool:
+            return list(pool.map(lambda i: self.stream(upstream, route, mode, **kwargs), range(streams)))
+
+    @allure.title("流式代理：首字节时间与代理增加的事件延迟")
+    def test_stream_latency(self, upstream, PerfReport):
+        '''每种模式与链路顺序读取 stream_latency_runs 条流，事件按 stream_interval_ms 间隔生产'''
+        rows = []
+        for mode in MODES:
+            for route in ROUTES:
+                results = [self.stream(upstream, route, mode) for i in range(stream_latency_runs)]
+                rows.append(dict(summarize_streams(results, stream_interval_ms), mode=mode, route=route))
+
+        direct = {r["mode"]: r for r in rows if r["route"] == "直连上游"}
+        lines = [f"每条流 {stream_events} 个事件，间隔 {stream_interval_ms} 毫秒，每个约 {stream_event_size} 字节，"
+                 f"每组 {stream_latency_runs} 条流:"]
+        for r in rows:
+            line = (f"{r['mode']} {r['route']}: 首字节 P50 {r['ttfb_p50'] * 1000:.1f}毫秒, "
+                    f"事件延迟 P50 {r['latency_p50'] * 1000:.1f}毫秒 P99 {r['latency_p99'] * 1000:.1f}毫秒 "
+                    f"最大 {r['latency_max'] * 1000:.1f}毫秒, 到达间隔 P50 {r['gap_p50'] * 1000:.1f}毫秒 "
+                    f"P99 {r['gap_p99'] * 1000:.1f}毫秒, 成批到达 {r['batched_ratio'] * 100:.1f}%, 失败 {r['errors']}")
+            if r["route"] != "直连上游":
+                base = direct[r["mode"]]
+                r["added_ttfb_p50"] = r["ttfb_p50"] - base["ttfb_p50"]
+                r["added_latency_p50"] = r["latency_p50"] - base["latency_p50"]
+                r["added_latency_p99"] = r["latency_p99"] - base["latency_p99"]
+                line += (f", 代理增加首字节 {r['added_ttfb_p50'] * 1000:.1f}毫秒, "
+                         f"事件延迟 P50 {r['added_latency_p50'] * 1000:.1f}毫秒 P99 {r['added_latency_p99'] * 1000:.1f}毫秒")
+                if r["batched_ratio"] > 0.5:
+                    line += "（多数事件成批到达，代理存在缓冲）"
+            lines.append(line)
+        PerfReport("流式代理延迟", "\n".join(lines), rows)
+        for r in rows:
+            assert r["errors"] == 0, f"{r['mode']} {r['route']} 存在失败的流: {r['error_samples']}"
+            assert r["incomplete"] == 0, f"{r['mode']} {r['route']} 存在事件不完整的流"
+
+    @allure.title("流式代理：单流最大持续事件速率")
+    def test_stream_max_rate(self, upstream, PerfReport):
+        '''上游不间断生产 stream_rate_events 个事件，按首末事件的到达时刻计算客户端持续收到的事件速率'''
+        rows = []
+        for mode in MODES:
+            for route in ROUTES:
+                result = self.stream(upstream, route, mode, events=stream_rate_events, interval_ms=0)
+                arrivals = [arrival for _, _, arrival in result["events"]]
+                span = arrivals[-1] - arrivals[0] if len(arrivals) > 1 else 0.0
+                rows.append({
+                    "mode": mode, "route": route, "status": result["status"], "error": result["error"],
+                    "events": len(arrivals), "done": result["done"], "elapsed": result["elapsed_s"],
+                    "events_per_second": (len(arrivals) - 1) / span if span else 0.0,
+                    "mb_per_second": result["bytes"] / 1024 / 1024 / span if span else 0.0,
+                    "latency_p99": percentile(event_latencies(result), 99)
+                })
+
+        lines = [f"每条流 {stream_rate_events} 个事件，每个约 {stream_event_size} 字节，无生产间隔:"]
+        for r in rows:
+            lines.append(f"{r['mode']} {r['route']}: {r['events_per_second']:.0f} 事件/秒 ({r['mb_per_second']:.2f}MB/秒), "
+                         f"收到 {r['events']} 个事件, 事件延迟 P99 {r['latency_p99'] * 1000:.1f}毫秒, "
+                         f"总耗时 {r['elapsed']:.2f}秒, 结束标记 {'有' if r['done'] else '无'}")
+        PerfReport("流式代理事件速率", "\n".join(lines), rows)
+        for r in rows:
+            assert r["status"] == 200 and r["error"] is None, f"{r['mode']} {r['route']} 读取失败: {r['error']}"
+            assert r["events"] == stream_rate_events, f"{r['mode']} {r['route']} 只收到 {r['events']} 个事件"
+
+    @allure.title("流式代理：延迟劣化前可承载的并发流数")
+    def test_stream_concurrency(self, upstream, PerfReport):
+        '''
+        逐级提高同时打开的流数，直连上游作为客户端自身开销的参照；
+        代理与直连的事件延迟 P99 之差超过单流时的差值加 stream_latency_budget_ms，或出现失败的流，即视为劣化
+        '''
+        rows = []
+        for mode in MODES:
+            for streams in stream_concurrency:
+                for route in ROUTES:
+                    results = self.concurrent(upstream, route, mode, streams)
+                    rows.append(dict(summarize_streams(results, stream_interval_ms), mode=mode, route=route,
+                                     concurrency=streams))
+
+        lines = [f"每条流 {stream_events} 个事件，间隔 {stream_interval_ms} 毫秒，劣化阈值为单流基线加 {stream_latency_budget_ms} 毫秒:"]
+        sustained = {}
+        for mode in MODES:
+            direct = {r["concurrency"]: r for r in rows if r["mode"] == mode and r["route"] == "直连上游"}
+            proxied = [r for r in rows if r["mode"] == mode and r["route"] == "工具代理"]
+            for r in proxied:
+                r["added_latency_p99"] = r["latency_p99"] - direct[r["concurrency"]]["latency_p99"]
+            threshold = proxied[0]["added_latency_p99"] + stream_latency_budget_ms / 1000.0
+            sustained[mode] = 0
+            for r in proxied:
+                r["degraded"] = r["errors"] > 0 or r["added_latency_p99"] > threshold
+                if r["degraded"]:
+                    break
+                sustained[mode] = r["concurrency"]
+            for r in proxied:
+                base = direct[r["concurrency"]]
+                lines.append(f"{mode} 并发 {r['concurrency']}: 代理事件延迟 P99 {r['latency_p99'] * 1000:.1f}毫秒"
+                             f"（直连 {base['latency_p99'] * 1000:.1f}毫秒，增加 {r['added_latency_p99'] * 1000:.1f}毫秒）, "
+                             f"首字节 P99 {r['ttfb_p99'] * 1000:.1f}毫秒, 失败 {r['errors']}"
+                             + ("，已劣化" if r.get("degraded") else ""))
+            lines.append(f"{mode} 模式延迟劣化前可承载的并发流数: {sustained[mode]}")
+        PerfReport("流式代理并发", "\n".join(lines), {"rows": rows, "sustained": sustained})
+        attach_line_chart({f"{r_mode} {route}": [(r["concurrency"], r["latency_p99"] * 1000) for r in rows
+                                                 if r["mode"] == r_mode and r["route"] == route]
+                           for r_mode in MODES for route in ROUTES},
+                          "流式事件延迟P99-并发流数曲线", "并发流数", "事件延迟P99(毫秒)")
+        for mode in MODES:
+            assert sustained[mode] > 0, f"{mode} 模式单流即出现失败或延迟劣化"
@@ -0,0 +1,198 @@
+# -*- coding:UTF-8 -*-
+
+import allure
+import json
+import random
+import string
+import threading
+import time
+import pytest
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+
+from common.distributions import WeightedChoice, zipf_weights
+from common.echo_upstream_server import echo_tools_spec, upstream_from_config
+from common.get_content import GetContent
+from common.perf_stats import parse_server_timing, percentile, summarize
+from lib.tool_box import ToolBox
+
+configfile = "./config/env.ini"
+config = GetContent(configfile).config()
+
+# 多工具混合代理测试参数，可在 env.ini 的 [performance] 段覆盖
+mix_boxes = config.getint("performance", "tool_mix_boxes", fallback=20)
+mix_tools = config.getint("performance", "tool_mix_tools", fallback=10)
+mix_calls = config.getint("performance", "tool_mix_calls", fallback=2000)
+mix_concurrency = config.getint("performance", "tool_mix_concurrency", fallback=16)
+mix_zipf_s = config.getfloat("performance", "tool_mix_zipf_s", fallback=1.1)
+mix_seed = config.getint("performance", "tool_mix_seed", fallback=0)
+mix_timeout = config.getint("performance", "tool_mix_timeout", fallback=60)
+
+# Server-Timing 中的阶段：auth 权限校验，lookup 查询工具箱与工具，metadata 查询元数据，proxy 代理转发，total 服务端总耗时
+RESOLVE_STAGES = ["auth", "lookup", "metadata"]
+STAGES = RESOLVE_STAGES + ["proxy", "total"]
+
+local = threading.local()
+
+
+def session():
+    '''每个线程复用各自的连接池会话，避免建连耗时计入延迟'''
+    if not hasattr(local, "session"):
+        local.session = requests.Session()
+    return local.session
+
+
+@allure.feature("代理性能测试：工具箱规模下的多工具混合代理")
+class TestToolMixPerformance:
+    '''
+    创建 tool_mix_boxes 个工具箱、每个 tool_mix_tools 个工具，全部指向本地回显上游，
+    按 Zipf 权重随机调用 /tool-box/{box}/proxy/{tool}，对比每次调用服务端解析工具
+    （权限校验、工具箱与工具查询、元数据查询，取自 Server-Timing 响应头）与上游耗时（响应中的 duration_ms），
+    判断工具解析与鉴权是否成为代理调用的主要开销；同时以只调用单个工具作为热点基线
+    被测服务需能访问 echo_upstream_advertise_host:echo_upstream_port
+    '''
+    tb_client = ToolBox()
+
+    @pytest.fixture(scope="class")
+    def toolset(self, Headers):
+        '''启动回显上游，创建并发布全部工具箱；被测服务无法访问上游时跳过'''
+        upstream = upstream_from_config(config).start()
+        prefix = "tool_mix_" + ''.join(random.choice(string.ascii_lowercase) for i in range(6))
+        boxes, tools = [], []
+        try:
+            for b in range(mix_boxes):
+                name = f"{prefix}_{b}"
+                spec = echo_tools_spec(upstream.base_url(), mix_tools, title=name)
+                result = self.tb_client.CreateToolbox({"box_name": name, "data": spec, "metadata_type": "openapi"},
+                                                      Headers)
+                assert result[0] == 200, f"创建工具箱失败: {result}"
+                box_id = result[1]["box_id"]
+                boxes.append(box_id)
+                result = self.tb_client.UpdateToolbox(box_id, {
+                    "box_name": name, "box_desc": "tool mix test toolbox", "box_svc_url": upstream.base_url(),
+                    "box_icon": "icon-color-tool-FADB14", "box_category": "data_process", "metadata_type": "openapi"
+                }, Headers)
+                assert result[0] == 200, f"更新工具箱失败: {result}"
+                result = self.tb_client.GetBoxToolsList(box_id, {"page_size": mix_tools + 10}, Headers)
+                box_tools = [t["tool_id"] for t in result[1]["tools"]]
+                self.tb_client.UpdateToolStatus(box_id, [{"tool_id": t, "status": "enabled"} for t in box_tools],
+                                                Headers)
+                self.tb_client.UpdateToolboxStatus(box_id, {"status": "published"}, Headers)
+                tools += [(box_id, t) for t in box_tools]
+
+            headers = dict(Headers, **{"Content-Type": "application/json"})
+            status, content, _ = self.call(tools[0], headers)[:3]
+            if upstream.stats()["counts"]["requests"] == 0:
+                pytest.skip(f"被测服务未调用本地回显上游，请确认其可访问 {upstream.base_url()}（响应 {status}: {content[:200]}）")
+
+            # 工具按随机顺序分配 Zipf 权重，热点工具分散在不同工具箱中
+            rng = random.Random(mix_seed)
+            ranked = tools[:]
+            rng.shuffle(ranked)
+            yield {"upstream": upstream, "tools": ranked, "headers": headers,
+                   "choice": WeightedChoice(ranked, zipf_weights(len(ranked), mix_zipf_s), rng)}
+        finally:
+            upstream.stop()
+            for box_id in boxes:
+                self.tb_client.UpdateToolboxStatus(box_id, {"status": "offline"}, Headers)
+                self.tb_client.DeleteToolbox(box_id, Headers)
+
+    def call(self, tool, headers):
+        '''调用一次工具代理，返回 (状态码, 响应内容, 客户端延迟, 服务端分段耗时, 上游耗时)'''
+        box_id, tool_id = tool
+        body = json.dumps({"header": {"Content-Type": "application/json"}, "body": {"data": "x" * 64},
+                           "timeout": mix_timeout})
+        begin = time.perf_counter()
+        try:
+            resp = session().post(f"{self.tb_client.base_url}/{box_id}/proxy/{tool_id}", data=body, headers=headers,
+                                  verify=False, timeout=mix_timeout)
+        except requests.RequestException as e:
+            return 0, str(e).encode(), time.perf_counter() - begin, {}, None
+        latency = time.perf_counter() - begin
+        upstream_time = None
+        if resp.status_code == 200:
+            data = resp.json()
+            if data.get("status_code") == 200:
+                upstream_time = data.get("duration_ms", 0) / 1000.0
+        return resp.status_code, resp.content, latency, parse_server_timing(resp.headers.get("Server-Timing")), \
+            upstream_time
+
+    def run(self, toolset, pick):
+        '''mix_concurrency 个线程共调用 mix_calls 次，pick 返回每次调用的工具'''
+        picks = [pick() for i in range(mix_calls)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=mix_concurrency) as pool:
+            results = list(pool.map(lambda tool: self.call(tool, toolset["headers"]), picks))
+        elapsed = time.perf_counter() - start
+        return picks, results, elapsed
+
+    @staticmethod
+    def breakdown(results):
+        '''成功调用的各阶段耗时分位数（毫秒），resolve 为解析阶段之和，overhead 为服务端总耗时减上游耗时'''
+        ok = [r for r in results if r[0] == 200 and r[4] is not None]
+        series = {stage: [r[3][stage] for r in ok if stage in r[3]] for stage in STAGES}
+        series["resolve"] = [sum(r[3].get(s, 0) for s in RESOLVE_STAGES) for r in ok if "total" in r[3]]
+        series["upstream"] = [r[4] for r in ok]
+        series["overhead"] = [r[3]["total"] - r[4] for r in ok if "total" in r[3]]
+        series["client"] = [r[2] for r in ok]
+        return {name: {"p50": percentile(values, 50) * 1000, "p99": percentile(values, 99) * 1000,
+                       "avg": sum(values) / len(values) * 1000 if values else 0.0, "count": len(values)}
+                for name, values in series.items()}
+
+    @staticmethod
+    def format_breakdown(name, b):
+        if not b["total"]["count"]:
+            return (f"{name}: 被测服务未返回 Server-Timing，客户端延迟 P50 {b['client']['p50']:.2f}毫秒, "
+                    f"上游耗时 P50 {b['upstream']['p50']:.2f}毫秒")
+        share = b["resolve"]["avg"] / b["total"]["avg"] if b["total"]["avg"] else 0.0
+        return (f"{name}: 服务端总耗时 P50 {b['total']['p50']:.2f}毫秒 P99 {b['total']['p99']:.2f}毫秒, "
+                f"解析 P50 {b['resolve']['p50']:.2f}毫秒 P99 {b['resolve']['p99']:.2f}毫秒"
+                f"（权限 {b['auth']['p50']:.2f} / 工具箱与工具 {b['lookup']['p50']:.2f} / 元数据 {b['metadata']['p50']:.2f}）, "
+                f"上游 P50 {b['upstream']['p50']:.2f}毫秒 P99 {b['upstream']['p99']:.2f}毫秒, "
+                f"服务端开销（总耗时 - 上游）P50 {b['overhead']['p50']:.2f}毫秒, "
+                f"解析占服务端总耗时 {share * 100:.1f}%, 客户端延迟 P50 {b['client']['p50']:.2f}毫秒")
+
+    @allure.title("多工具混合代理：工具解析与鉴权开销对比上游耗时")
+    def test_tool_mix(self, toolset, PerfReport):
+        '''先只调用权重最高的工具作为热点基线，再按 Zipf 权重混合调用全部工具，对比各阶段耗时'''
+        choice, hot = toolset["choice"], toolset["tools"][0]
+        phases, runs = {}, {}
+        for phase, pick in [("单工具热点", lambda: hot), ("多工具混合", choice)]:
+            picks, results, elapsed = self.run(toolset, pick)
+            runs[phase] = (picks, results)
+            errors = [r for r in results if r[0] != 200 or r[4] is None]
+            phases[phase] = {
+                "summary": summarize([r[2] for r in results], len(errors), elapsed),
+                "distinct_tools": len(set(picks)),
+                "distinct_boxes": len({box for box, _ in picks}),
+                "breakdown": self.breakdown(results),
+                "error_samples": [(r[0], r[1][:200].decode(errors="replace")) for r in errors[:3]]
+            }
+
+        # 按抽样概率把工具分成头部（前 10%）与长尾，长尾工具更可能未命中服务端缓存
+        mix_picks, mix_results = runs["多工具混合"]
+        head = set(toolset["tools"][:max(1, len(toolset["tools"]) // 10)])
+        tiers = {
+            "头部工具": self.breakdown([r for p, r in zip(mix_picks, mix_results) if p in head]),
+            "长尾工具": self.breakdown([r for p, r in zip(mix_picks, mix_results) if p not in head])
+        }
+
+        lines = [f"{mix_boxes} 个工具箱 × {mix_tools} 个工具，Zipf s={mix_zipf_s}，"
+                 f"每阶段 {mix_calls} 次调用，{mix_concurrency} 并发，头部 10% 工具占调用的 "
+                 f"{sum(choice.share(i) for i in range(len(head))) * 100:.1f}%:"]
+        for phase, p in phases.items():
+            s = p["summary"]
+            lines.append(f"{phase}（{p['distinct_tools']} 个工具，{p['distinct_boxes']} 个工具箱）: "
+                         f"吞吐 {s['throughput']:.1f} 次/秒, 错误率 {s['error_rate'] * 100:.2f}%")
+            lines.append("  " + self.format_breakdown(phase, p["breakdown"]))
+        for tier, b in tiers.items():
+            lines.append("  " + self.format_breakdown(tier, b))
+        mix, base = phases["多工具混合"]["breakdown"], phases["单工具热点"]["breakdown"]
+        if mix["total"]["count"] and base["total"]["count"]:
+            lines.append(f"混合调用比单工具热点的解析耗时 P50 增加 {mix['resolve']['p50'] - base['resolve']['p50']:.2f}毫秒, "
+                         f"P99 增加 {mix['resolve']['p99'] - base['resolve']['p99']:.2f}毫秒")
+        PerfReport("多工具混合代理", "\n".join(lines), {"phases": phases, "tiers": tiers})
+
+        for phase, p in phases.items():
+            assert p["summary"]["errors"] == 0, f"{phase} 存在失败调用: {p['error_samples']}"